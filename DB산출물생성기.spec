@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('jre', 'jre'), ('ojdbc8.jar', '.'), ('dboutput.ico', '.')],
-    hiddenimports=['pymysql', 'psycopg2', 'jpype1', 'cryptography.hazmat.primitives.kdf.pbkdf2', 'cryptography.hazmat.primitives.hashes', 'cryptography.hazmat.primitives.ciphers', 'cryptography.hazmat.backends.openssl'],
+    hiddenimports=['pymysql', 'psycopg2', 'jpype1', 'oracledb', 'cryptography.hazmat.primitives.kdf.pbkdf2', 'cryptography.hazmat.primitives.hashes', 'cryptography.hazmat.primitives.ciphers', 'cryptography.hazmat.backends.openssl'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
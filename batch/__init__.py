@@ -0,0 +1,23 @@
+"""
+일괄 생성(배치 모드) 모듈
+
+이 모듈은 여러 데이터베이스의 연결 프로필을 읽어 대상마다 메타데이터를 수집하고
+Excel 명세서를 생성합니다. 대상은 작업 프로세스 풀에서 동시에 처리됩니다.
+
+주요 함수:
+- load_profiles: 연결 프로필 JSON 파일 읽기
+- run_fleet: 프로필 목록을 작업 프로세스에서 처리하고 결과 목록 반환
+- write_summary: 처리 결과 요약 보고서 저장
+
+사용 예시:
+    python main.py --batch profiles.json --workers 4
+"""
+
+from .fleet_runner import load_profiles, run_fleet, write_summary, run_batch
+
+__all__ = [
+    'load_profiles',
+    'run_fleet',
+    'write_summary',
+    'run_batch'
+]
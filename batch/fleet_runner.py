@@ -0,0 +1,268 @@
+"""
+여러 데이터베이스 명세서 일괄 생성
+
+대상(연결 프로필)마다 별도 작업 프로세스에서 메타데이터 수집과 Excel 생성을 실행합니다.
+프로세스마다 인터프리터와 JVM(Oracle JDBC)이 따로 있으므로 대상 수와 코어 수에 맞춰 처리량이 늘어나고,
+한 대상의 실패나 드라이버 오류가 다른 대상에 영향을 주지 않습니다.
+
+프로필 파일 형식 (JSON 배열):
+    [
+        {
+            "name": "주문DB",
+            "dbms": "MySQL",
+            "host": "10.0.0.1",
+            "port": 3306,
+            "database": "orders",
+            "username": "reader",
+            "password_env": "ORDERS_DB_PASSWORD",
+            "selected_tables": ["orders", "order_items"],
+            "output": "주문DB_명세서.xlsx"
+        }
+    ]
+
+비밀번호는 "password"에 직접 쓰거나 "password_env"로 환경 변수 이름을 지정합니다.
+"oracle_type", "selected_tables", "output"은 생략할 수 있습니다.
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from config import BATCH_CONFIG, FILE_CONFIG, SUPPORTED_DBMS, SNAPSHOT_CONFIG, EXPORT_CONFIG
+from utils import ensure_directory_exists, ensure_excel_extension, generate_spec_filename
+
+# 프로필 필수 항목
+REQUIRED_FIELDS = ('dbms', 'host', 'database', 'username')
+
+
+def load_profiles(path):
+    """
+    연결 프로필 파일 읽기
+    
+    Args:
+        path (str): 프로필 JSON 파일 경로
+        
+    Returns:
+        list: 프로필 딕셔너리 목록
+        
+    Raises:
+        ValueError: 파일 형식이 올바르지 않은 경우
+    """
+    with open(path, encoding=FILE_CONFIG["encoding"]) as f:
+        profiles = json.load(f)
+        
+    if isinstance(profiles, dict):
+        profiles = profiles.get('profiles', [])
+    if not isinstance(profiles, list):
+        raise ValueError("프로필 파일은 JSON 배열이어야 합니다.")
+        
+    for index, profile in enumerate(profiles, 1):
+        missing = [field for field in REQUIRED_FIELDS if not profile.get(field)]
+        if missing:
+            raise ValueError(f"{index}번째 프로필에 필수 항목이 없습니다: {', '.join(missing)}")
+        if profile['dbms'] not in SUPPORTED_DBMS:
+            raise ValueError(f"{index}번째 프로필: 지원하지 않는 DBMS입니다: {profile['dbms']}")
+        profile.setdefault('name', f"{profile['dbms']}_{profile['host']}_{profile['database']}")
+        profile.setdefault('port', SUPPORTED_DBMS[profile['dbms']]['default_port'])
+    return profiles
+
+
+def _resolve_password(profile):
+    """프로필의 비밀번호 (password_env가 있으면 환경 변수에서 읽음)"""
+    if profile.get('password_env'):
+        password = os.environ.get(profile['password_env'])
+        if password is None:
+            raise ValueError(f"환경 변수 {profile['password_env']}가 설정되어 있지 않습니다.")
+        return password
+    return profile.get('password', '')
+
+
+def _output_path(profile, output_dir):
+    """대상별 명세서 저장 경로"""
+    filename = profile.get('output') or generate_spec_filename(profile['name'])
+    return os.path.join(output_dir, ensure_excel_extension(filename))
+
+
+def _run_target(profile, output_dir):
+    """
+    작업 프로세스에서 대상 하나 처리 (수집 → Excel 생성)
+    
+    예외는 밖으로 던지지 않고 결과 딕셔너리의 error로 반환합니다.
+    """
+    started = time.time()
+    result = {
+        'name': profile['name'],
+        'dbms': profile['dbms'],
+        'host': profile['host'],
+        'database': profile['database'],
+        'success': False,
+        'worker_pid': os.getpid()
+    }
+    
+    # 작업 프로세스에서 처음 import (드라이버, JVM은 프로세스마다 따로 초기화)
+    try:
+        from database import connection_manager, metadata_collector
+        from excel import excel_generator
+        from snapshot import save_snapshot, snapshot_path_for
+        from export import export_parquet, export_dir_for, is_pyarrow_available
+    except ImportError as e:
+        result['error'] = f"필요한 모듈을 불러올 수 없습니다: {e}"
+        result['duration_ms'] = round((time.time() - started) * 1000, 2)
+        return result
+        
+    try:
+        metadata = metadata_collector.collect_database_metadata(
+            dbms=profile['dbms'],
+            host=profile['host'],
+            port=int(profile['port']),
+            database=profile['database'],
+            username=profile['username'],
+            password=_resolve_password(profile),
+            timeout=profile.get('timeout', BATCH_CONFIG["connect_timeout"]),
+            selected_tables=profile.get('selected_tables'),
+            oracle_type=profile.get('oracle_type')
+        )
+        result['path'] = excel_generator.generate_excel(metadata, _output_path(profile, output_dir))
+        # 스냅샷/Parquet은 부가 출력이므로 실패해도 명세서 생성은 성공으로 처리하고 경고만 기록
+        if SNAPSHOT_CONFIG["save_with_spec"]:
+            # 다음에는 DB 연결 없이 스냅샷에서 명세서를 다시 만들 수 있도록 함께 저장
+            try:
+                result['snapshot'] = save_snapshot(metadata, snapshot_path_for(result['path']))
+            except Exception as e:
+                result.setdefault('warnings', []).append(f"스냅샷 저장 실패: {e}")
+        if EXPORT_CONFIG["save_with_spec"] and is_pyarrow_available():
+            # 여러 DB의 카탈로그를 합쳐 분석할 수 있도록 Parquet 파일도 저장
+            try:
+                result['parquet'] = export_parquet(metadata, export_dir_for(result['path']))['output_dir']
+            except Exception as e:
+                result.setdefault('warnings', []).append(f"Parquet 저장 실패: {e}")
+        result['tables'] = metadata['statistics']['total_tables']
+        result['columns'] = metadata['statistics']['total_columns']
+        result['success'] = True
+    except Exception as e:
+        result['error'] = str(e)
+    finally:
+        # 다음 대상과 연결을 공유하지 않으므로 풀의 연결 정리 (요약 보고서용 풀 통계는 정리 전에 기록)
+        result['pool_stats'] = connection_manager.get_pool_stats()
+        connection_manager.close_all()
+        
+    result['duration_ms'] = round((time.time() - started) * 1000, 2)
+    return result
+
+
+def run_fleet(profiles, output_dir=None, workers=None, on_result=None):
+    """
+    프로필 목록을 작업 프로세스 풀에서 처리
+    
+    Args:
+        profiles (list): load_profiles로 읽은 프로필 목록
+        output_dir (str): 명세서 저장 위치 (None이면 설정값)
+        workers (int): 작업 프로세스 수 (None이면 설정값, 설정값도 없으면 CPU 코어 수)
+        on_result (callable): 대상 하나가 끝날 때마다 결과 딕셔너리로 호출
+        
+    Returns:
+        list: 프로필 순서대로의 결과 딕셔너리 목록
+    """
+    output_dir = output_dir or BATCH_CONFIG["output_dir"]
+    ensure_directory_exists(output_dir)
+    workers = workers or BATCH_CONFIG["workers"] or os.cpu_count() or 1
+    workers = max(1, min(workers, len(profiles)))
+    
+    results = [None] * len(profiles)
+    if not profiles:
+        return results
+        
+    # JVM은 fork된 프로세스에서 사용할 수 없으므로 모든 플랫폼에서 spawn 방식으로 시작
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {
+            executor.submit(_run_target, profile, output_dir): index
+            for index, profile in enumerate(profiles)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # 작업 프로세스 자체가 비정상 종료된 경우 (드라이버 충돌 등)
+                profile = profiles[index]
+                result = {
+                    'name': profile['name'],
+                    'dbms': profile['dbms'],
+                    'host': profile['host'],
+                    'database': profile['database'],
+                    'success': False,
+                    'error': f"작업 프로세스 오류: {e}"
+                }
+            results[index] = result
+            if on_result:
+                on_result(result)
+                
+    return results
+
+
+def write_summary(results, output_dir=None, duration_ms=None):
+    """
+    처리 결과 요약 보고서 저장 (JSON)
+    
+    Returns:
+        str: 저장된 보고서 경로
+    """
+    output_dir = output_dir or BATCH_CONFIG["output_dir"]
+    ensure_directory_exists(output_dir)
+    succeeded = [result for result in results if result['success']]
+    
+    summary = {
+        'generated_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'total': len(results),
+        'succeeded': len(succeeded),
+        'failed': len(results) - len(succeeded),
+        'total_tables': sum(result.get('tables', 0) for result in succeeded),
+        'duration_ms': duration_ms,
+        'results': results
+    }
+    
+    path = os.path.join(output_dir, f"batch_summary_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    with open(path, 'w', encoding=FILE_CONFIG["encoding"]) as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def format_summary(results):
+    """콘솔 출력용 요약 문자열"""
+    lines = []
+    for result in results:
+        if result['success']:
+            lines.append(f"  ✅ {result['name']}: 테이블 {result['tables']}개, "
+                         f"{result['duration_ms']}ms → {result['path']}")
+            lines.extend(f"     ⚠️ {warning}" for warning in result.get('warnings', []))
+        else:
+            lines.append(f"  ❌ {result['name']}: {result['error']}")
+    succeeded = sum(1 for result in results if result['success'])
+    lines.append(f"성공 {succeeded}개 / 실패 {len(results) - succeeded}개 (전체 {len(results)}개)")
+    return "\n".join(lines)
+
+
+def run_batch(profiles_path, output_dir=None, workers=None):
+    """
+    배치 모드 진입점 (프로필 파일 읽기 → 일괄 생성 → 요약 보고서 저장)
+    
+    Returns:
+        int: 종료 코드 (모두 성공하면 0, 실패한 대상이 있으면 1)
+    """
+    profiles = load_profiles(profiles_path)
+    print(f"일괄 생성 시작: 대상 {len(profiles)}개")
+    
+    started = time.time()
+    results = run_fleet(
+        profiles, output_dir, workers,
+        on_result=lambda result: print(f"[{'완료' if result['success'] else '실패'}] {result['name']}")
+    )
+    duration_ms = round((time.time() - started) * 1000, 2)
+    
+    print(format_summary(results))
+    summary_path = write_summary(results, output_dir, duration_ms)
+    print(f"요약 보고서: {summary_path} ({duration_ms}ms)")
+    return 0 if all(result['success'] for result in results) else 1
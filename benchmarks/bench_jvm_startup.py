@@ -0,0 +1,82 @@
+"""
+Oracle JDBC용 JVM 기동 시간 벤치마크
+
+각 시행마다 새 프로세스에서 JVM을 시작해 다음 두 경우를 비교합니다.
+  - cold: AppCDS 아카이브 없이 시작
+  - cds : 첫 실행에서 생성한 AppCDS 아카이브로 시작 (Java 13 이상)
+
+사용법:
+    python benchmarks/bench_jvm_startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD_SCRIPT = r"""
+import json, sys, time
+sys.path.insert(0, {root!r})
+from config import JVM_CONFIG
+JVM_CONFIG['use_cds_archive'] = {use_cds!r}
+JVM_CONFIG['cds_archive_dir'] = {archive_dir!r}
+started = time.time()
+from database.jdbc_oracle_connection import ensure_jvm_started, get_jvm_timings
+ensure_jvm_started()
+timings = get_jvm_timings()
+timings['total_ms'] = round((time.time() - started) * 1000, 2)
+print('RESULT ' + json.dumps(timings))
+"""
+
+
+def run_child(use_cds, archive_dir):
+    """새 프로세스에서 JVM을 한 번 시작하고 시간 측정 결과 반환"""
+    script = CHILD_SCRIPT.format(root=ROOT_DIR, use_cds=use_cds, archive_dir=archive_dir)
+    output = subprocess.run(
+        [sys.executable, '-c', script], cwd=ROOT_DIR,
+        capture_output=True, text=True, check=True
+    ).stdout
+    for line in output.splitlines():
+        if line.startswith('RESULT '):
+            return json.loads(line[len('RESULT '):])
+    raise RuntimeError(f"측정 결과를 찾을 수 없습니다:\n{output}")
+
+
+def summarize(label, results):
+    """측정 결과 요약 출력"""
+    for field in ('jvm_boot_ms', 'class_load_ms', 'total_ms'):
+        values = [r[field] for r in results if r.get(field) is not None]
+        if values:
+            print(f"  {label:5s} {field:14s} 중앙값 {statistics.median(values):9.2f}ms "
+                  f"(최소 {min(values):.2f} / 최대 {max(values):.2f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JVM 기동 시간 벤치마크")
+    parser.add_argument('--runs', type=int, default=5, help="경우별 반복 횟수")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as archive_dir:
+        cold = [run_child(False, archive_dir) for _ in range(args.runs)]
+        
+        # 첫 실행은 아카이브 생성 (측정에서 제외)
+        run_child(True, archive_dir)
+        if not any(name.endswith('.jsa') for name in os.listdir(archive_dir)):
+            print("AppCDS 아카이브가 생성되지 않았습니다. (Java 13 이상 필요) cold 결과만 출력합니다.")
+            summarize('cold', cold)
+            return
+            
+        cds = [run_child(True, archive_dir) for _ in range(args.runs)]
+        
+    print(f"JVM 기동 시간 ({args.runs}회)")
+    summarize('cold', cold)
+    summarize('cds', cds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+MySQL 드라이버 비교 벤치마크 (mysqlclient vs PyMySQL)
+
+같은 서버에서 INFORMATION_SCHEMA 카탈로그 조회(get_tables_info)를 드라이버별로 실행해
+조회+해석 시간을 비교합니다. 조회 결과를 JSON으로 저장해 두면(--save) 다음 실행에서
+행 수와 내용이 같은지 함께 확인합니다. (실제 MySQL/MariaDB 서버 필요)
+
+사용법:
+    python benchmarks/bench_mysql_drivers.py --host HOST --database DB --username USER \\
+        --password PASS [--port 3306] [--repeat 5] [--save catalog.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.mysql_connection import MySQLConnection  # noqa: E402
+from database.mysql_drivers import DRIVER_LOADERS  # noqa: E402
+
+
+def run_driver(driver, args):
+    """드라이버 하나로 카탈로그 조회를 반복 실행 (소요 시간 목록, 마지막 결과 반환)"""
+    conn = MySQLConnection(args.host, args.port, args.database, args.username, args.password,
+                           driver=driver)
+    conn.connect()
+    try:
+        timings = []
+        rows = None
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            rows = conn.get_tables_info()
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings, rows
+    finally:
+        conn.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MySQL 드라이버 비교 벤치마크")
+    parser.add_argument('--host', required=True)
+    parser.add_argument('--port', type=int, default=3306)
+    parser.add_argument('--database', required=True)
+    parser.add_argument('--username', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', help="조회 결과 저장/비교용 JSON 파일")
+    args = parser.parse_args()
+    
+    results = {}
+    for driver in DRIVER_LOADERS:
+        try:
+            timings, rows = run_driver(driver, args)
+        except ImportError as e:
+            print(f"{driver:12s} 건너뜀 (설치되지 않음: {e})")
+            continue
+        results[driver] = rows
+        print(f"{driver:12s} {len(rows):,}행  중앙값 {statistics.median(timings):9.1f}ms  "
+              f"최소 {min(timings):9.1f}ms")
+    
+    if len(results) > 1:
+        first, second = list(results.values())[:2]
+        print(f"드라이버 간 결과 {'동일' if first == second else '다름'}")
+        
+    if args.save and results:
+        rows = next(iter(results.values()))
+        if os.path.exists(args.save):
+            with open(args.save, encoding='utf-8') as f:
+                recorded = json.load(f)
+            same = recorded == json.loads(json.dumps(rows, default=str, ensure_ascii=False))
+            print(f"저장된 결과({len(recorded):,}행)와 {'동일' if same else '다름'}")
+        else:
+            with open(args.save, 'w', encoding='utf-8') as f:
+                json.dump(rows, f, default=str, ensure_ascii=False)
+            print(f"조회 결과 저장: {args.save}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+수집 결과 정규화 벤치마크 (1,000,000행 합성 카탈로그)
+
+행마다 후보 키를 조회하는 방식(_normalize_tables_by_lookup)과
+첫 행으로 결과 컬럼을 정한 뒤 operator.itemgetter로 꺼내는 방식(_normalize_tables_data)의
+정규화 시간을 비교하고 두 결과가 같은지 확인합니다.
+MySQL 형식(한글/대문자 별칭)과 PostgreSQL 형식(소문자 컬럼명) 행을 각각 측정합니다. (DB 서버 불필요)
+
+사용법:
+    python benchmarks/bench_normalize.py [--rows 1000000] [--repeat 3]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.data_collector import DatabaseMetadataCollector  # noqa: E402
+
+
+def build_mysql_rows(row_count, column_count=15):
+    """MySQL 테이블 쿼리와 같은 별칭의 합성 행"""
+    rows = []
+    for i in range(row_count):
+        c = i % column_count + 1
+        rows.append({
+            'table_name': f"tb_table_{i // column_count:06d}",
+            '테이블설명': f"테이블 {i // column_count}",
+            'NO': c,
+            '컬럼명': 'id' if c == 1 else f"col_{c:02d}",
+            'TYPE': 'bigint' if c == 1 else 'varchar(100)',
+            'DEFAULT_VALUE': None if c % 4 else 'CURRENT_TIMESTAMP',
+            'NULLABLE': 'NO' if c == 1 else 'YES',
+            'KEY_TYPE': 'PRI' if c == 1 else '',
+            'EXTRA': 'auto_increment' if c == 1 else '',
+            '설명': f"컬럼 {c} 설명"
+        })
+    return rows
+
+
+def build_postgresql_rows(row_count, column_count=15):
+    """PostgreSQL 테이블 쿼리와 같은 소문자 컬럼명의 합성 행"""
+    rows = []
+    for i in range(row_count):
+        c = i % column_count + 1
+        rows.append({
+            'table_name': f"tb_table_{i // column_count:06d}",
+            'table_comment': None,
+            'column_position': c,
+            'column_name': 'id' if c == 1 else f"col_{c:02d}",
+            'data_type': 'bigint' if c == 1 else 'character varying(100)',
+            'default_value': None,
+            'is_nullable': 'NO' if c == 1 else 'YES',
+            'key_type': 'PRI' if c == 1 else None,
+            'extra': None,
+            'column_comment': None
+        })
+    return rows
+
+
+def measure(func, repeat):
+    """반복 실행 소요 시간 목록 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집 결과 정규화 벤치마크")
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    collector = DatabaseMetadataCollector()
+    print(f"합성 카탈로그: {args.rows:,}행")
+    print(f"{'형식':<14}{'방식':<24}{'중앙값(ms)':>12}{'최소(ms)':>12}{'속도':>8}")
+    
+    for name, build in (("MySQL", build_mysql_rows), ("PostgreSQL", build_postgresql_rows)):
+        rows = build(args.rows)
+        assert collector._normalize_tables_data(rows) == collector._normalize_tables_by_lookup(rows), \
+            f"{name}: 두 방식의 정규화 결과가 다릅니다."
+            
+        lookup = measure(lambda: collector._normalize_tables_by_lookup(rows), args.repeat)
+        compiled = measure(lambda: collector._normalize_tables_data(rows), args.repeat)
+        speedup = statistics.median(lookup) / statistics.median(compiled)
+        print(f"{name:<14}{'행마다 후보 키 조회':<24}{statistics.median(lookup):>12.1f}{min(lookup):>12.1f}{1:>7.1f}x")
+        print(f"{name:<14}{'첫 행 기준 itemgetter':<24}{statistics.median(compiled):>12.1f}{min(compiled):>12.1f}{speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
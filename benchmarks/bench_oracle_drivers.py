@@ -0,0 +1,77 @@
+"""
+Oracle 연결 방식 비교 벤치마크 (JDBC vs python-oracledb)
+
+같은 서버에 두 방식으로 각각 연결해 연결 시간과 메타데이터 조회 시간을 비교하고,
+두 방식의 조회 결과가 같은지 확인합니다. (실제 Oracle 서버 필요)
+
+사용법:
+    python benchmarks/bench_oracle_drivers.py --host HOST --port 1521 --database ORCLPDB1 \\
+        --username USER --password PASS [--oracle-type sid] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection_factory import DatabaseConnectionFactory  # noqa: E402
+
+STEPS = ['get_tables_info', 'get_foreign_keys_info', 'get_indexes_info']
+
+
+def run_driver(driver, args):
+    """한 방식으로 연결 후 단계별 소요 시간(ms)과 결과 반환"""
+    timings = {}
+    started = time.perf_counter()
+    conn = DatabaseConnectionFactory.create_connection(
+        dbms='Oracle', host=args.host, port=args.port, database=args.database,
+        username=args.username, password=args.password, oracle_type=args.oracle_type,
+        oracle_driver=driver
+    )
+    conn.connect()
+    timings['connect'] = (time.perf_counter() - started) * 1000
+    
+    results = {}
+    try:
+        for step in STEPS:
+            best = None
+            for _ in range(args.repeat):
+                step_started = time.perf_counter()
+                results[step] = getattr(conn, step)()
+                elapsed = (time.perf_counter() - step_started) * 1000
+                best = elapsed if best is None else min(best, elapsed)
+            timings[step] = best
+    finally:
+        conn.disconnect()
+    return timings, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Oracle JDBC / oracledb 비교 벤치마크")
+    parser.add_argument('--host', required=True)
+    parser.add_argument('--port', type=int, default=1521)
+    parser.add_argument('--database', required=True, help="서비스명 또는 SID")
+    parser.add_argument('--username', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--oracle-type', default='service_name', choices=['service_name', 'sid'])
+    parser.add_argument('--repeat', type=int, default=3, help="단계별 반복 횟수 (최소값 사용)")
+    args = parser.parse_args()
+    
+    # JDBC는 JVM 시작 시간이 연결 시간에 포함됨 (첫 실행 기준)
+    jdbc_timings, jdbc_results = run_driver('jdbc', args)
+    oracledb_timings, oracledb_results = run_driver('oracledb', args)
+    
+    print(f"{'단계':24s} {'JDBC':>12s} {'oracledb':>12s}")
+    for step in ['connect'] + STEPS:
+        print(f"{step:24s} {jdbc_timings[step]:10.1f}ms {oracledb_timings[step]:10.1f}ms")
+        
+    for step in STEPS:
+        same = jdbc_results[step] == oracledb_results[step]
+        print(f"{step}: {len(jdbc_results[step])}행 / {len(oracledb_results[step])}행 "
+              f"({'결과 동일' if same else '결과 다름'})")
+
+
+if __name__ == '__main__':
+    main()
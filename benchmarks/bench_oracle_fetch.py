@@ -0,0 +1,110 @@
+"""
+Oracle JDBC 결과 변환 벤치마크
+
+DB 없이 CachedRowSet으로 user_tab_columns 형태의 결과를 만들어
+기존 방식(셀마다 getObject + str)과 컬럼 타입별 변환 방식을 비교합니다.
+
+사용법:
+    python benchmarks/bench_oracle_fetch.py [--rows 300000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jpype  # noqa: E402
+
+from database.jdbc_oracle_connection import ensure_jvm_started, fetch_result_set  # noqa: E402
+
+# (컬럼명, java.sql.Types 값)
+COLUMNS = [
+    ('TABLE_NAME', 12),   # VARCHAR
+    ('NO', 2),            # NUMERIC
+    ('컬럼명', 12),
+    ('TYPE', 12),
+    ('NULLABLE', 1),      # CHAR
+    ('KEY_TYPE', 12),
+    ('설명', 12),
+]
+
+
+def build_row_set(rows):
+    """user_tab_columns 조회 결과와 비슷한 CachedRowSet 생성"""
+    RowSetProvider = jpype.JClass('javax.sql.rowset.RowSetProvider')
+    RowSetMetaDataImpl = jpype.JClass('javax.sql.rowset.RowSetMetaDataImpl')
+    BigDecimal = jpype.JClass('java.math.BigDecimal')
+    
+    meta_data = RowSetMetaDataImpl()
+    meta_data.setColumnCount(len(COLUMNS))
+    for i, (name, sql_type) in enumerate(COLUMNS, start=1):
+        meta_data.setColumnName(i, name)
+        meta_data.setColumnLabel(i, name)
+        meta_data.setColumnType(i, sql_type)
+        
+    row_set = RowSetProvider.newFactory().createCachedRowSet()
+    row_set.setMetaData(meta_data)
+    for r in range(rows):
+        row_set.moveToInsertRow()
+        row_set.updateString(1, f"TABLE_{r // 40:05d}")
+        row_set.updateBigDecimal(2, BigDecimal(r % 40 + 1))
+        row_set.updateString(3, f"COLUMN_{r % 40:02d}")
+        row_set.updateString(4, 'VARCHAR2(100)')
+        row_set.updateString(5, 'Y' if r % 3 else 'N')
+        row_set.updateString(6, 'PRI' if r % 40 == 0 else '')
+        row_set.updateString(7, f"설명 {r}")
+        row_set.insertRow()
+    row_set.moveToCurrentRow()
+    return row_set
+
+
+def legacy_fetch(result_set):
+    """기존 execute_query의 변환 루프"""
+    meta_data = result_set.getMetaData()
+    columns = [str(meta_data.getColumnLabel(i)).lower() for i in range(1, meta_data.getColumnCount() + 1)]
+    result = []
+    while result_set.next():
+        row_dict = {}
+        for i, column_name in enumerate(columns, 1):
+            value = result_set.getObject(i)
+            row_dict[column_name] = None if value is None else str(value)
+        result.append(row_dict)
+    return result
+
+
+def measure(label, fetch, row_set, repeat):
+    """fetch 함수 실행 시간 측정 (최소값 출력)"""
+    best = None
+    for _ in range(repeat):
+        row_set.beforeFirst()
+        started = time.perf_counter()
+        rows = fetch(row_set)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {label:8s} {best * 1000:10.1f}ms  ({len(rows) / best:,.0f} rows/s)")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Oracle JDBC 결과 변환 벤치마크")
+    parser.add_argument('--rows', type=int, default=300000, help="결과 행 수")
+    parser.add_argument('--repeat', type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+    
+    ensure_jvm_started()
+    print(f"결과 생성 중... ({args.rows:,}행)")
+    row_set = build_row_set(args.rows)
+    
+    print("변환 시간 (최소값)")
+    legacy_rows = measure('legacy', legacy_fetch, row_set, args.repeat)
+    typed_rows = measure('typed', fetch_result_set, row_set, args.repeat)
+    
+    # NO 컬럼은 문자열 대신 정수로 받는지 확인
+    assert len(legacy_rows) == len(typed_rows)
+    assert typed_rows[0]['no'] == int(legacy_rows[0]['no'])
+
+
+if __name__ == '__main__':
+    main()
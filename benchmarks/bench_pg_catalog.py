@@ -0,0 +1,126 @@
+"""
+PostgreSQL 카탈로그 조회 벤치마크 (information_schema vs pg_catalog)
+
+이전 방식(information_schema JOIN + PK/FK 별도 조회)과 pg_catalog OID 조인 쿼리의
+테이블+컬럼 조회 시간을 비교합니다. --create로 대상 DB의 public 스키마에
+벤치마크용 테이블(bench_t00000 ...)을 만들 수 있습니다. (실제 PostgreSQL 서버 필요)
+
+사용법:
+    python benchmarks/bench_pg_catalog.py --host HOST --database DB --username USER \\
+        --password PASS [--create 10000] [--drop] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.postgresql_connection import PostgreSQLConnection  # noqa: E402
+
+# 이전 get_tables_info 방식 (information_schema, relname만으로 pg_class 조인)
+LEGACY_QUERIES = [
+    """
+    SELECT t.table_name, COALESCE(pgd.description, '') AS 테이블설명,
+           col.ordinal_position AS NO, col.column_name AS 컬럼명, col.data_type AS TYPE,
+           COALESCE(col.column_default, '') AS DEFAULT_VALUE, col.is_nullable AS NULLABLE
+    FROM information_schema.tables t
+    JOIN information_schema.columns col
+      ON t.table_name = col.table_name AND t.table_schema = col.table_schema
+    LEFT JOIN pg_class pgc ON pgc.relname = t.table_name
+    LEFT JOIN pg_description pgd ON pgd.objoid = pgc.oid AND pgd.objsubid = 0
+    WHERE t.table_schema = 'public' AND t.table_type IN ('BASE TABLE', 'VIEW')
+    ORDER BY t.table_name, col.ordinal_position
+    """,
+    """
+    SELECT ku.table_name, ku.column_name
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage ku ON tc.constraint_name = ku.constraint_name
+    WHERE tc.constraint_type = 'PRIMARY KEY' AND tc.table_schema = 'public'
+    """,
+    """
+    SELECT ku.table_name, ku.column_name
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage ku ON tc.constraint_name = ku.constraint_name
+    WHERE tc.constraint_type = 'FOREIGN KEY' AND tc.table_schema = 'public'
+    """
+]
+
+
+def legacy_tables_info(conn):
+    """이전 방식으로 테이블+컬럼 조회 후 KEY_TYPE 계산"""
+    tables_data, pk_data, fk_data = [conn.execute_query(query) for query in LEGACY_QUERIES]
+    pk_columns = {(row['table_name'], row['column_name']) for row in pk_data}
+    fk_columns = {(row['table_name'], row['column_name']) for row in fk_data}
+    for row in tables_data:
+        key = (row['table_name'], row['컬럼명'])
+        row['KEY_TYPE'] = 'PRI' if key in pk_columns else 'MUL' if key in fk_columns else ''
+    return tables_data
+
+
+def create_tables(conn, count):
+    """벤치마크용 테이블 생성 (PK, FK, 코멘트 포함)"""
+    with conn.get_cursor() as cursor:
+        for i in range(count):
+            name = f"bench_t{i:05d}"
+            parent = f", parent_id integer REFERENCES bench_t{i - 1:05d}(id)" if i else ""
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {name} ("
+                f"id serial PRIMARY KEY, code varchar(20) UNIQUE, amount numeric(12,2) DEFAULT 0, "
+                f"created_at timestamp DEFAULT now(){parent})"
+            )
+            cursor.execute(f"COMMENT ON COLUMN {name}.code IS '코드 {i}'")
+            if i % 1000 == 0:
+                print(f"  {i:,}/{count:,} 테이블 생성")
+
+
+def drop_tables(conn):
+    """벤치마크용 테이블 삭제"""
+    rows = conn.execute_query("SELECT tablename FROM pg_tables WHERE tablename LIKE 'bench\\_t%%'")
+    with conn.get_cursor() as cursor:
+        for row in rows:
+            cursor.execute(f"DROP TABLE IF EXISTS {row['tablename']} CASCADE")
+
+
+def measure(label, func, repeat):
+    """실행 시간 측정 (최소값)"""
+    best, rows = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = func()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {label:16s} {best:10.1f}ms  ({len(rows):,}행)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PostgreSQL 카탈로그 조회 벤치마크")
+    parser.add_argument('--host', required=True)
+    parser.add_argument('--port', type=int, default=5432)
+    parser.add_argument('--database', required=True)
+    parser.add_argument('--username', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--create', type=int, default=0, help="생성할 벤치마크 테이블 수")
+    parser.add_argument('--drop', action='store_true', help="종료 시 벤치마크 테이블 삭제")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    conn = PostgreSQLConnection(args.host, args.port, args.database, args.username, args.password)
+    conn.connect()
+    try:
+        if args.create:
+            print(f"벤치마크 테이블 생성 중... ({args.create:,}개)")
+            create_tables(conn, args.create)
+            
+        print("테이블+컬럼 조회 시간 (최소값)")
+        measure('information_schema', lambda: legacy_tables_info(conn), args.repeat)
+        measure('pg_catalog', conn.get_tables_info, args.repeat)
+    finally:
+        if args.drop:
+            drop_tables(conn)
+        conn.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+PostgreSQL 카탈로그 조회 벤치마크 (psycopg 3 파이프라인 vs 순차 실행)
+
+같은 서버에서 get_catalog()(버전, 테이블+컬럼, 외래키, 인덱스)를 아래 방식별로 실행해
+소요 시간을 비교합니다. 네트워크 지연이 큰 환경일수록 파이프라인 모드의 이점이 커집니다.
+(실제 PostgreSQL 서버 필요)
+
+    - psycopg 파이프라인: 네 쿼리를 한 번에 전송 (바이너리 프로토콜, 튜플 행)
+    - psycopg 순차 실행: 같은 드라이버로 쿼리를 하나씩 실행
+    - psycopg2 순차 실행: 기존 방식 (RealDictCursor)
+
+사용법:
+    python benchmarks/bench_pg_pipeline.py --host HOST --database DB --username USER \\
+        --password PASS [--port 5432] [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import POSTGRESQL_CONFIG  # noqa: E402
+from database.postgresql_connection import PostgreSQLConnection  # noqa: E402
+
+
+def run_mode(driver, pipeline, args):
+    """방식 하나로 카탈로그 조회를 반복 실행 (소요 시간 목록, 마지막 결과 반환)"""
+    POSTGRESQL_CONFIG["pipeline"] = pipeline
+    conn = PostgreSQLConnection(args.host, args.port, args.database, args.username, args.password,
+                                driver=driver)
+    conn.connect()
+    try:
+        timings = []
+        catalog = None
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            catalog = conn.get_catalog()
+            # 순차 실행 방식은 행 이터레이터를 반환하므로 순서대로 모두 읽어야 조회가 끝남
+            for key in ('tables', 'foreign_keys', 'indexes'):
+                catalog[key] = list(catalog[key])
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings, catalog
+    finally:
+        conn.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PostgreSQL 파이프라인 모드 벤치마크")
+    parser.add_argument('--host', required=True)
+    parser.add_argument('--port', type=int, default=5432)
+    parser.add_argument('--database', required=True)
+    parser.add_argument('--username', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    
+    modes = [
+        ("psycopg 파이프라인", 'psycopg', True),
+        ("psycopg 순차 실행", 'psycopg', False),
+        ("psycopg2 순차 실행", 'psycopg2', False),
+    ]
+    
+    baseline = None
+    for label, driver, pipeline in modes:
+        try:
+            timings, catalog = run_mode(driver, pipeline, args)
+        except ImportError as e:
+            print(f"{label:20s} 건너뜀 (설치되지 않음: {e})")
+            continue
+            
+        counts = tuple(len(catalog[key]) for key in ('tables', 'foreign_keys', 'indexes'))
+        if baseline is None:
+            baseline = counts
+        elif counts != baseline:
+            print(f"  경고: {label} 결과 행 수가 다릅니다: {counts} != {baseline}")
+            
+        print(f"{label:20s} 중앙값 {statistics.median(timings):9.1f} ms  "
+              f"최소 {min(timings):9.1f} ms  (컬럼 {counts[0]}행, FK {counts[1]}행, 인덱스 {counts[2]}행)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+외래키/인덱스 조회 벤치마크 (테이블 20,000개, 외래키 약 20,000개 합성 카탈로그)
+
+명세서 한 장을 만들 때 필요한 조회(테이블별 외래키/인덱스, 컬럼별 참조 외래키)를
+전체 목록을 훑는 기존 방식과 RelationshipIndex 조회로 각각 측정합니다.
+기존 방식은 테이블 수 x 외래키 수에 비례하므로 일부 테이블(--sample)만 측정해 전체 시간을 추정합니다. (DB 서버 불필요)
+
+사용법:
+    python benchmarks/bench_relationship_index.py [--tables 20000] [--columns 15] [--sample 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model import SchemaModel, RelationshipIndex  # noqa: E402
+from bench_snapshot_load import build_metadata  # noqa: E402
+
+
+def scan_lookups(schema, tables):
+    """기존 방식: 테이블마다 전체 외래키/인덱스 목록을 훑고, 컬럼마다 다시 외래키 목록을 훑음"""
+    found = 0
+    for table in tables:
+        found += len([fk for fk in schema.foreign_keys if fk.table_name == table.name])
+        found += len([idx for idx in schema.indexes if idx.table_name == table.name])
+        for column in table.columns:
+            for fk in schema.foreign_keys:
+                if fk.table_name == table.name and fk.column_name == column.name:
+                    found += 1
+                    break
+    return found
+
+
+def index_lookups(relationships, tables):
+    """색인 방식: 테이블/컬럼별로 바로 조회"""
+    found = 0
+    for table in tables:
+        found += len(relationships.table_foreign_keys(table.name))
+        found += len(relationships.table_indexes(table.name))
+        for column in table.columns:
+            if relationships.foreign_key(table.name, column.name) is not None:
+                found += 1
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="외래키/인덱스 조회 벤치마크")
+    parser.add_argument('--tables', type=int, default=20000)
+    parser.add_argument('--columns', type=int, default=15)
+    parser.add_argument('--sample', type=int, default=200, help="기존 방식으로 측정할 테이블 수")
+    args = parser.parse_args()
+    
+    metadata = build_metadata(args.tables, args.columns)
+    schema = SchemaModel.from_metadata(metadata)
+    tables = list(schema.iter_tables())
+    sample = tables[:args.sample]
+    print(f"합성 카탈로그: 테이블 {len(tables):,}개, 외래키 {len(schema.foreign_keys):,}개, "
+          f"인덱스 {len(schema.indexes):,}개")
+    
+    started = time.perf_counter()
+    relationships = RelationshipIndex(schema.foreign_keys, schema.indexes)
+    build_ms = (time.perf_counter() - started) * 1000
+    
+    started = time.perf_counter()
+    index_found = index_lookups(relationships, tables)
+    index_ms = (time.perf_counter() - started) * 1000
+    
+    started = time.perf_counter()
+    scan_found = scan_lookups(schema, sample)
+    scan_ms = (time.perf_counter() - started) * 1000
+    assert scan_found == index_lookups(relationships, sample), "두 방식의 조회 결과가 다릅니다."
+    estimated_ms = scan_ms * len(tables) / max(len(sample), 1)
+    
+    print(f"색인 생성: {build_ms:.1f}ms")
+    print(f"색인 조회 (전체 {len(tables):,}개 테이블): {index_ms:.1f}ms (조회 결과 {index_found:,}건)")
+    print(f"목록 훑기 ({len(sample):,}개 테이블): {scan_ms:.1f}ms → 전체 추정 {estimated_ms / 1000:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+스키마 모델 메모리 벤치마크 (150,000개 컬럼 합성 카탈로그)
+
+DB 드라이버가 돌려주는 것처럼 행마다 새 문자열 객체를 가진 정규화 행 딕셔너리 목록과,
+같은 행으로 만든 스키마 모델(__slots__ 객체 + intern 문자열)이 차지하는 메모리를 tracemalloc으로 비교하고
+모델 생성 시간과 행 뷰로 다시 읽는 시간을 측정합니다. (DB 서버 불필요)
+
+사용법:
+    python benchmarks/bench_schema_model.py [--tables 10000] [--columns 15]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model import SchemaModel  # noqa: E402
+
+
+def fresh(text):
+    """드라이버가 행마다 새로 만드는 문자열처럼 같은 내용의 새 객체 생성"""
+    return ''.join(list(text))
+
+
+def build_rows(table_count, column_count):
+    """수집기 정규화 결과와 같은 형식의 합성 행 (문자열은 행마다 새 객체)"""
+    tables, foreign_keys, indexes = [], [], []
+    for t in range(table_count):
+        table_name = f"tb_table_{t:06d}"
+        for c in range(1, column_count + 1):
+            tables.append({
+                'table_name': fresh(table_name),
+                'table_comment': f"테이블 {t}",
+                'column_position': c,
+                'column_name': fresh('id') if c == 1 else f"col_{c:02d}",
+                'data_type': fresh('bigint') if c == 1 else fresh('varchar(100)' if c % 3 else 'datetime'),
+                'default_value': fresh('' if c % 4 else 'CURRENT_TIMESTAMP'),
+                'is_nullable': fresh('NO' if c == 1 else 'YES'),
+                'key_type': fresh('PRI' if c == 1 else ''),
+                'extra': fresh('auto_increment' if c == 1 else ''),
+                'column_comment': f"컬럼 {c} 설명"
+            })
+        indexes.append({
+            'table_name': fresh(table_name), 'index_name': fresh('PRIMARY'), 'non_unique': 0,
+            'column_name': fresh('id'), 'seq_in_index': 1
+        })
+        if t:
+            foreign_keys.append({
+                'table_name': fresh(table_name), 'column_name': fresh('col_02'),
+                'referenced_table_name': f"tb_table_{t - 1:06d}", 'referenced_column_name': fresh('id'),
+                'constraint_name': f"fk_{t:06d}"
+            })
+    return tables, foreign_keys, indexes
+
+
+def traced_size():
+    """현재 tracemalloc으로 추적 중인 메모리 (MB)"""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스키마 모델 메모리 벤치마크")
+    parser.add_argument('--tables', type=int, default=10000)
+    parser.add_argument('--columns', type=int, default=15)
+    args = parser.parse_args()
+    
+    tracemalloc.start()
+    base = traced_size()
+    tables, foreign_keys, indexes = build_rows(args.tables, args.columns)
+    rows_mb = traced_size() - base
+    print(f"합성 카탈로그: 테이블 {args.tables:,}개, 컬럼 {len(tables):,}개, "
+          f"외래키 {len(foreign_keys):,}개, 인덱스 {len(indexes):,}개")
+    
+    started = time.perf_counter()
+    schema = SchemaModel.from_rows(tables, foreign_keys, indexes)
+    build_ms = (time.perf_counter() - started) * 1000
+    tables = foreign_keys = indexes = None
+    model_mb = traced_size() - base
+    tracemalloc.stop()
+    
+    metadata = schema.attach({})
+    started = time.perf_counter()
+    row_count = sum(1 for _ in metadata['tables'])
+    view_ms = (time.perf_counter() - started) * 1000
+    assert row_count == schema.column_count, "행 뷰의 행 수가 모델과 다릅니다."
+    
+    print(f"{'구조':<28}{'메모리(MB)':>12}")
+    print(f"{'정규화 행 딕셔너리':<28}{rows_mb:>12.1f}")
+    print(f"{'스키마 모델 (__slots__+intern)':<28}{model_mb:>12.1f}  ({model_mb / rows_mb:.0%})")
+    print(f"모델 생성(tracemalloc 추적 중): {build_ms:.1f}ms, 행 뷰로 전체 행 읽기: {view_ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
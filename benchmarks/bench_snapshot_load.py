@@ -0,0 +1,138 @@
+"""
+스냅샷 읽기 벤치마크 (20,000개 테이블 합성 카탈로그)
+
+합성 메타데이터를 스냅샷 파일로 저장한 뒤 읽기 시간을 측정하고,
+행마다 키를 반복하는 일반 JSON(gzip) 파일과 파일 크기/읽기 시간을 비교합니다.
+mmap 저장소는 열기(색인 읽기)와 테이블 하나 조회 시간을 함께 측정합니다.
+(DB 서버 불필요, 같은 카탈로그의 실제 수집 시간과 비교하려면 수집 로그의 수집 시간을 참고)
+
+사용법:
+    python benchmarks/bench_snapshot_load.py [--tables 20000] [--columns 15] [--repeat 5]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snapshot import save_snapshot, load_snapshot, read_snapshot_header, write_store, SnapshotStore  # noqa: E402
+
+
+def build_metadata(table_count, column_count):
+    """수집기 정규화 결과와 같은 형식의 합성 메타데이터"""
+    tables, foreign_keys, indexes = [], [], []
+    for t in range(table_count):
+        table_name = f"tb_table_{t:06d}"
+        for c in range(1, column_count + 1):
+            tables.append({
+                'table_name': table_name,
+                'table_comment': f"테이블 {t}",
+                'column_position': c,
+                'column_name': 'id' if c == 1 else f"col_{c:02d}",
+                'data_type': 'bigint' if c == 1 else ('varchar(100)' if c % 3 else 'datetime'),
+                'default_value': '' if c % 4 else 'CURRENT_TIMESTAMP',
+                'is_nullable': 'NO' if c == 1 else 'YES',
+                'key_type': 'PRI' if c == 1 else '',
+                'extra': 'auto_increment' if c == 1 else '',
+                'column_comment': f"컬럼 {c} 설명"
+            })
+        indexes.append({
+            'table_name': table_name, 'index_name': 'PRIMARY', 'non_unique': 0,
+            'column_name': 'id', 'seq_in_index': 1
+        })
+        if t:
+            foreign_keys.append({
+                'table_name': table_name, 'column_name': 'col_02',
+                'referenced_table_name': f"tb_table_{t - 1:06d}", 'referenced_column_name': 'id',
+                'constraint_name': f"fk_{t:06d}"
+            })
+            indexes.append({
+                'table_name': table_name, 'index_name': f"ix_{t:06d}", 'non_unique': 1,
+                'column_name': 'col_02', 'seq_in_index': 1
+            })
+    return {
+        'connection_info': {
+            'dbms': 'MySQL/MariaDB', 'host': 'localhost', 'port': 3306, 'database': 'bench',
+            'username': 'bench', 'version': 'MySQL 8.0.36', 'collection_time': time.strftime("%Y-%m-%d %H:%M:%S")
+        },
+        'tables': tables,
+        'foreign_keys': foreign_keys,
+        'indexes': indexes,
+        'statistics': {
+            'total_tables': table_count,
+            'total_columns': len(tables),
+            'total_foreign_keys': len(foreign_keys),
+            'collection_duration_ms': 0
+        }
+    }
+
+
+def measure(func, repeat):
+    """반복 실행 소요 시간 목록 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스냅샷 읽기 벤치마크")
+    parser.add_argument('--tables', type=int, default=20000)
+    parser.add_argument('--columns', type=int, default=15)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    
+    metadata = build_metadata(args.tables, args.columns)
+    print(f"합성 카탈로그: 테이블 {args.tables:,}개, 컬럼 {len(metadata['tables']):,}개, "
+          f"외래키 {len(metadata['foreign_keys']):,}개, 인덱스 {len(metadata['indexes']):,}개")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        snapshot_path = os.path.join(temp_dir, 'bench.dbsnap')
+        rows_path = os.path.join(temp_dir, 'bench_rows.json.gz')
+        store_path = os.path.join(temp_dir, 'bench.dbstore')
+        
+        save_ms = measure(lambda: save_snapshot(metadata, snapshot_path), 1)[0]
+        with gzip.open(rows_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            json.dump(metadata, f, ensure_ascii=False)
+        write_store(metadata, store_path)
+        
+        def load_rows():
+            with gzip.open(rows_path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+                
+        def open_store_and_get_table():
+            with SnapshotStore(store_path) as store:
+                return store.get_table(store.table_names[len(store) // 2])
+                
+        results = [
+            ("스냅샷 (열 단위, 체크섬 확인)", os.path.getsize(snapshot_path),
+             measure(lambda: load_snapshot(snapshot_path), args.repeat)),
+            ("스냅샷 (체크섬 생략)", os.path.getsize(snapshot_path),
+             measure(lambda: load_snapshot(snapshot_path, verify=False), args.repeat)),
+            ("스냅샷 헤더만", os.path.getsize(snapshot_path),
+             measure(lambda: read_snapshot_header(snapshot_path), args.repeat)),
+            ("일반 JSON (행 단위, gzip)", os.path.getsize(rows_path),
+             measure(load_rows, args.repeat)),
+            ("mmap 저장소 열기 + 테이블 1개", os.path.getsize(store_path),
+             measure(open_store_and_get_table, args.repeat)),
+        ]
+        
+        loaded = load_snapshot(snapshot_path)
+        assert loaded['tables'] == metadata['tables'], "스냅샷 왕복 결과가 원본과 다릅니다."
+        
+    print(f"스냅샷 저장: {save_ms:.1f}ms")
+    print(f"{'방식':<32}{'파일 크기':>12}{'중앙값(ms)':>12}{'최소(ms)':>12}")
+    for name, size, timings in results:
+        print(f"{name:<32}{size / 1024 / 1024:>10.2f}MB{statistics.median(timings):>12.1f}{min(timings):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
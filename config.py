@@ -39,7 +39,9 @@ SUPPORTED_DBMS = {
 FILE_CONFIG = {
     "default_filename": "DB산출물.xlsx",
     "excel_extensions": [".xlsx", ".xls"],
-    "encoding": "utf-8"
+    "encoding": "utf-8",
+    "user_data_dir": "~/.dboutput",        # 사용자 설정/캐시 저장 위치
+    "settings_filename": "settings.json"   # 마지막 사용 DBMS 등 (비밀번호는 저장하지 않음)
 }
 
 # UI 메시지
@@ -63,4 +65,113 @@ ERROR_MESSAGES = {
     "empty_username": "사용자 ID를 입력해주세요.",
     "empty_filename": "파일명을 입력해주세요.",
     "invalid_filename": "올바른 파일명을 입력해주세요."
-}
\ No newline at end of file
+}
+
+# 연결 풀 설정
+POOL_CONFIG = {
+    "max_connections_per_key": 4,   # 연결 키별 최대 연결 수 (사용 중 + 유휴)
+    "idle_timeout": 300,            # 유휴 연결 제거 시간 (초)
+    "evict_interval": 60,           # 유휴 연결 정리 주기 (초, 풀에 유휴 연결이 있는 동안만 실행)
+    "validate_on_checkout": True    # 풀에서 꺼낼 때 연결 유효성 확인
+}
+
+# 메타데이터 병렬 수집 설정 (테이블을 나누어 여러 연결로 동시에 조회)
+PARALLEL_COLLECT_CONFIG = {
+    # DBMS별 최대 동시 연결 수 (운영 DB 부하 제한, 1이면 병렬 수집 안 함, 연결 풀 최대 연결 수 이하로 적용)
+    "workers": {
+        "MySQL": 2,
+        "MariaDB": 2,
+        "PostgreSQL": 2,
+        "Oracle": 4
+    },
+    "min_tables_per_partition": 500   # 분할 하나에 넣을 최소 테이블 수 (작은 스키마는 나누지 않음)
+}
+
+# 증분 수집 설정 (이전 수집 후 구조가 바뀐 테이블만 다시 조회)
+INCREMENTAL_CONFIG = {
+    "enabled": True,
+    "state_dir": "incremental"   # 사용자 데이터 디렉토리 아래 상태 파일 위치 (연결 키별 JSON, 인증 정보 제외)
+}
+
+# 메타데이터 캐시 설정 (연결 키 + 서버 버전별 SQLite 캐시, 인증 정보 제외)
+CACHE_CONFIG = {
+    "enabled": True,
+    "filename": "metadata_cache.sqlite3",   # 사용자 데이터 디렉토리 아래 캐시 파일
+    "ttl_seconds": 7 * 24 * 3600,           # 캐시 유효 기간 (초, 지나면 다시 조회)
+    "max_bytes": 200 * 1024 * 1024,         # 최대 캐시 크기 (초과 시 오래 사용하지 않은 항목부터 삭제)
+    "background_refresh": True              # 캐시된 테이블 목록으로 바로 시작한 뒤 백그라운드에서 최신 여부 확인
+}
+
+# 스키마 스냅샷 설정 (DB 연결 없이 명세서를 다시 생성하기 위한 압축 파일)
+SNAPSHOT_CONFIG = {
+    "extension": ".dbsnap",
+    "store_extension": ".dbstore",   # 테이블 단위로 읽는 mmap 저장소 파일 (스냅샷에서 생성)
+    "compresslevel": 6,              # gzip 압축 수준 (1: 빠름 ~ 9: 작음)
+    "save_with_spec": True           # 명세서 생성 시 같은 위치에 스냅샷도 저장
+}
+
+# Arrow/Parquet 내보내기 설정 (pyarrow 설치 시 사용)
+EXPORT_CONFIG = {
+    "directory_suffix": "_parquet",  # 명세서/스냅샷 이름 뒤에 붙여 만드는 내보내기 폴더
+    "compression": "zstd",           # Parquet 압축 방식 (zstd, snappy, gzip, none)
+    "save_with_spec": False          # 배치 모드에서 명세서와 함께 Parquet 파일도 저장
+}
+
+# 여러 데이터베이스 일괄 생성(배치 모드) 설정
+BATCH_CONFIG = {
+    "workers": None,                  # 동시에 처리할 대상 수 (작업 프로세스 수, None이면 CPU 코어 수)
+    "output_dir": "batch_output",     # 명세서와 요약 보고서 저장 위치
+    "connect_timeout": 30             # 대상별 연결 시간 제한 (초)
+}
+
+# GUI 작업 세션 설정
+SESSION_CONFIG = {
+    "keepalive_interval": 60   # 테이블 선택 창이 열려 있는 동안 keepalive 간격 (초)
+}
+
+# Oracle JDBC용 JVM 설정
+JVM_CONFIG = {
+    "max_heap": "512m",          # -Xmx (대용량 딕셔너리는 1g 이상 권장)
+    "initial_heap": None,        # -Xms (None이면 JVM 기본값)
+    "gc_options": [],            # 예: ["-XX:+UseSerialGC"] (짧게 실행되는 작업에 유리)
+    "extra_options": [],         # 기타 JVM 옵션
+    "use_cds_archive": True,     # AppCDS 아카이브 사용 (Java 13 이상에서만 적용)
+    "cds_archive_dir": None      # 아카이브 저장 위치 (None이면 사용자 데이터 디렉토리)
+}
+
+# Oracle JDBC 결과 조회 설정
+ORACLE_FETCH_CONFIG = {
+    "fetch_size": 1000,      # Statement.setFetchSize (왕복 1회당 가져올 행 수)
+    "row_prefetch": 1000     # 연결 속성 defaultRowPrefetch
+}
+
+# Oracle 연결 방식 설정
+ORACLE_CONFIG = {
+    "driver": "auto",        # 'auto'(oracledb 설치 시 우선 사용), 'oracledb', 'jdbc'
+    "thick_mode": False,     # thin 모드 실패 시 Oracle Client(thick 모드)로 재시도
+    "arraysize": 1000,       # 한 번에 가져올 행 수 (cursor.arraysize)
+    "prefetchrows": 1000     # 쿼리 실행 시 미리 가져올 행 수 (cursor.prefetchrows)
+}
+
+# MySQL/MariaDB 드라이버 설정
+MYSQL_CONFIG = {
+    "driver": "auto",           # 'auto'(mysqlclient 설치 시 우선 사용), 'mysqlclient', 'pymysql'
+    "multi_statements": True,   # 카탈로그 쿼리를 다중 문장 한 번으로 실행 (네트워크 왕복 1회)
+    # MySQL 5.7 이하/MariaDB: 테이블 단위 조회 설정 (.frm 파일 열기와 메타데이터 잠금 경합 최소화)
+    "legacy_catalog": {
+        "batch_tables": 20,             # 시작 배치 크기 (테이블 수)
+        "max_batch_tables": 200,        # 최대 배치 크기
+        "target_batch_seconds": 0.5,    # 배치 1회 목표 시간 (초과 시 배치 크기 축소)
+        "pause_ratio": 0.5,             # 배치 소요 시간 대비 쉬는 시간 비율
+        "lock_wait_timeout": 2,         # 세션 lock_wait_timeout (DDL을 오래 막지 않도록)
+        "lock_retries": 3,              # 잠금 대기 초과 시 배치 재시도 횟수
+        "time_budget": 600              # 전체 조회 제한 시간 (초)
+    }
+}
+
+# PostgreSQL 드라이버 설정
+POSTGRESQL_CONFIG = {
+    "driver": "auto",    # 'auto'(psycopg 3 설치 시 우선 사용), 'psycopg', 'psycopg2'
+    "pipeline": True,    # psycopg 3 파이프라인 모드로 카탈로그 쿼리를 한 번에 전송
+    "itersize": 2000     # 서버 측(이름 있는) 커서에서 한 번에 가져올 행 수
+}
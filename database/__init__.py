@@ -8,6 +8,7 @@
 - DatabaseConnectionFactory: DBMS별 연결 객체 생성
 - ConnectionManager: 연결 관리 및 테스트
 - BaseConnection: 모든 DB 연결의 기본 클래스
+- ConnectionSession: 연결 테스트부터 명세서 생성까지 하나의 연결을 유지하는 세션
 
 사용 예시:
     from database import connection_manager
@@ -25,13 +26,15 @@
 from .connection_factory import DatabaseConnectionFactory
 from .connection_manager import ConnectionManager, connection_manager
 from .data_collector import DatabaseMetadataCollector, metadata_collector
+from .session import ConnectionSession
 from .exceptions import (
     DatabaseConnectionError,
     DatabaseAuthenticationError, 
     DatabaseNotFoundError,
     DatabaseTimeoutError,
     DatabaseQueryError,
-    UnsupportedDatabaseError
+    UnsupportedDatabaseError,
+    OracleThinModeUnsupportedError
 )
 
 __all__ = [
@@ -40,10 +43,12 @@ __all__ = [
     'connection_manager',
     'DatabaseMetadataCollector',
     'metadata_collector',
+    'ConnectionSession',
     'DatabaseConnectionError',
     'DatabaseAuthenticationError',
     'DatabaseNotFoundError', 
     'DatabaseTimeoutError',
     'DatabaseQueryError',
-    'UnsupportedDatabaseError'
+    'UnsupportedDatabaseError',
+    'OracleThinModeUnsupportedError'
 ]
\ No newline at end of file
@@ -4,10 +4,48 @@
 
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
+import itertools
 import time
 from .exceptions import DatabaseConnectionError, DatabaseTimeoutError
 
 
+# IN 목록 하나에 넣을 최대 테이블 수 (Oracle IN 목록 1000개 제한, 바인드 변수 개수 제한 회피)
+TABLE_FILTER_CHUNK_SIZE = 1000
+
+
+class PositionalRows:
+    """
+    컬럼명 목록과 값 튜플 행 (드라이버가 행을 딕셔너리로 바꾸지 않은 결과)
+    
+    수집기는 컬럼명으로 필드 위치를 한 번 정해 값 튜플을 그대로 읽습니다.
+    한 번만 순회할 수 있으며, 끝까지 읽거나 close()를 호출하면 on_close를 실행합니다.
+    """
+    
+    __slots__ = ('columns', '_rows', '_on_close')
+    
+    def __init__(self, columns, rows, on_close=None):
+        self.columns = list(columns)
+        self._rows = rows
+        self._on_close = on_close
+        
+    def __iter__(self):
+        try:
+            yield from self._rows
+        finally:
+            self.close()
+            
+    def iter_dicts(self):
+        """컬럼명과 묶은 딕셔너리 행으로 순회 (위치로 읽을 수 없는 경우용)"""
+        columns = self.columns
+        return (dict(zip(columns, row)) for row in self)
+        
+    def close(self):
+        """남은 행을 버리고 결과 정리"""
+        on_close, self._on_close = self._on_close, None
+        if on_close:
+            on_close()
+
+
 class BaseConnection(ABC):
     """데이터베이스 연결 기본 클래스"""
     
@@ -41,19 +79,61 @@ class BaseConnection(ABC):
         """쿼리 실행"""
         pass
         
+    def iter_query(self, query, params=None):
+        """
+        쿼리 결과를 한 행씩 반환
+        
+        기본 구현은 execute_query 결과를 순회합니다. 서버 측 커서로 나누어 가져올 수 있는
+        DBMS는 재정의해 전체 결과를 메모리에 올리지 않습니다.
+        """
+        yield from self.execute_query(query, params)
+        
+    def _fetch(self, query, params=None, stream=False):
+        """stream이면 행 이터레이터, 아니면 행 목록 반환"""
+        if stream:
+            return self.iter_query(query, params)
+        return self.execute_query(query, params)
+        
+    def _fetch_by_tables(self, build_query, params, table_names, stream=False):
+        """
+        테이블 목록 조건을 붙여 조회 (목록이 길면 TABLE_FILTER_CHUNK_SIZE개씩 나누어 실행)
+        
+        Args:
+            build_query (callable): 테이블명 바인드 변수 개수를 받아 쿼리 반환 (None이면 조건 없는 쿼리)
+            params (tuple): 테이블명 앞에 오는 바인드 변수 값
+            table_names (list): 조회할 테이블 목록 (None이면 전체)
+            stream (bool): True이면 행 이터레이터 반환
+        """
+        params = tuple(params or ())
+        if table_names is None:
+            return self._fetch(build_query(None), params, stream)
+            
+        # 정렬된 순서로 나누어 조회하면 결과도 테이블명 순서를 유지
+        names = sorted(set(table_names))
+        chunks = [names[start:start + TABLE_FILTER_CHUNK_SIZE]
+                  for start in range(0, len(names), TABLE_FILTER_CHUNK_SIZE)]
+        rows = itertools.chain.from_iterable(
+            self._fetch(build_query(len(chunk)), params + tuple(chunk), stream) for chunk in chunks
+        )
+        return rows if stream else list(rows)
+        
     @abstractmethod
     def get_dbms_name(self):
         """DBMS 이름 반환"""
         pass
         
+    def get_dbms_family(self):
+        """캐시·증분 수집 상태 키에 쓰는 DBMS 이름 (연결 방식이 달라도 같은 DB면 같은 값)"""
+        return self.get_dbms_name()
+        
     @abstractmethod
     def get_version(self):
         """DB 버전 정보 반환"""
         pass
     
     @abstractmethod
-    def get_tables_info(self):
-        """테이블 상세 정보 반환 (컬럼 포함)"""
+    def get_tables_info(self, table_names=None, stream=False):
+        """테이블 상세 정보 반환 (컬럼 포함, table_names가 있으면 해당 테이블만, stream이면 행 이터레이터)"""
         pass
     
     @abstractmethod
@@ -62,13 +142,64 @@ class BaseConnection(ABC):
         pass
     
     @abstractmethod
-    def get_foreign_keys_info(self):
-        """외래키 정보 반환"""
+    def get_foreign_keys_info(self, table_names=None, stream=False):
+        """외래키 정보 반환 (table_names가 있으면 해당 테이블만, stream이면 행 이터레이터)"""
         pass
     
     @abstractmethod
-    def get_indexes_info(self):
-        """인덱스 정보 반환"""
+    def get_indexes_info(self, table_names=None, stream=False):
+        """인덱스 정보 반환 (table_names가 있으면 해당 테이블만, stream이면 행 이터레이터)"""
+        pass
+        
+    def get_catalog(self, table_names=None):
+        """
+        메타데이터 수집에 필요한 카탈로그 전체 조회
+        
+        기본 구현은 쿼리를 차례로 실행합니다. 여러 결과를 한 번에 받을 수 있는 DBMS는 재정의합니다.
+        tables, foreign_keys, indexes는 행 이터레이터일 수 있으며, 이 경우 쿼리는 순회를 시작할 때
+        실행되므로 반드시 tables, foreign_keys, indexes 순서로 한 번씩 끝까지 소비해야 합니다.
+        중간에 멈추면 close()가 있는 결과는 close()를 호출해 커서를 정리해야 합니다.
+        
+        Args:
+            table_names (list): 조회할 테이블 목록 (None이면 전체, 조건은 서버에서 적용)
+            
+        Returns:
+            dict: version, tables, foreign_keys, indexes
+        """
+        return {
+            'version': self.get_version(),
+            'tables': self.get_tables_info(table_names, stream=True),
+            'foreign_keys': self.get_foreign_keys_info(table_names, stream=True),
+            'indexes': self.get_indexes_info(table_names, stream=True)
+        }
+        
+    def get_change_markers(self):
+        """
+        테이블별 변경 표시 조회 (증분 수집용)
+        
+        구조가 바뀌면 값이 달라지는 표시(DDL 시각 등)를 반환합니다. 지원하지 않는 DBMS는 None을 반환하며
+        이 경우 항상 전체를 수집합니다.
+        
+        Returns:
+            dict: 테이블명 -> 변경 표시 문자열
+        """
+        return None
+        
+    def ping(self):
+        """연결 유효성 확인 (연결 풀에서 꺼낼 때 사용)"""
+        if not self.is_connected:
+            return False
+        try:
+            return bool(self.test_connection())
+        except Exception:
+            return False
+            
+    def attach_thread(self):
+        """작업 스레드에서 연결을 사용하기 전 호출 (스레드별 준비가 필요한 드라이버만 재정의)"""
+        pass
+        
+    def detach_thread(self):
+        """작업 스레드에서 연결 사용을 마친 후 호출"""
         pass
         
     @contextmanager
@@ -2,9 +2,11 @@
 데이터베이스 연결 팩토리
 """
 
+from config import ORACLE_CONFIG
 from .mysql_connection import MySQLConnection
 from .postgresql_connection import PostgreSQLConnection
 from .jdbc_oracle_connection import JdbcOracleConnection
+from .oracle_connection import OracleConnection, is_oracledb_available
 from .exceptions import UnsupportedDatabaseError
 
 
@@ -16,11 +18,31 @@ class DatabaseConnectionFactory:
         'MySQL': MySQLConnection,
         'MariaDB': MySQLConnection,  # MariaDB는 MySQL 드라이버 사용
         'PostgreSQL': PostgreSQLConnection,
-        'Oracle': JdbcOracleConnection  # JDBC 방식 Oracle 연결
+        'Oracle': JdbcOracleConnection  # JDBC 방식 Oracle 연결 (oracledb 방식은 get_oracle_driver로 결정)
     }
     
+    # Oracle 연결 방식별 클래스
+    ORACLE_DRIVER_CLASSES = {
+        'jdbc': JdbcOracleConnection,
+        'oracledb': OracleConnection
+    }
+    
+    @classmethod
+    def get_oracle_driver(cls):
+        """
+        설정에 따른 Oracle 연결 방식 반환
+        
+        Returns:
+            str: 'oracledb' 또는 'jdbc' ('auto'이면 oracledb 설치 여부로 결정)
+        """
+        driver = ORACLE_CONFIG.get("driver", "auto")
+        if driver == 'auto':
+            return 'oracledb' if is_oracledb_available() else 'jdbc'
+        return driver
+        
     @classmethod
-    def create_connection(cls, dbms, host, port, database, username, password, timeout=30, oracle_type=None):
+    def create_connection(cls, dbms, host, port, database, username, password, timeout=30, oracle_type=None,
+                          oracle_driver=None):
         """
         DBMS 종류에 따라 적절한 연결 객체 생성
         
@@ -33,6 +55,7 @@ class DatabaseConnectionFactory:
             password (str): 비밀번호
             timeout (int): 연결 시간 제한 (초)
             oracle_type (str): Oracle 연결 방식 ('service_name' 또는 'sid')
+            oracle_driver (str): Oracle 드라이버 ('oracledb' 또는 'jdbc', None이면 설정값)
             
         Returns:
             BaseConnection: 데이터베이스 연결 객체
@@ -45,8 +68,9 @@ class DatabaseConnectionFactory:
             
         connection_class = cls.CONNECTION_CLASSES[dbms]
         
-        # Oracle DBMS인 경우 oracle_type 파라미터 추가
+        # Oracle DBMS인 경우 드라이버 선택 및 oracle_type 파라미터 추가
         if dbms == 'Oracle':
+            connection_class = cls.ORACLE_DRIVER_CLASSES[oracle_driver or cls.get_oracle_driver()]
             return connection_class(
                 host=host,
                 port=port,
@@ -5,25 +5,135 @@
 import threading
 import time
 from contextlib import contextmanager
+from config import POOL_CONFIG
 from .connection_factory import DatabaseConnectionFactory
-from .exceptions import DatabaseConnectionError
+from .exceptions import DatabaseConnectionError, DatabaseTimeoutError, OracleThinModeUnsupportedError
 
 
 class ConnectionManager:
-    """데이터베이스 연결 관리자"""
+    """데이터베이스 연결 관리자 (연결 키별 연결 풀)"""
     
-    def __init__(self):
+    def __init__(self, max_connections_per_key=None, idle_timeout=None, validate_on_checkout=None):
+        # 연결 키 -> [(연결 객체, 마지막 사용 시각), ...] (유휴 연결 목록)
         self._connections = {}
+        # 연결 키 -> 사용 중인 연결 수
+        self._in_use = {}
+        # id(연결 객체) -> 연결 키 (반납 시 키 확인용)
+        self._owners = {}
+        # oracledb thin 모드로 연결할 수 없어 JDBC로 연결하는 연결 키
+        self._oracle_jdbc_keys = set()
         self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        # 유휴 연결 정리 스레드 중지 이벤트 (풀에 유휴 연결이 있는 동안만 실행)
+        self._sweeper_stop = None
         
-    def get_connection_key(self, dbms, host, port, database, username):
+        self.max_connections_per_key = max_connections_per_key or POOL_CONFIG["max_connections_per_key"]
+        self.idle_timeout = idle_timeout if idle_timeout is not None else POOL_CONFIG["idle_timeout"]
+        self.validate_on_checkout = (POOL_CONFIG["validate_on_checkout"]
+                                     if validate_on_checkout is None else validate_on_checkout)
+        self.evict_interval = POOL_CONFIG.get("evict_interval", 60)
+        
+        self._stats = {
+            'hits': 0,        # 풀에 있던 연결 재사용
+            'misses': 0,      # 새 연결 생성
+            'evictions': 0,   # 유휴 시간 초과로 제거
+            'discarded': 0,   # 유효성 검사 실패 또는 오류로 폐기
+            'waits': 0,       # 최대 연결 수 도달로 대기
+            'jdbc_fallbacks': 0  # oracledb thin 모드 미지원 서버를 JDBC로 다시 연결
+        }
+        
+    def get_connection_key(self, dbms, host, port, database, username, oracle_type=None):
         """연결 키 생성"""
-        return f"{dbms}://{username}@{host}:{port}/{database}"
+        key = f"{dbms}://{username}@{host}:{port}/{database}"
+        if oracle_type:
+            key += f"?oracle_type={oracle_type}"
+        return key
+        
+    def acquire(self, dbms, host, port, database, username, password, timeout=30, oracle_type=None):
+        """
+        풀에서 연결을 꺼내거나 새로 생성
+        
+        반환된 연결은 사용 후 반드시 release()로 반납해야 합니다.
+        
+        Args:
+            timeout (int): 연결 시간 제한 겸 최대 연결 수 도달 시 대기 시간 (초)
+            
+        Returns:
+            BaseConnection: 연결된 데이터베이스 연결 객체
+            
+        Raises:
+            DatabaseTimeoutError: 최대 연결 수에 도달한 상태로 대기 시간이 초과된 경우
+        """
+        key = self.get_connection_key(dbms, host, port, database, username, oracle_type)
+        deadline = time.time() + timeout
+        
+        while True:
+            connection = self._checkout_idle(key, deadline)
+            if connection is None:
+                # 새 연결을 만들 자리가 확보됨
+                break
+                
+            # 비밀번호가 바뀌었거나 끊어진 연결은 폐기 후 다시 시도
+            if connection.password == password and self._is_alive(connection):
+                with self._lock:
+                    self._stats['hits'] += 1
+                return connection
+            self._discard(key, connection)
+            
+        try:
+            connection = self._connect(key, dbms, host, port, database, username, password, timeout, oracle_type)
+        except Exception:
+            self._free_slot(key)
+            raise
+            
+        with self._lock:
+            self._owners[id(connection)] = key
+        return connection
+        
+    def _connect(self, key, dbms, host, port, database, username, password, timeout, oracle_type):
+        """새 연결 생성 (oracledb로 연결할 수 없는 Oracle 서버는 JDBC로 재시도)"""
+        params = dict(dbms=dbms, host=host, port=port, database=database, username=username,
+                      password=password, timeout=timeout, oracle_type=oracle_type)
+        oracle_driver = 'jdbc' if key in self._oracle_jdbc_keys else None
+        connection = DatabaseConnectionFactory.create_connection(oracle_driver=oracle_driver, **params)
+        try:
+            connection.connect()
+        except OracleThinModeUnsupportedError:
+            # 다음 연결부터는 바로 JDBC 사용 (get_pool_stats의 jdbc_fallbacks로 확인)
+            with self._lock:
+                self._stats['jdbc_fallbacks'] += 1
+            self._oracle_jdbc_keys.add(key)
+            connection = DatabaseConnectionFactory.create_connection(oracle_driver='jdbc', **params)
+            connection.connect()
+        return connection
+        
+    def release(self, connection, discard=False):
+        """
+        연결을 풀에 반납
+        
+        Args:
+            connection (BaseConnection): acquire()로 얻은 연결 객체
+            discard (bool): True이면 풀에 넣지 않고 연결 종료
+        """
+        with self._available:
+            key = self._owners.get(id(connection))
+            if key is not None and not discard and connection.is_connected:
+                self._in_use[key] -= 1
+                self._connections.setdefault(key, []).append((connection, time.time()))
+                self._available.notify()
+                self._start_sweeper_locked()
+                return
+                
+        if key is None:
+            # 풀에서 관리하지 않는 연결
+            connection.disconnect()
+        else:
+            self._discard(key, connection)
         
     @contextmanager
     def get_connection(self, dbms, host, port, database, username, password, timeout=30, oracle_type=None):
         """
-        연결 컨텍스트 매니저
+        연결 컨텍스트 매니저 (풀에서 연결을 빌려 사용 후 반납)
         
         Args:
             dbms (str): DBMS 종류
@@ -38,25 +148,150 @@ class ConnectionManager:
         Yields:
             BaseConnection: 데이터베이스 연결 객체
         """
-        connection = None
+        connection = self.acquire(dbms, host, port, database, username, password, timeout, oracle_type)
+        discard = False
         try:
-            connection = DatabaseConnectionFactory.create_connection(
-                dbms=dbms,
-                host=host,
-                port=port,
-                database=database,
-                username=username,
-                password=password,
-                timeout=timeout,
-                oracle_type=oracle_type
-            )
-            
-            connection.connect()
             yield connection
-            
+        except DatabaseConnectionError:
+            # 연결 자체에 문제가 있을 수 있으므로 재사용하지 않음
+            discard = True
+            raise
         finally:
-            if connection:
+            self.release(connection, discard=discard)
+            
+    def _checkout_idle(self, key, deadline):
+        """유휴 연결을 꺼내거나 새 연결 자리를 확보 (새 연결 자리면 None 반환)"""
+        with self._available:
+            while True:
+                expired = self._collect_expired_locked(time.time())
+                if expired:
+                    # 만료된 연결 정리는 잠금 밖에서 수행
+                    break
+                    
+                idle = self._connections.get(key)
+                in_use = self._in_use.get(key, 0)
+                if idle:
+                    connection, _ = idle.pop()
+                    self._in_use[key] = in_use + 1
+                    return connection
+                if in_use < self.max_connections_per_key:
+                    self._in_use[key] = in_use + 1
+                    self._stats['misses'] += 1
+                    return None
+                    
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise DatabaseTimeoutError(
+                        f"사용 가능한 연결이 없습니다. (최대 {self.max_connections_per_key}개 사용 중)"
+                    )
+                self._stats['waits'] += 1
+                self._available.wait(remaining)
+            
+        self._close_connections(expired)
+        return self._checkout_idle(key, deadline)
+            
+    def _collect_expired_locked(self, now):
+        """유휴 시간이 초과된 연결을 풀에서 분리 (잠금 보유 상태에서 호출)"""
+        expired = []
+        for key in list(self._connections):
+            alive = []
+            for connection, last_used in self._connections[key]:
+                if now - last_used > self.idle_timeout:
+                    expired.append(connection)
+                    self._owners.pop(id(connection), None)
+                else:
+                    alive.append((connection, last_used))
+            if alive:
+                self._connections[key] = alive
+            else:
+                del self._connections[key]
+        self._stats['evictions'] += len(expired)
+        return expired
+        
+    def _is_alive(self, connection):
+        """체크아웃 시 연결 유효성 확인"""
+        if not self.validate_on_checkout:
+            return connection.is_connected
+        try:
+            return connection.ping()
+        except Exception:
+            return False
+            
+    def _discard(self, key, connection):
+        """사용 중인 연결을 폐기하고 자리를 반환"""
+        with self._lock:
+            self._owners.pop(id(connection), None)
+            self._stats['discarded'] += 1
+        self._free_slot(key)
+        self._close_connections([connection])
+        
+    def _free_slot(self, key):
+        """사용 중 연결 수 감소 및 대기 중인 스레드 깨우기"""
+        with self._available:
+            self._in_use[key] = max(self._in_use.get(key, 0) - 1, 0)
+            self._available.notify()
+            
+    def _close_connections(self, connections):
+        """연결 목록 종료 (오류는 무시)"""
+        for connection in connections:
+            try:
                 connection.disconnect()
+            except Exception:
+                pass
+                
+    def evict_idle(self):
+        """유휴 시간이 초과된 연결 정리"""
+        with self._lock:
+            expired = self._collect_expired_locked(time.time())
+        self._close_connections(expired)
+        return len(expired)
+        
+    def _start_sweeper_locked(self):
+        """유휴 연결 정리 스레드 시작 (이미 실행 중이면 무시, 잠금 보유 상태에서 호출)"""
+        if self._sweeper_stop is not None or not self.evict_interval:
+            return
+        stop_event = self._sweeper_stop = threading.Event()
+        threading.Thread(
+            target=self._sweeper_loop, args=(stop_event,), name='pool-sweeper', daemon=True
+        ).start()
+        
+    def _sweeper_loop(self, stop_event):
+        """
+        유휴 연결 정리 스레드 본문
+        
+        다시 꺼내지 않는 유휴 연결도 idle_timeout이 지나면 닫히도록 주기적으로 정리하고,
+        풀에 유휴 연결이 남지 않으면 종료합니다 (다음 반납 때 다시 시작).
+        """
+        while not stop_event.wait(self.evict_interval):
+            self.evict_idle()
+            with self._lock:
+                if stop_event.is_set() or not self._connections:
+                    if self._sweeper_stop is stop_event:
+                        self._sweeper_stop = None
+                    return
+                    
+    def close_all(self):
+        """풀에 있는 모든 유휴 연결 종료 (프로그램 종료 시 호출)"""
+        with self._lock:
+            if self._sweeper_stop is not None:
+                self._sweeper_stop.set()
+                self._sweeper_stop = None
+            idle = [connection for entries in self._connections.values() for connection, _ in entries]
+            for connection in idle:
+                self._owners.pop(id(connection), None)
+            self._connections.clear()
+        self._close_connections(idle)
+        
+    def get_pool_stats(self):
+        """풀 사용 통계 반환 (적중률 포함)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['idle_connections'] = sum(len(entries) for entries in self._connections.values())
+            stats['in_use_connections'] = sum(self._in_use.values())
+        requests = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / requests, 4) if requests else 0.0
+        stats['miss_rate'] = round(stats['misses'] / requests, 4) if requests else 0.0
+        return stats
                 
     def test_connection(self, dbms, host, port, database, username, password, timeout=30, oracle_type=None):
         """
@@ -137,4 +372,4 @@ class ConnectionManager:
 
 
 # 싱글톤 인스턴스
-connection_manager = ConnectionManager()
\ No newline at end of file
+connection_manager = ConnectionManager()
@@ -2,11 +2,59 @@
 데이터베이스 메타데이터 수집기
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from config import PARALLEL_COLLECT_CONFIG, INCREMENTAL_CONFIG
+from model import SchemaModel, schema_of
 from .connection_manager import connection_manager
+from .incremental_state import incremental_state_store
+from .metadata_cache import metadata_cache
+from .base_connection import PositionalRows
 from .exceptions import DatabaseConnectionError, DatabaseQueryError
+import math
+import operator
 import time
 
 
+# 정규화 필드별 DBMS 결과 컬럼 후보 (앞쪽 후보 우선, _get_value와 같은 순서)
+TABLE_FIELD_KEYS = (
+    ('table_name', ('table_name', 'TABLE_NAME')),
+    ('table_comment', ('comment', 'table_comment', 'TABLE_COMMENT', '테이블설명')),
+    ('column_position', ('NO', 'no', 'column_position', 'ORDINAL_POSITION')),
+    ('column_name', ('컬럼명', 'column_name', 'COLUMN_NAME')),
+    ('data_type', ('TYPE', 'type', 'data_type', 'COLUMN_TYPE')),
+    ('default_value', ('DEFAULT_VALUE', 'default_value', 'COLUMN_DEFAULT')),
+    ('is_nullable', ('NULLABLE', 'nullable', 'IS_NULLABLE')),
+    ('key_type', ('KEY_TYPE', 'key_type', 'COLUMN_KEY')),
+    ('extra', ('EXTRA', 'extra', 'AUTO_INCREMENT')),
+    ('column_comment', ('설명', 'column_comment', 'COLUMN_COMMENT'))
+)
+
+FOREIGN_KEY_FIELD_KEYS = (
+    ('table_name', ('table_name', 'TABLE_NAME')),
+    ('column_name', ('column_name', 'COLUMN_NAME')),
+    ('referenced_table_name', ('referenced_table_name', 'REFERENCED_TABLE_NAME')),
+    ('referenced_column_name', ('referenced_column_name', 'REFERENCED_COLUMN_NAME')),
+    ('constraint_name', ('constraint_name', 'CONSTRAINT_NAME'))
+)
+
+INDEX_FIELD_KEYS = (
+    ('table_name', ('table_name', 'TABLE_NAME')),
+    ('index_name', ('index_name', 'INDEX_NAME')),
+    ('non_unique', ('non_unique', 'NON_UNIQUE')),
+    ('column_name', ('column_name', 'COLUMN_NAME')),
+    ('seq_in_index', ('seq_in_index', 'SEQ_IN_INDEX'))
+)
+
+# nullable/키 타입 정규화 값 (대문자로 바꾼 원래 값 -> 정규화 값)
+NULLABLE_VALUES = {'Y': 'YES', 'YES': 'YES', 'TRUE': 'YES', '1': 'YES', 'N': 'NO', 'NO': 'NO', 'FALSE': 'NO', '0': 'NO'}
+KEY_TYPE_VALUES = {
+    'PRI': 'PRI', 'PRIMARY': 'PRI', 'P': 'PRI',
+    'MUL': 'MUL', 'FOREIGN': 'MUL', 'F': 'MUL', 'R': 'MUL',
+    'UNI': 'UNI', 'UNIQUE': 'UNI', 'U': 'UNI'
+}
+
+
 class DatabaseMetadataCollector:
     """데이터베이스 메타데이터 수집 클래스"""
     
@@ -33,73 +81,394 @@ class DatabaseMetadataCollector:
             dict: 수집된 메타데이터
         """
         start_time = time.time()
+        conn_params = dict(dbms=dbms, host=host, port=port, database=database, username=username,
+                           password=password, timeout=timeout, oracle_type=oracle_type)
         
         try:
-            with connection_manager.get_connection(
-                dbms=dbms, host=host, port=port, database=database,
-                username=username, password=password, timeout=timeout,
-                oracle_type=oracle_type
-            ) as conn:
-                
-                # 기본 정보 수집
-                metadata = {
-                    'connection_info': {
-                        'dbms': conn.get_dbms_name(),
-                        'host': host,
-                        'port': port,
-                        'database': database,
-                        'username': username,
-                        'version': conn.get_version(),
-                        'collection_time': time.strftime("%Y-%m-%d %H:%M:%S")
-                    },
-                    'tables': [],
-                    'foreign_keys': [],
-                    'indexes': [],
-                    'statistics': {
-                        'total_tables': 0,
-                        'total_columns': 0,
-                        'total_foreign_keys': 0,
-                        'collection_duration_ms': 0
-                    }
-                }
+            with connection_manager.get_connection(**conn_params) as conn:
+                return self._collect_metadata(conn, selected_tables, start_time, conn_params)
                 
-                # 테이블 및 컬럼 정보 수집 (모든 DBMS 동일한 방식)
-                tables_data = conn.get_tables_info()
-                metadata['tables'] = self._normalize_tables_data(tables_data)
-                
-                # 외래키 정보 수집
-                fk_data = conn.get_foreign_keys_info()
-                metadata['foreign_keys'] = self._normalize_foreign_keys_data(fk_data)
-                
-                # 인덱스 정보 수집
-                indexes_data = conn.get_indexes_info()
-                metadata['indexes'] = self._normalize_indexes_data(indexes_data)
-                
-                # 선택된 테이블들만 필터링
-                if selected_tables:
-                    metadata['tables'] = [table for table in metadata['tables'] 
-                                        if table['table_name'] in selected_tables]
-                    metadata['foreign_keys'] = [fk for fk in metadata['foreign_keys'] 
-                                               if fk['table_name'] in selected_tables]
-                    metadata['indexes'] = [idx for idx in metadata['indexes'] 
-                                         if idx['table_name'] in selected_tables]
+        except Exception as e:
+            raise DatabaseQueryError(f"메타데이터 수집 실패: {str(e)}")
+            
+    def collect_metadata_from_connection(self, conn, selected_tables=None, conn_params=None):
+        """
+        이미 열려 있는 연결로 메타데이터 전체 수집 (추가 로그인 없음)
+        
+        Args:
+            conn (BaseConnection): 연결된 데이터베이스 연결 객체
+            selected_tables (list): 선택된 테이블 목록 (None이면 전체)
+            conn_params (dict): 병렬 수집용 추가 연결 정보 (connection_manager.acquire 인자, None이면 병렬 수집 안 함)
+            
+        Returns:
+            dict: 수집된 메타데이터
+        """
+        start_time = time.time()
+        
+        try:
+            return self._collect_metadata(conn, selected_tables, start_time, conn_params)
+        except Exception as e:
+            raise DatabaseQueryError(f"메타데이터 수집 실패: {str(e)}")
+            
+    def _collect_metadata(self, conn, selected_tables, start_time, conn_params=None):
+        """
+        연결 객체로부터 메타데이터 수집
+        
+        이전 수집 상태가 있으면 구조가 바뀌었거나 새로 생긴 테이블만 조회하고 나머지는 상태에서 가져오며,
+        조회할 테이블이 많으면 나누어 여러 연결로 동시에 수집합니다.
+        """
+        selected = set(selected_tables) if selected_tables else None
+        plan = self._plan_incremental(conn, selected)
+        
+        fetch = selected
+        if plan is not None:
+            # 선택 없이 전체가 바뀐 경우(첫 수집 등)는 테이블 조건 없이 조회
+            fetch = None if not selected and len(plan['fetch']) == len(plan['markers']) else plan['fetch']
+            
+        if plan is not None and not plan['fetch']:
+            # 바뀐 테이블 없음: 조회 없이 저장된 상태 사용
+            partitions = []
+            version, tables, foreign_keys, indexes = plan['version'], [], [], []
+        else:
+            # 전체 조회면 변경 표시로 이미 알고 있는 테이블명으로 분할 (테이블 목록을 따로 조회하지 않음)
+            known_names = plan['wanted'] if plan is not None else None
+            partitions = self._plan_partitions(fetch, conn_params, known_names)
+            if len(partitions) > 1:
+                version, tables, foreign_keys, indexes = self._collect_partitions(conn, partitions, conn_params)
+            else:
+                version, tables, foreign_keys, indexes = self._collect_catalog(conn, partitions[0])
                 
-                # 통계 계산
-                metadata['statistics']['total_tables'] = len(set(table['table_name'] for table in metadata['tables']))
-                metadata['statistics']['total_columns'] = len(metadata['tables'])
-                metadata['statistics']['total_foreign_keys'] = len(metadata['foreign_keys'])
-                metadata['statistics']['collection_duration_ms'] = round((time.time() - start_time) * 1000, 2)
+        if plan is not None:
+            tables, foreign_keys, indexes = self._merge_incremental(plan, tables, foreign_keys, indexes)
+            
+        # 기본 정보 수집
+        metadata = {
+            'connection_info': {
+                'dbms': conn.get_dbms_name(),
+                'host': conn.host,
+                'port': conn.port,
+                'database': conn.database,
+                'username': conn.username,
+                'version': version,
+                'collection_time': time.strftime("%Y-%m-%d %H:%M:%S")
+            },
+            'tables': [],
+            'foreign_keys': [],
+            'indexes': [],
+            'statistics': {
+                'total_tables': 0,
+                'total_columns': 0,
+                'total_foreign_keys': 0,
+                'collection_duration_ms': 0,
+                'partitions': len(partitions),
+                'fetched_tables': len(plan['fetch']) if plan is not None else None,
+                'reused_tables': len(plan['wanted']) - len(plan['fetch']) if plan is not None else 0
+            }
+        }
+        
+        # 선택된 테이블들만 남았는지 확인 (서버에서 이미 걸렀으므로 집합으로 빠르게 확인)
+        if selected:
+            tables = [table for table in tables 
+                      if table['table_name'] in selected]
+            foreign_keys = [fk for fk in foreign_keys 
+                            if fk['table_name'] in selected]
+            indexes = [idx for idx in indexes 
+                       if idx['table_name'] in selected]
+        
+        # 테이블별로 한 번만 묶은 모델 생성 (행 목록은 모델의 행 뷰로 바꾸고 정규화 행 딕셔너리는 버림)
+        schema = SchemaModel.from_rows(tables, foreign_keys, indexes)
+        tables = foreign_keys = indexes = None
+        schema.attach(metadata)
+        
+        # 통계 계산
+        metadata['statistics']['total_tables'] = len(schema.tables)
+        metadata['statistics']['total_columns'] = schema.column_count
+        metadata['statistics']['total_foreign_keys'] = len(schema.foreign_keys)
+        metadata['statistics']['collection_duration_ms'] = round((time.time() - start_time) * 1000, 2)
+        
+        if plan is not None:
+            # 캐시된 메타데이터를 쓰기 전에 변경 표시만 다시 조회해 비교할 수 있도록 함께 저장
+            metadata['change_markers'] = {name: plan['markers'][name] for name in plan['wanted']}
+            
+        self.connection_info = metadata['connection_info']
+        self.last_collection_time = time.time()
+        
+        # 다음 실행에서 바로 시작할 수 있도록 캐시에 저장 (인증 정보 제외)
+        metadata_cache.put(self.get_cache_key(conn), version, 'metadata', metadata,
+                           metadata_cache.selection_key(selected))
+        
+        return metadata
+        
+    def _collect_catalog(self, conn, table_names):
+        """
+        연결 하나로 카탈로그를 조회해 정규화
+        
+        Args:
+            table_names (list): 조회할 테이블 목록 (None이면 전체, 조건은 쿼리에서 적용)
+            
+        Returns:
+            tuple: (버전, 테이블+컬럼 목록, 외래키 목록, 인덱스 목록)
+        """
+        # 버전, 테이블+컬럼, 외래키, 인덱스 정보를 한 번에 조회 (DBMS에 따라 왕복 1회)
+        # tables/foreign_keys/indexes는 서버 측 커서 행 이터레이터일 수 있으므로 아래 순서대로 한 번씩 순회
+        catalog = conn.get_catalog(table_names)
+        try:
+            # 테이블 및 컬럼 정보 정규화 (모든 DBMS 동일한 방식)
+            tables = self._normalize_tables_data(catalog['tables'])
+            
+            # 외래키 정보 정규화
+            foreign_keys = self._normalize_foreign_keys_data(catalog['foreign_keys'])
+            
+            # 인덱스 정보 정규화
+            indexes = self._normalize_indexes_data(catalog['indexes'])
+        finally:
+            # 중간에 실패해도 아직 순회하지 않은 결과의 서버 측 커서가 열린 채 남지 않도록 정리
+            for key in ('tables', 'foreign_keys', 'indexes'):
+                close = getattr(catalog[key], 'close', None)
+                if close is not None:
+                    close()
+                    
+        return catalog['version'], tables, foreign_keys, indexes
+        
+    def get_cache_key(self, conn):
+        """
+        메타데이터 캐시·증분 수집 상태 키 (연결 키와 같은 형식, 비밀번호 제외)
+        
+        접속 정보가 아닌 연결 객체에서만 만들어 같은 DB는 어느 경로로 수집해도 같은 키를 씁니다.
+        """
+        return connection_manager.get_connection_key(
+            conn.get_dbms_family(), conn.host, conn.port, conn.database, conn.username,
+            getattr(conn, 'oracle_type', None)
+        )
+        
+    def _plan_incremental(self, conn, selected):
+        """
+        증분 수집 계획 (변경 표시를 이전 상태와 비교)
+        
+        Returns:
+            dict: key, version, markers, state_tables, wanted(결과에 포함할 테이블), fetch(다시 조회할 테이블)
+                  (증분 수집을 쓰지 않으면 None)
+        """
+        if not INCREMENTAL_CONFIG.get("enabled"):
+            return None
+        try:
+            markers = conn.get_change_markers()
+        except Exception:
+            # 변경 표시를 읽을 수 없으면 전체 수집 (statistics의 fetched_tables가 None)
+            return None
+        if markers is None:
+            return None
+            
+        key = self.get_cache_key(conn)
+        version = conn.get_version()
+        state = incremental_state_store.load(key)
+        # 서버 버전이 바뀌면 카탈로그 형식이 달라질 수 있으므로 이전 상태를 쓰지 않음
+        state_tables = state['tables'] if state and state.get('version') == version else {}
+        
+        wanted = sorted(name for name in (selected or markers) if name in markers)
+        fetch = {
+            name for name in wanted
+            if name not in state_tables or state_tables[name].get('marker') != markers[name]
+        }
+        return {
+            'key': key,
+            'version': version,
+            'markers': markers,
+            'state_tables': state_tables,
+            'wanted': wanted,
+            'fetch': fetch
+        }
+        
+    def _merge_incremental(self, plan, tables, foreign_keys, indexes):
+        """
+        새로 조회한 테이블과 이전 상태의 테이블을 합치고 상태 갱신
+        
+        삭제된 테이블은 상태에서 제거하며, 결과는 테이블명 순서로 정렬됩니다.
+        
+        Returns:
+            tuple: (테이블+컬럼 목록, 외래키 목록, 인덱스 목록)
+        """
+        fetched = {}
+        for section, rows in (('columns', tables), ('foreign_keys', foreign_keys), ('indexes', indexes)):
+            for row in rows:
+                entry = fetched.setdefault(row['table_name'], {'columns': [], 'foreign_keys': [], 'indexes': []})
+                entry[section].append(row)
                 
-                self.connection_info = metadata['connection_info']
-                self.last_collection_time = time.time()
+        state_tables = {
+            name: entry for name, entry in plan['state_tables'].items() if name in plan['markers']
+        }
+        for name in plan['fetch']:
+            entry = fetched.get(name, {'columns': [], 'foreign_keys': [], 'indexes': []})
+            entry['marker'] = plan['markers'][name]
+            state_tables[name] = entry
+        incremental_state_store.save(plan['key'], plan['version'], state_tables)
+        
+        merged_tables, merged_foreign_keys, merged_indexes = [], [], []
+        for name in plan['wanted']:
+            entry = state_tables[name]
+            merged_tables.extend(entry['columns'])
+            merged_foreign_keys.extend(entry['foreign_keys'])
+            merged_indexes.extend(entry['indexes'])
+        return merged_tables, merged_foreign_keys, merged_indexes
+        
+    def _get_parallel_workers(self, conn_params):
+        """DBMS별 설정된 동시 연결 수 (연결 풀 최대 연결 수 이하)"""
+        if not conn_params:
+            return 1
+        workers = PARALLEL_COLLECT_CONFIG["workers"].get(conn_params['dbms'], 1)
+        return max(1, min(workers, connection_manager.max_connections_per_key))
+        
+    def _plan_partitions(self, selected, conn_params, known_names=None):
+        """
+        수집할 테이블을 분할 (테이블명 순서로 연속된 구간)
+        
+        Args:
+            selected (set): 조회할 테이블 (None이면 전체)
+            known_names (list): 전체 조회일 때 나눌 테이블명 (변경 표시의 테이블명, 모르면 None)
+            
+        Returns:
+            list: 분할별 테이블 목록 (나누지 않으면 [선택 목록 또는 None])
+        """
+        table_names = sorted(selected) if selected else None
+        workers = self._get_parallel_workers(conn_params)
+        if workers <= 1:
+            return [table_names]
+            
+        if table_names is None:
+            if not known_names:
+                # 테이블명을 모르면 목록 조회 왕복을 더하지 않고 연결 하나로 전체 조회
+                return [None]
+            table_names = sorted(known_names)
+        count = min(workers, len(table_names) // PARALLEL_COLLECT_CONFIG["min_tables_per_partition"])
+        if count <= 1:
+            return [sorted(selected) if selected else None]
+            
+        size = math.ceil(len(table_names) / count)
+        return [table_names[start:start + size] for start in range(0, len(table_names), size)]
+        
+    def _collect_partitions(self, conn, partitions, conn_params):
+        """
+        분할별로 동시에 수집 후 분할 순서대로 병합
+        
+        첫 번째 분할은 전달받은 연결로, 나머지는 연결 풀에서 빌린 연결로 조회합니다.
+        분할이 테이블명 순서로 나뉘어 있으므로 이어 붙인 결과도 단일 연결 수집과 같은 순서입니다.
+        """
+        with ThreadPoolExecutor(max_workers=len(partitions), thread_name_prefix='collector') as executor:
+            futures = [
+                executor.submit(self._collect_partition, conn if index == 0 else None, partition, conn_params)
+                for index, partition in enumerate(partitions)
+            ]
+            results = [future.result() for future in futures]
+            
+        version = results[0][0]
+        tables, foreign_keys, indexes = [], [], []
+        for _, partition_tables, partition_foreign_keys, partition_indexes in results:
+            tables.extend(partition_tables)
+            foreign_keys.extend(partition_foreign_keys)
+            indexes.extend(partition_indexes)
+        return version, tables, foreign_keys, indexes
+        
+    def _collect_partition(self, conn, table_names, conn_params):
+        """작업 스레드에서 분할 하나 수집 (conn이 None이면 연결 풀에서 연결을 빌려 사용)"""
+        borrowed = conn is None
+        if borrowed:
+            conn = connection_manager.acquire(**conn_params)
+            
+        discard = False
+        conn.attach_thread()
+        try:
+            return self._collect_catalog(conn, table_names)
+        except DatabaseConnectionError:
+            discard = True
+            raise
+        finally:
+            conn.detach_thread()
+            if borrowed:
+                connection_manager.release(conn, discard=discard)
                 
-                return metadata
+    def _compile_projection(self, columns, field_keys, positional=False):
+        """
+        결과 컬럼으로 필드별 위치를 한 번만 정해 행 -> 값 튜플 함수 생성
+        
+        같은 쿼리의 행은 키가 모두 같으므로 행마다 후보 키를 찾지 않고 operator.itemgetter로 한 번에 꺼냅니다.
+        한 필드의 후보 키가 결과에 여럿 있으면 행마다 None이 아닌 값을 골라야 하므로 None을 반환합니다.
+        
+        Args:
+            columns (list): 결과 컬럼명 (딕셔너리 행이면 첫 행의 키)
+            positional (bool): True이면 행이 columns 순서의 값 튜플
+            
+        Returns:
+            callable: 행 -> field_keys 순서의 값 튜플 (컴파일할 수 없으면 None)
+        """
+        positions = {column: index for index, column in enumerate(columns)}
+        keys = []
+        for _, candidates in field_keys:
+            present = [key for key in candidates if key in positions]
+            if len(present) > 1:
+                return None
+            if not present:
+                keys.append(None)
+            else:
+                keys.append(positions[present[0]] if positional else present[0])
                 
-        except Exception as e:
-            raise DatabaseQueryError(f"메타데이터 수집 실패: {str(e)}")
+        if None not in keys:
+            return operator.itemgetter(*keys)
             
+        # 결과에 없는 필드는 None으로 채움
+        getters = [operator.itemgetter(key) if key is not None else (lambda row: None) for key in keys]
+        return lambda row: tuple(getter(row) for getter in getters)
+        
+    def _project_rows(self, rows, field_keys):
+        """
+        행 이터레이터를 값 튜플 이터레이터로 변환
+        
+        드라이버가 컬럼명과 값 튜플로 돌려준 결과(PositionalRows)는 딕셔너리로 바꾸지 않고 위치로 읽습니다.
+        
+        Returns:
+            tuple: (값 튜플 이터레이터, None) 또는 컴파일할 수 없으면 (None, 딕셔너리 행 이터레이터)
+        """
+        if isinstance(rows, PositionalRows):
+            project = self._compile_projection(rows.columns, field_keys, positional=True)
+            if project is None:
+                return None, rows.iter_dicts()
+            return map(project, rows), None
+            
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return iter(()), None
+        rows = chain((first,), rows)
+        project = self._compile_projection(first, field_keys) if isinstance(first, dict) else None
+        if project is None:
+            return None, rows
+        return map(project, rows), None
+        
     def _normalize_tables_data(self, tables_data):
-        """테이블 데이터 정규화 (MySQL/PostgreSQL/Oracle 모두 지원)"""
+        """테이블 데이터 정규화 (MySQL/PostgreSQL/Oracle 모두 지원, 행 이터레이터를 한 행씩 소비)"""
+        projected, rows = self._project_rows(tables_data, TABLE_FIELD_KEYS)
+        if projected is None:
+            return self._normalize_tables_by_lookup(rows)
+            
+        normalize_nullable, normalize_key_type = self._normalize_nullable, self._normalize_key_type
+        return [
+            {
+                'table_name': table_name,
+                'table_comment': table_comment or '',
+                'column_position': column_position,
+                'column_name': column_name,
+                'data_type': data_type,
+                'default_value': default_value or '',
+                'is_nullable': normalize_nullable(is_nullable),
+                'key_type': normalize_key_type(key_type),
+                'extra': extra or '',
+                'column_comment': column_comment or ''
+            }
+            for (table_name, table_comment, column_position, column_name, data_type,
+                 default_value, is_nullable, key_type, extra, column_comment) in projected
+        ]
+        
+    def _normalize_tables_by_lookup(self, tables_data):
+        """테이블 데이터 정규화 (행마다 후보 키 조회, 첫 행으로 컬럼을 정할 수 없는 결과용)"""
         normalized = []
         
         for row in tables_data:
@@ -121,7 +490,24 @@ class DatabaseMetadataCollector:
         return normalized
         
     def _normalize_foreign_keys_data(self, fk_data):
-        """외래키 데이터 정규화"""
+        """외래키 데이터 정규화 (행 이터레이터를 한 행씩 소비)"""
+        projected, rows = self._project_rows(fk_data, FOREIGN_KEY_FIELD_KEYS)
+        if projected is None:
+            return self._normalize_foreign_keys_by_lookup(rows)
+            
+        return [
+            {
+                'table_name': table_name,
+                'column_name': column_name,
+                'referenced_table_name': referenced_table_name,
+                'referenced_column_name': referenced_column_name,
+                'constraint_name': constraint_name or ''
+            }
+            for table_name, column_name, referenced_table_name, referenced_column_name, constraint_name in projected
+        ]
+        
+    def _normalize_foreign_keys_by_lookup(self, fk_data):
+        """외래키 데이터 정규화 (행마다 후보 키 조회)"""
         normalized = []
         
         for row in fk_data:
@@ -148,69 +534,51 @@ class DatabaseMetadataCollector:
         """nullable 값 정규화"""
         if value is None:
             return 'YES'
-        
-        value_str = str(value).upper()
-        if value_str in ['Y', 'YES', 'TRUE', '1']:
-            return 'YES'
-        elif value_str in ['N', 'NO', 'FALSE', '0']:
-            return 'NO'
-        else:
-            return 'YES'  # 기본값
             
+        # 알 수 없는 값은 기본값 YES
+        return NULLABLE_VALUES.get(str(value).upper(), 'YES')
+        
     def _normalize_key_type(self, value):
         """키 타입 정규화"""
         if value is None or value == '':
             return ''
             
         value_str = str(value).upper()
-        if value_str in ['PRI', 'PRIMARY', 'P']:
-            return 'PRI'
-        elif value_str in ['MUL', 'FOREIGN', 'F', 'R']:
-            return 'MUL'
-        elif value_str in ['UNI', 'UNIQUE', 'U']:
-            return 'UNI'
-        else:
-            return value_str
-            
+        return KEY_TYPE_VALUES.get(value_str, value_str)
+        
     def get_tables_summary(self, metadata):
         """테이블 요약 정보 생성"""
         if not metadata or 'tables' not in metadata:
             return []
             
-        tables_summary = {}
-        
-        for row in metadata['tables']:
-            table_name = row['table_name']
-            if table_name not in tables_summary:
-                tables_summary[table_name] = {
-                    'table_name': table_name,
-                    'table_comment': row['table_comment'],
-                    'column_count': 0,
-                    'primary_keys': [],
-                    'foreign_keys': []
-                }
-                
-            tables_summary[table_name]['column_count'] += 1
-            
-            # Primary Key 수집
-            if row['key_type'] == 'PRI':
-                tables_summary[table_name]['primary_keys'].append(row['column_name'])
-                
-        # Foreign Key 정보 추가
-        if 'foreign_keys' in metadata:
-            for fk in metadata['foreign_keys']:
-                table_name = fk['table_name']
-                if table_name in tables_summary:
-                    fk_info = f"{fk['column_name']} -> {fk['referenced_table_name']}.{fk['referenced_column_name']}"
-                    tables_summary[table_name]['foreign_keys'].append(fk_info)
-                    
-        return list(tables_summary.values())
+        # 수집 시 테이블별로 묶은 모델과 외래키 색인 사용 (행을 다시 묶거나 외래키 목록을 훑지 않음)
+        schema = schema_of(metadata)
+        relationships = schema.relationships
+        return [
+            {
+                'table_name': table.name,
+                'table_comment': table.comment,
+                'column_count': len(table.columns),
+                'primary_keys': table.primary_keys,
+                'foreign_keys': [
+                    f"{fk.column_name} -> {fk.referenced_table_name}.{fk.referenced_column_name}"
+                    for fk in relationships.table_foreign_keys(table.name)
+                ],
+                # 이 테이블을 참조하는 외래키 (참조하는 테이블.컬럼)
+                'referenced_by': [
+                    f"{fk.table_name}.{fk.column_name}" for fk in relationships.referencing(table.name)
+                ]
+            }
+            for table in schema.iter_tables()
+        ]
         
     def format_metadata_for_excel(self, metadata):
         """Excel 생성을 위한 메타데이터 포맷"""
         if not metadata:
             return None
             
+        # 수집 시 테이블별로 묶고 컬럼을 position 순으로 정렬한 모델 사용
+        schema = schema_of(metadata)
         formatted = {
             'database_info': metadata['connection_info'],
             'tables_by_name': {},
@@ -218,32 +586,26 @@ class DatabaseMetadataCollector:
             'statistics': metadata['statistics']
         }
         
-        # 테이블별로 그룹화
-        for row in metadata['tables']:
-            table_name = row['table_name']
-            if table_name not in formatted['tables_by_name']:
-                formatted['tables_by_name'][table_name] = {
-                    'table_info': {
-                        'name': table_name,
-                        'comment': row['table_comment']
-                    },
-                    'columns': []
-                }
-                
-            formatted['tables_by_name'][table_name]['columns'].append({
-                'position': row['column_position'],
-                'name': row['column_name'],
-                'type': row['data_type'],
-                'default': row['default_value'],
-                'nullable': row['is_nullable'],
-                'key': row['key_type'],
-                'extra': row['extra'],
-                'comment': row['column_comment']
-            })
-            
-        # 컬럼을 position 순으로 정렬
-        for table_data in formatted['tables_by_name'].values():
-            table_data['columns'].sort(key=lambda x: x['position'] or 0)
+        for table in schema.iter_tables():
+            formatted['tables_by_name'][table.name] = {
+                'table_info': {
+                    'name': table.name,
+                    'comment': table.comment
+                },
+                'columns': [
+                    {
+                        'position': column.position,
+                        'name': column.name,
+                        'type': column.type,
+                        'default': column.default,
+                        'nullable': column.nullable,
+                        'key': column.key,
+                        'extra': column.extra,
+                        'comment': column.comment
+                    }
+                    for column in table.columns
+                ]
+            }
             
         return formatted
     
@@ -272,50 +634,91 @@ class DatabaseMetadataCollector:
                 username=username, password=password, timeout=timeout,
                 oracle_type=oracle_type
             ) as conn:
-                
-                # 기본 정보 수집
-                table_list_data = {
-                    'connection_info': {
-                        'dbms': conn.get_dbms_name(),
-                        'host': host,
-                        'port': port,
-                        'database': database,
-                        'username': username,
-                        'version': conn.get_version(),
-                        'collection_time': time.strftime("%Y-%m-%d %H:%M:%S")
-                    }
-                }
-                
-                # 테이블 목록만 수집 (간단한 정보)
-                tables_info = conn.get_tables_basic_info()
-                
-                # 정규화된 테이블 목록 생성
-                table_list = []
-                for idx, table in enumerate(tables_info, 1):
-                    table_list.append({
-                        'no': idx,
-                        'table_name': self._get_value(table, ['table_name', 'TABLE_NAME']),
-                        'table_comment': self._get_value(table, ['table_comment', 'TABLE_COMMENT', '테이블설명']) or ''
-                    })
-                
-                table_list_data['table_list'] = table_list
-                
-                # 통계 정보
-                end_time = time.time()
-                collection_duration = (end_time - start_time) * 1000
-                
-                table_list_data['statistics'] = {
-                    'total_tables': len(table_list),
-                    'collection_duration_ms': round(collection_duration, 2)
-                }
-                
-                return table_list_data
+                return self._collect_table_list(conn, start_time)
                 
         except Exception as e:
             raise DatabaseConnectionError(f"테이블 목록 수집 중 오류가 발생했습니다: {str(e)}")
-    
+            
+    def collect_table_list_from_connection(self, conn):
+        """
+        이미 열려 있는 연결로 테이블 목록 수집 (추가 로그인 없음)
+        
+        Args:
+            conn (BaseConnection): 연결된 데이터베이스 연결 객체
+            
+        Returns:
+            dict: 수집된 테이블 목록
+        """
+        start_time = time.time()
+        
+        try:
+            return self._collect_table_list(conn, start_time)
+        except Exception as e:
+            raise DatabaseConnectionError(f"테이블 목록 수집 중 오류가 발생했습니다: {str(e)}")
+            
+    def _collect_table_list(self, conn, start_time):
+        """연결 객체로부터 테이블 목록 수집 (수집 결과는 메타데이터 캐시에 저장)"""
+        # 기본 정보 수집
+        table_list_data = {
+            'connection_info': {
+                'dbms': conn.get_dbms_name(),
+                'host': conn.host,
+                'port': conn.port,
+                'database': conn.database,
+                'username': conn.username,
+                'version': conn.get_version(),
+                'collection_time': time.strftime("%Y-%m-%d %H:%M:%S")
+            }
+        }
+        
+        # 테이블 목록만 수집 (간단한 정보)
+        tables_info = conn.get_tables_basic_info()
+        
+        # 정규화된 테이블 목록 생성
+        table_list = []
+        for idx, table in enumerate(tables_info, 1):
+            table_list.append({
+                'no': idx,
+                'table_name': self._get_value(table, ['table_name', 'TABLE_NAME']),
+                'table_comment': self._get_value(table, ['table_comment', 'TABLE_COMMENT', '테이블설명']) or ''
+            })
+            
+        table_list_data['table_list'] = table_list
+        
+        # 통계 정보
+        end_time = time.time()
+        collection_duration = (end_time - start_time) * 1000
+        
+        table_list_data['statistics'] = {
+            'total_tables': len(table_list),
+            'collection_duration_ms': round(collection_duration, 2)
+        }
+        
+        metadata_cache.put(self.get_cache_key(conn), table_list_data['connection_info']['version'],
+                           'table_list', table_list_data)
+        
+        return table_list_data
+        
     def _normalize_indexes_data(self, indexes_data):
-        """인덱스 데이터 정규화"""
+        """인덱스 데이터 정규화 (행 이터레이터를 한 행씩 소비, 인덱스명이 없는 행은 제외)"""
+        projected, rows = self._project_rows(indexes_data, INDEX_FIELD_KEYS)
+        if projected is None:
+            return self._normalize_indexes_by_lookup(rows)
+            
+        return [
+            {
+                'table_name': table_name,
+                'index_name': index_name,
+                'non_unique': 0 if non_unique is None else non_unique,  # 0/False(고유 인덱스)는 그대로 유지
+                'column_name': column_name,
+                'seq_in_index': seq_in_index or 1
+            }
+            for table_name, index_name, non_unique, column_name, seq_in_index in projected
+            if table_name and index_name
+        ]
+        
+    def _normalize_indexes_by_lookup(self, indexes_data):
+        """인덱스 데이터 정규화 (행마다 후보 키 조회)"""
         normalized = []
         
         for row in indexes_data:
@@ -36,13 +36,19 @@ class DatabaseTimeoutError(DatabaseConnectionError):
 
 class DatabaseQueryError(Exception):
     """데이터베이스 쿼리 실행 오류"""
-    def __init__(self, message, query=None):
+    def __init__(self, message, query=None, error_code=None):
         super().__init__(message)
         self.query = query
+        self.error_code = error_code
 
 
 class UnsupportedDatabaseError(Exception):
     """지원하지 않는 데이터베이스"""
     def __init__(self, dbms):
         super().__init__(f"지원하지 않는 DBMS입니다: {dbms}")
-        self.dbms = dbms
\ No newline at end of file
+        self.dbms = dbms
+
+
+class OracleThinModeUnsupportedError(DatabaseConnectionError):
+    """python-oracledb thin 모드로 연결할 수 없는 Oracle 서버 (JDBC 방식으로 재시도 필요)"""
+    pass
\ No newline at end of file
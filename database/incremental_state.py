@@ -0,0 +1,90 @@
+"""
+증분 수집 상태 저장소
+
+이전 수집 때의 테이블별 변경 표시와 정규화된 메타데이터(컬럼, 외래키, 인덱스)를
+연결 키별 JSON 파일로 저장합니다. 연결 키에는 비밀번호가 없으며 인증 정보는 저장하지 않습니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from config import INCREMENTAL_CONFIG, FILE_CONFIG
+from utils import get_user_data_dir, ensure_directory_exists
+
+
+# 상태 파일 형식 버전 (정규화 형식이 바뀌면 올려서 이전 상태를 무시)
+STATE_FORMAT_VERSION = 1
+
+
+class IncrementalStateStore:
+    """연결 키별 증분 수집 상태 저장소"""
+    
+    def __init__(self, state_dir=None):
+        self._state_dir = state_dir
+        self._lock = threading.Lock()
+        
+    def get_state_dir(self):
+        """상태 파일 디렉토리 (없으면 생성)"""
+        state_dir = self._state_dir or os.path.join(get_user_data_dir(), INCREMENTAL_CONFIG["state_dir"])
+        ensure_directory_exists(state_dir)
+        return state_dir
+        
+    def _get_path(self, key):
+        """연결 키에 해당하는 상태 파일 경로 (파일명에는 키의 해시만 사용)"""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.get_state_dir(), f"{digest}.json")
+        
+    def load(self, key):
+        """
+        저장된 상태 읽기
+        
+        Returns:
+            dict: {'key', 'version', 'saved_at', 'tables': {테이블명: {'marker', 'columns', 'foreign_keys', 'indexes'}}}
+                  (없거나 손상되었거나 형식이 다르면 None)
+        """
+        with self._lock:
+            try:
+                with open(self._get_path(key), encoding=FILE_CONFIG["encoding"]) as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                return None
+                
+        if not isinstance(state, dict) or state.get('format') != STATE_FORMAT_VERSION or state.get('key') != key:
+            return None
+        return state
+        
+    def save(self, key, version, tables):
+        """상태 저장 (임시 파일에 쓴 뒤 교체해 중간에 실패해도 이전 상태 유지)"""
+        state = {
+            'format': STATE_FORMAT_VERSION,
+            'key': key,
+            'version': version,
+            'saved_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'tables': tables
+        }
+        path = self._get_path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with self._lock:
+            try:
+                with open(temp_path, 'w', encoding=FILE_CONFIG["encoding"]) as f:
+                    json.dump(state, f, ensure_ascii=False, default=str)
+                os.replace(temp_path, path)
+                return True
+            except OSError as e:
+                print(f"증분 수집 상태 저장 실패: {e}")
+                return False
+                
+    def clear(self, key):
+        """상태 삭제 (다음 수집은 전체 조회)"""
+        with self._lock:
+            try:
+                os.remove(self._get_path(key))
+                return True
+            except OSError:
+                return False
+
+
+# 싱글톤 인스턴스
+incremental_state_store = IncrementalStateStore()
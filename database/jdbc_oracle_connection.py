@@ -4,16 +4,416 @@
 JDBC Oracle 연결 클래스 (순수 Java JDBC + JPype 사용)
 """
 
+import atexit
+import hashlib
 import os
 import sys
+import threading
+import time
 import jpype
 from typing import List, Dict, Any, Optional
 
+from config import JVM_CONFIG, ORACLE_FETCH_CONFIG
+from utils import get_user_data_dir, ensure_directory_exists
 from .base_connection import BaseConnection
 from .exceptions import DatabaseConnectionError, DatabaseAuthenticationError
+from .oracle_metadata import OracleMetadataMixin
 
 
-class JdbcOracleConnection(BaseConnection):
+# JVM 시작 후 미리 로딩할 클래스 (첫 연결 시 클래스 로딩 대기 제거)
+PRELOAD_CLASSES = [
+    'oracle.jdbc.OracleDriver',
+    'java.sql.DriverManager',
+    'java.sql.Connection',
+    'java.sql.Statement',
+    'java.sql.PreparedStatement',
+    'java.sql.ResultSet',
+    'java.sql.ResultSetMetaData',
+    'java.sql.DatabaseMetaData',
+    'java.sql.Types',
+    'java.util.Properties',
+]
+
+# JVM은 프로세스당 한 번만 시작 가능하므로 모듈 단위로 상태 관리
+_jvm_lock = threading.Lock()
+_jvm_ready = threading.Event()
+_jvm_prestart_thread = None
+_jvm_timings = {}
+
+# 아카이브 생성 잠금 파일을 남긴 프로세스가 비정상 종료된 것으로 보는 시간 (초)
+CDS_LOCK_STALE_SECONDS = 3600
+
+
+def _get_base_path() -> str:
+    """JRE/JDBC JAR가 위치한 기본 경로 반환"""
+    if hasattr(sys, '_MEIPASS'):
+        # PyInstaller 실행 파일에서
+        return sys._MEIPASS
+    # 개발 환경에서
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_jdbc_jar_path() -> str:
+    """JDBC JAR 파일 경로 반환"""
+    return os.path.join(_get_base_path(), 'ojdbc8.jar')
+
+
+def _jvm_library_candidates(java_home: str) -> List[str]:
+    """Java 홈 경로 기준 JVM 라이브러리 후보 목록 (Windows/Linux/macOS, JDK 8의 jre 하위 구조 포함)"""
+    candidates = []
+    for home in (java_home, os.path.join(java_home, 'jre')):
+        candidates += [
+            # Windows
+            os.path.join(home, 'bin', 'server', 'jvm.dll'),
+            os.path.join(home, 'bin', 'client', 'jvm.dll'),
+            os.path.join(home, 'bin', 'jvm.dll'),
+            # Linux (Java 9 이상 / Java 8)
+            os.path.join(home, 'lib', 'server', 'libjvm.so'),
+            os.path.join(home, 'lib', 'amd64', 'server', 'libjvm.so'),
+            os.path.join(home, 'lib', 'aarch64', 'server', 'libjvm.so'),
+            os.path.join(home, 'lib', 'i386', 'client', 'libjvm.so'),
+            # macOS
+            os.path.join(home, 'lib', 'server', 'libjvm.dylib'),
+            os.path.join(home, 'lib', 'libjvm.dylib'),
+        ]
+    return candidates
+
+
+def _find_jvm() -> tuple:
+    """
+    JVM 라이브러리 찾기 (포함된 JRE → JAVA_HOME → JPype 기본 경로 순)
+    
+    Returns:
+        tuple: (JVM 라이브러리 경로, Java 홈 경로 또는 None)
+    """
+    java_homes = [os.path.join(_get_base_path(), 'jre')]
+    if os.environ.get('JAVA_HOME'):
+        java_homes.append(os.environ['JAVA_HOME'])
+        
+    checked = []
+    for java_home in java_homes:
+        print(f"JRE 경로: {java_home}")
+        for path in _jvm_library_candidates(java_home):
+            checked.append(path)
+            if os.path.exists(path):
+                print(f"✅ JVM 라이브러리 발견: {path}")
+                return path, java_home
+                
+    # 시스템에 설치된 Java (JPype 기본 탐색)
+    try:
+        path = jpype.getDefaultJVMPath()
+        if path and os.path.exists(path):
+            print(f"✅ 시스템 JVM 발견: {path}")
+            return path, None
+    except Exception:
+        pass
+        
+    raise DatabaseConnectionError(
+        f"JVM 라이브러리(jvm.dll/libjvm.so)를 찾을 수 없습니다.\n확인된 경로들:\n" + 
+        "\n".join(f"- {path}" for path in checked if os.path.isdir(os.path.dirname(path))) + 
+        "\n\nJRE가 올바르게 설치되었는지 또는 JAVA_HOME이 설정되었는지 확인하세요.",
+        dbms="Oracle JDBC"
+    )
+
+
+def _get_java_major_version(java_home: Optional[str]) -> Optional[int]:
+    """Java 홈의 release 파일에서 주 버전 확인 (1.8 → 8, 17.0.2 → 17)"""
+    if not java_home:
+        return None
+    try:
+        with open(os.path.join(java_home, 'release'), encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('JAVA_VERSION='):
+                    version = line.split('=', 1)[1].strip().strip('"')
+                    parts = version.split('.')
+                    return int(parts[1]) if parts[0] == '1' else int(parts[0].split('-')[0])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _claim_cds_archive(archive_path: str) -> bool:
+    """
+    아카이브 생성 권한 확보 (잠금 파일을 먼저 만든 프로세스 하나만 생성)
+    
+    배치 모드의 작업 프로세스들이 동시에 같은 아카이브를 쓰지 않도록 합니다.
+    오래된 잠금 파일은 생성하던 프로세스가 비정상 종료된 것으로 보고 지웁니다.
+    """
+    lock_path = f"{archive_path}.lock"
+    try:
+        if time.time() - os.path.getmtime(lock_path) > CDS_LOCK_STALE_SECONDS:
+            os.remove(lock_path)
+    except OSError:
+        pass
+    try:
+        fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except OSError:
+        return False
+    os.write(fd, str(os.getpid()).encode('ascii'))
+    os.close(fd)
+    return True
+
+
+def _publish_cds_archive(temp_path: str, archive_path: str):
+    """
+    프로그램 종료 시 JVM을 먼저 종료해 아카이브를 임시 파일에 쓰게 한 뒤 완성된 파일로 교체
+    
+    아카이브는 JVM 종료 중에 기록되므로, 교체 전에는 다른 프로세스가 쓰다 만 파일을 읽지 않습니다.
+    """
+    try:
+        if jpype.isJVMStarted():
+            jpype.shutdownJVM()
+    except Exception as e:
+        print(f"AppCDS 아카이브 저장을 위한 JVM 종료 실패: {e}")
+    try:
+        if os.path.getsize(temp_path) > 0:
+            os.replace(temp_path, archive_path)
+    except OSError:
+        pass
+    finally:
+        for path in (temp_path, f"{archive_path}.lock"):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _get_cds_options(jvm_path: str, java_home: Optional[str], jdbc_jar: str) -> List[str]:
+    """
+    AppCDS 아카이브 옵션 생성
+    
+    첫 실행에서는 종료 시 로딩된 클래스(ojdbc8, java.sql 등)를 아카이브로 저장하고,
+    이후 실행에서는 저장된 아카이브를 사용해 클래스 로딩 시간을 줄입니다.
+    동적 아카이브(-XX:ArchiveClassesAtExit)는 Java 13 이상에서만 지원됩니다.
+    아카이브는 프로세스별 임시 파일에 쓴 뒤 교체하며, 동시에 여러 프로세스가 시작해도 하나만 생성합니다.
+    """
+    if not JVM_CONFIG.get("use_cds_archive"):
+        return []
+        
+    java_version = _get_java_major_version(java_home)
+    if java_version is None or java_version < 13:
+        print(f"AppCDS 아카이브를 사용하지 않습니다. (Java 버전: {java_version or '확인 불가'}, 13 이상 필요)")
+        return []
+        
+    archive_dir = JVM_CONFIG.get("cds_archive_dir") or os.path.join(get_user_data_dir(), 'cds')
+    if not ensure_directory_exists(archive_dir):
+        return []
+        
+    # JVM 또는 JDBC JAR가 바뀌면 기존 아카이브를 쓸 수 없으므로 파일명에 반영
+    jar_stat = os.stat(jdbc_jar)
+    fingerprint = hashlib.sha1(
+        f"{jvm_path}|{java_version}|{jdbc_jar}|{jar_stat.st_size}|{int(jar_stat.st_mtime)}".encode('utf-8')
+    ).hexdigest()[:16]
+    archive_path = os.path.join(archive_dir, f"ojdbc8-{fingerprint}.jsa")
+    
+    if os.path.exists(archive_path):
+        print(f"AppCDS 아카이브 사용: {archive_path}")
+        return [f"-XX:SharedArchiveFile={archive_path}", "-Xshare:auto"]
+        
+    if not _claim_cds_archive(archive_path):
+        print("다른 프로세스가 AppCDS 아카이브를 생성하고 있어 이번 실행에서는 사용하지 않습니다.")
+        return []
+        
+    temp_path = f"{archive_path}.{os.getpid()}.tmp"
+    # atexit는 등록 역순으로 실행되므로 JPype의 종료 처리보다 먼저 실행됨
+    atexit.register(_publish_cds_archive, temp_path, archive_path)
+    print(f"AppCDS 아카이브를 생성합니다 (프로그램 종료 시 저장): {archive_path}")
+    return [f"-XX:ArchiveClassesAtExit={temp_path}"]
+
+
+def _build_jvm_options(jvm_path: str, java_home: Optional[str], jdbc_jar: str) -> List[str]:
+    """JVM 시작 옵션 생성 (힙/GC/CDS 설정 반영)"""
+    options = ["-ea"]
+    if JVM_CONFIG.get("initial_heap"):
+        options.append(f"-Xms{JVM_CONFIG['initial_heap']}")
+    if JVM_CONFIG.get("max_heap"):
+        options.append(f"-Xmx{JVM_CONFIG['max_heap']}")  # 메모리 제한
+    options += list(JVM_CONFIG.get("gc_options") or [])
+    options += list(JVM_CONFIG.get("extra_options") or [])
+    options += _get_cds_options(jvm_path, java_home, jdbc_jar)
+    options.append(f"-Djava.class.path={jdbc_jar}")
+    return options
+
+
+def ensure_jvm_started() -> Dict[str, Any]:
+    """
+    JVM 시작 및 JDBC 클래스 미리 로딩 (스레드 안전, 한 번만 수행)
+    
+    백그라운드 사전 시작이 진행 중이면 같은 작업을 반복하지 않고 완료될 때까지 기다립니다.
+    
+    Returns:
+        dict: JVM 시작 소요 시간 정보 (jvm_boot_ms, class_load_ms, wait_ms 등)
+    """
+    if _jvm_ready.is_set():
+        return dict(_jvm_timings)
+        
+    wait_start = time.time()
+    with _jvm_lock:
+        if _jvm_ready.is_set():
+            # 다른 스레드(사전 시작)가 준비를 끝냄
+            wait_ms = round((time.time() - wait_start) * 1000, 2)
+            print(f"JVM 사전 시작 완료 대기: {wait_ms}ms")
+            return dict(_jvm_timings, wait_ms=wait_ms)
+            
+        boot_start = time.time()
+        if jpype.isJVMStarted():
+            print("JVM이 이미 시작되었습니다. 기존 JVM을 재사용합니다.")
+        else:
+            print("새로운 JVM을 시작합니다...")
+            jvm_path, java_home = _find_jvm()
+            
+            # JDBC JAR 경로 확인
+            jdbc_jar = get_jdbc_jar_path()
+            print(f"JDBC JAR: {jdbc_jar}")
+            
+            if not os.path.exists(jdbc_jar):
+                raise DatabaseConnectionError(
+                    f"JDBC JAR 파일을 찾을 수 없습니다: {jdbc_jar}",
+                    dbms="Oracle JDBC"
+                )
+                
+            jvm_options = _build_jvm_options(jvm_path, java_home, jdbc_jar)
+            print(f"JVM 시작 중... ({jvm_path})")
+            print(f"JVM 옵션: {' '.join(jvm_options)}")
+            jpype.startJVM(jvm_path, *jvm_options)
+            print("✅ JVM 시작 완료!")
+        jvm_boot_ms = round((time.time() - boot_start) * 1000, 2)
+        
+        # 드라이버 및 java.sql 클래스 미리 로딩
+        class_start = time.time()
+        for class_name in PRELOAD_CLASSES:
+            jpype.JClass(class_name)
+        class_load_ms = round((time.time() - class_start) * 1000, 2)
+        
+        _jvm_timings.update({
+            'jvm_boot_ms': jvm_boot_ms,
+            'class_load_ms': class_load_ms,
+            'prestarted': threading.current_thread() is _jvm_prestart_thread
+        })
+        _jvm_ready.set()
+        print(f"JVM 준비 완료: JVM 시작 {jvm_boot_ms}ms, 클래스 로딩 {class_load_ms}ms")
+        return dict(_jvm_timings)
+
+
+def prestart_jvm(callback=None) -> bool:
+    """
+    백그라운드 스레드에서 JVM 시작 (Oracle 선택 시 미리 호출)
+    
+    Args:
+        callback (callable): 완료 시 callback(timings, error) 호출 (백그라운드 스레드에서 실행)
+        
+    Returns:
+        bool: 새로 사전 시작을 시작했으면 True (이미 준비되었거나 다른 스레드가 시작하는 중이면 False)
+    """
+    global _jvm_prestart_thread
+    
+    def _run():
+        try:
+            timings = ensure_jvm_started()
+            error = None
+        except Exception as e:
+            timings = None
+            error = e
+            print(f"JVM 사전 시작 실패 (연결 시 다시 시도): {e}")
+        if callback:
+            callback(timings, error)
+            
+    # UI 스레드에서 호출되므로 기다리지 않음 (잠금이 잡혀 있으면 다른 스레드가 JVM을 시작하는 중)
+    if not _jvm_lock.acquire(blocking=False):
+        return False
+    try:
+        if _jvm_ready.is_set() or (_jvm_prestart_thread and _jvm_prestart_thread.is_alive()):
+            return False
+        _jvm_prestart_thread = threading.Thread(target=_run, daemon=True)
+        _jvm_prestart_thread.start()
+        return True
+    finally:
+        _jvm_lock.release()
+
+
+def get_jvm_timings() -> Dict[str, Any]:
+    """JVM 시작/클래스 로딩 소요 시간 반환 (아직 준비 전이면 빈 딕셔너리)"""
+    return dict(_jvm_timings)
+
+
+# java.sql.Types 분류 (컬럼 타입별로 알맞은 getter 사용)
+_INTEGRAL_TYPES = {-6, 5, 4, -5}         # TINYINT, SMALLINT, INTEGER, BIGINT
+_DECIMAL_TYPES = {2, 3}                  # NUMERIC, DECIMAL (Oracle NUMBER)
+_FLOAT_TYPES = {6, 7, 8, 100, 101}       # FLOAT, REAL, DOUBLE, BINARY_FLOAT, BINARY_DOUBLE
+_STRING_TYPES = {1, 12, -1, -15, -9, -16, 2005, 2011}  # CHAR, VARCHAR, LONGVARCHAR, N*, CLOB, NCLOB
+
+
+def _column_reader(result_set, sql_type: int):
+    """
+    컬럼 타입에 맞는 값 읽기 함수 생성
+    
+    셀마다 JDBC 호출은 한 번만 하고(wasNull 호출 없음) 변환은 파이썬에서 합니다.
+    정수형과 소수점 없는 NUMBER는 int, 실수형은 float, 나머지 NUMBER와 문자열은 str로 반환합니다.
+    그 외 타입(DATE, TIMESTAMP 등)은 기존과 같이 getObject 결과를 문자열로 변환합니다.
+    """
+    get_string = result_set.getString
+    if sql_type in _INTEGRAL_TYPES:
+        def read(index):
+            value = get_string(index)
+            return None if value is None else int(str(value))
+    elif sql_type in _DECIMAL_TYPES:
+        def read(index):
+            value = get_string(index)
+            if value is None:
+                return None
+            text = str(value)
+            # NUMBER 식(CASE, column_id 등)은 정밀도 정보가 없으므로 값으로 판단
+            return int(text) if text.lstrip('-').isdigit() else text
+    elif sql_type in _FLOAT_TYPES:
+        def read(index):
+            value = get_string(index)
+            return None if value is None else float(str(value))
+    elif sql_type in _STRING_TYPES:
+        def read(index):
+            value = get_string(index)
+            return None if value is None else str(value)
+    else:
+        get_object = result_set.getObject
+        
+        def read(index):
+            value = get_object(index)
+            return None if value is None else str(value)
+    return read
+
+
+def get_result_columns(result_set) -> List[str]:
+    """결과 컬럼 이름 목록 (소문자로 변환)"""
+    meta_data = result_set.getMetaData()
+    return [str(meta_data.getColumnLabel(i)).lower() for i in range(1, meta_data.getColumnCount() + 1)]
+
+
+def iter_result_rows(result_set):
+    """
+    ResultSet을 한 행씩 값 튜플로 읽기
+    
+    컬럼별 getter를 미리 결정해 두고 행마다 타입 판별 없이 읽습니다.
+    (서버에서 가져오는 단위는 Statement fetch size로 정해짐)
+    
+    Yields:
+        tuple: 컬럼 순서대로의 값 튜플
+    """
+    meta_data = result_set.getMetaData()
+    readers = [
+        (i, _column_reader(result_set, int(meta_data.getColumnType(i))))
+        for i in range(1, meta_data.getColumnCount() + 1)
+    ]
+    next_row = result_set.next
+    while next_row():
+        yield tuple([read(i) for i, read in readers])
+
+
+def fetch_result_set(result_set) -> List[Dict[str, Any]]:
+    """ResultSet 전체를 딕셔너리 목록으로 변환"""
+    columns = get_result_columns(result_set)
+    return [dict(zip(columns, values)) for values in iter_result_rows(result_set)]
+
+
+class JdbcOracleConnection(OracleMetadataMixin, BaseConnection):
     """JayDeBeApi를 사용한 Oracle JDBC 연결"""
     
     def __init__(self, host: str, port: int, database: str, username: str, password: str, 
@@ -22,6 +422,8 @@ class JdbcOracleConnection(BaseConnection):
         self.oracle_type = oracle_type
         self.connection = None
         self.jdbc_url = self._build_jdbc_url()
+        # attach_thread로 JVM에 연결한 스레드 ID
+        self._attached_threads = set()
         self._setup_jvm()
     
     def _build_jdbc_url(self) -> str:
@@ -32,74 +434,9 @@ class JdbcOracleConnection(BaseConnection):
             return f"jdbc:oracle:thin:@{self.host}:{self.port}/{self.database}"
     
     def _setup_jvm(self):
-        """JVM 초기화"""
-        # JVM이 이미 시작되었는지 확인 (매우 중요!)
-        if jpype.isJVMStarted():
-            print("JVM이 이미 시작되었습니다. 기존 JVM을 재사용합니다.")
-            return
-        
-        print("새로운 JVM을 시작합니다...")
-        
+        """JVM 초기화 (사전 시작이 진행 중이면 완료를 기다림)"""
         try:
-            # JRE 경로 설정
-            if hasattr(sys, '_MEIPASS'):
-                # PyInstaller 실행 파일에서
-                jre_path = os.path.join(sys._MEIPASS, 'jre')
-            else:
-                # 개발 환경에서
-                current_dir = os.path.dirname(os.path.abspath(__file__))
-                jre_path = os.path.join(os.path.dirname(current_dir), 'jre')
-            
-            print(f"JRE 경로: {jre_path}")
-            
-            # JVM DLL 경로 찾기
-            jvm_dll_paths = [
-                os.path.join(jre_path, 'bin', 'server', 'jvm.dll'),
-                os.path.join(jre_path, 'bin', 'client', 'jvm.dll'),
-                os.path.join(jre_path, 'bin', 'jvm.dll')
-            ]
-            
-            jvm_path = None
-            for path in jvm_dll_paths:
-                print(f"JVM DLL 확인 중: {path}")
-                if os.path.exists(path):
-                    jvm_path = path
-                    print(f"✅ JVM DLL 발견: {jvm_path}")
-                    break
-            
-            if not jvm_path:
-                raise DatabaseConnectionError(
-                    f"JVM DLL을 찾을 수 없습니다.\n확인된 경로들:\n" + 
-                    "\n".join(f"- {path}" for path in jvm_dll_paths) + 
-                    "\n\nJRE가 올바르게 설치되었는지 확인하세요.",
-                    dbms="Oracle JDBC",
-                    host=self.host,
-                    port=self.port,
-                    database=self.database
-                )
-            
-            # JDBC JAR 경로 확인
-            jdbc_jar = self._get_jdbc_jar_path()
-            print(f"JDBC JAR: {jdbc_jar}")
-            
-            if not os.path.exists(jdbc_jar):
-                raise DatabaseConnectionError(
-                    f"JDBC JAR 파일을 찾을 수 없습니다: {jdbc_jar}",
-                    dbms="Oracle JDBC",
-                    host=self.host,
-                    port=self.port,
-                    database=self.database
-                )
-            
-            print(f"JVM 시작 중... ({jvm_path})")
-            jpype.startJVM(
-                jvm_path, 
-                "-ea",
-                "-Xmx512m",  # 메모리 제한
-                f"-Djava.class.path={jdbc_jar}"
-            )
-            print("✅ JVM 시작 완료!")
-            
+            ensure_jvm_started()
         except Exception as e:
             raise DatabaseConnectionError(
                 f"JVM 초기화 실패: {str(e)}",
@@ -111,20 +448,16 @@ class JdbcOracleConnection(BaseConnection):
     
     def _get_jdbc_jar_path(self) -> str:
         """JDBC JAR 파일 경로 반환"""
-        if hasattr(sys, '_MEIPASS'):
-            # PyInstaller 실행 파일에서
-            return os.path.join(sys._MEIPASS, 'ojdbc8.jar')
-        else:
-            # 개발 환경에서
-            return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'ojdbc8.jar')
-    
+        return get_jdbc_jar_path()
+        
     def get_dbms_name(self) -> str:
         return "Oracle JDBC"
     
     def test_connection(self) -> bool:
         """연결 테스트"""
         try:
-            result = self.connect()
+            # 이미 연결된 경우(연결 풀에서 재사용) 다시 로그인하지 않음
+            result = self.is_connected or self.connect()
             if result and self.is_connected:
                 # 간단한 쿼리로 연결 확인
                 test_result = self.execute_query("SELECT 'TEST' as test_col FROM dual")
@@ -134,6 +467,34 @@ class JdbcOracleConnection(BaseConnection):
             print(f"연결 테스트 실패: {e}")
             return False
     
+    def ping(self) -> bool:
+        """연결 유효성 확인 (JDBC Connection.isValid 사용)"""
+        if not self.is_connected or not getattr(self, 'java_connection', None):
+            return False
+        try:
+            return bool(self.java_connection.isValid(5))
+        except Exception:
+            return False
+            
+    def attach_thread(self):
+        """
+        현재 스레드를 JVM에 연결 (병렬 수집 작업 스레드용)
+        
+        JPype는 첫 Java 호출 때 스레드를 자동으로 연결하지만 해제하지 않으므로,
+        직접 연결한 스레드는 detach_thread에서 해제합니다.
+        연결 여부는 Java 호출 없이 확인해야 합니다 (JClass 호출 자체가 스레드를 자동 연결함).
+        """
+        if not jpype.isThreadAttachedToJVM():
+            jpype.attachThreadToJVM()
+            self._attached_threads.add(threading.get_ident())
+            
+    def detach_thread(self):
+        """attach_thread로 연결한 스레드를 JVM에서 해제"""
+        ident = threading.get_ident()
+        if ident in self._attached_threads:
+            self._attached_threads.discard(ident)
+            jpype.detachThreadFromJVM()
+            
     def get_version(self) -> str:
         """Oracle 버전 정보 반환"""
         try:
@@ -150,11 +511,11 @@ class JdbcOracleConnection(BaseConnection):
     def connect(self) -> bool:
         """Oracle JDBC 연결"""
         try:
-            # JVM 상태 확인 및 로깅
-            if jpype.isJVMStarted():
+            # JVM 상태 확인 및 로깅 (사전 시작 중이면 완료를 기다림)
+            if jpype.isJVMStarted() and _jvm_ready.is_set():
                 print(f"JVM 상태: {self.get_jvm_info()}")
             else:
-                print("JVM이 시작되지 않았습니다. 초기화를 다시 시도합니다.")
+                print("JVM이 준비되지 않았습니다. 초기화를 기다립니다.")
                 self._setup_jvm()
             
 
@@ -180,6 +541,10 @@ class JdbcOracleConnection(BaseConnection):
                 props = Properties()
                 props.setProperty("user", JavaString(username_str))
                 props.setProperty("password", JavaString(password_str))
+                # 왕복 횟수를 줄이기 위한 기본 행 프리페치 크기
+                props.setProperty("defaultRowPrefetch", str(ORACLE_FETCH_CONFIG["row_prefetch"]))
+                # LONG 컬럼(DATA_DEFAULT)이 있어도 행을 하나씩 가져오지 않도록 설정
+                props.setProperty("useFetchSizeWithLongColumn", "true")
                 
                 # JDBC 연결
                 java_connection = DriverManager.getConnection(self.jdbc_url, props)
@@ -272,311 +637,76 @@ class JdbcOracleConnection(BaseConnection):
                 return f"JVM 실행 중 (정보 확인 실패: {e})"
         else:
             return "JVM 미실행"
-    
-    def execute_query(self, query: str) -> List[Dict[str, Any]]:
-        """쿼리 실행 (순수 Java JDBC 사용)"""
-        if not hasattr(self, 'java_connection') or not self.java_connection:
-            raise DatabaseConnectionError("데이터베이스에 연결되지 않았습니다.", dbms=self.get_dbms_name())
-        
-        try:
-            # Java Statement 생성
-            statement = self.java_connection.createStatement()
-            result_set = statement.executeQuery(query)
             
-            # 메타데이터 가져오기
-            meta_data = result_set.getMetaData()
-            column_count = meta_data.getColumnCount()
-            
-            # 컬럼 이름 추출 (소문자로 변환)
-            columns = []
-            for i in range(1, column_count + 1):
-                column_label = meta_data.getColumnLabel(i)
-                # Java String을 Python 문자열로 변환 후 소문자 변환
-                columns.append(str(column_label).lower())
-            
-            # 결과 데이터 추출
-            result = []
-            while result_set.next():
-                row_dict = {}
-                for i, column_name in enumerate(columns, 1):
-                    value = result_set.getObject(i)
-                    # Java null을 Python None으로 변환
-                    if value is None:
-                        row_dict[column_name] = None
-                    else:
-                        row_dict[column_name] = str(value)  # Java 객체를 문자열로 변환
-                result.append(row_dict)
-            
-            # 리소스 정리
-            result_set.close()
-            statement.close()
-            
-            return result
-            
-        except Exception as e:
-            raise DatabaseConnectionError(f"쿼리 실행 실패: {str(e)}", dbms=self.get_dbms_name())
-    
-    def get_tables_basic_info(self) -> List[Dict[str, Any]]:
-        """테이블 기본 정보만 조회 (MySQL과 동일한 컬럼명)"""
-        query = """
-        SELECT
-            t.table_name                             AS TABLE_NAME,
-            NVL(tc.comments, '')                     AS "테이블설명"
-        FROM (
-            SELECT table_name  FROM user_tables  WHERE table_name NOT LIKE 'BIN$%'
-            UNION ALL
-            SELECT view_name AS table_name FROM user_views
-        ) t
-        LEFT JOIN user_tab_comments tc
-            ON tc.table_name = t.table_name
-        ORDER BY t.table_name
+    def execute_query(self, query: str, params=None) -> List[Dict[str, Any]]:
         """
-        return self.execute_query(query)
-    
-    def _get_default_values_via_jdbc(self) -> Dict[str, str]:
-        """JDBC 메타데이터로 모든 테이블의 Default 값을 한 번에 수집"""
-        default_map = {}
-        try:
-            db_meta = self.java_connection.getMetaData()
-            # Oracle에서는 username이 스키마명
-            schema_name = self.username.upper()
-            
-            col_meta_rs = db_meta.getColumns(
-                None,
-                schema_name,              # TABLE_SCHEMA (username 사용)
-                None,                     # TABLE_NAME (모든 테이블)
-                None                      # COLUMN_NAME (모든 컬럼)
-            )
-            
-            while col_meta_rs.next():
-                table_name = col_meta_rs.getString("TABLE_NAME")
-                col_name = col_meta_rs.getString("COLUMN_NAME")
-                col_def = col_meta_rs.getString("COLUMN_DEF")  # DEFAULT 값
-                
-                # 테이블.컬럼 형태로 키 생성
-                key = f"{table_name}.{col_name}"
-                # Default 값 정리: None, 빈 문자열, 공백만 있는 경우 처리
-                if col_def is None:
-                    clean_default = ""
-                else:
-                    clean_default = str(col_def).strip()
-                    # 특수한 Oracle Default 값들 정리
-                    if clean_default in ['NULL', 'null', "''", '""', '-']:
-                        clean_default = ""
-                default_map[key] = clean_default
-                
-            col_meta_rs.close()
-            return default_map
-        except Exception as e:
-            # JDBC 메타데이터 수집 실패 시 빈 딕셔너리 반환 (기존 동작 유지)
-            return {}
-
-    def get_tables_info(self) -> List[Dict[str, Any]]:
-        """테이블+컬럼 정보 조회 (MySQL과 완전히 동일한 컬럼명·순서)"""
-        # 1. JDBC 메타데이터로 Default 값들을 한 번에 수집
-        default_map = self._get_default_values_via_jdbc()
+        쿼리 실행 (순수 Java JDBC 사용)
         
-        # 2. 기본 테이블+컬럼 정보 조회 (DEFAULT_VALUE는 여전히 빈 문자열)
-        query = """
-        SELECT
-            t.table_name                             AS TABLE_NAME,
-            NVL(tc.comments, '')                     AS "테이블설명",
-            c.column_id                              AS NO,
-            c.column_name                            AS "컬럼명",
-            -- MySQL의 COLUMN_TYPE 과 같은 형태로 뿌려주기
-            CASE
-              WHEN c.data_type IN ('VARCHAR2','CHAR','NVARCHAR2','NCHAR')
-                THEN c.data_type || '(' || c.char_length || ')'
-              WHEN c.data_type='NUMBER'
-                AND c.data_precision IS NOT NULL
-                AND c.data_scale     IS NOT NULL
-                THEN c.data_type || '(' || c.data_precision || ',' || c.data_scale || ')'
-              WHEN c.data_type='NUMBER'
-                AND c.data_precision IS NOT NULL
-                THEN c.data_type || '(' || c.data_precision || ')'
-              ELSE c.data_type
-            END                                       AS TYPE,
-            -- LONG 타입 충돌 회피를 위해 빈 문자열로만 내려줌 (나중에 JDBC 메타데이터로 교체)
-            ''                                        AS DEFAULT_VALUE,
-            CASE WHEN c.nullable='Y' THEN 'Y' ELSE 'N' END AS NULLABLE,
-            NVL(k.key_type, '')                       AS KEY_TYPE,
-            -- AUTO_INCREMENT 여부는 Oracle에서는 해당 없음
-            ''                                        AS EXTRA,
-            NVL(cc.comments, '')                      AS "설명"
-        FROM (
-            SELECT table_name  FROM user_tables  WHERE table_name NOT LIKE 'BIN$%'
-            UNION ALL
-            SELECT view_name AS table_name FROM user_views
-        ) t
-        JOIN user_tab_columns c
-            ON c.table_name = t.table_name
-        LEFT JOIN user_tab_comments tc
-            ON tc.table_name = t.table_name
-        LEFT JOIN user_col_comments cc
-            ON cc.table_name  = c.table_name
-           AND cc.column_name = c.column_name
-        LEFT JOIN (
-            -- PK/UNI/FK 를 MySQL COLUMN_KEY 값과 매핑 (PRI/UNI/MUL)
-            SELECT acc.table_name,
-                   acc.column_name,
-                   CASE ac.constraint_type
-                     WHEN 'P' THEN 'PRI'
-                     WHEN 'U' THEN 'UNI'
-                     WHEN 'R' THEN 'MUL'
-                   END AS key_type
-            FROM user_constraints ac
-            JOIN user_cons_columns acc
-              ON ac.constraint_name = acc.constraint_name
-            WHERE ac.constraint_type IN ('P','U','R')
-        ) k
-          ON k.table_name  = c.table_name
-         AND k.column_name = c.column_name
-        ORDER BY t.table_name, c.column_id
+        Args:
+            query (str): 실행할 쿼리 (바인드 변수는 ?)
+            params (list): 바인드 변수 값 목록
         """
-        
-        # 3. 쿼리 실행
-        result = self.execute_query(query)
-        
-        # 4. 결과에서 DEFAULT_VALUE를 JDBC 메타데이터로 교체
-        for row in result:
-            table_name = row.get('table_name') or row.get('TABLE_NAME')
-            column_name = row.get('컬럼명') or row.get('column_name') or row.get('COLUMN_NAME')
+        if not hasattr(self, 'java_connection') or not self.java_connection:
+            raise DatabaseConnectionError("데이터베이스에 연결되지 않았습니다.", dbms=self.get_dbms_name())
             
-            if table_name and column_name:
-                key = f"{table_name}.{column_name}"
-                default_value = default_map.get(key, "")
-                
-                # DEFAULT_VALUE 키 업데이트
-                if 'default_value' in row:
-                    row['default_value'] = default_value
-                elif 'DEFAULT_VALUE' in row:
-                    row['DEFAULT_VALUE'] = default_value
-        
-        return result
-
-    
-    def get_columns_info(self, table_name: str) -> List[Dict[str, Any]]:
-        """컬럼 정보 조회 (기본값 포함: JDBC Metadata 사용)"""
+        statement = None
         try:
-            # 1) 공통 JDBC 메타데이터 함수 사용 (해당 테이블만 필터링)
-            all_defaults = self._get_default_values_via_jdbc()
-            default_map = {}
-            table_prefix = f"{table_name.upper()}."
-            for key, value in all_defaults.items():
-                if key.startswith(table_prefix):
-                    col_name = key[len(table_prefix):]  # 테이블명. 제거
-                    default_map[col_name] = value
-
-            # 2) 실제 조회 쿼리 (DATA_DEFAULT 대신 '' AS DEFAULT_VALUE)
-            query = """
-            SELECT 
-                c.column_name                AS COLUMN_NAME,
-                CASE 
-                WHEN c.data_type IN ('VARCHAR2','CHAR','NVARCHAR2','NCHAR')
-                    THEN c.data_type || '(' || c.char_length || ')'
-                WHEN c.data_type = 'NUMBER' 
-                    AND c.data_precision IS NOT NULL 
-                    AND c.data_scale IS NOT NULL
-                    THEN c.data_type || '(' || c.data_precision || ',' || c.data_scale || ')'
-                WHEN c.data_type = 'NUMBER' 
-                    AND c.data_precision IS NOT NULL
-                    THEN c.data_type || '(' || c.data_precision || ')'
-                ELSE c.data_type
-                END                           AS TYPE,
-                CASE 
-                WHEN c.data_type IN ('VARCHAR2','CHAR','NVARCHAR2','NCHAR')
-                    THEN c.char_length
-                WHEN c.data_type = 'NUMBER' 
-                    AND c.data_precision IS NOT NULL
-                    THEN c.data_precision
-                ELSE c.data_length
-                END                           AS MAX_LENGTH,
-                c.data_precision             AS PRECISION,
-                c.data_scale                 AS SCALE,
-                CASE WHEN c.nullable = 'Y' THEN 1 ELSE 0 END AS IS_NULLABLE,
-                -- SQL에서는 빈 문자열로 채워 두고
-                ''                            AS DEFAULT_VALUE,
-                NVL(cc.comments, '')          AS "COMMENT",
-                c.column_id                  AS ORDINAL_POSITION
-            FROM user_tab_columns c
-            LEFT JOIN user_col_comments cc
-            ON cc.table_name  = c.table_name
-            AND cc.column_name = c.column_name
-            WHERE UPPER(c.table_name) = UPPER(?)
-            ORDER BY c.column_id
-            """
-            statement = self.java_connection.prepareStatement(query)
-            statement.setString(1, table_name)
+            statement = self._prepare_statement(query, params)
             result_set = statement.executeQuery()
-
-            # 3) 메타데이터+결과 매핑 (DEFAULT_VALUE는 default_map 사용)
-            meta_data    = result_set.getMetaData()
-            column_count = meta_data.getColumnCount()
-            columns = [meta_data.getColumnLabel(i).lower() for i in range(1, column_count+1)]
-
-            result = []
-            while result_set.next():
-                row_dict = {}
-                for idx, col_key in enumerate(columns, start=1):
-                    if col_key == "default_value":
-                        # SQL에서는 ''지만, 실제로는 JDBC 메타데이터에서 채워 넣기
-                        java_col_name = meta_data.getColumnLabel(idx)  # e.g. "DEFAULT_VALUE"
-                        # 원래 컬럼 이름(COLUMN_NAME) 키 가져오기
-                        actual_col_name = result_set.getString("COLUMN_NAME")
-                        row_dict[col_key] = default_map.get(actual_col_name, "")
-                    else:
-                        val = result_set.getObject(idx)
-                        row_dict[col_key] = None if val is None else str(val)
-                result.append(row_dict)
-
-            result_set.close()
-            statement.close()
-            return result
-
+            try:
+                return fetch_result_set(result_set)
+            finally:
+                result_set.close()
+                
         except Exception as e:
-            raise DatabaseConnectionError(f"컬럼 정보 조회 실패: {str(e)}")
-
-    
-    def get_foreign_keys_info(self) -> List[Dict[str, Any]]:
-        """외래키 정보 조회 (MySQL 구조와 동일)"""
-        query = """
-        SELECT
-            acc.table_name            AS TABLE_NAME,
-            acc.column_name           AS COLUMN_NAME,
-            r_acc.table_name          AS REFERENCED_TABLE_NAME,
-            r_acc.column_name         AS REFERENCED_COLUMN_NAME,
-            acc.constraint_name       AS CONSTRAINT_NAME
-        FROM user_constraints ac
-        JOIN user_cons_columns acc
-          ON ac.constraint_name = acc.constraint_name
-        JOIN user_cons_columns r_acc
-          ON ac.r_constraint_name = r_acc.constraint_name
-         AND acc.position = r_acc.position
-        WHERE ac.constraint_type = 'R'
-        ORDER BY acc.table_name, acc.column_name
+            raise DatabaseConnectionError(f"쿼리 실행 실패: {str(e)}", dbms=self.get_dbms_name())
+        finally:
+            if statement is not None:
+                statement.close()
+                
+    def iter_query(self, query: str, params=None):
         """
-        return self.execute_query(query)
-
-    def get_indexes_info(self) -> List[Dict[str, Any]]:
-        """인덱스 정보 조회 (MySQL 구조와 동일)"""
-        query = """
-        SELECT
-            ic.table_name             AS TABLE_NAME,
-            ic.index_name             AS INDEX_NAME,
-            CASE WHEN i.uniqueness='UNIQUE' THEN 0 ELSE 1 END AS NON_UNIQUE,
-            ic.column_name            AS COLUMN_NAME,
-            ic.column_position        AS SEQ_IN_INDEX
-        FROM user_indexes i
-        JOIN user_ind_columns ic
-          ON i.index_name = ic.index_name
-         AND i.table_name = ic.table_name
-        WHERE i.index_type = 'NORMAL'
-          AND NOT EXISTS (
-            SELECT 1
-              FROM user_constraints uc
-             WHERE uc.constraint_name = i.index_name
-               AND uc.constraint_type = 'P'
-          )
-        ORDER BY ic.table_name, ic.index_name, ic.column_position
+        쿼리 결과를 한 행씩 반환 (fetch size 단위로 서버에서 가져옴)
+        
+        Args:
+            query (str): 실행할 쿼리 (바인드 변수는 ?)
+            params (list): 바인드 변수 값 목록
         """
-        return self.execute_query(query)
\ No newline at end of file
+        if not hasattr(self, 'java_connection') or not self.java_connection:
+            raise DatabaseConnectionError("데이터베이스에 연결되지 않았습니다.", dbms=self.get_dbms_name())
+            
+        statement = None
+        result_set = None
+        try:
+            try:
+                statement = self._prepare_statement(query, params)
+                result_set = statement.executeQuery()
+                columns = get_result_columns(result_set)
+                rows = iter_result_rows(result_set)
+            except Exception as e:
+                raise DatabaseConnectionError(f"쿼리 실행 실패: {str(e)}", dbms=self.get_dbms_name())
+                
+            for values in rows:
+                yield dict(zip(columns, values))
+        finally:
+            if result_set is not None:
+                result_set.close()
+            if statement is not None:
+                statement.close()
+                
+    def _prepare_statement(self, query: str, params=None):
+        """PreparedStatement 생성 및 fetch size/바인드 변수 설정"""
+        statement = self.java_connection.prepareStatement(query)
+        statement.setFetchSize(ORACLE_FETCH_CONFIG["fetch_size"])
+        for index, value in enumerate(params or [], start=1):
+            if value is None:
+                statement.setNull(index, 12)  # java.sql.Types.VARCHAR
+            elif isinstance(value, bool):
+                statement.setBoolean(index, value)
+            elif isinstance(value, int):
+                statement.setLong(index, value)
+            elif isinstance(value, float):
+                statement.setDouble(index, value)
+            else:
+                statement.setString(index, str(value))
+        return statement
@@ -0,0 +1,305 @@
+"""
+메타데이터 캐시 (SQLite)
+
+정규화된 테이블 목록과 메타데이터(컬럼, 외래키, 인덱스)를 연결 키와 서버 버전별로
+사용자 데이터 디렉토리의 SQLite 파일에 저장해, 프로그램을 다시 시작해도
+테이블 선택과 명세서 생성을 캐시된 데이터로 바로 시작할 수 있게 합니다.
+메타데이터는 스키마 모델의 값 목록(SchemaModel.iter_columnar)을 테이블 단위로 나누어 압축하므로
+저장할 때 행 딕셔너리나 전체 JSON 문자열을 한꺼번에 만들지 않습니다.
+연결 키에는 비밀번호가 없으며 인증 정보는 저장하지 않습니다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from config import CACHE_CONFIG
+from model import SchemaModel, json_default, schema_of
+from model.schema_model import SECTIONS
+from utils import get_user_data_dir, without_credentials, CREDENTIAL_KEYS
+
+
+# 캐시 형식 버전 (정규화 형식이 바뀌면 올려서 이전 캐시를 무시)
+CACHE_FORMAT_VERSION = 2
+
+# 최신 여부 비교에서 제외하는 키 (수집 시각/통계/변경 표시)
+VOLATILE_KEYS = ('connection_info', 'statistics', 'change_markers')
+
+# 행 목록 구역을 모델 값 목록으로 저장했음을 표시하는 키
+COLUMNAR_KEY = '_columnar'
+
+# 전체 테이블을 뜻하는 선택 키
+ALL_TABLES = '*'
+
+# 버전을 알 수 없는 서버는 캐시하지 않음 (버전이 바뀌어도 구분할 수 없으므로)
+UNKNOWN_VERSIONS = (None, '', 'Unknown')
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    cache_key TEXT NOT NULL,
+    server_version TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    selection TEXT NOT NULL,
+    format INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (cache_key, server_version, kind, selection)
+)
+"""
+
+SELECT_ENTRY = """
+SELECT payload, digest, created_at FROM cache_entries
+WHERE cache_key = ? AND server_version = ? AND kind = ? AND selection = ? AND format = ?
+"""
+
+SELECT_DIGEST = """
+SELECT digest FROM cache_entries
+WHERE cache_key = ? AND server_version = ? AND kind = ? AND selection = ?
+"""
+
+UPSERT_ENTRY = """
+INSERT OR REPLACE INTO cache_entries
+    (cache_key, server_version, kind, selection, format, digest, payload, size, created_at, accessed_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class MetadataCache:
+    """연결 키 + 서버 버전별 메타데이터 캐시"""
+    
+    def __init__(self, path=None, ttl_seconds=None, max_bytes=None):
+        self._path = path
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else CACHE_CONFIG["ttl_seconds"]
+        self.max_bytes = max_bytes if max_bytes is not None else CACHE_CONFIG["max_bytes"]
+        self._lock = threading.Lock()
+        self._initialized = False
+        
+    @property
+    def enabled(self):
+        """캐시 사용 여부"""
+        return bool(CACHE_CONFIG.get("enabled"))
+        
+    def get_path(self):
+        """캐시 파일 경로 (사용자 데이터 디렉토리)"""
+        return self._path or os.path.join(get_user_data_dir(), CACHE_CONFIG["filename"])
+        
+    def _connect(self):
+        """SQLite 연결 (작업마다 새로 열어 스레드 간에 공유하지 않음)"""
+        db = sqlite3.connect(self.get_path(), timeout=10)
+        if not self._initialized:
+            db.execute(CREATE_TABLE)
+            db.commit()
+            self._initialized = True
+        return db
+        
+    @staticmethod
+    def selection_key(table_names):
+        """선택된 테이블 목록의 캐시 키 (None이면 전체)"""
+        if not table_names:
+            return ALL_TABLES
+        joined = '\n'.join(sorted(set(table_names)))
+        return hashlib.sha1(joined.encode('utf-8')).hexdigest()
+        
+    @staticmethod
+    def strip_credentials(data):
+        """connection_info에서 인증 정보를 제거한 사본 반환"""
+        data = dict(data)
+        if isinstance(data.get('connection_info'), dict):
+            data['connection_info'] = without_credentials(data['connection_info'])
+        for key in CREDENTIAL_KEYS:
+            data.pop(key, None)
+        return data
+        
+    @staticmethod
+    def _encode_chunks(data):
+        """
+        데이터를 JSON 조각으로 나누어 생성 (조각, 내용 해시 포함 여부)
+        
+        tables가 있으면 행 목록 구역(tables, foreign_keys, indexes)은 스키마 모델의 값 목록으로
+        테이블/행 하나씩 인코딩합니다. 수집기가 만든 메타데이터는 행 뷰의 모델을 그대로 쓰므로
+        행 딕셔너리를 다시 만들지 않습니다.
+        """
+        def dumps(value):
+            return json.dumps(value, ensure_ascii=False, default=json_default)
+            
+        schema = schema_of(data) if 'tables' in data else None
+        yield '{', False
+        first = True
+        for key, value in data.items():
+            if schema is not None and key in SECTIONS:
+                continue
+            yield f"{'' if first else ','}{dumps(key)}:{dumps(value)}", key not in VOLATILE_KEYS
+            first = False
+        if schema is None:
+            yield '}', False
+            return
+            
+        yield f"{'' if first else ','}{dumps(COLUMNAR_KEY)}:true", False
+        for section in SECTIONS:
+            yield f",{dumps(section)}:[", True
+            for index, item in enumerate(schema.iter_columnar(section)):
+                yield f"{',' if index else ''}{dumps(item)}", True
+            yield ']', True
+        yield '}', False
+        
+    @classmethod
+    def content_digest(cls, data):
+        """수집 시각/통계를 제외한 내용의 해시 (최신 여부 비교용)"""
+        digest = hashlib.sha1()
+        for chunk, hashed in cls._encode_chunks(data):
+            if hashed:
+                digest.update(chunk.encode('utf-8'))
+        return digest.hexdigest()
+        
+    @classmethod
+    def _encode(cls, data):
+        """
+        압축된 페이로드와 내용 해시 생성 (조각마다 압축/해시하므로 전체 JSON 문자열을 만들지 않음)
+        
+        Returns:
+            tuple: (페이로드 bytes, 내용 해시)
+        """
+        compressor = zlib.compressobj()
+        digest = hashlib.sha1()
+        parts = []
+        for chunk, hashed in cls._encode_chunks(data):
+            encoded = chunk.encode('utf-8')
+            if hashed:
+                digest.update(encoded)
+            parts.append(compressor.compress(encoded))
+        parts.append(compressor.flush())
+        return b''.join(parts), digest.hexdigest()
+        
+    @staticmethod
+    def _decode(payload):
+        """페이로드를 데이터로 복원 (값 목록으로 저장한 구역은 스키마 모델의 행 뷰로 연결)"""
+        data = json.loads(zlib.decompress(payload).decode('utf-8'))
+        if data.pop(COLUMNAR_KEY, False):
+            schema = SchemaModel.from_columnar(*(data.pop(section) for section in SECTIONS))
+            schema.attach(data)
+        return data
+        
+    def get(self, cache_key, server_version, kind, selection=ALL_TABLES):
+        """
+        캐시된 데이터 읽기
+        
+        Args:
+            cache_key (str): 연결 키 (ConnectionManager.get_connection_key)
+            server_version (str): 서버 버전
+            kind (str): 'table_list' 또는 'metadata'
+            selection (str): 선택 키 (selection_key)
+            
+        Returns:
+            dict: 캐시된 데이터 (statistics에 from_cache, cached_at 추가, 없거나 만료되었으면 None)
+        """
+        if not self.enabled or server_version in UNKNOWN_VERSIONS:
+            return None
+        now = time.time()
+        params = (cache_key, str(server_version), kind, selection)
+        
+        with self._lock:
+            try:
+                db = self._connect()
+                try:
+                    row = db.execute(SELECT_ENTRY, params + (CACHE_FORMAT_VERSION,)).fetchone()
+                    if row is None:
+                        return None
+                    payload, _, created_at = row
+                    if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                        return None
+                    db.execute(
+                        "UPDATE cache_entries SET accessed_at = ? "
+                        "WHERE cache_key = ? AND server_version = ? AND kind = ? AND selection = ?",
+                        (now,) + params
+                    )
+                    db.commit()
+                finally:
+                    db.close()
+                data = self._decode(payload)
+            except (sqlite3.Error, zlib.error, ValueError) as e:
+                print(f"메타데이터 캐시 읽기 실패: {e}")
+                return None
+                
+        statistics = data.setdefault('statistics', {})
+        statistics['from_cache'] = True
+        statistics['cached_at'] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created_at))
+        return data
+        
+    def put(self, cache_key, server_version, kind, data, selection=ALL_TABLES):
+        """
+        데이터 저장 (인증 정보는 제거하고 저장, 저장 후 TTL/용량 기준으로 정리)
+        
+        Returns:
+            bool: 이전에 저장된 내용과 달라졌으면 True (처음 저장 포함)
+        """
+        if not self.enabled or server_version in UNKNOWN_VERSIONS:
+            return False
+        data = self.strip_credentials(data)
+        if isinstance(data.get('statistics'), dict):
+            data['statistics'] = {
+                key: value for key, value in data['statistics'].items() if key not in ('from_cache', 'cached_at')
+            }
+        payload, digest = self._encode(data)
+        now = time.time()
+        params = (cache_key, str(server_version), kind, selection)
+        
+        with self._lock:
+            try:
+                db = self._connect()
+                try:
+                    row = db.execute(SELECT_DIGEST, params).fetchone()
+                    db.execute(UPSERT_ENTRY, params + (CACHE_FORMAT_VERSION, digest, payload, len(payload), now, now))
+                    db.commit()
+                    self._evict(db, now)
+                finally:
+                    db.close()
+            except sqlite3.Error as e:
+                print(f"메타데이터 캐시 저장 실패: {e}")
+                return False
+        return row is None or row[0] != digest
+        
+    def _evict(self, db, now):
+        """만료된 항목 삭제 후 전체 크기가 최대 크기 이하가 될 때까지 오래 사용하지 않은 항목 삭제"""
+        if self.ttl_seconds:
+            db.execute("DELETE FROM cache_entries WHERE created_at < ?", (now - self.ttl_seconds,))
+        db.execute("DELETE FROM cache_entries WHERE format != ?", (CACHE_FORMAT_VERSION,))
+        
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+        if self.max_bytes and total > self.max_bytes:
+            rows = db.execute(
+                "SELECT rowid, size FROM cache_entries ORDER BY accessed_at"
+            ).fetchall()
+            for rowid, size in rows:
+                if total <= self.max_bytes:
+                    break
+                db.execute("DELETE FROM cache_entries WHERE rowid = ?", (rowid,))
+                total -= size
+        db.commit()
+        
+    def clear(self, cache_key=None):
+        """캐시 삭제 (cache_key가 없으면 전체)"""
+        with self._lock:
+            try:
+                db = self._connect()
+                try:
+                    if cache_key is None:
+                        db.execute("DELETE FROM cache_entries")
+                    else:
+                        db.execute("DELETE FROM cache_entries WHERE cache_key = ?", (cache_key,))
+                    db.commit()
+                finally:
+                    db.close()
+                return True
+            except sqlite3.Error as e:
+                print(f"메타데이터 캐시 삭제 실패: {e}")
+                return False
+
+
+# 싱글톤 인스턴스
+metadata_cache = MetadataCache()
@@ -2,43 +2,290 @@
 MySQL/MariaDB 연결 클래스
 """
 
-import pymysql
-import pymysql.cursors
-from .base_connection import BaseConnection
+import re
+import time
+from config import MYSQL_CONFIG
+from .base_connection import BaseConnection, TABLE_FILTER_CHUNK_SIZE
+from .mysql_drivers import get_mysql_driver
 from .exceptions import (
     DatabaseConnectionError, DatabaseAuthenticationError,
     DatabaseNotFoundError, DatabaseTimeoutError, DatabaseQueryError
 )
 
 
+# 버전 정보
+VERSION_QUERY = "SELECT VERSION() as version"
+
+# 테이블+컬럼 정보 ({table_filter}: 테이블명 IN 조건, 전체 조회 시 빈 문자열)
+TABLES_INFO_QUERY = """
+    SELECT 
+        t.TABLE_NAME,
+        t.TABLE_COMMENT AS 테이블설명,
+        c.ORDINAL_POSITION AS NO,
+        c.COLUMN_NAME AS 컬럼명,
+        c.COLUMN_TYPE AS TYPE,
+        c.COLUMN_DEFAULT AS DEFAULT_VALUE,
+        c.IS_NULLABLE AS NULLABLE,
+        c.COLUMN_KEY AS KEY_TYPE,
+        c.EXTRA AS EXTRA,
+        c.COLUMN_COMMENT AS 설명
+    FROM 
+        INFORMATION_SCHEMA.TABLES t
+    JOIN 
+        INFORMATION_SCHEMA.COLUMNS c
+        ON t.TABLE_NAME = c.TABLE_NAME
+        AND t.TABLE_SCHEMA = c.TABLE_SCHEMA
+    WHERE 
+        t.TABLE_SCHEMA = %s
+        AND t.TABLE_TYPE IN ('BASE TABLE', 'VIEW')
+        {table_filter}
+    ORDER BY 
+        t.TABLE_NAME, c.ORDINAL_POSITION
+"""
+
+# 외래키 정보 ({table_filter}: 테이블명 IN 조건)
+FOREIGN_KEYS_QUERY = """
+    SELECT 
+        TABLE_NAME,
+        COLUMN_NAME,
+        REFERENCED_TABLE_NAME,
+        REFERENCED_COLUMN_NAME,
+        CONSTRAINT_NAME
+    FROM 
+        INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+    WHERE 
+        TABLE_SCHEMA = %s
+        AND REFERENCED_TABLE_NAME IS NOT NULL
+        {table_filter}
+    ORDER BY TABLE_NAME, COLUMN_NAME
+"""
+
+# 테이블 기본 정보 (테이블명, 코멘트)
+TABLES_BASIC_INFO_QUERY = """
+    SELECT 
+        TABLE_NAME as table_name,
+        TABLE_COMMENT as table_comment
+    FROM 
+        INFORMATION_SCHEMA.TABLES
+    WHERE 
+        TABLE_SCHEMA = %s
+        AND TABLE_TYPE IN ('BASE TABLE', 'VIEW')
+    ORDER BY 
+        TABLE_NAME
+"""
+
+# 인덱스 정보 (PRIMARY 제외, {table_filter}: 테이블명 IN 조건)
+INDEXES_QUERY = """
+    SELECT 
+        TABLE_NAME,
+        INDEX_NAME,
+        NON_UNIQUE,
+        COLUMN_NAME,
+        SEQ_IN_INDEX
+    FROM 
+        INFORMATION_SCHEMA.STATISTICS 
+    WHERE 
+        TABLE_SCHEMA = %s
+        AND INDEX_NAME != 'PRIMARY'
+        {table_filter}
+    ORDER BY 
+        TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+"""
+# 테이블별 변경 표시 (8.0 이상 전용, 명세서에 나오는 구조의 해시)
+# CREATE_TIME은 메타데이터만 바꾸는 ALTER(코멘트 변경, INSTANT ADD COLUMN)에서 바뀌지 않고
+# UPDATE_TIME은 DML에서만 바뀌므로, 데이터 사전에서 읽는 컬럼/인덱스/외래키/뷰 정의를 해시합니다.
+# 통계 컬럼은 읽지 않으므로 테이블을 열지 않습니다.
+CHANGE_MARKERS_QUERY = """
+    SELECT 
+        t.TABLE_NAME,
+        MD5(CONCAT_WS('|',
+            t.TABLE_COMMENT,
+            c.signature,
+            s.signature,
+            k.signature,
+            MD5(v.VIEW_DEFINITION)
+        )) AS MARKER
+    FROM 
+        INFORMATION_SCHEMA.TABLES t
+    LEFT JOIN (
+        SELECT TABLE_NAME, MD5(GROUP_CONCAT(
+                   CONCAT_WS(',', ORDINAL_POSITION, COLUMN_NAME, COLUMN_TYPE, IFNULL(COLUMN_DEFAULT, '(NULL)'),
+                             IS_NULLABLE, COLUMN_KEY, EXTRA, COLUMN_COMMENT)
+                   ORDER BY ORDINAL_POSITION SEPARATOR ';')) AS signature
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = %s
+        GROUP BY TABLE_NAME
+    ) c ON c.TABLE_NAME = t.TABLE_NAME
+    LEFT JOIN (
+        SELECT TABLE_NAME, MD5(GROUP_CONCAT(
+                   CONCAT_WS(',', INDEX_NAME, NON_UNIQUE, COLUMN_NAME, SEQ_IN_INDEX)
+                   ORDER BY INDEX_NAME, SEQ_IN_INDEX SEPARATOR ';')) AS signature
+        FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_SCHEMA = %s
+        GROUP BY TABLE_NAME
+    ) s ON s.TABLE_NAME = t.TABLE_NAME
+    LEFT JOIN (
+        SELECT TABLE_NAME, MD5(GROUP_CONCAT(
+                   CONCAT_WS(',', CONSTRAINT_NAME, COLUMN_NAME, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME)
+                   ORDER BY CONSTRAINT_NAME, COLUMN_NAME SEPARATOR ';')) AS signature
+        FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = %s
+            AND REFERENCED_TABLE_NAME IS NOT NULL
+        GROUP BY TABLE_NAME
+    ) k ON k.TABLE_NAME = t.TABLE_NAME
+    LEFT JOIN 
+        INFORMATION_SCHEMA.VIEWS v
+        ON v.TABLE_SCHEMA = t.TABLE_SCHEMA
+        AND v.TABLE_NAME = t.TABLE_NAME
+    WHERE 
+        t.TABLE_SCHEMA = %s
+        AND t.TABLE_TYPE IN ('BASE TABLE', 'VIEW')
+"""
+
+# 변경 표시 해시 전에 GROUP_CONCAT이 잘리지 않도록 늘리는 길이 (기본 1024바이트)
+CHANGE_MARKERS_GROUP_CONCAT_MAX_LEN = 16 * 1024 * 1024
+
+# MySQL 5.7 이하/MariaDB용 테이블 단위 쿼리
+# TABLE_SCHEMA와 TABLE_NAME을 상수로 지정하면 INFORMATION_SCHEMA가 해당 테이블의 .frm만 엽니다.
+LEGACY_TABLE_LIST_QUERY = "SHOW FULL TABLES"
+
+LEGACY_TABLE_COLUMNS_QUERY = """
+    SELECT 
+        c.TABLE_NAME,
+        (SELECT t.TABLE_COMMENT FROM INFORMATION_SCHEMA.TABLES t
+          WHERE t.TABLE_SCHEMA = %s AND t.TABLE_NAME = %s) AS 테이블설명,
+        c.ORDINAL_POSITION AS NO,
+        c.COLUMN_NAME AS 컬럼명,
+        c.COLUMN_TYPE AS TYPE,
+        c.COLUMN_DEFAULT AS DEFAULT_VALUE,
+        c.IS_NULLABLE AS NULLABLE,
+        c.COLUMN_KEY AS KEY_TYPE,
+        c.EXTRA AS EXTRA,
+        c.COLUMN_COMMENT AS 설명
+    FROM 
+        INFORMATION_SCHEMA.COLUMNS c
+    WHERE 
+        c.TABLE_SCHEMA = %s
+        AND c.TABLE_NAME = %s
+    ORDER BY 
+        c.ORDINAL_POSITION
+"""
+
+LEGACY_TABLE_COMMENT_QUERY = """
+    SELECT 
+        TABLE_NAME as table_name,
+        TABLE_COMMENT as table_comment
+    FROM 
+        INFORMATION_SCHEMA.TABLES
+    WHERE 
+        TABLE_SCHEMA = %s
+        AND TABLE_NAME = %s
+"""
+
+LEGACY_TABLE_FOREIGN_KEYS_QUERY = """
+    SELECT 
+        TABLE_NAME,
+        COLUMN_NAME,
+        REFERENCED_TABLE_NAME,
+        REFERENCED_COLUMN_NAME,
+        CONSTRAINT_NAME
+    FROM 
+        INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+    WHERE 
+        TABLE_SCHEMA = %s
+        AND TABLE_NAME = %s
+        AND REFERENCED_TABLE_NAME IS NOT NULL
+    ORDER BY COLUMN_NAME
+"""
+
+LEGACY_TABLE_INDEXES_QUERY = """
+    SELECT 
+        TABLE_NAME,
+        INDEX_NAME,
+        NON_UNIQUE,
+        COLUMN_NAME,
+        SEQ_IN_INDEX
+    FROM 
+        INFORMATION_SCHEMA.STATISTICS 
+    WHERE 
+        TABLE_SCHEMA = %s
+        AND TABLE_NAME = %s
+        AND INDEX_NAME != 'PRIMARY'
+    ORDER BY 
+        INDEX_NAME, SEQ_IN_INDEX
+"""
+
+# 잠금 대기 시간 초과 오류 코드 (ER_LOCK_WAIT_TIMEOUT)
+LOCK_WAIT_TIMEOUT_ERROR = 1205
+
+# 세션 잠금 대기 시간 설정 (테이블 단위 조회 동안 낮췄다가 원래 값으로 복원)
+SET_LOCK_WAIT_TIMEOUT_QUERY = "SET SESSION lock_wait_timeout = %s"
+
+
+def _table_filter(column, count):
+    """테이블명 IN 조건 (count가 None이면 빈 문자열)"""
+    if count is None:
+        return ""
+    return f"AND {column} IN ({', '.join(['%s'] * count)})"
+
+
+class _ResultSetRows:
+    """
+    다중 문장 결과 집합 하나의 행 이터레이터
+    
+    순회를 시작하기 전에 버려져도 close()로 서버 측 커서를 닫을 수 있습니다.
+    """
+    
+    __slots__ = ('_rows', '_cursor')
+    
+    def __init__(self, rows, cursor):
+        self._rows = rows
+        self._cursor = cursor
+        
+    def __iter__(self):
+        return self._rows
+        
+    def close(self):
+        """남은 결과를 버리고 커서 닫기 (여러 번 호출해도 안전)"""
+        self._rows.close()
+        self._cursor.close()
+
+
 class MySQLConnection(BaseConnection):
     """MySQL/MariaDB 연결 클래스"""
     
+    def __init__(self, host, port, database, username, password, timeout=30, driver=None):
+        """
+        MySQL/MariaDB 연결 초기화
+        
+        Args:
+            driver (str): 드라이버 ('mysqlclient', 'pymysql', 'auto', None이면 설정값)
+        """
+        super().__init__(host, port, database, username, password, timeout)
+        self.driver = get_mysql_driver(driver)
+        self.multi_statements = MYSQL_CONFIG.get("multi_statements", False)
+        self._server_version = None
+        
     def get_dbms_name(self):
         return "MySQL/MariaDB"
         
     def connect(self):
         """MySQL/MariaDB 연결"""
         try:
-            self.connection = pymysql.connect(
+            self.connection = self.driver.connect(
                 host=self.host,
                 port=self.port,
                 user=self.username,
                 password=self.password,
                 database=self.database,
-                charset='utf8mb4',
-                connect_timeout=self.timeout,
-                read_timeout=self.timeout,
-                write_timeout=self.timeout,
-                cursorclass=pymysql.cursors.DictCursor,
-                autocommit=True
+                timeout=self.timeout,
+                multi_statements=self.multi_statements
             )
             self.is_connected = True
             return True
             
-        except pymysql.err.OperationalError as e:
-            error_code = e.args[0] if e.args else 0
-            error_msg = e.args[1] if len(e.args) > 1 else str(e)
+        except self.driver.OperationalError as e:
+            error_code, error_msg = self.driver.get_error_info(e)
             
             if error_code == 1045:  # Access denied
                 raise DatabaseAuthenticationError(
@@ -103,6 +350,16 @@ class MySQLConnection(BaseConnection):
         except Exception as e:
             raise DatabaseConnectionError(f"연결 테스트 실패: {str(e)}")
             
+    def ping(self):
+        """연결 유효성 확인 (자동 재연결 없이)"""
+        if not self.is_connected or not self.connection:
+            return False
+        try:
+            self.driver.ping(self.connection)
+            return True
+        except Exception:
+            return False
+            
     def execute_query(self, query, params=None):
         """쿼리 실행"""
         try:
@@ -116,100 +373,329 @@ class MySQLConnection(BaseConnection):
                     return cursor.rowcount
                     
         except Exception as e:
-            raise DatabaseQueryError(f"쿼리 실행 오류: {str(e)}", query=query)
+            raise self._query_error(e, query)
+            
+    def _query_error(self, error, query):
+        """드라이버 오류를 서버 오류 코드가 담긴 DatabaseQueryError로 변환"""
+        error_code, _ = self.driver.get_error_info(error)
+        if not isinstance(error_code, int):
+            error_code = None  # 드라이버 오류가 아닌 경우 (args[0]이 메시지)
+        return DatabaseQueryError(f"쿼리 실행 오류: {str(error)}", query=query, error_code=error_code)
+        
+    def iter_query(self, query, params=None):
+        """
+        쿼리 결과를 서버 측 커서(SSDictCursor)로 한 행씩 반환
+        
+        결과를 끝까지 읽기 전에는 같은 연결로 다른 쿼리를 실행할 수 없습니다.
+        """
+        if not self.is_connected:
+            raise DatabaseConnectionError("데이터베이스에 연결되지 않았습니다.")
+            
+        cursor = self.connection.cursor(self.driver.cursors.SSDictCursor)
+        try:
+            try:
+                cursor.execute(query, params)
+            except Exception as e:
+                raise self._query_error(e, query)
+            yield from iter(cursor.fetchone, None)
+        finally:
+            cursor.close()
             
     def get_version(self):
         """MySQL/MariaDB 버전 정보"""
         try:
-            result = self.execute_query("SELECT VERSION() as version")
+            result = self.execute_query(VERSION_QUERY)
             if result and len(result) > 0:
-                version_str = result[0]['version']
-                # MariaDB인지 MySQL인지 구분
-                if 'mariadb' in version_str.lower():
-                    return f"MariaDB {version_str}"
-                else:
-                    return f"MySQL {version_str}"
+                return self._format_version(result[0]['version'])
             return "Unknown"
         except Exception:
             return "Unknown"
             
-    def get_tables_info(self):
-        """테이블 정보 조회"""
-        query = """
-        SELECT 
-            t.TABLE_NAME,
-            t.TABLE_COMMENT AS 테이블설명,
-            c.ORDINAL_POSITION AS NO,
-            c.COLUMN_NAME AS 컬럼명,
-            c.COLUMN_TYPE AS TYPE,
-            c.COLUMN_DEFAULT AS DEFAULT_VALUE,
-            c.IS_NULLABLE AS NULLABLE,
-            c.COLUMN_KEY AS KEY_TYPE,
-            c.EXTRA AS EXTRA,
-            c.COLUMN_COMMENT AS 설명
-        FROM 
-            INFORMATION_SCHEMA.TABLES t
-        JOIN 
-            INFORMATION_SCHEMA.COLUMNS c
-            ON t.TABLE_NAME = c.TABLE_NAME
-            AND t.TABLE_SCHEMA = c.TABLE_SCHEMA
-        WHERE 
-            t.TABLE_SCHEMA = %s
-            AND t.TABLE_TYPE IN ('BASE TABLE', 'VIEW')
-        ORDER BY 
-            t.TABLE_NAME, c.ORDINAL_POSITION
-        """
-        return self.execute_query(query, (self.database,))
-        
-    def get_foreign_keys_info(self):
-        """외래키 정보 조회"""
-        query = """
-        SELECT 
-            TABLE_NAME,
-            COLUMN_NAME,
-            REFERENCED_TABLE_NAME,
-            REFERENCED_COLUMN_NAME,
-            CONSTRAINT_NAME
-        FROM 
-            INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-        WHERE 
-            TABLE_SCHEMA = %s
-            AND REFERENCED_TABLE_NAME IS NOT NULL
-        ORDER BY TABLE_NAME, COLUMN_NAME
+    @staticmethod
+    def _format_version(version_str):
+        """버전 문자열에 MariaDB/MySQL 구분 추가"""
+        if 'mariadb' in version_str.lower():
+            return f"MariaDB {version_str}"
+        else:
+            return f"MySQL {version_str}"
+            
+    def get_server_version(self):
         """
-        return self.execute_query(query, (self.database,))
-    
+        서버 종류와 버전 번호 확인 (연결 단위 캐시)
+        
+        Returns:
+            tuple: (MariaDB 여부, (주, 부, 패치) 버전 튜플)
+        """
+        if self._server_version is None:
+            result = self.execute_query(VERSION_QUERY)
+            version_str = result[0]['version'] if result else ''
+            numbers = re.match(r'(\d+)\.(\d+)\.?(\d*)', version_str)
+            version = tuple(int(n or 0) for n in numbers.groups()) if numbers else (0, 0, 0)
+            self._server_version = ('mariadb' in version_str.lower(), version)
+        return self._server_version
+        
+    def uses_data_dictionary(self):
+        """
+        MySQL 8.0 이상(트랜잭션 데이터 사전) 여부
+        
+        8.0 이상은 INFORMATION_SCHEMA가 데이터 사전을 조회하므로 스키마 전체 조회가 저렴하지만,
+        5.7 이하와 MariaDB는 테이블마다 .frm 파일을 열고 메타데이터 잠금을 잡습니다.
+        """
+        is_mariadb, version = self.get_server_version()
+        return not is_mariadb and version >= (8, 0, 0)
+        
+    def _execute_batch(self, statements):
+        """
+        여러 쿼리 실행 후 결과 집합 목록 반환
+        
+        다중 문장이 허용된 연결이면 한 번에 보내고 결과 집합을 차례로 읽으며,
+        아니면 쿼리를 하나씩 실행합니다.
+        
+        Args:
+            statements (list): [(쿼리, 파라미터 튜플), ...]
+        """
+        if not self.multi_statements:
+            return [list(self.execute_query(query, params)) for query, params in statements]
+            
+        batch, params = self._join_statements(statements)
+        try:
+            with self.get_cursor() as cursor:
+                cursor.execute(batch, params)
+                results = [list(cursor.fetchall())]
+                while cursor.nextset():
+                    results.append(list(cursor.fetchall()))
+            return results
+        except Exception as e:
+            raise self._query_error(e, batch)
+            
+    @staticmethod
+    def _join_statements(statements):
+        """[(쿼리, 파라미터), ...]를 다중 문장 하나와 파라미터 튜플로 결합"""
+        batch = ";\n".join(query.strip() for query, _ in statements)
+        params = tuple(value for _, query_params in statements for value in (query_params or ()))
+        return batch, params
+        
+    def _stream_batch(self, statements):
+        """
+        다중 문장을 서버 측 커서(SSDictCursor)로 실행하고 결과 집합별 행 이터레이터 목록 반환
+        
+        이터레이터는 반드시 목록 순서대로 끝까지 소비해야 하며,
+        마지막 결과 집합을 다 읽으면 커서를 닫습니다. 중간에 멈추면 아무 결과의 close()로 커서를 닫습니다.
+        """
+        batch, params = self._join_statements(statements)
+        cursor = self.connection.cursor(self.driver.cursors.SSDictCursor)
+        try:
+            cursor.execute(batch, params)
+        except Exception as e:
+            cursor.close()
+            raise self._query_error(e, batch)
+            
+        last = len(statements) - 1
+        
+        def rows(index):
+            completed = False
+            try:
+                if index == 0 or cursor.nextset():
+                    yield from iter(cursor.fetchone, None)
+                completed = True
+            except Exception as e:
+                raise self._query_error(e, batch)
+            finally:
+                # 마지막 결과 집합을 다 읽었거나 중간에 중단되면 남은 결과를 버리고 커서 닫기
+                if index == last or not completed:
+                    cursor.close()
+                    
+        return [_ResultSetRows(rows(index), cursor) for index in range(len(statements))]
+        
+    def get_catalog(self, table_names=None):
+        """
+        카탈로그 전체 조회 (버전, 테이블+컬럼, 외래키, 인덱스)
+        
+        MySQL 8.0 이상은 다중 문장(CLIENT_MULTI_STATEMENTS)으로 네 쿼리를 한 번에 보내
+        네트워크 왕복을 한 번으로 줄이고, 5.7 이하/MariaDB는 테이블 단위 배치로 조회합니다.
+        8.0 이상의 tables, foreign_keys, indexes는 서버 측 커서 행 이터레이터이므로 순서대로 소비해야 합니다.
+        
+        Args:
+            table_names (list): 조회할 테이블 목록 (None이면 전체)
+        """
+        if not self.uses_data_dictionary():
+            return self._get_catalog_legacy(sorted(set(table_names)) if table_names is not None else None)
+        if not self.multi_statements or (table_names is not None
+                                         and not 0 < len(set(table_names)) <= TABLE_FILTER_CHUNK_SIZE):
+            # 다중 문장을 쓸 수 없거나 목록이 길면 나누어 차례로 조회
+            return super().get_catalog(table_names)
+            
+        if table_names is None:
+            count, names = None, ()
+        else:
+            names = tuple(sorted(set(table_names)))
+            count = len(names)
+        params = (self.database,) + names
+        version_rows, tables, foreign_keys, indexes = self._stream_batch([
+            (VERSION_QUERY, None),
+            (TABLES_INFO_QUERY.format(table_filter=_table_filter('t.TABLE_NAME', count)), params),
+            (FOREIGN_KEYS_QUERY.format(table_filter=_table_filter('TABLE_NAME', count)), params),
+            (INDEXES_QUERY.format(table_filter=_table_filter('TABLE_NAME', count)), params)
+        ])
+        version_rows = list(version_rows)
+        return {
+            'version': self._format_version(version_rows[0]['version']) if version_rows else "Unknown",
+            'tables': tables,
+            'foreign_keys': foreign_keys,
+            'indexes': indexes
+        }
+        
+    def _get_legacy_table_names(self):
+        """SHOW FULL TABLES로 테이블/뷰 이름 목록 조회 (.frm 파일을 열지 않음)"""
+        # execute_query는 SELECT가 아닌 쿼리의 영향 행 수를 반환하므로 커서에서 직접 읽음
+        try:
+            with self.get_cursor() as cursor:
+                cursor.execute(LEGACY_TABLE_LIST_QUERY)
+                rows = cursor.fetchall()
+        except Exception as e:
+            raise self._query_error(e, LEGACY_TABLE_LIST_QUERY)
+            
+        names = []
+        for row in rows:
+            table_name, table_type = list(row.values())[:2]
+            if table_type in ('BASE TABLE', 'VIEW'):
+                names.append(table_name)
+        return sorted(names)
+        
+    def _run_legacy_batches(self, table_names, queries):
+        """
+        테이블 단위 쿼리를 배치로 나누어 실행 (MySQL 5.7 이하/MariaDB)
+        
+        - 세션 lock_wait_timeout을 낮춰 DDL이 기다리는 테이블은 빨리 포기하고 나중에 다시 시도
+        - 배치 소요 시간에 따라 배치 크기를 조절하고, 배치 사이에 쉬어 운영 부하를 제한
+        - 전체 제한 시간을 넘기면 중단
+        
+        Args:
+            table_names (list): 조회할 테이블 목록
+            queries (list): 테이블마다 실행할 쿼리 목록 (파라미터는 스키마명, 테이블명 순서 반복)
+            
+        Returns:
+            list: 쿼리별 결과 행 목록 (테이블 순서대로 이어 붙임)
+        """
+        settings = MYSQL_CONFIG["legacy_catalog"]
+        batch_size = settings["batch_tables"]
+        started = time.time()
+        results = [[] for _ in queries]
+        pending = list(table_names)
+        retries = 0
+        
+        saved = self.execute_query("SELECT @@SESSION.lock_wait_timeout AS lock_wait_timeout")
+        self.execute_query(SET_LOCK_WAIT_TIMEOUT_QUERY, (settings["lock_wait_timeout"],))
+        try:
+            while pending:
+                if time.time() - started > settings["time_budget"]:
+                    done = len(table_names) - len(pending)
+                    raise DatabaseTimeoutError(
+                        f"테이블 정보 조회 제한 시간({settings['time_budget']}초)을 초과했습니다. "
+                        f"({done}/{len(table_names)}개 테이블 처리) 테이블을 나누어 선택해주세요.",
+                        dbms=self.get_dbms_name(), host=self.host, port=self.port, database=self.database
+                    )
+                    
+                batch, rest = pending[:batch_size], pending[batch_size:]
+                statements = []
+                for table_name in batch:
+                    for query in queries:
+                        statements.append((query, (self.database, table_name) * (query.count('%s') // 2)))
+                        
+                batch_started = time.time()
+                try:
+                    batch_results = self._execute_batch(statements)
+                except DatabaseQueryError as e:
+                    if e.error_code != LOCK_WAIT_TIMEOUT_ERROR or retries >= settings["lock_retries"]:
+                        raise
+                    # DDL과 잠금 경합: 배치를 줄이고 쉬었다가 다시 시도
+                    retries += 1
+                    batch_size = max(1, batch_size // 2)
+                    time.sleep(settings["lock_wait_timeout"])
+                    continue
+                elapsed = time.time() - batch_started
+                
+                for index, rows in enumerate(batch_results):
+                    results[index % len(queries)].extend(rows)
+                pending = rest
+                
+                # 배치 크기 조절 및 쉬는 시간
+                if elapsed > settings["target_batch_seconds"]:
+                    batch_size = max(1, batch_size // 2)
+                elif elapsed < settings["target_batch_seconds"] / 2:
+                    batch_size = min(settings["max_batch_tables"], batch_size * 2)
+                if pending:
+                    time.sleep(elapsed * settings["pause_ratio"])
+        except Exception:
+            # 설정 복원 실패(연결 끊김 등)가 원래 오류를 가리지 않도록 복원 오류는 무시
+            try:
+                self.execute_query(SET_LOCK_WAIT_TIMEOUT_QUERY, (saved[0]['lock_wait_timeout'],))
+            except DatabaseQueryError:
+                pass
+            raise
+        self.execute_query(SET_LOCK_WAIT_TIMEOUT_QUERY, (saved[0]['lock_wait_timeout'],))
+        
+        return results
+        
+    def _get_catalog_legacy(self, table_names=None):
+        """
+        MySQL 5.7 이하/MariaDB 카탈로그 조회
+        
+        스키마 전체를 한 번에 JOIN하면 모든 테이블의 .frm을 열고 잠금 경합이 생기므로
+        SHOW FULL TABLES로 목록을 얻은 뒤 테이블 단위 쿼리를 배치로 실행합니다.
+        """
+        if table_names is None:
+            table_names = self._get_legacy_table_names()
+        tables, foreign_keys, indexes = self._run_legacy_batches(
+            table_names,
+            [LEGACY_TABLE_COLUMNS_QUERY, LEGACY_TABLE_FOREIGN_KEYS_QUERY, LEGACY_TABLE_INDEXES_QUERY]
+        )
+        return {
+            'version': self.get_version(),
+            'tables': tables,
+            'foreign_keys': foreign_keys,
+            'indexes': indexes
+        }
+        
+    def get_tables_info(self, table_names=None, stream=False):
+        """테이블 정보 조회 (table_names가 있으면 해당 테이블만)"""
+        return self._fetch_by_tables(
+            lambda count: TABLES_INFO_QUERY.format(table_filter=_table_filter('t.TABLE_NAME', count)),
+            (self.database,), table_names, stream
+        )
+        
+    def get_foreign_keys_info(self, table_names=None, stream=False):
+        """외래키 정보 조회 (table_names가 있으면 해당 테이블만)"""
+        return self._fetch_by_tables(
+            lambda count: FOREIGN_KEYS_QUERY.format(table_filter=_table_filter('TABLE_NAME', count)),
+            (self.database,), table_names, stream
+        )
+        
+    def get_change_markers(self):
+        """
+        테이블별 변경 표시 (컬럼/인덱스/외래키/코멘트/뷰 정의 해시)
+        
+        5.7 이하/MariaDB는 스키마 전체 INFORMATION_SCHEMA 조회가 테이블마다 .frm을 열고
+        메타데이터 잠금을 기다리므로 None을 반환하고 테이블 단위 배치로 전체를 수집합니다.
+        """
+        if not self.uses_data_dictionary():
+            return None
+        self.execute_query("SET SESSION group_concat_max_len = %s", (CHANGE_MARKERS_GROUP_CONCAT_MAX_LEN,))
+        return {
+            row['TABLE_NAME']: row['MARKER']
+            for row in self.execute_query(CHANGE_MARKERS_QUERY, (self.database,) * 4)
+        }
+        
     def get_tables_basic_info(self):
         """테이블 기본 정보만 조회 (테이블명, 코멘트)"""
-        query = """
-        SELECT 
-            TABLE_NAME as table_name,
-            TABLE_COMMENT as table_comment
-        FROM 
-            INFORMATION_SCHEMA.TABLES
-        WHERE 
-            TABLE_SCHEMA = %s
-            AND TABLE_TYPE IN ('BASE TABLE', 'VIEW')
-        ORDER BY 
-            TABLE_NAME
-        """
-        return self.execute_query(query, (self.database,))
-    
-    def get_indexes_info(self):
-        """인덱스 정보 조회"""
-        query = """
-        SELECT 
-            TABLE_NAME,
-            INDEX_NAME,
-            NON_UNIQUE,
-            COLUMN_NAME,
-            SEQ_IN_INDEX
-        FROM 
-            INFORMATION_SCHEMA.STATISTICS 
-        WHERE 
-            TABLE_SCHEMA = %s
-            AND INDEX_NAME != 'PRIMARY'
-        ORDER BY 
-            TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
-        """
-        return self.execute_query(query, (self.database,))
\ No newline at end of file
+        if not self.uses_data_dictionary():
+            # 5.7 이하/MariaDB: 테이블 단위로 코멘트 조회
+            return self._run_legacy_batches(self._get_legacy_table_names(), [LEGACY_TABLE_COMMENT_QUERY])[0]
+        return self.execute_query(TABLES_BASIC_INFO_QUERY, (self.database,))
+        
+    def get_indexes_info(self, table_names=None, stream=False):
+        """인덱스 정보 조회 (table_names가 있으면 해당 테이블만)"""
+        return self._fetch_by_tables(
+            lambda count: INDEXES_QUERY.format(table_filter=_table_filter('TABLE_NAME', count)),
+            (self.database,), table_names, stream
+        )
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""
+MySQL/MariaDB 드라이버 계층
+
+C 확장으로 패킷을 해석하는 mysqlclient(MySQLdb)가 설치되어 있으면 우선 사용하고,
+없으면 순수 파이썬 드라이버인 PyMySQL을 사용합니다.
+두 드라이버 모두 DictCursor 결과와 OperationalError(코드, 메시지) 형식이 같도록 맞춥니다.
+"""
+
+from config import MYSQL_CONFIG
+
+
+class MySQLDriver:
+    """MySQL 드라이버 공통 인터페이스"""
+    
+    name = None
+    
+    def __init__(self, module, cursors, client_constants):
+        self.module = module
+        self.cursors = cursors
+        self.client_constants = client_constants
+        self.OperationalError = module.OperationalError
+        
+    def connect(self, host, port, user, password, database, timeout, multi_statements=False):
+        """
+        연결 생성 (DictCursor, autocommit)
+        
+        Args:
+            multi_statements (bool): 한 번에 여러 SQL 문 실행 허용 (CLIENT_MULTI_STATEMENTS)
+        """
+        client_flag = self.client_constants.MULTI_STATEMENTS if multi_statements else 0
+        return self.module.connect(
+            host=host,
+            port=port,
+            user=user,
+            password=password,
+            database=database,
+            charset='utf8mb4',
+            connect_timeout=timeout,
+            read_timeout=timeout,
+            write_timeout=timeout,
+            cursorclass=self.cursors.DictCursor,
+            client_flag=client_flag,
+            autocommit=True
+        )
+        
+    def ping(self, connection):
+        """자동 재연결 없이 연결 확인"""
+        raise NotImplementedError
+        
+    @staticmethod
+    def get_error_info(error):
+        """OperationalError에서 (오류 코드, 메시지) 추출"""
+        error_code = error.args[0] if error.args else 0
+        error_msg = error.args[1] if len(error.args) > 1 else str(error)
+        return error_code, error_msg
+
+
+class MySQLClientDriver(MySQLDriver):
+    """mysqlclient (MySQLdb, C 확장)"""
+    
+    name = 'mysqlclient'
+    
+    def ping(self, connection):
+        # mysqlclient 2.x는 자동 재연결이 기본적으로 꺼져 있음
+        connection.ping()
+
+
+class PyMySQLDriver(MySQLDriver):
+    """PyMySQL (순수 파이썬)"""
+    
+    name = 'pymysql'
+    
+    def ping(self, connection):
+        connection.ping(reconnect=False)
+
+
+def _load_mysqlclient():
+    import MySQLdb
+    import MySQLdb.cursors
+    from MySQLdb.constants import CLIENT
+    return MySQLClientDriver(MySQLdb, MySQLdb.cursors, CLIENT)
+
+
+def _load_pymysql():
+    import pymysql
+    import pymysql.cursors
+    from pymysql.constants import CLIENT
+    return PyMySQLDriver(pymysql, pymysql.cursors, CLIENT)
+
+
+# 드라이버 이름 -> 로더 ('auto'일 때 이 순서로 시도)
+DRIVER_LOADERS = {
+    'mysqlclient': _load_mysqlclient,
+    'pymysql': _load_pymysql
+}
+
+_drivers = {}
+
+
+def get_mysql_driver(name=None):
+    """
+    사용할 MySQL 드라이버 반환
+    
+    Args:
+        name (str): 'mysqlclient', 'pymysql' 또는 'auto' (None이면 설정값)
+        
+    Returns:
+        MySQLDriver: 드라이버 객체
+        
+    Raises:
+        ImportError: 사용할 수 있는 드라이버가 없는 경우
+    """
+    name = name or MYSQL_CONFIG.get("driver", "auto")
+    candidates = list(DRIVER_LOADERS) if name == 'auto' else [name]
+    
+    errors = []
+    for candidate in candidates:
+        if candidate not in _drivers:
+            try:
+                _drivers[candidate] = DRIVER_LOADERS[candidate]()
+            except ImportError as e:
+                errors.append(f"{candidate}: {e}")
+                continue
+        return _drivers[candidate]
+        
+    raise ImportError(f"사용할 수 있는 MySQL 드라이버가 없습니다. ({'; '.join(errors)})")
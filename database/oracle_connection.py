@@ -0,0 +1,233 @@
+"""
+Oracle 연결 클래스 (python-oracledb 사용, JVM 불필요)
+"""
+
+from typing import List, Dict, Any
+
+try:
+    import oracledb
+except ImportError:  # python-oracledb 미설치 시 JDBC 방식만 사용
+    oracledb = None
+
+from config import ORACLE_CONFIG
+from .base_connection import BaseConnection
+from .oracle_metadata import OracleMetadataMixin
+from .exceptions import (
+    DatabaseConnectionError, DatabaseAuthenticationError,
+    DatabaseNotFoundError, DatabaseTimeoutError, DatabaseQueryError,
+    OracleThinModeUnsupportedError
+)
+
+
+# thin 모드에서 지원하지 않는 서버/설정 오류 (thick 모드 또는 JDBC로만 연결 가능)
+THIN_UNSUPPORTED_ERRORS = (
+    'DPY-3001',  # Native Network Encryption 사용 서버
+    'DPY-3010',  # 지원하지 않는 서버 버전 (11.2 미만)
+    'DPY-3012',  # 지원하지 않는 문자셋
+    'DPY-3015',  # 지원하지 않는 비밀번호 검증 방식 (10g 방식)
+)
+
+_thick_mode_initialized = False
+
+
+def is_oracledb_available():
+    """python-oracledb 설치 여부 확인"""
+    return oracledb is not None
+
+
+class OracleConnection(OracleMetadataMixin, BaseConnection):
+    """Oracle 연결 클래스 (python-oracledb thin 모드)"""
+    
+    bind_paramstyle = 'numeric'
+    
+    def __init__(self, host, port, database, username, password, timeout=30, oracle_type='service_name'):
+        """
+        Oracle 연결 초기화
+        
+        Args:
+            oracle_type (str): Oracle 연결 방식 ('service_name' 또는 'sid')
+        """
+        super().__init__(host, port, database, username, password, timeout)
+        self.oracle_type = oracle_type
+        
+    def get_dbms_name(self):
+        return "Oracle"
+        
+    def _build_dsn(self):
+        """연결 방식에 따른 DSN 생성"""
+        if self.oracle_type == 'sid':
+            # Easy Connect 문자열은 SID를 지원하지 않으므로 연결 기술자 사용
+            return oracledb.makedsn(self.host, self.port, sid=self.database)
+        # Service Name 방식: host:port/service_name (기본값)
+        return f"{self.host}:{self.port}/{self.database}"
+        
+    def _open(self, dsn):
+        """oracledb 연결 생성"""
+        self.connection = oracledb.connect(
+            user=self.username,
+            password=self.password,
+            dsn=dsn,
+            tcp_connect_timeout=self.timeout
+        )
+        self.connection.autocommit = True
+        self.is_connected = True
+        
+    def connect(self):
+        """Oracle 연결 (thin 모드, 필요 시 thick 모드로 재시도)"""
+        global _thick_mode_initialized
+        
+        if oracledb is None:
+            raise OracleThinModeUnsupportedError(
+                "python-oracledb가 설치되어 있지 않습니다.",
+                dbms=self.get_dbms_name(), host=self.host, port=self.port, database=self.database
+            )
+            
+        dsn = self._build_dsn()
+        try:
+            self._open(dsn)
+            print(f"Oracle {'thick' if _thick_mode_initialized else 'thin'} mode 연결 성공!")
+            return True
+            
+        except oracledb.DatabaseError as error:
+            error_msg = str(error)
+            if not any(code in error_msg for code in THIN_UNSUPPORTED_ERRORS):
+                raise self._translate_error(error)
+            print(f"Oracle thin mode로 연결할 수 없는 서버입니다: {error_msg}")
+            
+        # thin 모드로 연결할 수 없는 서버: 설정된 경우 thick 모드(Oracle Client) 시도
+        if ORACLE_CONFIG.get("thick_mode"):
+            try:
+                if not _thick_mode_initialized:
+                    oracledb.init_oracle_client()
+                    _thick_mode_initialized = True
+                    print("Oracle thick mode 초기화 성공!")
+                self._open(dsn)
+                print("Oracle thick mode 연결 성공!")
+                return True
+            except Exception as thick_error:
+                print(f"Oracle thick mode도 실패: {thick_error}")
+                
+        raise OracleThinModeUnsupportedError(
+            "python-oracledb로 연결할 수 없는 서버입니다. JDBC 방식으로 연결해야 합니다.",
+            dbms=self.get_dbms_name(), host=self.host, port=self.port, database=self.database
+        )
+        
+    def _translate_error(self, error):
+        """oracledb 오류를 공통 예외로 변환 (JDBC 연결과 같은 분류)"""
+        error_msg = str(error)
+        lowered = error_msg.lower()
+        details = dict(dbms=self.get_dbms_name(), host=self.host, port=self.port, database=self.database)
+        
+        if 'ORA-01017' in error_msg:
+            return DatabaseAuthenticationError(
+                "인증 실패: 사용자명 또는 비밀번호가 올바르지 않습니다.", **details
+            )
+        if 'ORA-28000' in error_msg:
+            return DatabaseAuthenticationError(
+                "Oracle 계정이 잠겨있습니다. DBA에게 문의하여 계정 잠금을 해제해주세요.", **details
+            )
+        if any(code in error_msg for code in ('ORA-12514', 'ORA-12505', 'DPY-6001', 'DPY-6003')):
+            return DatabaseNotFoundError(
+                f"서비스명 또는 SID를 찾을 수 없습니다: {self.database}", **details
+            )
+        if 'timed out' in lowered or 'ORA-12170' in error_msg:
+            return DatabaseTimeoutError(
+                f"연결 시간 초과: {self.host}:{self.port}", **details
+            )
+        if 'DPY-6005' in error_msg or 'ORA-12541' in error_msg:
+            return DatabaseConnectionError(
+                f"서버에 연결할 수 없습니다: {self.host}:{self.port}", **details
+            )
+        return DatabaseConnectionError(f"Oracle 연결 실패: {error_msg}", **details)
+        
+    def disconnect(self):
+        """Oracle 연결 해제"""
+        if self.connection:
+            try:
+                self.connection.close()
+            except:
+                pass  # 연결 해제 중 오류는 무시
+            finally:
+                self.connection = None
+                self.is_connected = False
+                
+    def test_connection(self):
+        """연결 테스트"""
+        try:
+            # 이미 연결된 경우(연결 풀에서 재사용) 다시 로그인하지 않음
+            result = self.is_connected or self.connect()
+            if result and self.is_connected:
+                test_result = self.execute_query("SELECT 'TEST' AS test_col FROM dual")
+                return len(test_result) > 0 and test_result[0].get('test_col') == 'TEST'
+            return False
+        except Exception as e:
+            print(f"연결 테스트 실패: {e}")
+            return False
+            
+    def ping(self):
+        """연결 유효성 확인 (서버 왕복 1회)"""
+        if not self.is_connected or not self.connection:
+            return False
+        try:
+            self.connection.ping()
+            return True
+        except Exception:
+            return False
+            
+    def execute_query(self, query, params=None) -> List[Dict[str, Any]]:
+        """
+        쿼리 실행 (배열 단위 조회, 컬럼명은 소문자로 변환)
+        
+        Args:
+            query (str): 실행할 쿼리 (바인드 변수는 :1, :2, ...)
+            params (list): 바인드 변수 값 목록
+        """
+        try:
+            with self.get_cursor() as cursor:
+                cursor.arraysize = ORACLE_CONFIG["arraysize"]
+                cursor.prefetchrows = ORACLE_CONFIG["prefetchrows"]
+                cursor.execute(query, params or [])
+                
+                if cursor.description is None:
+                    return cursor.rowcount
+                    
+                # Oracle은 DictCursor가 없으므로 컬럼명과 함께 딕셔너리로 변환
+                columns = [desc[0].lower() for desc in cursor.description]
+                result = []
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
+                    result.extend(dict(zip(columns, row)) for row in rows)
+                return result
+                
+        except Exception as e:
+            raise DatabaseQueryError(f"쿼리 실행 오류: {str(e)}", query=query)
+            
+    def iter_query(self, query, params=None):
+        """쿼리 결과를 arraysize 행씩 가져와 한 행씩 반환 (컬럼명은 소문자로 변환)"""
+        with self.get_cursor() as cursor:
+            cursor.arraysize = ORACLE_CONFIG["arraysize"]
+            cursor.prefetchrows = ORACLE_CONFIG["prefetchrows"]
+            try:
+                cursor.execute(query, params or [])
+            except Exception as e:
+                raise DatabaseQueryError(f"쿼리 실행 오류: {str(e)}", query=query)
+                
+            columns = [desc[0].lower() for desc in cursor.description]
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(columns, row))
+                    
+    def get_version(self):
+        """Oracle 버전 정보"""
+        try:
+            result = self.execute_query("SELECT banner FROM v$version WHERE ROWNUM = 1")
+            if result and len(result) > 0:
+                return result[0]['banner']
+            return "Unknown"
+        except Exception:
+            return "Unknown"
@@ -0,0 +1,327 @@
+"""
+Oracle 메타데이터 조회 (쿼리 및 공통 조회 로직)
+
+JDBC(JdbcOracleConnection)와 python-oracledb(OracleConnection) 연결이 같은 쿼리와
+조회 로직을 사용해 두 방식의 결과 컬럼명·순서·값이 동일하도록 합니다.
+"""
+
+from typing import List, Dict, Any, Iterable, Optional
+
+from .exceptions import DatabaseConnectionError
+
+# 테이블 기본 정보 (테이블명, 코멘트)
+TABLES_BASIC_INFO_QUERY = """
+    SELECT
+        t.table_name                             AS TABLE_NAME,
+        NVL(tc.comments, '')                     AS "테이블설명"
+    FROM (
+        SELECT table_name  FROM user_tables  WHERE table_name NOT LIKE 'BIN$%'
+        UNION ALL
+        SELECT view_name AS table_name FROM user_views
+    ) t
+    LEFT JOIN user_tab_comments tc
+        ON tc.table_name = t.table_name
+    ORDER BY t.table_name
+"""
+
+# 테이블별 변경 표시 (마지막 DDL 시각)
+CHANGE_MARKERS_QUERY = """
+    SELECT
+        object_name                                          AS TABLE_NAME,
+        TO_CHAR(last_ddl_time, 'YYYY-MM-DD HH24:MI:SS')      AS MARKER
+    FROM user_objects
+    WHERE object_type IN ('TABLE', 'VIEW')
+      AND object_name NOT LIKE 'BIN$%'
+"""
+
+# 컬럼 기본값 (DATA_DEFAULT는 LONG 타입이므로 SELECT 목록 마지막에 두고 순서대로 읽음)
+DEFAULT_VALUES_QUERY = """
+    SELECT table_name, column_name, data_default
+    FROM user_tab_columns
+    WHERE default_length > 0
+"""
+
+# 테이블+컬럼 정보 (MySQL과 완전히 동일한 컬럼명·순서)
+# {table_filter}: 테이블명 IN 조건 (전체 조회 시 빈 문자열, 이하 쿼리 공통)
+TABLES_INFO_QUERY = """
+    SELECT
+        t.table_name                             AS TABLE_NAME,
+        NVL(tc.comments, '')                     AS "테이블설명",
+        c.column_id                              AS NO,
+        c.column_name                            AS "컬럼명",
+        -- MySQL의 COLUMN_TYPE 과 같은 형태로 뿌려주기
+        CASE
+          WHEN c.data_type IN ('VARCHAR2','CHAR','NVARCHAR2','NCHAR')
+            THEN c.data_type || '(' || c.char_length || ')'
+          WHEN c.data_type='NUMBER'
+            AND c.data_precision IS NOT NULL
+            AND c.data_scale     IS NOT NULL
+            THEN c.data_type || '(' || c.data_precision || ',' || c.data_scale || ')'
+          WHEN c.data_type='NUMBER'
+            AND c.data_precision IS NOT NULL
+            THEN c.data_type || '(' || c.data_precision || ')'
+          ELSE c.data_type
+        END                                       AS TYPE,
+        -- LONG 타입 충돌 회피를 위해 빈 문자열로만 내려줌 (나중에 user_tab_columns.data_default로 교체)
+        ''                                        AS DEFAULT_VALUE,
+        CASE WHEN c.nullable='Y' THEN 'Y' ELSE 'N' END AS NULLABLE,
+        NVL(k.key_type, '')                       AS KEY_TYPE,
+        -- AUTO_INCREMENT 여부는 Oracle에서는 해당 없음
+        ''                                        AS EXTRA,
+        NVL(cc.comments, '')                      AS "설명"
+    FROM (
+        SELECT table_name  FROM user_tables  WHERE table_name NOT LIKE 'BIN$%'
+        UNION ALL
+        SELECT view_name AS table_name FROM user_views
+    ) t
+    JOIN user_tab_columns c
+        ON c.table_name = t.table_name
+    LEFT JOIN user_tab_comments tc
+        ON tc.table_name = t.table_name
+    LEFT JOIN user_col_comments cc
+        ON cc.table_name  = c.table_name
+       AND cc.column_name = c.column_name
+    LEFT JOIN (
+        -- PK/UNI/FK 를 MySQL COLUMN_KEY 값과 매핑 (PRI/UNI/MUL)
+        SELECT acc.table_name,
+               acc.column_name,
+               CASE ac.constraint_type
+                 WHEN 'P' THEN 'PRI'
+                 WHEN 'U' THEN 'UNI'
+                 WHEN 'R' THEN 'MUL'
+               END AS key_type
+        FROM user_constraints ac
+        JOIN user_cons_columns acc
+          ON ac.constraint_name = acc.constraint_name
+        WHERE ac.constraint_type IN ('P','U','R')
+    ) k
+      ON k.table_name  = c.table_name
+     AND k.column_name = c.column_name
+    {table_filter}
+    ORDER BY t.table_name, c.column_id
+"""
+
+# 단일 테이블 컬럼 정보 ({bind}: 테이블명 바인드 변수)
+COLUMNS_INFO_QUERY = """
+    SELECT 
+        c.column_name                AS COLUMN_NAME,
+        CASE 
+        WHEN c.data_type IN ('VARCHAR2','CHAR','NVARCHAR2','NCHAR')
+            THEN c.data_type || '(' || c.char_length || ')'
+        WHEN c.data_type = 'NUMBER' 
+            AND c.data_precision IS NOT NULL 
+            AND c.data_scale IS NOT NULL
+            THEN c.data_type || '(' || c.data_precision || ',' || c.data_scale || ')'
+        WHEN c.data_type = 'NUMBER' 
+            AND c.data_precision IS NOT NULL
+            THEN c.data_type || '(' || c.data_precision || ')'
+        ELSE c.data_type
+        END                           AS TYPE,
+        CASE 
+        WHEN c.data_type IN ('VARCHAR2','CHAR','NVARCHAR2','NCHAR')
+            THEN c.char_length
+        WHEN c.data_type = 'NUMBER' 
+            AND c.data_precision IS NOT NULL
+            THEN c.data_precision
+        ELSE c.data_length
+        END                           AS MAX_LENGTH,
+        c.data_precision             AS PRECISION,
+        c.data_scale                 AS SCALE,
+        CASE WHEN c.nullable = 'Y' THEN 1 ELSE 0 END AS IS_NULLABLE,
+        -- SQL에서는 빈 문자열로 채워 두고
+        ''                            AS DEFAULT_VALUE,
+        NVL(cc.comments, '')          AS "COMMENT",
+        c.column_id                  AS ORDINAL_POSITION
+    FROM user_tab_columns c
+    LEFT JOIN user_col_comments cc
+    ON cc.table_name  = c.table_name
+    AND cc.column_name = c.column_name
+    WHERE UPPER(c.table_name) = UPPER({bind})
+    ORDER BY c.column_id
+"""
+
+# 외래키 정보 (MySQL 구조와 동일)
+FOREIGN_KEYS_QUERY = """
+    SELECT
+        acc.table_name            AS TABLE_NAME,
+        acc.column_name           AS COLUMN_NAME,
+        r_acc.table_name          AS REFERENCED_TABLE_NAME,
+        r_acc.column_name         AS REFERENCED_COLUMN_NAME,
+        acc.constraint_name       AS CONSTRAINT_NAME
+    FROM user_constraints ac
+    JOIN user_cons_columns acc
+      ON ac.constraint_name = acc.constraint_name
+    JOIN user_cons_columns r_acc
+      ON ac.r_constraint_name = r_acc.constraint_name
+     AND acc.position = r_acc.position
+    WHERE ac.constraint_type = 'R'
+    {table_filter}
+    ORDER BY acc.table_name, acc.column_name
+"""
+
+# 인덱스 정보 (MySQL 구조와 동일, PK 인덱스 제외)
+INDEXES_QUERY = """
+    SELECT
+        ic.table_name             AS TABLE_NAME,
+        ic.index_name             AS INDEX_NAME,
+        CASE WHEN i.uniqueness='UNIQUE' THEN 0 ELSE 1 END AS NON_UNIQUE,
+        ic.column_name            AS COLUMN_NAME,
+        ic.column_position        AS SEQ_IN_INDEX
+    FROM user_indexes i
+    JOIN user_ind_columns ic
+      ON i.index_name = ic.index_name
+     AND i.table_name = ic.table_name
+    WHERE i.index_type = 'NORMAL'
+      AND NOT EXISTS (
+        SELECT 1
+          FROM user_constraints uc
+         WHERE uc.constraint_name = i.index_name
+           AND uc.constraint_type = 'P'
+      )
+    {table_filter}
+    ORDER BY ic.table_name, ic.index_name, ic.column_position
+"""
+
+
+
+def bind_placeholders(count, paramstyle='qmark'):
+    """
+    바인드 변수 자리 표시 문자열 생성
+    
+    Args:
+        count (int): 바인드 변수 개수
+        paramstyle (str): 'qmark'(JDBC: ?) 또는 'numeric'(oracledb: :1, :2, ...)
+    """
+    if paramstyle == 'numeric':
+        return ', '.join(f":{i}" for i in range(1, count + 1))
+    return ', '.join('?' * count)
+
+
+def table_filter(prefix, count, paramstyle='qmark'):
+    """
+    테이블명 IN 조건 생성
+    
+    Args:
+        prefix (str): 조건 앞부분 (예: 'WHERE t.table_name', 'AND acc.table_name')
+        count (int): 테이블명 바인드 변수 개수 (None이면 빈 문자열)
+        paramstyle (str): 바인드 변수 형식
+    """
+    if count is None:
+        return ""
+    return f"{prefix} IN ({bind_placeholders(count, paramstyle)})"
+
+
+def clean_default_value(value):
+    """Default 값 정리: None, 빈 문자열, 공백만 있는 경우 처리"""
+    if value is None:
+        return ""
+    clean_default = str(value).strip()
+    # 특수한 Oracle Default 값들 정리
+    if clean_default in ['NULL', 'null', "''", '""', '-']:
+        return ""
+    return clean_default
+
+
+class OracleMetadataMixin:
+    """
+    Oracle 메타데이터 조회 공통 구현
+    
+    execute_query(query, params)가 소문자 컬럼명의 딕셔너리 목록을 반환하는 연결 클래스에서 사용합니다.
+    """
+    
+    # 바인드 변수 형식 ('qmark' 또는 'numeric')
+    bind_paramstyle = 'qmark'
+    
+    def get_dbms_family(self) -> str:
+        """JDBC와 python-oracledb 연결이 캐시·증분 수집 상태를 공유하도록 같은 이름 반환"""
+        return "Oracle"
+        
+    def get_tables_basic_info(self) -> List[Dict[str, Any]]:
+        """테이블 기본 정보만 조회 (MySQL과 동일한 컬럼명)"""
+        return self.execute_query(TABLES_BASIC_INFO_QUERY)
+        
+    def get_change_markers(self) -> Dict[str, str]:
+        """테이블별 변경 표시 (user_objects.LAST_DDL_TIME)"""
+        return {row['table_name']: row['marker'] for row in self.execute_query(CHANGE_MARKERS_QUERY)}
+        
+    def _get_default_values(self, table_names: Optional[List[str]] = None) -> Dict[str, Dict[str, str]]:
+        """
+        컬럼 기본값 조회 (DATA_DEFAULT가 있는 컬럼만)
+        
+        Args:
+            table_names (list): 조회할 테이블 목록 (None이면 전체 테이블, 이름은 그대로 비교)
+            
+        Returns:
+            dict: 테이블명 -> {컬럼명: 기본값}
+        """
+        try:
+            rows = self._fetch_by_tables(
+                lambda count: DEFAULT_VALUES_QUERY + table_filter("AND table_name", count, self.bind_paramstyle),
+                (), table_names
+            )
+            defaults = {}
+            for row in rows:
+                defaults.setdefault(row['table_name'], {})[row['column_name']] = \
+                    clean_default_value(row['data_default'])
+            return defaults
+        except Exception as e:
+            # 기본값 수집 실패 시 빈 딕셔너리 반환 (기존 동작 유지)
+            print(f"기본값 조회 실패: {e}")
+            return {}
+            
+    def _fetch_with_table_filter(self, query, prefix, table_names, stream):
+        """{table_filter} 자리에 테이블명 IN 조건을 넣어 조회 (1000개씩 나누어 실행)"""
+        return self._fetch_by_tables(
+            lambda count: query.format(table_filter=table_filter(prefix, count, self.bind_paramstyle)),
+            (), table_names, stream
+        )
+        
+    def get_tables_info(self, table_names: Optional[List[str]] = None,
+                        stream: bool = False) -> Iterable[Dict[str, Any]]:
+        """테이블+컬럼 정보 조회 (MySQL과 완전히 동일한 컬럼명·순서, stream이면 행 이터레이터)"""
+        # 1. Default 값이 있는 컬럼만 수집 (테이블 목록이 있으면 해당 테이블만)
+        default_map = self._get_default_values(table_names)
+        
+        # 2. 기본 테이블+컬럼 정보 조회 (DEFAULT_VALUE는 여전히 빈 문자열)
+        rows = self._fetch_with_table_filter(TABLES_INFO_QUERY, "WHERE t.table_name", table_names, stream)
+        
+        # 3. 결과에서 DEFAULT_VALUE를 조회한 기본값으로 교체
+        result = self._fill_default_values(rows, default_map)
+        return result if stream else list(result)
+        
+    @staticmethod
+    def _fill_default_values(rows, default_map):
+        """행마다 DEFAULT_VALUE를 조회한 기본값으로 교체하며 반환"""
+        for row in rows:
+            table_defaults = default_map.get(row['table_name'])
+            if table_defaults:
+                row['default_value'] = table_defaults.get(row['컬럼명'], "")
+            yield row
+            
+    def get_columns_info(self, table_name: str) -> List[Dict[str, Any]]:
+        """컬럼 정보 조회 (기본값 포함)"""
+        try:
+            # 1) 해당 테이블의 기본값만 조회
+            default_map = self._get_default_values([table_name]).get(table_name, {})
+            
+            # 2) 실제 조회 쿼리 (DATA_DEFAULT 대신 '' AS DEFAULT_VALUE)
+            query = COLUMNS_INFO_QUERY.format(bind=bind_placeholders(1, self.bind_paramstyle))
+            result = self.execute_query(query, [table_name])
+            
+            # 3) DEFAULT_VALUE는 SQL에서는 ''지만, 실제로는 조회한 기본값으로 채워 넣기
+            for row in result:
+                row['default_value'] = default_map.get(row['column_name'], "")
+            return result
+            
+        except Exception as e:
+            raise DatabaseConnectionError(f"컬럼 정보 조회 실패: {str(e)}")
+            
+    def get_foreign_keys_info(self, table_names: Optional[List[str]] = None,
+                              stream: bool = False) -> Iterable[Dict[str, Any]]:
+        """외래키 정보 조회 (MySQL 구조와 동일)"""
+        return self._fetch_with_table_filter(FOREIGN_KEYS_QUERY, "AND acc.table_name", table_names, stream)
+        
+    def get_indexes_info(self, table_names: Optional[List[str]] = None,
+                         stream: bool = False) -> Iterable[Dict[str, Any]]:
+        """인덱스 정보 조회 (MySQL 구조와 동일)"""
+        return self._fetch_with_table_filter(INDEXES_QUERY, "AND i.table_name", table_names, stream)
\ No newline at end of file
@@ -2,43 +2,221 @@
 PostgreSQL 연결 클래스
 """
 
-import psycopg2
-import psycopg2.extras
+import itertools
+from config import POSTGRESQL_CONFIG
 from .base_connection import BaseConnection
+from .postgresql_drivers import get_postgresql_driver
 from .exceptions import (
     DatabaseConnectionError, DatabaseAuthenticationError,
     DatabaseNotFoundError, DatabaseTimeoutError, DatabaseQueryError
 )
 
 
+# 조회 대상 스키마
+SCHEMA_NAME = 'public'
+
+# 버전 정보
+VERSION_QUERY = "SELECT version() as version"
+
+# 테이블+컬럼 정보 (pg_catalog OID 조인, 컬럼 설명 포함)
+# {identity}: IDENTITY 컬럼 여부 식 (PostgreSQL 10 이상에서만 attidentity 존재)
+# {table_filter}: 테이블명 조건 (= ANY 배열 바인드, 전체 조회 시 빈 문자열, 이하 쿼리 공통)
+TABLES_INFO_QUERY = """
+    SELECT 
+        c.relname AS table_name,
+        COALESCE(obj_description(c.oid, 'pg_class'), '') AS 테이블설명,
+        a.attnum AS NO,
+        a.attname AS 컬럼명,
+        regexp_replace(
+            regexp_replace(format_type(a.atttypid, a.atttypmod), '^character varying', 'varchar'),
+            '^character(\\(|$)', 'char\\1'
+        ) AS TYPE,
+        COALESCE(pg_get_expr(ad.adbin, ad.adrelid), '') AS DEFAULT_VALUE,
+        CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END AS NULLABLE,
+        CASE 
+            WHEN k.is_pk THEN 'PRI'
+            WHEN k.is_uni THEN 'UNI'
+            WHEN k.is_fk THEN 'MUL'
+            ELSE ''
+        END AS KEY_TYPE,
+        CASE 
+            WHEN {identity} OR pg_get_expr(ad.adbin, ad.adrelid) LIKE 'nextval%%' THEN 'auto_increment'
+            ELSE ''
+        END AS EXTRA,
+        COALESCE(col_description(c.oid, a.attnum), '') AS 설명
+    FROM 
+        pg_class c
+    JOIN 
+        pg_namespace n ON n.oid = c.relnamespace
+    JOIN 
+        pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+    LEFT JOIN 
+        pg_attrdef ad ON ad.adrelid = a.attrelid AND ad.adnum = a.attnum
+    LEFT JOIN (
+        -- 컬럼별 PK/UNIQUE/FK 여부 (제약조건 컬럼 배열을 펼쳐 집계)
+        SELECT 
+            conrelid,
+            attnum,
+            bool_or(contype = 'p') AS is_pk,
+            bool_or(contype = 'u') AS is_uni,
+            bool_or(contype = 'f') AS is_fk
+        FROM (
+            SELECT conrelid, contype, unnest(conkey) AS attnum
+            FROM pg_constraint
+            WHERE contype IN ('p', 'u', 'f')
+        ) con
+        GROUP BY conrelid, attnum
+    ) k ON k.conrelid = c.oid AND k.attnum = a.attnum
+    WHERE 
+        n.nspname = %s
+        AND c.relkind IN ('r', 'p', 'v')
+        {table_filter}
+    ORDER BY 
+        c.relname, a.attnum
+"""
+
+# 외래키 정보 (복합 외래키는 컬럼 순서대로 짝지음)
+FOREIGN_KEYS_QUERY = """
+    SELECT 
+        c.relname AS table_name,
+        a.attname AS column_name,
+        rc.relname AS referenced_table_name,
+        ra.attname AS referenced_column_name,
+        con.conname AS constraint_name
+    FROM (
+        SELECT conname, conrelid, confrelid, connamespace, conkey, confkey,
+               generate_subscripts(conkey, 1) AS i
+        FROM pg_constraint
+        WHERE contype = 'f'
+    ) con
+    JOIN 
+        pg_namespace n ON n.oid = con.connamespace
+    JOIN 
+        pg_class c ON c.oid = con.conrelid
+    JOIN 
+        pg_class rc ON rc.oid = con.confrelid
+    JOIN 
+        pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = con.conkey[con.i]
+    JOIN 
+        pg_attribute ra ON ra.attrelid = con.confrelid AND ra.attnum = con.confkey[con.i]
+    WHERE 
+        n.nspname = %s
+        {table_filter}
+    ORDER BY 
+        c.relname, a.attname
+"""
+
+# 테이블 기본 정보 (테이블명, 코멘트)
+TABLES_BASIC_INFO_QUERY = """
+    SELECT 
+        c.relname AS table_name,
+        COALESCE(obj_description(c.oid, 'pg_class'), '') AS table_comment
+    FROM 
+        pg_class c
+    JOIN 
+        pg_namespace n ON n.oid = c.relnamespace
+    WHERE 
+        n.nspname = %s
+        AND c.relkind IN ('r', 'p', 'v')
+    ORDER BY 
+        c.relname
+"""
+
+# 테이블별 변경 표시
+# 테이블, 컬럼, 기본값, 제약조건, 인덱스, 설명 카탈로그 행은 변경될 때마다 새 행 버전(xmin)이 생기므로
+# 관련 행들의 xmin을 묶은 해시를 DDL 변경 표시로 사용 (VACUUM FREEZE 등으로 바뀌면 다시 조회할 뿐)
+CHANGE_MARKERS_QUERY = """
+    SELECT 
+        c.relname AS table_name,
+        md5(concat_ws('|',
+            c.xmin::text,
+            (SELECT string_agg(a.xmin::text, ',' ORDER BY a.attnum)
+               FROM pg_attribute a WHERE a.attrelid = c.oid AND a.attnum > 0),
+            (SELECT string_agg(ad.xmin::text, ',' ORDER BY ad.adnum)
+               FROM pg_attrdef ad WHERE ad.adrelid = c.oid),
+            (SELECT string_agg(con.xmin::text, ',' ORDER BY con.oid)
+               FROM pg_constraint con WHERE con.conrelid = c.oid),
+            (SELECT string_agg(i.xmin::text, ',' ORDER BY i.indexrelid)
+               FROM pg_index i WHERE i.indrelid = c.oid),
+            (SELECT string_agg(d.objsubid || ':' || d.xmin::text, ',' ORDER BY d.objsubid)
+               FROM pg_description d WHERE d.objoid = c.oid AND d.classoid = 'pg_class'::regclass)
+        )) AS marker
+    FROM 
+        pg_class c
+    JOIN 
+        pg_namespace n ON n.oid = c.relnamespace
+    WHERE 
+        n.nspname = %s
+        AND c.relkind IN ('r', 'p', 'v')
+"""
+
+# 인덱스 정보 (PK 인덱스 제외, 표현식 인덱스 컬럼 제외)
+# {key_columns}: 키 컬럼 수 (PostgreSQL 11 이상은 INCLUDE 컬럼을 뺀 indnkeyatts)
+INDEXES_QUERY = """
+    SELECT 
+        t.relname AS table_name,
+        ic.relname AS index_name,
+        NOT ix.indisunique AS non_unique,
+        a.attname AS column_name,
+        ix.i + 1 AS seq_in_index
+    FROM (
+        SELECT indrelid, indexrelid, indisunique, indisprimary, indkey,
+               generate_series(0, {key_columns} - 1) AS i
+        FROM pg_index
+    ) ix
+    JOIN 
+        pg_class t ON t.oid = ix.indrelid
+    JOIN 
+        pg_namespace n ON n.oid = t.relnamespace
+    JOIN 
+        pg_class ic ON ic.oid = ix.indexrelid
+    JOIN 
+        pg_attribute a ON a.attrelid = ix.indrelid AND a.attnum = ix.indkey[ix.i]
+    WHERE 
+        n.nspname = %s
+        AND NOT ix.indisprimary
+        {table_filter}
+    ORDER BY 
+        t.relname, ic.relname, ix.i
+"""
+
+
+# 서버 측 커서 이름 일련번호
+_cursor_ids = itertools.count(1)
+
+
 class PostgreSQLConnection(BaseConnection):
     """PostgreSQL 연결 클래스"""
     
+    def __init__(self, host, port, database, username, password, timeout=30, driver=None):
+        """
+        PostgreSQL 연결 초기화
+        
+        Args:
+            driver (str): 드라이버 ('psycopg', 'psycopg2', 'auto', None이면 설정값)
+        """
+        super().__init__(host, port, database, username, password, timeout)
+        self.driver = get_postgresql_driver(driver)
+        
     def get_dbms_name(self):
         return "PostgreSQL"
         
     def connect(self):
         """PostgreSQL 연결"""
         try:
-            # PostgreSQL 연결 문자열 생성
-            connection_string = (
-                f"host={self.host} "
-                f"port={self.port} "
-                f"dbname={self.database} "
-                f"user={self.username} "
-                f"password={self.password} "
-                f"connect_timeout={self.timeout}"
-            )
-            
-            self.connection = psycopg2.connect(
-                connection_string,
-                cursor_factory=psycopg2.extras.RealDictCursor
+            # 연결 정보는 키워드 인자로 전달 (공백 등이 포함된 비밀번호도 안전)
+            self.connection = self.driver.connect(
+                host=self.host,
+                port=self.port,
+                user=self.username,
+                password=self.password,
+                database=self.database,
+                timeout=self.timeout
             )
-            self.connection.autocommit = True
             self.is_connected = True
             return True
             
-        except psycopg2.OperationalError as e:
+        except self.driver.OperationalError as e:
             error_msg = str(e).strip()
             
             if "password authentication failed" in error_msg or "authentication failed" in error_msg:
@@ -57,7 +235,8 @@ class PostgreSQLConnection(BaseConnection):
                     port=self.port,
                     database=self.database
                 )
-            elif "could not connect to server" in error_msg or "Connection refused" in error_msg:
+            elif ("could not connect to server" in error_msg or "Connection refused" in error_msg
+                  or "connection failed" in error_msg):
                 raise DatabaseConnectionError(
                     f"서버에 연결할 수 없습니다: {self.host}:{self.port} ({error_msg})",
                     dbms=self.get_dbms_name(),
@@ -104,6 +283,12 @@ class PostgreSQLConnection(BaseConnection):
         except Exception as e:
             raise DatabaseConnectionError(f"연결 테스트 실패: {str(e)}")
             
+    def ping(self):
+        """연결 유효성 확인"""
+        if not self.is_connected or not self.connection or self.connection.closed:
+            return False
+        return super().ping()
+            
     def execute_query(self, query, params=None):
         """쿼리 실행"""
         try:
@@ -119,196 +304,114 @@ class PostgreSQLConnection(BaseConnection):
         except Exception as e:
             raise DatabaseQueryError(f"쿼리 실행 오류: {str(e)}", query=query)
             
+    def iter_query(self, query, params=None):
+        """쿼리 결과를 이름 있는 서버 측 커서로 itersize 행씩 가져와 한 행씩 반환"""
+        if not self.is_connected:
+            raise DatabaseConnectionError("데이터베이스에 연결되지 않았습니다.")
+            
+        cursor = self.driver.server_cursor(
+            self.connection, f"dboutput_cursor_{next(_cursor_ids)}", POSTGRESQL_CONFIG.get("itersize", 2000)
+        )
+        try:
+            try:
+                cursor.execute(query, params)
+            except Exception as e:
+                raise DatabaseQueryError(f"쿼리 실행 오류: {str(e)}", query=query)
+            yield from cursor
+        finally:
+            cursor.close()
+            
     def get_version(self):
         """PostgreSQL 버전 정보"""
         try:
-            result = self.execute_query("SELECT version() as version")
+            result = self.execute_query(VERSION_QUERY)
             if result and len(result) > 0:
                 return result[0]['version']
             return "Unknown"
         except Exception:
             return "Unknown"
             
-    def get_tables_info(self):
-        """테이블 정보 조회"""
-        # 단순화된 쿼리 - 기본 테이블과 컬럼 정보만 조회
-        query = """
-        SELECT 
-            t.table_name,
-            COALESCE(pgd.description, '') AS 테이블설명,
-            col.ordinal_position AS NO,
-            col.column_name AS 컬럼명,
-            CASE 
-                WHEN col.data_type = 'character varying' THEN 'varchar(' || COALESCE(col.character_maximum_length::text, '') || ')'
-                WHEN col.data_type = 'character' THEN 'char(' || COALESCE(col.character_maximum_length::text, '') || ')'
-                WHEN col.data_type = 'numeric' THEN 'numeric(' || COALESCE(col.numeric_precision::text, '0') || ',' || COALESCE(col.numeric_scale::text, '0') || ')'
-                ELSE col.data_type
-            END AS TYPE,
-            COALESCE(col.column_default, '') AS DEFAULT_VALUE,
-            col.is_nullable AS NULLABLE,
-            '' AS KEY_TYPE,  -- 별도 쿼리에서 처리
-            CASE 
-                WHEN col.column_default LIKE 'nextval%' THEN 'auto_increment'
-                ELSE ''
-            END AS EXTRA,
-            '' AS 설명
-        FROM 
-            information_schema.tables t
-        JOIN 
-            information_schema.columns col ON t.table_name = col.table_name AND t.table_schema = col.table_schema
-        LEFT JOIN 
-            pg_class pgc ON pgc.relname = t.table_name
-        LEFT JOIN 
-            pg_description pgd ON pgd.objoid = pgc.oid AND pgd.objsubid = 0
-        WHERE 
-            t.table_schema = 'public'
-            AND t.table_type IN ('BASE TABLE', 'VIEW')
-        ORDER BY 
-            t.table_name, col.ordinal_position
+    def get_server_version_num(self):
+        """서버 버전 번호 (예: 150002)"""
+        return self.driver.server_version(self.connection)
+        
+    def _get_tables_info_query(self, table_filter=""):
+        """서버 버전에 맞는 테이블+컬럼 조회 쿼리"""
+        identity = "a.attidentity IN ('a', 'd')" if self.get_server_version_num() >= 100000 else "false"
+        return TABLES_INFO_QUERY.format(identity=identity, table_filter=table_filter)
+        
+    def _get_indexes_query(self, table_filter=""):
+        """서버 버전에 맞는 인덱스 조회 쿼리 (11 이상은 커버링 인덱스의 INCLUDE 컬럼 제외)"""
+        key_columns = "indnkeyatts" if self.get_server_version_num() >= 110000 else "indnatts"
+        return INDEXES_QUERY.format(key_columns=key_columns, table_filter=table_filter)
+        
+    @staticmethod
+    def _table_filter(column, table_names):
         """
+        테이블명 조건과 파라미터 반환
         
-        try:
-            tables_data = self.execute_query(query)
-            
-            # Primary Key 정보 별도 조회
-            pk_query = """
-            SELECT 
-                ku.table_name,
-                ku.column_name
-            FROM 
-                information_schema.table_constraints tc
-            JOIN 
-                information_schema.key_column_usage ku ON tc.constraint_name = ku.constraint_name
-            WHERE 
-                tc.constraint_type = 'PRIMARY KEY' 
-                AND tc.table_schema = 'public'
-            """
-            pk_data = self.execute_query(pk_query)
-            pk_columns = {(row['table_name'], row['column_name']) for row in pk_data}
-            
-            # Foreign Key 정보 별도 조회  
-            fk_query = """
-            SELECT 
-                ku.table_name,
-                ku.column_name
-            FROM 
-                information_schema.table_constraints tc
-            JOIN 
-                information_schema.key_column_usage ku ON tc.constraint_name = ku.constraint_name
-            WHERE 
-                tc.constraint_type = 'FOREIGN KEY'
-                AND tc.table_schema = 'public'
-            """
-            fk_data = self.execute_query(fk_query)
-            fk_columns = {(row['table_name'], row['column_name']) for row in fk_data}
-            
-            # KEY_TYPE 설정
-            for row in tables_data:
-                table_name = row['table_name']
-                column_name = row['컬럼명']
-                
-                if (table_name, column_name) in pk_columns:
-                    row['KEY_TYPE'] = 'PRI'
-                elif (table_name, column_name) in fk_columns:
-                    row['KEY_TYPE'] = 'MUL'
-                else:
-                    row['KEY_TYPE'] = ''
-                    
-            return tables_data
+        목록 전체를 배열 하나로 바인드하므로 테이블 수가 많아도 나누어 실행할 필요가 없습니다.
+        
+        Returns:
+            tuple: (조건 문자열, 파라미터 튜플)
+        """
+        if table_names is None:
+            return "", (SCHEMA_NAME,)
+        return f"AND {column} = ANY(%s::name[])", (SCHEMA_NAME, sorted(set(table_names)))
+        
+    def get_catalog(self, table_names=None):
+        """
+        카탈로그 전체 조회 (버전, 테이블+컬럼, 외래키, 인덱스)
+        
+        psycopg 3 파이프라인 모드에서는 네 쿼리를 한 번에 보내고 결과를 함께 받으며,
+        그 외에는 쿼리를 차례로 실행합니다. 파이프라인 결과의 tables, foreign_keys, indexes는
+        값 튜플 행 이터레이터(PositionalRows)이므로 다른 방식과 같이 순서대로 한 번씩 소비합니다.
+        
+        Args:
+            table_names (list): 조회할 테이블 목록 (None이면 전체)
+        """
+        if not self.driver.supports_pipeline():
+            return super().get_catalog(table_names)
             
+        table_filter, params = self._table_filter('c.relname', table_names)
+        index_filter, _ = self._table_filter('t.relname', table_names)
+        try:
+            version_rows, tables, foreign_keys, indexes = self.driver.execute_many_queries(self.connection, [
+                (VERSION_QUERY, None),
+                (self._get_tables_info_query(table_filter), params),
+                (FOREIGN_KEYS_QUERY.format(table_filter=table_filter), params),
+                (self._get_indexes_query(index_filter), params)
+            ])
         except Exception as e:
-            # 오류 발생 시 최소한의 정보라도 반환
-            basic_query = """
-            SELECT 
-                t.table_name,
-                '' AS 테이블설명,
-                col.ordinal_position AS NO,
-                col.column_name AS 컬럼명,
-                col.data_type AS TYPE,
-                COALESCE(col.column_default, '') AS DEFAULT_VALUE,
-                col.is_nullable AS NULLABLE,
-                '' AS KEY_TYPE,
-                '' AS EXTRA,
-                '' AS 설명
-            FROM 
-                information_schema.tables t
-            JOIN 
-                information_schema.columns col ON t.table_name = col.table_name AND t.table_schema = col.table_schema
-            WHERE 
-                t.table_schema = 'public'
-                AND t.table_type = 'BASE TABLE'
-            ORDER BY 
-                t.table_name, col.ordinal_position
-            """
-            return self.execute_query(basic_query)
+            raise DatabaseQueryError(f"카탈로그 조회 오류: {str(e)}")
+            
+        version_rows = list(version_rows.iter_dicts())
+        return {
+            'version': version_rows[0]['version'] if version_rows else "Unknown",
+            'tables': tables,
+            'foreign_keys': foreign_keys,
+            'indexes': indexes
+        }
+        
+    def get_tables_info(self, table_names=None, stream=False):
+        """테이블 정보 조회 (타입, 기본값, PK/UNIQUE/FK, 컬럼 설명을 한 번에 조회)"""
+        table_filter, params = self._table_filter('c.relname', table_names)
+        return self._fetch(self._get_tables_info_query(table_filter), params, stream)
         
-    def get_foreign_keys_info(self):
+    def get_foreign_keys_info(self, table_names=None, stream=False):
         """외래키 정보 조회"""
-        query = """
-        SELECT 
-            kcu.table_name,
-            kcu.column_name,
-            ccu.table_name AS referenced_table_name,
-            ccu.column_name AS referenced_column_name,
-            tc.constraint_name
-        FROM 
-            information_schema.table_constraints tc
-        JOIN 
-            information_schema.key_column_usage kcu ON tc.constraint_name = kcu.constraint_name
-        JOIN 
-            information_schema.constraint_column_usage ccu ON ccu.constraint_name = tc.constraint_name
-        WHERE 
-            tc.constraint_type = 'FOREIGN KEY' 
-            AND tc.table_schema = 'public'
-        ORDER BY 
-            kcu.table_name, kcu.column_name
-        """
-        return self.execute_query(query)
-    
+        table_filter, params = self._table_filter('c.relname', table_names)
+        return self._fetch(FOREIGN_KEYS_QUERY.format(table_filter=table_filter), params, stream)
+        
+    def get_change_markers(self):
+        """테이블별 변경 표시 (관련 카탈로그 행 xmin 해시)"""
+        return {row['table_name']: row['marker'] for row in self.execute_query(CHANGE_MARKERS_QUERY, (SCHEMA_NAME,))}
+        
     def get_tables_basic_info(self):
         """테이블 기본 정보만 조회 (테이블명, 코멘트)"""
-        query = """
-        SELECT 
-            t.table_name,
-            COALESCE(obj_description(pgc.oid), '') as table_comment
-        FROM 
-            information_schema.tables t
-        LEFT JOIN 
-            pg_class pgc ON pgc.relname = t.table_name
-        LEFT JOIN 
-            pg_namespace pgn ON pgn.oid = pgc.relnamespace
-        WHERE 
-            t.table_schema = 'public'
-            AND t.table_type IN ('BASE TABLE', 'VIEW')
-            AND (pgn.nspname = 'public' OR pgn.nspname IS NULL)
-        ORDER BY 
-            t.table_name
-        """
-        return self.execute_query(query)
-    
-    def get_indexes_info(self):
+        return self.execute_query(TABLES_BASIC_INFO_QUERY, (SCHEMA_NAME,))
+        
+    def get_indexes_info(self, table_names=None, stream=False):
         """인덱스 정보 조회"""
-        query = """
-        SELECT 
-            i.tablename as table_name,
-            i.indexname as index_name,
-            NOT ix.indisunique as non_unique,
-            a.attname as column_name,
-            a.attnum as seq_in_index
-        FROM 
-            pg_indexes i
-        JOIN 
-            pg_class t ON t.relname = i.tablename
-        JOIN 
-            pg_index ix ON ix.indrelid = t.oid
-        JOIN 
-            pg_class ic ON ic.oid = ix.indexrelid AND ic.relname = i.indexname  
-        JOIN 
-            pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
-        WHERE 
-            i.schemaname = 'public'
-            AND i.indexname NOT LIKE '%_pkey'
-        ORDER BY 
-            i.tablename, i.indexname, a.attnum
-        """
-        return self.execute_query(query)
\ No newline at end of file
+        table_filter, params = self._table_filter('t.relname', table_names)
+        return self._fetch(self._get_indexes_query(table_filter), params, stream)
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""
+PostgreSQL 드라이버 계층
+
+psycopg 3가 설치되어 있으면 우선 사용하고(파이프라인 모드, 바이너리 프로토콜),
+없으면 psycopg2를 사용합니다. 두 드라이버 모두 일반 쿼리 결과는 딕셔너리 행으로 반환하며,
+파이프라인 결과만 컬럼명과 값 튜플(PositionalRows)로 반환합니다.
+"""
+
+from config import POSTGRESQL_CONFIG
+from .base_connection import PositionalRows
+
+
+class PostgreSQLDriver:
+    """PostgreSQL 드라이버 공통 인터페이스"""
+    
+    name = None
+    
+    def __init__(self, module):
+        self.module = module
+        self.OperationalError = module.OperationalError
+        
+    def connect(self, host, port, user, password, database, timeout):
+        """연결 생성 (딕셔너리 행, autocommit)"""
+        raise NotImplementedError
+        
+    def server_version(self, connection):
+        """서버 버전 번호 (예: 150002)"""
+        raise NotImplementedError
+        
+    def server_cursor(self, connection, name, itersize):
+        """
+        이름 있는 서버 측 커서 생성 (순회 시 itersize 행씩 가져옴)
+        
+        연결이 autocommit이므로 WITH HOLD로 선언해 트랜잭션 밖에서도 유지합니다.
+        """
+        raise NotImplementedError
+        
+    def supports_pipeline(self):
+        """파이프라인 모드 지원 여부"""
+        return False
+        
+    def execute_many_queries(self, connection, statements):
+        """
+        여러 쿼리를 실행해 결과 집합 목록 반환 (기본: 차례로 실행)
+        
+        Args:
+            statements (list): [(쿼리, 파라미터), ...]
+            
+        Returns:
+            list: 쿼리별 딕셔너리 행 목록 (파이프라인 모드는 PositionalRows)
+        """
+        results = []
+        for query, params in statements:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params)
+                results.append(list(cursor.fetchall()))
+            finally:
+                cursor.close()
+        return results
+
+
+class Psycopg2Driver(PostgreSQLDriver):
+    """psycopg2 (RealDictCursor)"""
+    
+    name = 'psycopg2'
+    
+    def __init__(self, module, extras):
+        super().__init__(module)
+        self.extras = extras
+        
+    def connect(self, host, port, user, password, database, timeout):
+        connection = self.module.connect(
+            host=host,
+            port=port,
+            dbname=database,
+            user=user,
+            password=password,
+            connect_timeout=timeout,
+            cursor_factory=self.extras.RealDictCursor
+        )
+        connection.autocommit = True
+        return connection
+        
+    def server_version(self, connection):
+        return connection.server_version
+        
+    def server_cursor(self, connection, name, itersize):
+        cursor = connection.cursor(name=name, cursor_factory=self.extras.RealDictCursor, withhold=True)
+        cursor.itersize = itersize
+        return cursor
+
+
+class PsycopgDriver(PostgreSQLDriver):
+    """psycopg 3 (dict_row, 파이프라인 모드에서는 바이너리 + tuple_row)"""
+    
+    name = 'psycopg'
+    
+    def __init__(self, module, rows):
+        super().__init__(module)
+        self.rows = rows
+        
+    def connect(self, host, port, user, password, database, timeout):
+        return self.module.connect(
+            host=host,
+            port=port,
+            dbname=database,
+            user=user,
+            password=password,
+            connect_timeout=timeout,
+            autocommit=True,
+            row_factory=self.rows.dict_row
+        )
+        
+    def server_version(self, connection):
+        return connection.info.server_version
+        
+    def server_cursor(self, connection, name, itersize):
+        cursor = connection.cursor(name=name, binary=True, withhold=True)
+        cursor.itersize = itersize
+        return cursor
+        
+    def supports_pipeline(self):
+        # 파이프라인 모드는 libpq 14 이상 필요
+        return POSTGRESQL_CONFIG.get("pipeline", True) and self.module.Pipeline.is_supported()
+        
+    def execute_many_queries(self, connection, statements):
+        """
+        파이프라인 모드로 쿼리를 모두 보낸 뒤 한 번에 동기화해 결과 수신
+        
+        각 쿼리는 바이너리 형식의 튜플 행으로 받아 딕셔너리로 바꾸지 않고 PositionalRows로 반환합니다.
+        행은 순회할 때 하나씩 꺼내며, 끝까지 읽거나 close()하면 커서를 닫습니다.
+        """
+        if not self.supports_pipeline():
+            return super().execute_many_queries(connection, statements)
+            
+        cursors = []
+        try:
+            with connection.pipeline() as pipeline:
+                for query, params in statements:
+                    cursor = connection.cursor(binary=True, row_factory=self.rows.tuple_row)
+                    cursors.append(cursor)
+                    cursor.execute(query, params)
+                pipeline.sync()
+        except Exception:
+            for cursor in cursors:
+                cursor.close()
+            raise
+            
+        return [
+            PositionalRows([column.name for column in cursor.description], cursor, cursor.close)
+            for cursor in cursors
+        ]
+
+
+def _load_psycopg():
+    import psycopg
+    import psycopg.rows
+    return PsycopgDriver(psycopg, psycopg.rows)
+
+
+def _load_psycopg2():
+    import psycopg2
+    import psycopg2.extras
+    return Psycopg2Driver(psycopg2, psycopg2.extras)
+
+
+# 드라이버 이름 -> 로더 ('auto'일 때 이 순서로 시도)
+DRIVER_LOADERS = {
+    'psycopg': _load_psycopg,
+    'psycopg2': _load_psycopg2
+}
+
+_drivers = {}
+
+
+def get_postgresql_driver(name=None):
+    """
+    사용할 PostgreSQL 드라이버 반환
+    
+    Args:
+        name (str): 'psycopg', 'psycopg2' 또는 'auto' (None이면 설정값)
+        
+    Returns:
+        PostgreSQLDriver: 드라이버 객체
+        
+    Raises:
+        ImportError: 사용할 수 있는 드라이버가 없는 경우
+    """
+    name = name or POSTGRESQL_CONFIG.get("driver", "auto")
+    candidates = list(DRIVER_LOADERS) if name == 'auto' else [name]
+    
+    errors = []
+    for candidate in candidates:
+        if candidate not in _drivers:
+            try:
+                _drivers[candidate] = DRIVER_LOADERS[candidate]()
+            except ImportError as e:
+                errors.append(f"{candidate}: {e}")
+                continue
+        return _drivers[candidate]
+        
+    raise ImportError(f"사용할 수 있는 PostgreSQL 드라이버가 없습니다. ({'; '.join(errors)})")
@@ -0,0 +1,305 @@
+"""
+연결 세션 (연결 테스트 → 테이블 선택 → 생성 작업 흐름에서 연결 재사용)
+"""
+
+import threading
+import time
+from config import SESSION_CONFIG, CACHE_CONFIG
+from .connection_manager import connection_manager
+from .data_collector import metadata_collector
+from .metadata_cache import metadata_cache, ALL_TABLES
+
+
+class ConnectionSession:
+    """
+    연결 테스트가 성공하면 생성되어, 연결 정보가 바뀌기 전까지
+    하나의 연결과 조회된 테이블 목록을 유지하는 세션
+    
+    메타데이터 캐시에 같은 연결 키와 서버 버전으로 저장된 테이블 목록이 있으면 조회 없이 바로 반환하고,
+    백그라운드에서 다시 조회해 캐시를 갱신합니다. 갱신이 끝나면 on_cache_refresh(kind, changed)를 호출합니다.
+    작업을 멈추지 않는 문제(변경 표시 조회 실패, keepalive 중 연결 끊김 등)는 on_warning(message)로 알립니다.
+    두 콜백 모두 작업 스레드에서 호출될 수 있습니다.
+    명세서용 메타데이터는 세션 연결로 변경 표시만 조회해 캐시와 같을 때만 캐시를 사용하고,
+    다르거나 확인할 수 없으면 바로 수집합니다 (바뀐 테이블만 다시 조회).
+    """
+    
+    def __init__(self, dbms, host, port, database, username, password, timeout=30, oracle_type=None,
+                 on_cache_refresh=None, on_warning=None):
+        self.conn_info = {
+            'dbms': dbms,
+            'host': host,
+            'port': port,
+            'database': database,
+            'username': username,
+            'password': password,
+            'oracle_type': oracle_type
+        }
+        self.timeout = timeout
+        self.connection = None
+        self.table_list_data = None
+        self.cache_key = None
+        self.server_version = None
+        self.on_cache_refresh = on_cache_refresh
+        self.on_warning = on_warning
+        self._refreshing = set()
+        self._lock = threading.RLock()
+        self._keepalive_stop = None
+        self._keepalive_thread = None
+        
+    @property
+    def is_open(self):
+        """세션 연결 유지 여부"""
+        return self.connection is not None and self.connection.is_connected
+        
+    def matches(self, conn_info):
+        """현재 입력된 연결 정보와 세션의 연결 정보가 같은지 확인"""
+        return all(self.conn_info.get(key) == conn_info.get(key) for key in self.conn_info)
+        
+    def open(self):
+        """
+        연결을 열고 연결 테스트 실행
+        
+        Returns:
+            dict: 테스트 결과 정보 (ConnectionManager.test_connection과 같은 형식)
+        """
+        start_time = time.time()
+        info = self.conn_info
+        
+        try:
+            with self._lock:
+                self._acquire()
+                if not self.connection.test_connection():
+                    self._release(discard=True)
+                    return {
+                        'success': False,
+                        'error': '연결 테스트 쿼리가 실패했습니다.',
+                        'dbms': info['dbms'],
+                        'host': info['host'],
+                        'port': info['port'],
+                        'database': info['database']
+                    }
+                    
+                try:
+                    version = self.connection.get_version()
+                except Exception:
+                    version = "Unknown"
+                    
+                # 연결이 끊어져도 캐시를 찾을 수 있도록 캐시 키와 서버 버전 보관
+                self.cache_key = metadata_collector.get_cache_key(self.connection)
+                self.server_version = version
+                
+                connection_time = round((time.time() - start_time) * 1000, 2)
+                return {
+                    'success': True,
+                    'dbms': self.connection.get_dbms_name(),
+                    'version': version,
+                    'connection_time_ms': connection_time,
+                    'host': info['host'],
+                    'port': info['port'],
+                    'database': info['database'],
+                    'message': f"연결 성공! ({connection_time}ms)"
+                }
+                
+        except Exception as e:
+            self.close()
+            return {
+                'success': False,
+                'error': str(e),
+                'dbms': info['dbms'],
+                'host': info['host'],
+                'port': info['port'],
+                'database': info['database'],
+                'connection_time_ms': round((time.time() - start_time) * 1000, 2)
+            }
+            
+    def get_table_list(self, refresh=False):
+        """테이블 목록 반환 (이미 조회한 목록이나 캐시된 목록이 있으면 재사용)"""
+        with self._lock:
+            if self.table_list_data is None and not refresh:
+                cached = self._get_cached('table_list')
+                if cached is not None:
+                    self.table_list_data = cached
+                    self._start_refresh('table_list', cached)
+            if self.table_list_data is None or refresh:
+                self.table_list_data = self._run(metadata_collector.collect_table_list_from_connection)
+            return self.table_list_data
+            
+    def collect_metadata(self, selected_tables=None, use_cache=True):
+        """세션 연결로 메타데이터 수집 (캐시된 메타데이터는 변경 표시가 같을 때만 사용)"""
+        with self._lock:
+            if use_cache:
+                cached = self._get_cached_metadata(selected_tables)
+                if cached is not None and self._is_cache_current(cached, selected_tables):
+                    return cached
+                    
+            # 테이블이 많으면 연결 풀에서 연결을 더 빌려 병렬로 수집
+            conn_params = dict(self.conn_info, timeout=self.timeout)
+            return self._run(metadata_collector.collect_metadata_from_connection, selected_tables, conn_params)
+            
+    def _get_cached(self, kind, selection=ALL_TABLES):
+        """캐시된 데이터 조회 (연결 테스트 전이면 None)"""
+        if self.cache_key is None:
+            return None
+        return metadata_cache.get(self.cache_key, self.server_version, kind, selection)
+        
+    def _get_cached_metadata(self, selected_tables):
+        """
+        캐시된 메타데이터 조회
+        
+        선택한 테이블 목록 그대로 저장된 항목이 없으면 전체 메타데이터 항목에서 선택한 테이블만 추립니다.
+        전체 항목에 없는 테이블이 있으면(새로 만든 테이블 등) 캐시를 쓰지 않습니다.
+        """
+        cached = self._get_cached('metadata', metadata_cache.selection_key(selected_tables))
+        if cached is not None or not selected_tables:
+            return cached
+            
+        cached = self._get_cached('metadata')
+        if cached is None:
+            return None
+        selected = set(selected_tables)
+        if not selected <= {row['table_name'] for row in cached['tables']}:
+            return None
+            
+        cached['tables'] = [row for row in cached['tables'] if row['table_name'] in selected]
+        cached['foreign_keys'] = [fk for fk in cached['foreign_keys'] if fk['table_name'] in selected]
+        cached['indexes'] = [idx for idx in cached['indexes'] if idx['table_name'] in selected]
+        statistics = cached['statistics']
+        statistics['total_tables'] = len(selected)
+        statistics['total_columns'] = len(cached['tables'])
+        statistics['total_foreign_keys'] = len(cached['foreign_keys'])
+        return cached
+        
+    def _is_cache_current(self, cached, selected_tables):
+        """
+        캐시된 메타데이터의 변경 표시가 현재 DB와 같은지 세션 연결로 확인
+        
+        변경 표시를 지원하지 않는 DBMS이거나 조회에 실패하면 확인할 수 없으므로 False를 반환합니다.
+        """
+        cached_markers = cached.get('change_markers')
+        if cached_markers is None:
+            return False
+        try:
+            markers = self._run(lambda conn: conn.get_change_markers())
+        except Exception as e:
+            self._warn(f"변경 표시 조회 실패, 메타데이터를 다시 수집합니다: {e}")
+            return False
+        if markers is None:
+            return False
+            
+        # 선택이 없으면 새로 생기거나 삭제된 테이블도 비교
+        names = set(selected_tables) if selected_tables else set(markers) | set(cached_markers)
+        return all(markers.get(name) == cached_markers.get(name) for name in names)
+        
+    def _start_refresh(self, kind, cached):
+        """캐시 최신 여부 확인을 백그라운드 스레드로 시작 (같은 대상은 한 번에 하나만)"""
+        if not CACHE_CONFIG.get("background_refresh"):
+            return
+        with self._lock:
+            if kind in self._refreshing:
+                return
+            self._refreshing.add(kind)
+        threading.Thread(
+            target=self._refresh_cache,
+            args=(kind, metadata_cache.content_digest(cached)),
+            daemon=True
+        ).start()
+        
+    def _refresh_cache(self, kind, cached_digest):
+        """
+        백그라운드 갱신 스레드 본문
+        
+        세션 연결은 사용자 작업에 쓰이므로 연결 풀에서 따로 연결을 빌려 다시 조회합니다.
+        수집기가 조회 결과를 캐시에 저장하므로 여기서는 캐시된 내용과 달라졌는지만 비교합니다.
+        테이블 목록만 갱신하며, 메타데이터는 collect_metadata에서 변경 표시로 확인합니다.
+        """
+        try:
+            conn_params = dict(self.conn_info, timeout=self.timeout)
+            with connection_manager.get_connection(**conn_params) as conn:
+                fresh = metadata_collector.collect_table_list_from_connection(conn)
+                
+            changed = metadata_cache.content_digest(fresh) != cached_digest
+            if changed:
+                with self._lock:
+                    if self.table_list_data is not None:
+                        self.table_list_data = fresh
+            if self.on_cache_refresh:
+                self.on_cache_refresh(kind, changed)
+        except Exception as e:
+            self._warn(f"캐시 최신 여부 확인 실패: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(kind)
+                
+    def start_keepalive(self, interval=None):
+        """keepalive 시작 (테이블 선택 창이 열려 있는 동안 연결 유지)"""
+        interval = interval or SESSION_CONFIG["keepalive_interval"]
+        self.stop_keepalive()
+        self._keepalive_stop = threading.Event()
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive_loop, args=(self._keepalive_stop, interval), daemon=True
+        )
+        self._keepalive_thread.start()
+        
+    def stop_keepalive(self):
+        """keepalive 중지"""
+        if self._keepalive_stop:
+            self._keepalive_stop.set()
+        self._keepalive_stop = None
+        self._keepalive_thread = None
+        
+    def close(self):
+        """세션 종료 (연결은 연결 풀에 반납)"""
+        self.stop_keepalive()
+        with self._lock:
+            self.table_list_data = None
+            if self.connection is not None:
+                self._release()
+                
+    def _keepalive_loop(self, stop_event, interval):
+        """keepalive 스레드 본문"""
+        while not stop_event.wait(interval):
+            with self._lock:
+                if self.connection is None:
+                    return
+                if not self.connection.ping():
+                    self._warn("세션 연결이 끊어졌습니다. 다음 작업에서 다시 연결합니다.")
+                    self._release(discard=True)
+                    
+    def _warn(self, message):
+        """호출한 쪽에 경고 전달 (on_warning이 없으면 무시)"""
+        if self.on_warning:
+            self.on_warning(message)
+            
+    def _run(self, func, *args):
+        """세션 연결로 작업 실행 (연결이 끊어졌으면 한 번 다시 연결 후 재시도)"""
+        if self.connection is None:
+            self._acquire()
+        try:
+            return func(self.connection, *args)
+        except Exception:
+            # 연결이 살아 있으면 작업 자체의 오류이므로 그대로 전달
+            if self.connection is not None and self.connection.ping():
+                raise
+            self._release(discard=True)
+            self._acquire()
+            return func(self.connection, *args)
+            
+    def _acquire(self):
+        """연결 풀에서 세션 연결 확보"""
+        info = self.conn_info
+        self.connection = connection_manager.acquire(
+            dbms=info['dbms'],
+            host=info['host'],
+            port=info['port'],
+            database=info['database'],
+            username=info['username'],
+            password=info['password'],
+            timeout=self.timeout,
+            oracle_type=info['oracle_type']
+        )
+        
+    def _release(self, discard=False):
+        """세션 연결을 연결 풀에 반납"""
+        connection, self.connection = self.connection, None
+        if connection is not None:
+            connection_manager.release(connection, discard=discard)
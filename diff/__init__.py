@@ -0,0 +1,25 @@
+"""
+스키마 비교 모듈
+
+이 모듈은 두 시점의 메타데이터(실시간 수집 결과 또는 스냅샷 파일)를 비교해
+추가/삭제/변경된 테이블, 컬럼, 외래키, 인덱스를 찾습니다.
+
+주요 함수:
+- compare_schemas: 두 메타데이터 비교 결과 반환
+
+사용 예시:
+    from diff import compare_schemas
+    from excel import diff_report_generator
+    
+    result = compare_schemas("v1.dbsnap", "v2.dbsnap")
+    diff_report_generator.generate_diff_excel(result, "변경내역.xlsx")
+"""
+
+from .schema_diff import compare_schemas, CHANGE_ADDED, CHANGE_DROPPED, CHANGE_MODIFIED
+
+__all__ = [
+    'compare_schemas',
+    'CHANGE_ADDED',
+    'CHANGE_DROPPED',
+    'CHANGE_MODIFIED'
+]
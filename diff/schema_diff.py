@@ -0,0 +1,237 @@
+"""
+스키마 비교 엔진
+
+두 메타데이터(실시간 수집 결과 또는 스냅샷 파일)를 비교해 추가/삭제/변경된
+테이블, 컬럼, 외래키, 인덱스를 찾습니다.
+
+테이블마다 정규화한 내용의 해시(서명)를 한 번 계산해 서명이 같은 테이블은 바로 건너뛰고,
+서명이 다른 테이블만 컬럼/외래키/인덱스 이름으로 짝지어 비교하므로
+소요 시간은 전체 스키마 크기(행 수)에 비례합니다.
+"""
+
+import hashlib
+import os
+import time
+from snapshot import load_snapshot
+
+
+# 변경 종류
+CHANGE_ADDED = '추가'
+CHANGE_DROPPED = '삭제'
+CHANGE_MODIFIED = '변경'
+
+# 비교 대상 종류
+OBJECT_TABLE = '테이블'
+OBJECT_COLUMN = '컬럼'
+OBJECT_FOREIGN_KEY = '외래키'
+OBJECT_INDEX = '인덱스'
+
+# 컬럼 비교 항목 (정규화 키, 보고서 표시 이름), 컬럼 순서(position)는 비교하지 않음
+COLUMN_ATTRIBUTES = (
+    ('data_type', 'TYPE'),
+    ('default_value', 'DEFAULT'),
+    ('is_nullable', 'NULL'),
+    ('key_type', 'KEY'),
+    ('extra', 'EXTRA'),
+    ('column_comment', '설명')
+)
+
+
+def _text(value):
+    """비교용 문자열 (None은 빈 문자열)"""
+    return '' if value is None else str(value)
+
+
+def _is_unique(non_unique):
+    """non_unique 값으로 고유 인덱스 여부 판별 (명세서와 같이 0 또는 False이면 고유)"""
+    return _text(non_unique) in ('0', 'False')
+
+
+def _build_schema(metadata):
+    """
+    메타데이터를 테이블별 비교용 구조로 변환 (행을 한 번씩만 순회)
+    
+    Returns:
+        dict: {테이블명: {'comment', 'columns': {컬럼명: 속성 튜플},
+                         'foreign_keys': {(컬럼, 참조 테이블, 참조 컬럼): 제약조건명},
+                         'indexes': {인덱스명: (고유 여부, 컬럼 튜플)}}}
+    """
+    schema = {}
+    
+    def table(name):
+        entry = schema.get(name)
+        if entry is None:
+            entry = schema[name] = {'comment': '', 'columns': {}, 'foreign_keys': {}, 'indexes': {}}
+        return entry
+        
+    for row in metadata.get('tables', []):
+        entry = table(row['table_name'])
+        entry['comment'] = _text(row.get('table_comment'))
+        entry['columns'][row['column_name']] = tuple(_text(row.get(key)) for key, _ in COLUMN_ATTRIBUTES)
+        
+    for fk in metadata.get('foreign_keys', []):
+        key = (_text(fk['column_name']), _text(fk['referenced_table_name']), _text(fk['referenced_column_name']))
+        table(fk['table_name'])['foreign_keys'][key] = _text(fk.get('constraint_name'))
+        
+    index_columns = {}
+    for idx in metadata.get('indexes', []):
+        key = (idx['table_name'], idx['index_name'])
+        index_columns.setdefault(key, []).append((int(idx.get('seq_in_index') or 0), _text(idx['column_name'])))
+        indexes = table(idx['table_name'])['indexes']
+        if idx['index_name'] not in indexes:
+            indexes[idx['index_name']] = _is_unique(idx.get('non_unique'))
+    for (table_name, index_name), columns in index_columns.items():
+        indexes = schema[table_name]['indexes']
+        indexes[index_name] = (indexes[index_name], tuple(name for _, name in sorted(columns)))
+        
+    for entry in schema.values():
+        entry['signature'] = _signature(entry)
+    return schema
+
+
+def _signature(entry):
+    """테이블 내용의 해시 (같으면 변경 없음)"""
+    content = (
+        entry['comment'],
+        sorted(entry['columns'].items()),
+        sorted(entry['foreign_keys'].items()),
+        sorted(entry['indexes'].items())
+    )
+    return hashlib.sha1(repr(content).encode('utf-8')).digest()
+
+
+def _compare_table(table_name, old, new):
+    """서명이 다른 테이블 하나의 변경 내역"""
+    changes = []
+    
+    if old['comment'] != new['comment']:
+        changes.append(_change(table_name, OBJECT_TABLE, table_name, CHANGE_MODIFIED, '논리명',
+                               old['comment'], new['comment']))
+    
+    old_columns, new_columns = old['columns'], new['columns']
+    for name, attributes in new_columns.items():
+        previous = old_columns.get(name)
+        if previous is None:
+            changes.append(_change(table_name, OBJECT_COLUMN, name, CHANGE_ADDED, 'TYPE', '', attributes[0]))
+        elif previous != attributes:
+            for (_, label), before, after in zip(COLUMN_ATTRIBUTES, previous, attributes):
+                if before != after:
+                    changes.append(_change(table_name, OBJECT_COLUMN, name, CHANGE_MODIFIED, label, before, after))
+    for name, attributes in old_columns.items():
+        if name not in new_columns:
+            changes.append(_change(table_name, OBJECT_COLUMN, name, CHANGE_DROPPED, 'TYPE', attributes[0], ''))
+            
+    old_fks, new_fks = old['foreign_keys'], new['foreign_keys']
+    for key in new_fks.keys() - old_fks.keys():
+        changes.append(_change(table_name, OBJECT_FOREIGN_KEY, new_fks[key] or key[0], CHANGE_ADDED,
+                               '참조', '', f"{key[0]} -> {key[1]}.{key[2]}"))
+    for key in old_fks.keys() - new_fks.keys():
+        changes.append(_change(table_name, OBJECT_FOREIGN_KEY, old_fks[key] or key[0], CHANGE_DROPPED,
+                               '참조', f"{key[0]} -> {key[1]}.{key[2]}", ''))
+    for key in sorted(old_fks.keys() & new_fks.keys()):
+        # 참조는 같고 제약조건명만 바뀐 경우 (서명에 제약조건명이 포함됨)
+        if old_fks[key] != new_fks[key]:
+            changes.append(_change(table_name, OBJECT_FOREIGN_KEY, new_fks[key] or key[0], CHANGE_MODIFIED,
+                                   '제약조건명', old_fks[key], new_fks[key]))
+    
+    old_indexes, new_indexes = old['indexes'], new['indexes']
+    for name, (unique, columns) in new_indexes.items():
+        previous = old_indexes.get(name)
+        if previous is None:
+            changes.append(_change(table_name, OBJECT_INDEX, name, CHANGE_ADDED, '컬럼', '',
+                                   _index_text(unique, columns)))
+        elif previous != (unique, columns):
+            changes.append(_change(table_name, OBJECT_INDEX, name, CHANGE_MODIFIED, '컬럼',
+                                   _index_text(*previous), _index_text(unique, columns)))
+    for name, (unique, columns) in old_indexes.items():
+        if name not in new_indexes:
+            changes.append(_change(table_name, OBJECT_INDEX, name, CHANGE_DROPPED, '컬럼',
+                                   _index_text(unique, columns), ''))
+    return changes
+
+
+def _index_text(unique, columns):
+    """인덱스 표시 문자열 (명세서와 같은 '컬럼,컬럼' 형식)"""
+    return f"{'UNIQUE ' if unique else ''}({','.join(columns)})"
+
+
+def _change(table_name, object_type, object_name, change, attribute, old_value, new_value):
+    """변경 내역 한 건"""
+    return {
+        'table_name': table_name,
+        'object_type': object_type,
+        'object_name': object_name,
+        'change': change,
+        'attribute': attribute,
+        'old_value': old_value,
+        'new_value': new_value
+    }
+
+
+def _load(source):
+    """메타데이터 또는 스냅샷 파일 경로를 메타데이터로 변환"""
+    if isinstance(source, (str, os.PathLike)):
+        return load_snapshot(source)
+    return source
+
+
+def compare_schemas(old_source, new_source):
+    """
+    두 메타데이터 비교
+    
+    Args:
+        old_source (dict | str): 이전 메타데이터 또는 스냅샷 파일 경로
+        new_source (dict | str): 새 메타데이터 또는 스냅샷 파일 경로
+        
+    Returns:
+        dict: {
+            'old_info', 'new_info': 각 메타데이터의 connection_info,
+            'added_tables', 'dropped_tables', 'modified_tables': 테이블명 목록 (이름순),
+            'changes': 변경 내역 목록 (테이블명 순, 테이블/컬럼/외래키/인덱스 단위),
+            'statistics': 건수 요약과 비교 소요 시간
+        }
+    """
+    start_time = time.time()
+    old_metadata, new_metadata = _load(old_source), _load(new_source)
+    old_schema, new_schema = _build_schema(old_metadata), _build_schema(new_metadata)
+    
+    added = sorted(new_schema.keys() - old_schema.keys())
+    dropped = sorted(old_schema.keys() - new_schema.keys())
+    modified = sorted(
+        name for name in new_schema.keys() & old_schema.keys()
+        if new_schema[name]['signature'] != old_schema[name]['signature']
+    )
+    
+    changes = []
+    for name in added:
+        changes.append(_change(name, OBJECT_TABLE, name, CHANGE_ADDED, '컬럼 수', '', len(new_schema[name]['columns'])))
+    for name in dropped:
+        changes.append(_change(name, OBJECT_TABLE, name, CHANGE_DROPPED, '컬럼 수', len(old_schema[name]['columns']), ''))
+    for name in modified:
+        changes.extend(_compare_table(name, old_schema[name], new_schema[name]))
+    changes.sort(key=lambda change: change['table_name'])
+    
+    counts = {}
+    for change in changes:
+        key = (change['object_type'], change['change'])
+        counts[key] = counts.get(key, 0) + 1
+        
+    return {
+        'old_info': old_metadata.get('connection_info', {}),
+        'new_info': new_metadata.get('connection_info', {}),
+        'added_tables': added,
+        'dropped_tables': dropped,
+        'modified_tables': modified,
+        'changes': changes,
+        'statistics': {
+            'old_tables': len(old_schema),
+            'new_tables': len(new_schema),
+            'unchanged_tables': len(new_schema) - len(added) - len(modified),
+            'total_changes': len(changes),
+            'counts': [
+                {'object_type': object_type, 'change': change, 'count': count}
+                for (object_type, change), count in sorted(counts.items())
+            ],
+            'comparison_duration_ms': round((time.time() - start_time) * 1000, 2)
+        }
+    }
@@ -5,6 +5,7 @@ Excel 명세서 생성 모듈
 
 주요 클래스:
 - DBSpecExcelGenerator: Excel 명세서 생성기
+- SchemaDiffExcelGenerator: 스키마 변경 보고서 생성기 (명세서와 같은 스타일)
 
 사용 예시:
     from excel import excel_generator
@@ -13,8 +14,11 @@ Excel 명세서 생성 모듈
 """
 
 from .excel_generator import DBSpecExcelGenerator, excel_generator
+from .diff_report_generator import SchemaDiffExcelGenerator, diff_report_generator
 
 __all__ = [
     'DBSpecExcelGenerator',
-    'excel_generator'
+    'excel_generator',
+    'SchemaDiffExcelGenerator',
+    'diff_report_generator'
 ]
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+스키마 변경 보고서 Excel 생성기
+"""
+
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+import os
+from .excel_generator import DBSpecExcelGenerator
+
+
+class SchemaDiffExcelGenerator(DBSpecExcelGenerator):
+    """스키마 비교 결과(compare_schemas)를 명세서와 같은 스타일의 Excel 보고서로 생성"""
+    
+    def generate_diff_excel(self, diff_result, save_path):
+        """
+        변경 보고서 Excel 생성
+        
+        Args:
+            diff_result (dict): diff.compare_schemas 결과
+            save_path (str): 저장할 파일 경로
+            
+        Returns:
+            str: 생성된 파일 경로
+        """
+        self.workbook = Workbook()
+        
+        # 기본 시트 제거
+        if 'Sheet' in self.workbook.sheetnames:
+            self.workbook.remove(self.workbook['Sheet'])
+            
+        self._create_diff_summary_sheet(diff_result)
+        self._create_diff_detail_sheet(diff_result['changes'])
+        
+        # 파일 저장
+        save_dir = os.path.dirname(save_path)
+        if save_dir:  # 디렉토리가 있는 경우에만 생성
+            os.makedirs(save_dir, exist_ok=True)
+        self.workbook.save(save_path)
+        
+        return save_path
+        
+    def _create_diff_summary_sheet(self, diff_result):
+        """변경 요약 시트 생성 (비교 대상 정보, 종류별 건수)"""
+        ws = self.workbook.create_sheet("변경요약")
+        
+        # 비교 대상 정보 (항목 | 이전 | 이후)
+        headers = ['항목', '이전', '이후']
+        for col, header in enumerate(headers, 1):
+            cell = ws.cell(row=1, column=col, value=header)
+            self._apply_style(cell, self.styles['header'])
+            
+        old_info, new_info = diff_result['old_info'], diff_result['new_info']
+        statistics = diff_result['statistics']
+        info_rows = [
+            ('DBMS', old_info.get('dbms'), new_info.get('dbms')),
+            ('서버', self._server_text(old_info), self._server_text(new_info)),
+            ('데이터베이스', old_info.get('database'), new_info.get('database')),
+            ('버전', old_info.get('version'), new_info.get('version')),
+            ('수집 시각', old_info.get('collection_time'), new_info.get('collection_time')),
+            ('테이블 수', statistics['old_tables'], statistics['new_tables'])
+        ]
+        row = 1
+        for label, old_value, new_value in info_rows:
+            row += 1
+            self._write_row(ws, row, [label, old_value or '', new_value or ''], label_columns=1)
+            
+        # 종류별 건수 (종류 | 변경 | 건수)
+        row += 2
+        for col, header in enumerate(['종류', '변경', '건수'], 1):
+            cell = ws.cell(row=row, column=col, value=header)
+            self._apply_style(cell, self.styles['header'])
+        summary_rows = [
+            (item['object_type'], item['change'], item['count']) for item in statistics['counts']
+        ]
+        summary_rows.append(('테이블', '변경 없음', statistics['unchanged_tables']))
+        for values in summary_rows:
+            row += 1
+            self._write_row(ws, row, list(values), label_columns=1, center_columns=(2, 3))
+            
+        column_widths = [16, 40, 40]
+        for i, width in enumerate(column_widths, 1):
+            ws.column_dimensions[get_column_letter(i)].width = width
+            
+    def _create_diff_detail_sheet(self, changes):
+        """변경 내역 시트 생성 (변경 한 건당 한 행)"""
+        ws = self.workbook.create_sheet("변경내역")
+        
+        headers = ['NO', '테이블명', '종류', '이름', '변경', '항목', '이전', '이후']
+        for col, header in enumerate(headers, 1):
+            cell = ws.cell(row=1, column=col, value=header)
+            self._apply_style(cell, self.styles['header'])
+            
+        for idx, change in enumerate(changes, 1):
+            values = [
+                idx,
+                change['table_name'],
+                change['object_type'],
+                change['object_name'],
+                change['change'],
+                change['attribute'],
+                change['old_value'],
+                change['new_value']
+            ]
+            self._write_row(ws, idx + 1, values, center_columns=(1, 3, 5, 6))
+            
+        # 머리글 고정 및 필터
+        ws.freeze_panes = 'A2'
+        if changes:
+            ws.auto_filter.ref = f"A1:{get_column_letter(len(headers))}{len(changes) + 1}"
+            
+        column_widths = [8, 30, 10, 30, 8, 10, 40, 40]
+        for i, width in enumerate(column_widths, 1):
+            ws.column_dimensions[get_column_letter(i)].width = width
+            
+    def _write_row(self, ws, row, values, label_columns=0, center_columns=()):
+        """한 행 입력 (앞쪽 label_columns개 열은 라벨 스타일, center_columns는 가운데 정렬)"""
+        for col, value in enumerate(values, 1):
+            cell = ws.cell(row=row, column=col, value=value)
+            if col <= label_columns:
+                style = self.styles['info_label']
+            elif col in center_columns:
+                style = self.styles['data_center']
+            else:
+                style = self.styles['data']
+            self._apply_style(cell, style)
+            
+    def _server_text(self, info):
+        """서버 주소 표시 문자열"""
+        if not info.get('host'):
+            return ''
+        return f"{info['host']}:{info.get('port', '')}"
+
+
+# 싱글톤 인스턴스
+diff_report_generator = SchemaDiffExcelGenerator()
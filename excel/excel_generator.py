@@ -7,6 +7,9 @@ from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
 from openpyxl.utils import get_column_letter
 import os
 from datetime import datetime
+from config import SNAPSHOT_CONFIG
+from model import Table, RelationshipIndex, schema_of
+from snapshot import load_snapshot, SnapshotStore
 
 
 class DBSpecExcelGenerator:
@@ -89,29 +92,42 @@ class DBSpecExcelGenerator:
             }
         }
         
-    def generate_excel(self, metadata, save_path):
+    def generate_excel(self, metadata, save_path, table_names=None):
         """
         메타데이터를 기반으로 Excel 명세서 생성
         
         Args:
-            metadata (dict): 데이터베이스 메타데이터
+            metadata (dict | SnapshotStore | str): 데이터베이스 메타데이터, 스냅샷 저장소,
+                또는 스냅샷/저장소 파일 경로 (DB 연결 없이 생성)
             save_path (str): 저장할 파일 경로
+            table_names (list): 명세서에 넣을 테이블 목록 (None이면 전체)
             
         Returns:
             str: 생성된 파일 경로
         """
+        if isinstance(metadata, (str, os.PathLike)):
+            if str(metadata).endswith(SNAPSHOT_CONFIG["store_extension"]):
+                with SnapshotStore(metadata) as store:
+                    return self.generate_excel(store, save_path, table_names)
+            metadata = load_snapshot(metadata)
+            
         self.workbook = Workbook()
         
         # 기본 시트 제거
         if 'Sheet' in self.workbook.sheetnames:
             self.workbook.remove(self.workbook['Sheet'])
             
-        # 포맷된 메타데이터 준비
-        formatted_metadata = self._format_metadata_for_excel(metadata)
-        
-        # 하나의 테이블명세서 시트에 모든 테이블 나열
-        self._create_unified_table_sheet(formatted_metadata)
+        if isinstance(metadata, SnapshotStore):
+            # 저장소는 테이블 블록을 하나씩 읽어 바로 시트에 기록 (전체를 메모리에 올리지 않음)
+            tables = self._iter_store_tables(metadata, table_names)
+        else:
+            # 수집기가 테이블별로 묶은 모델과 외래키/인덱스 색인 사용 (캐시/스냅샷에서 읽은 행 목록이면 한 번 묶음)
+            schema = schema_of(metadata)
+            tables = ((table, schema.relationships) for table in schema.iter_tables(table_names))
             
+        # 하나의 테이블명세서 시트에 모든 테이블 나열
+        self._create_unified_table_sheet(tables)
+        
         # 파일 저장
         save_dir = os.path.dirname(save_path)
         if save_dir:  # 디렉토리가 있는 경우에만 생성
@@ -176,25 +192,38 @@ class DBSpecExcelGenerator:
         column_widths = [8, 30, 50]  # NO, 테이블명, 논리명
         for i, width in enumerate(column_widths, 1):
             ws.column_dimensions[get_column_letter(i)].width = width
-    
-    def _create_unified_table_sheet(self, formatted_metadata):
-        """모든 테이블을 하나의 시트에 통합 생성"""
+            
+    def _create_unified_table_sheet(self, tables):
+        """
+        모든 테이블을 하나의 시트에 통합 생성
+        
+        Args:
+            tables (iterable): (Table, RelationshipIndex) 순서열
+        """
         ws = self.workbook.create_sheet("테이블명세서")
         
         current_row = 1
         table_count = 0
         
         # 각 테이블을 순차적으로 배치
-        for table_name, table_data in formatted_metadata['tables_by_name'].items():
+        for table, relationships in tables:
             # 첫 번째 테이블이 아니면 간격 추가 (2행 띄어서)
             if table_count > 0:
                 current_row += 2
                 
-            current_row = self._add_table_to_sheet(ws, table_name, table_data, formatted_metadata['foreign_keys'], formatted_metadata['indexes'], current_row)
+            current_row = self._add_table_to_sheet(ws, table, relationships, current_row)
             table_count += 1
-    
-    def _add_table_to_sheet(self, ws, table_name, table_data, foreign_keys, indexes, start_row):
+            
+    def _iter_store_tables(self, store, table_names=None):
+        """저장소의 테이블 블록을 하나씩 Table로 변환 (색인은 블록에 있는 해당 테이블의 외래키/인덱스만)"""
+        for block in store.iter_tables(table_names):
+            table = Table.from_rows(block['table_name'], block['table_comment'], block['columns'],
+                                    block['foreign_keys'], block['indexes'])
+            yield table, RelationshipIndex(table.foreign_keys, table.indexes)
+            
+    def _add_table_to_sheet(self, ws, table, relationships, start_row):
         """시트에 테이블 정보를 추가 (기존 _create_table_sheet 로직 재사용)"""
+        table_name = table.name
         
         # 테이블 정보 영역 (시작행부터 7행)
         
@@ -213,7 +242,7 @@ class DBSpecExcelGenerator:
         # 2행: 논리명 (테이블 comment)
         row2 = start_row + 1
         ws.cell(row=row2, column=1, value="논리명")
-        ws.cell(row=row2, column=3, value=table_data['table_info']['comment'] or '')
+        ws.cell(row=row2, column=3, value=table.comment or '')
         ws.merge_cells(f'A{row2}:B{row2}')
         ws.merge_cells(f'C{row2}:J{row2}')
         self._apply_style(ws.cell(row=row2, column=1), self.styles['info_label'])
@@ -236,16 +265,8 @@ class DBSpecExcelGenerator:
             self._apply_style(ws.cell(row=row3, column=col_num), self.styles['info_value'])
         
         # Primary Key, Foreign Key, Index 정보 수집
-        primary_keys = []
-        foreign_key_info = []
-        
-        for col_info in table_data['columns']:
-            if col_info['key'] == 'PRI':
-                primary_keys.append(col_info['name'])
-                
-        for fk in foreign_keys:
-            if fk['table_name'] == table_name:
-                foreign_key_info.append(f"{fk['column_name']}")
+        primary_keys = table.primary_keys
+        foreign_key_info = [f"{fk.column_name}" for fk in relationships.table_foreign_keys(table_name)]
         
         # 4행: PRIMARY KEY
         row4 = start_row + 3
@@ -274,16 +295,15 @@ class DBSpecExcelGenerator:
             self._apply_style(ws.cell(row=row5, column=col_num), self.styles['info_value'])
         
         # 인덱스 정보 수집 및 구성
-        table_indexes = [idx for idx in indexes if idx['table_name'] == table_name]
         regular_indexes = []
         unique_indexes = []
         
         # 인덱스를 그룹화하여 "인덱스명(컬럼명)" 형태로 구성
         index_groups = {}
-        for idx in table_indexes:
-            index_name = idx['index_name']
-            column_name = idx['column_name']
-            is_unique = idx['non_unique'] == 0 or idx['non_unique'] == False
+        for idx in relationships.table_indexes(table_name):
+            index_name = idx.index_name
+            column_name = idx.column_name
+            is_unique = idx.is_unique
             
             if index_name not in index_groups:
                 index_groups[index_name] = {
@@ -339,30 +359,25 @@ class DBSpecExcelGenerator:
             
         # 컬럼 정보 추가 (순차적 NO 부여)
         current_data_row = header_row
-        for idx, col_info in enumerate(table_data['columns'], 1):
+        for idx, column in enumerate(table.columns, 1):
             current_data_row += 1
             
-            # 외래키 참조 정보 찾기 및 FK 여부 판별
-            fk_ref = ""
-            is_foreign_key = False
-            for fk in foreign_keys:
-                if (fk['table_name'] == table_name and 
-                    fk['column_name'] == col_info['name']):
-                    fk_ref = f"{fk['referenced_table_name']}.{fk['referenced_column_name']}"
-                    is_foreign_key = True
-                    break
-                    
+            # 외래키 참조 정보 찾기 및 FK 여부 판별 ((테이블, 컬럼) 색인으로 바로 조회)
+            fk = relationships.foreign_key(table_name, column.name)
+            is_foreign_key = fk is not None
+            fk_ref = f"{fk.referenced_table_name}.{fk.referenced_column_name}" if is_foreign_key else ""
+            
             # 데이터 입력
             data_row = [
                 idx,  # NO (순차적)
-                'Y' if col_info['key'] == 'PRI' else '',  # PK
-                'Y' if 'auto_increment' in str(col_info['extra']).lower() else '',  # AI
+                'Y' if column.key == 'PRI' else '',  # PK
+                'Y' if 'auto_increment' in str(column.extra).lower() else '',  # AI
                 'Y' if is_foreign_key else '',  # FK (외래키 정보로 정확히 판별)
-                'Y' if col_info['nullable'] in ['YES', 'Y', 1, '1'] else '',  # NULL
-                col_info['name'],  # 컬럼명
-                col_info['type'],  # TYPE
-                col_info['default'] or '',  # DEFAULT
-                col_info['comment'] or '',  # 설명
+                'Y' if column.nullable in ['YES', 'Y', 1, '1'] else '',  # NULL
+                column.name,  # 컬럼명
+                column.type,  # TYPE
+                column.default or '',  # DEFAULT
+                column.comment or '',  # 설명
                 fk_ref  # 참조 테이블
             ]
             
@@ -454,8 +469,9 @@ class DBSpecExcelGenerator:
         ws.column_dimensions['A'].width = 20
         ws.column_dimensions['B'].width = 30
         
-    def _create_table_sheet(self, table_name, table_data, foreign_keys):
+    def _create_table_sheet(self, table, relationships):
         """테이블 상세 시트 생성 (이미지 양식에 맞춤)"""
+        table_name = table.name
         ws = self.workbook.create_sheet(f"📋 {table_name}")
         
         # 테이블 정보 영역 (A1:J7)
@@ -484,7 +500,7 @@ class DBSpecExcelGenerator:
         
         # 3행: 테이블 설명
         ws['A3'] = "테이블 설명"
-        ws['C3'] = table_data['table_info']['comment'] or ''
+        ws['C3'] = table.comment or ''
         ws.merge_cells('A3:B3')
         ws.merge_cells('C3:J3')
         self._apply_style(ws['A3'], self.styles['info_label'])
@@ -494,16 +510,8 @@ class DBSpecExcelGenerator:
             self._apply_style(ws[f'{col}3'], self.styles['info_value'])
         
         # Primary Key, Foreign Key, Index 정보 수집
-        primary_keys = []
-        foreign_key_info = []
-        
-        for col_info in table_data['columns']:
-            if col_info['key'] == 'PRI':
-                primary_keys.append(col_info['name'])
-                
-        for fk in foreign_keys:
-            if fk['table_name'] == table_name:
-                foreign_key_info.append(f"{fk['column_name']}")
+        primary_keys = table.primary_keys
+        foreign_key_info = [f"{fk.column_name}" for fk in relationships.table_foreign_keys(table_name)]
         
         # 4행: PRIMARY KEY
         ws['A4'] = "PRIMARY KEY"
@@ -556,30 +564,25 @@ class DBSpecExcelGenerator:
             self._apply_style(cell, self.styles['header'])
             
         # 컬럼 정보 추가 (순차적 NO 부여)
-        for idx, col_info in enumerate(table_data['columns'], 1):
+        for idx, column in enumerate(table.columns, 1):
             row += 1
             
-            # 외래키 참조 정보 찾기 및 FK 여부 판별
-            fk_ref = ""
-            is_foreign_key = False
-            for fk in foreign_keys:
-                if (fk['table_name'] == table_name and 
-                    fk['column_name'] == col_info['name']):
-                    fk_ref = f"{fk['referenced_table_name']}.{fk['referenced_column_name']}"
-                    is_foreign_key = True
-                    break
-                    
+            # 외래키 참조 정보 찾기 및 FK 여부 판별 ((테이블, 컬럼) 색인으로 바로 조회)
+            fk = relationships.foreign_key(table_name, column.name)
+            is_foreign_key = fk is not None
+            fk_ref = f"{fk.referenced_table_name}.{fk.referenced_column_name}" if is_foreign_key else ""
+            
             # 데이터 입력
             data_row = [
                 idx,  # NO (순차적)
-                'Y' if col_info['key'] == 'PRI' else '',  # PK
-                'Y' if 'auto_increment' in str(col_info['extra']).lower() else '',  # AI
+                'Y' if column.key == 'PRI' else '',  # PK
+                'Y' if 'auto_increment' in str(column.extra).lower() else '',  # AI
                 'Y' if is_foreign_key else '',  # FK (외래키 정보로 정확히 판별)
-                'Y' if col_info['nullable'] in ['YES', 'Y', 1, '1'] else '',  # NULL
-                col_info['name'],  # 컬럼명
-                col_info['type'],  # TYPE
-                col_info['default'] or '',  # DEFAULT
-                col_info['comment'] or '',  # 설명
+                'Y' if column.nullable in ['YES', 'Y', 1, '1'] else '',  # NULL
+                column.name,  # 컬럼명
+                column.type,  # TYPE
+                column.default or '',  # DEFAULT
+                column.comment or '',  # 설명
                 fk_ref  # 참조 테이블
             ]
             
@@ -640,45 +643,6 @@ class DBSpecExcelGenerator:
         for i, width in enumerate(column_widths, 1):
             ws.column_dimensions[get_column_letter(i)].width = width
             
-    def _format_metadata_for_excel(self, metadata):
-        """Excel 생성을 위한 메타데이터 포맷"""
-        formatted = {
-            'database_info': metadata['connection_info'],
-            'tables_by_name': {},
-            'foreign_keys': metadata['foreign_keys'],
-            'indexes': metadata.get('indexes', []),
-            'statistics': metadata['statistics']
-        }
-        
-        # 테이블별로 그룹화
-        for row in metadata['tables']:
-            table_name = row['table_name']
-            if table_name not in formatted['tables_by_name']:
-                formatted['tables_by_name'][table_name] = {
-                    'table_info': {
-                        'name': table_name,
-                        'comment': row['table_comment']
-                    },
-                    'columns': []
-                }
-                
-            formatted['tables_by_name'][table_name]['columns'].append({
-                'position': int(row['column_position']) if row['column_position'] else 0,
-                'name': row['column_name'],
-                'type': row['data_type'],
-                'default': row['default_value'],
-                'nullable': row['is_nullable'],
-                'key': row['key_type'],
-                'extra': row['extra'],
-                'comment': row['column_comment']
-            })
-            
-        # 컬럼을 position 순으로 정렬
-        for table_data in formatted['tables_by_name'].values():
-            table_data['columns'].sort(key=lambda x: x['position'] or 0)
-            
-        return formatted
-        
     def _apply_style(self, cell, style_dict):
         """셀에 스타일 적용"""
         if 'font' in style_dict:
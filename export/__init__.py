@@ -0,0 +1,34 @@
+"""
+Arrow/Parquet 내보내기 모듈
+
+이 모듈은 수집한 메타데이터(또는 스냅샷 파일)를 사전 인코딩 열을 쓰는 Arrow 테이블로 변환해
+Parquet 파일로 저장합니다. 여러 DB의 파일을 합쳐 pandas나 DuckDB로 타입 사용 현황,
+설명 작성률 등을 분석할 때 사용합니다. (pyarrow가 설치되어 있어야 함)
+
+주요 함수:
+- build_arrow_tables: 메타데이터 -> {'tables', 'columns', 'foreign_keys', 'indexes'} Arrow 테이블
+- export_parquet: Arrow 테이블을 폴더에 Parquet 파일로 저장
+
+사용 예시:
+    from export import export_parquet
+    
+    export_parquet(metadata, "catalogs/orders")   # 또는 export_parquet("orders.dbsnap", ...)
+    
+    # DuckDB: SELECT base_type, count(*) FROM 'catalogs/*/columns.parquet' GROUP BY 1
+"""
+
+from .arrow_exporter import (
+    ArrowExportError,
+    is_pyarrow_available,
+    build_arrow_tables,
+    export_parquet,
+    export_dir_for
+)
+
+__all__ = [
+    'ArrowExportError',
+    'is_pyarrow_available',
+    'build_arrow_tables',
+    'export_parquet',
+    'export_dir_for'
+]
@@ -0,0 +1,234 @@
+"""
+Arrow/Parquet 내보내기
+
+수집한 메타데이터(테이블, 컬럼, 외래키, 인덱스)를 Arrow 테이블로 변환해 Parquet 파일로 저장합니다.
+문자열 열은 사전(dictionary) 인코딩으로 반복 값(타입, DBMS, 테이블명 등)을 한 번만 저장하며,
+모든 행에 출처(DBMS, 호스트, 데이터베이스) 열이 있어 여러 DB의 파일을 그대로 합쳐
+pandas나 DuckDB에서 분석할 수 있습니다. (pyarrow 필요)
+"""
+
+import json
+import os
+import time
+from config import EXPORT_CONFIG, SNAPSHOT_CONFIG
+from model import schema_of
+from snapshot import load_snapshot, SnapshotStore
+from utils import without_credentials
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow 미설치 시 내보내기만 사용할 수 없음
+    pa = None
+    pq = None
+
+
+# 출처 열 (connection_info 키, 모든 행에 추가)
+SOURCE_FIELDS = ('dbms', 'host', 'database')
+
+# 내보내는 테이블 이름 (파일명: <이름>.parquet)
+EXPORT_TABLES = ('tables', 'columns', 'foreign_keys', 'indexes')
+
+# Arrow 스키마 메타데이터 키 (연결 정보와 통계 JSON)
+SCHEMA_METADATA_KEY = b'dboutput'
+
+
+class ArrowExportError(Exception):
+    """Arrow/Parquet 내보내기 오류 (pyarrow 미설치, 파일 쓰기 실패)"""
+    pass
+
+
+def is_pyarrow_available():
+    """pyarrow 설치 여부 확인"""
+    return pa is not None
+
+
+def _string(values):
+    """사전 인코딩 문자열 열"""
+    return pa.array(values, type=pa.string()).dictionary_encode()
+
+
+def _text(value):
+    """문자열 열 값 (None은 그대로, 그 밖의 값은 문자열로)"""
+    return value if value is None or type(value) is str else str(value)
+
+
+def _int(value):
+    """정수 열 값 (없거나 변환할 수 없으면 None)"""
+    try:
+        return int(value) if value is not None and value != '' else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _base_type(data_type):
+    """길이/정밀도를 뺀 타입 이름 (예: varchar(100) -> varchar, 타입 사용 현황 집계용)"""
+    if not data_type:
+        return ''
+    return str(data_type).split('(', 1)[0].strip().lower()
+
+
+def _load_metadata(source):
+    """메타데이터 딕셔너리, 스냅샷 저장소 또는 스냅샷/저장소 파일 경로를 메타데이터로 읽기"""
+    if isinstance(source, (str, os.PathLike)):
+        if str(source).endswith(SNAPSHOT_CONFIG["store_extension"]):
+            with SnapshotStore(source) as store:
+                return store.to_metadata()
+        return load_snapshot(source)
+    if isinstance(source, SnapshotStore):
+        return source.to_metadata()
+    return source
+
+
+def _make_table(columns, source, schema_metadata):
+    """
+    열 이름 -> (값 목록, 종류) 로 Arrow 테이블 생성 (출처 열을 앞에 추가)
+    
+    종류: 'string'(사전 인코딩), 'int32', 'bool'
+    """
+    row_count = len(next(iter(columns.values()))[0]) if columns else 0
+    names, arrays = [], []
+    for field in SOURCE_FIELDS:
+        names.append(field)
+        # 값이 하나뿐인 열: 사전 1개 + 인덱스만 저장
+        arrays.append(pa.DictionaryArray.from_arrays(
+            pa.array([0] * row_count, type=pa.int32()), pa.array([_text(source.get(field))], type=pa.string())
+        ))
+    for name, (values, kind) in columns.items():
+        names.append(name)
+        if kind == 'string':
+            arrays.append(_string(values))
+        elif kind == 'int32':
+            arrays.append(pa.array(values, type=pa.int32()))
+        else:
+            arrays.append(pa.array(values, type=pa.bool_()))
+    return pa.Table.from_arrays(arrays, names=names).replace_schema_metadata(schema_metadata)
+
+
+def build_arrow_tables(metadata):
+    """
+    메타데이터를 Arrow 테이블로 변환
+    
+    Args:
+        metadata (dict | SnapshotStore | str): collect_database_metadata 결과, 스냅샷 저장소,
+            또는 스냅샷/저장소 파일 경로
+            
+    Returns:
+        dict: {'tables', 'columns', 'foreign_keys', 'indexes'} -> pyarrow.Table
+        
+    Raises:
+        ArrowExportError: pyarrow가 설치되어 있지 않은 경우
+    """
+    if pa is None:
+        raise ArrowExportError("pyarrow가 설치되어 있지 않습니다. (pip install pyarrow)")
+        
+    metadata = _load_metadata(metadata)
+    source = without_credentials(metadata.get('connection_info'))
+    schema_metadata = {
+        SCHEMA_METADATA_KEY: json.dumps(
+            {'connection_info': source, 'statistics': metadata.get('statistics', {})},
+            ensure_ascii=False, default=str
+        ).encode('utf-8')
+    }
+    schema = schema_of(metadata)
+    
+    # 열 단위 값 목록 (모델을 한 번씩만 순회)
+    tables = {name: [] for name in ('table_name', 'table_comment', 'column_count', 'primary_keys',
+                                    'foreign_key_count', 'index_count')}
+    columns = {name: [] for name in ('table_name', 'column_position', 'column_name', 'data_type', 'base_type',
+                                     'default_value', 'is_nullable', 'key_type', 'extra', 'column_comment')}
+    for table in schema.iter_tables():
+        tables['table_name'].append(table.name)
+        tables['table_comment'].append(_text(table.comment))
+        tables['column_count'].append(len(table.columns))
+        tables['primary_keys'].append(','.join(map(str, table.primary_keys)))
+        tables['foreign_key_count'].append(len(table.foreign_keys))
+        tables['index_count'].append(len({idx.index_name for idx in table.indexes}))
+        
+        for column in table.columns:
+            columns['table_name'].append(table.name)
+            columns['column_position'].append(_int(column.position))
+            columns['column_name'].append(_text(column.name))
+            columns['data_type'].append(_text(column.type))
+            columns['base_type'].append(_base_type(column.type))
+            columns['default_value'].append(_text(column.default))
+            columns['is_nullable'].append(column.nullable == 'YES')
+            columns['key_type'].append(_text(column.key))
+            columns['extra'].append(_text(column.extra))
+            columns['column_comment'].append(_text(column.comment))
+            
+    kinds = {
+        'tables': {'column_count': 'int32', 'foreign_key_count': 'int32', 'index_count': 'int32'},
+        'columns': {'column_position': 'int32', 'is_nullable': 'bool'},
+        'foreign_keys': {},
+        'indexes': {'is_unique': 'bool', 'seq_in_index': 'int32'}
+    }
+    sections = {
+        'tables': tables,
+        'columns': columns,
+        'foreign_keys': {
+            field: [_text(getattr(fk, field)) for fk in schema.foreign_keys]
+            for field in ('table_name', 'column_name', 'referenced_table_name', 'referenced_column_name',
+                          'constraint_name')
+        },
+        'indexes': {
+            'table_name': [_text(idx.table_name) for idx in schema.indexes],
+            'index_name': [_text(idx.index_name) for idx in schema.indexes],
+            'is_unique': [idx.is_unique for idx in schema.indexes],
+            'column_name': [_text(idx.column_name) for idx in schema.indexes],
+            'seq_in_index': [_int(idx.seq_in_index) for idx in schema.indexes]
+        }
+    }
+    return {
+        name: _make_table(
+            {field: (values, kinds[name].get(field, 'string')) for field, values in sections[name].items()},
+            source, schema_metadata
+        )
+        for name in EXPORT_TABLES
+    }
+
+
+def export_parquet(metadata, output_dir, compression=None):
+    """
+    메타데이터를 Parquet 파일로 저장 (output_dir/<tables|columns|foreign_keys|indexes>.parquet)
+    
+    파일마다 임시 파일에 쓴 뒤 교체합니다.
+    
+    Args:
+        metadata (dict | SnapshotStore | str): build_arrow_tables 인자와 같음
+        output_dir (str): 저장할 폴더
+        compression (str): Parquet 압축 방식 (None이면 설정값)
+        
+    Returns:
+        dict: output_dir, files(테이블 이름 -> 파일 경로), statistics(테이블별 행 수, 소요 시간)
+        
+    Raises:
+        ArrowExportError: pyarrow가 없거나 파일을 쓰지 못한 경우
+    """
+    started = time.time()
+    arrow_tables = build_arrow_tables(metadata)
+    compression = compression or EXPORT_CONFIG["compression"]
+    os.makedirs(output_dir, exist_ok=True)
+    
+    result = {'output_dir': output_dir, 'files': {}, 'statistics': {}}
+    for name, table in arrow_tables.items():
+        path = os.path.join(output_dir, f"{name}.parquet")
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            pq.write_table(table, temp_path, compression=compression, use_dictionary=True)
+            os.replace(temp_path, path)
+        except (OSError, pa.ArrowException) as e:
+            raise ArrowExportError(f"Parquet 파일을 저장하지 못했습니다: {path} ({e})")
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        result['files'][name] = path
+        result['statistics'][f"{name}_rows"] = table.num_rows
+        
+    result['statistics']['export_duration_ms'] = round((time.time() - started) * 1000, 2)
+    return result
+
+
+def export_dir_for(excel_path):
+    """명세서 파일 경로에 대응하는 Parquet 폴더 경로 (명세서 이름 + 접미사)"""
+    return os.path.splitext(excel_path)[0] + EXPORT_CONFIG["directory_suffix"]
@@ -12,10 +12,11 @@ import subprocess
 import time
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import APP_CONFIG, SUPPORTED_DBMS, FILE_CONFIG, UI_MESSAGES, ERROR_MESSAGES
-from utils import validate_port, validate_filename, ensure_excel_extension, Logger
-from database import connection_manager, metadata_collector, DatabaseConnectionError
+from config import APP_CONFIG, SUPPORTED_DBMS, FILE_CONFIG, UI_MESSAGES, ERROR_MESSAGES, SNAPSHOT_CONFIG
+from utils import validate_port, validate_filename, ensure_excel_extension, Logger, load_user_settings, save_user_settings
+from database import connection_manager, metadata_collector, ConnectionSession, DatabaseConnectionError, DatabaseConnectionFactory
 from excel import excel_generator
+from snapshot import save_snapshot, snapshot_path_for, open_store
 from gui.table_selector import show_table_selector
 
 
@@ -23,9 +24,12 @@ class DBSpecGeneratorApp:
     def __init__(self):
         self.root = tk.Tk()
         self.logger = None  # 로그 위젯 생성 후 초기화
+        self.session = None  # 연결 테스트 성공 시 생성되는 연결 세션
         self.setup_window()
         self.create_widgets()
         self.setup_logger()
+        self._watch_connection_fields()
+        self._restore_last_dbms()
         
     def setup_window(self):
         """윈도우 기본 설정"""
@@ -239,7 +243,12 @@ class DBSpecGeneratorApp:
         # 테이블 목록 생성 버튼
         self.generate_list_button = ttk.Button(button_frame, text="목록 생성", 
                                               command=self.generate_table_list, width=12)
-        self.generate_list_button.grid(row=0, column=2, padx=(5, 0))
+        self.generate_list_button.grid(row=0, column=2, padx=(5, 5))
+        
+        # 스냅샷에서 명세서 생성 버튼 (DB 연결 없음)
+        self.snapshot_button = ttk.Button(button_frame, text="스냅샷에서 생성", 
+                                         command=self.generate_spec_from_snapshot, width=14)
+        self.snapshot_button.grid(row=0, column=3, padx=(5, 0))
         
         # 진행 상황 표시
         self.progress_var = tk.StringVar(value="준비됨")
@@ -271,6 +280,82 @@ class DBSpecGeneratorApp:
         """로거 설정"""
         self.logger = Logger(self.log_text)
         
+    def _watch_connection_fields(self):
+        """연결 정보 입력값이 바뀌면 연결 세션 무효화"""
+        for var in (self.dbms_var, self.host_var, self.port_var, self.oracle_type_var,
+                    self.database_var, self.username_var, self.password_var):
+            var.trace('w', self._on_connection_field_change)
+            
+    def _on_connection_field_change(self, *args):
+        """연결 정보 변경 이벤트"""
+        if self.session:
+            self._invalidate_session()
+            if self.logger:
+                self.logger.info("연결 정보가 변경되어 연결 세션을 종료했습니다.")
+                
+    def _invalidate_session(self):
+        """연결 세션 종료 (작업 중일 수 있으므로 별도 스레드에서 종료)"""
+        session, self.session = self.session, None
+        if session:
+            threading.Thread(target=session.close, daemon=True).start()
+            
+    def _on_cache_refresh(self, kind, changed):
+        """캐시 백그라운드 갱신 완료 (갱신 스레드에서 호출되므로 로그는 메인 스레드에서 출력)"""
+        if changed:
+            message = "캐시된 테이블 목록 이후 DB 구조가 바뀌어 캐시를 최신 정보로 갱신했습니다. 테이블 목록을 다시 열면 반영됩니다."
+        else:
+            message = "캐시된 테이블 목록이 최신 상태임을 확인했습니다."
+        self.root.after(0, lambda: self.logger and self.logger.info(message))
+        
+    def _on_session_warning(self, message):
+        """연결 세션 경고 (작업 스레드에서 호출되므로 로그는 메인 스레드에서 출력)"""
+        self.root.after(0, lambda: self.logger and self.logger.warning(message))
+        
+    def _get_active_session(self, conn_info):
+        """현재 입력된 연결 정보와 일치하는 연결 세션 반환 (없으면 None)"""
+        session = self.session
+        if session and session.matches(conn_info):
+            return session
+        return None
+        
+    def _restore_last_dbms(self):
+        """마지막으로 사용한 DBMS 복원 (Oracle이면 JVM 사전 시작)"""
+        last_dbms = load_user_settings().get('last_dbms')
+        if last_dbms in SUPPORTED_DBMS and last_dbms != self.dbms_var.get():
+            self.dbms_var.set(last_dbms)
+            self.on_dbms_change()
+            
+    def _prestart_jvm(self):
+        """Oracle 연결에 필요한 JVM을 백그라운드에서 미리 시작"""
+        # oracledb 방식으로 연결하면 JVM이 필요 없음
+        if DatabaseConnectionFactory.get_oracle_driver() != 'jdbc':
+            return
+            
+        try:
+            from database.jdbc_oracle_connection import prestart_jvm
+        except ImportError as e:
+            if self.logger:
+                self.logger.warning(f"JVM 사전 시작을 건너뜁니다: {str(e)}")
+            return
+            
+        def on_done(timings, error):
+            self.root.after(0, lambda: self._on_jvm_prestarted(timings, error))
+            
+        if prestart_jvm(on_done) and self.logger:
+            self.logger.info("Oracle 연결 준비를 위해 JVM을 백그라운드에서 시작합니다...")
+            
+    def _on_jvm_prestarted(self, timings, error):
+        """JVM 사전 시작 완료 처리"""
+        if not self.logger:
+            return
+        if error:
+            self.logger.warning(f"JVM 사전 시작 실패 (연결 시 다시 시도합니다): {error}")
+        else:
+            self.logger.info(
+                f"JVM 사전 시작 완료: JVM 시작 {timings['jvm_boot_ms']}ms, "
+                f"클래스 로딩 {timings['class_load_ms']}ms"
+            )
+            
     def on_dbms_change(self, event=None):
         """DBMS 변경 시 기본 포트 설정 및 Oracle 프레임 표시/숨김"""
         dbms = self.dbms_var.get()
@@ -287,6 +372,8 @@ class DBSpecGeneratorApp:
                 self.update_database_label()
                 # Oracle 선택 시 윈도우 크기 증가
                 self.adjust_window_size_for_oracle(True)
+                # 첫 연결 대기 시간을 줄이기 위해 JVM 미리 시작
+                self._prestart_jvm()
             else:
                 self.oracle_label.grid_remove()
                 self.oracle_frame.grid_remove()
@@ -532,8 +619,8 @@ class DBSpecGeneratorApp:
         try:
             conn_info = self.get_connection_info()
             
-            # 실제 DB 연결 테스트 실행
-            result = connection_manager.test_connection(
+            # 실제 DB 연결 테스트 실행 (성공하면 연결을 유지하는 세션 생성)
+            session = ConnectionSession(
                 dbms=conn_info['dbms'],
                 host=conn_info['host'],
                 port=conn_info['port'],
@@ -541,12 +628,15 @@ class DBSpecGeneratorApp:
                 username=conn_info['username'],
                 password=conn_info['password'],
                 timeout=30,
-                oracle_type=conn_info.get('oracle_type')
+                oracle_type=conn_info.get('oracle_type'),
+                on_cache_refresh=self._on_cache_refresh,
+                on_warning=self._on_session_warning
             )
+            result = session.open()
             
             if result['success']:
                 # 연결 성공 - 추가 정보와 함께 성공 처리
-                self.root.after(0, lambda: self._test_connection_success(result))
+                self.root.after(0, lambda: self._test_connection_success(result, session))
             else:
                 # 연결 실패
                 self.root.after(0, lambda: self._test_connection_error(result['error']))
@@ -555,11 +645,26 @@ class DBSpecGeneratorApp:
             error_msg = str(e)
             self.root.after(0, lambda msg=error_msg: self._test_connection_error(msg))
             
-    def _test_connection_success(self, result=None):
+    def _test_connection_success(self, result=None, session=None):
         """연결 테스트 성공 처리"""
         self.progress_bar.stop()
         self.progress_var.set("연결 성공!")
         
+        # 마지막 사용 DBMS 저장 (다음 실행 시 복원, 비밀번호는 저장하지 않음)
+        save_user_settings(last_dbms=self.dbms_var.get())
+        
+        # 테스트 중에 연결 정보가 바뀌지 않았으면 세션으로 유지
+        if session:
+            self._invalidate_session()
+            try:
+                current_info = self.get_connection_info()
+            except ValueError:
+                current_info = {}
+            if session.matches(current_info):
+                self.session = session
+            else:
+                threading.Thread(target=session.close, daemon=True).start()
+                
         if self.logger:
             if result:
                 # 상세 정보와 함께 로그
@@ -642,18 +747,7 @@ class DBSpecGeneratorApp:
     def _get_tables_for_spec_selection(self):
         """명세서용 테이블 목록 가져오기"""
         try:
-            conn_info = self.get_connection_info()
-            
-            # 테이블 목록 수집
-            table_list_data = metadata_collector.collect_table_list(
-                dbms=conn_info['dbms'],
-                host=conn_info['host'],
-                port=conn_info['port'],
-                database=conn_info['database'],
-                username=conn_info['username'],
-                password=conn_info['password'],
-                timeout=30
-            )
+            table_list_data = self._collect_table_list_for_selection()
             
             # GUI 업데이트는 메인 스레드에서
             self.root.after(0, lambda: self._show_table_selector_dialog_for_spec(table_list_data['table_list']))
@@ -661,7 +755,42 @@ class DBSpecGeneratorApp:
         except Exception as e:
             error_msg = str(e)
             self.root.after(0, lambda msg=error_msg: self._table_selection_error(msg, "spec"))
-    
+            
+    def _collect_table_list_for_selection(self):
+        """테이블 선택용 목록 수집 (연결 세션이 있으면 이미 조회한 목록 재사용)"""
+        conn_info = self.get_connection_info()
+        
+        session = self._get_active_session(conn_info)
+        if session:
+            table_list_data = session.get_table_list()
+            cached_at = table_list_data['statistics'].get('cached_at')
+            if cached_at and self.logger:
+                self.logger.info(f"캐시된 테이블 목록으로 시작합니다 (저장 시각: {cached_at}, 백그라운드에서 최신 여부 확인)")
+            return table_list_data
+            
+        # 테이블 목록 수집
+        return metadata_collector.collect_table_list(
+            dbms=conn_info['dbms'],
+            host=conn_info['host'],
+            port=conn_info['port'],
+            database=conn_info['database'],
+            username=conn_info['username'],
+            password=conn_info['password'],
+            timeout=30,
+            oracle_type=conn_info.get('oracle_type')
+        )
+        
+    def _show_table_selector_with_keepalive(self, table_list, title):
+        """테이블 선택 다이얼로그 표시 (열려 있는 동안 세션 연결 keepalive)"""
+        session = self.session
+        if session:
+            session.start_keepalive()
+        try:
+            return show_table_selector(self.root, table_list, title)
+        finally:
+            if session:
+                session.stop_keepalive()
+                
     def _show_table_selector_dialog_for_spec(self, table_list):
         """명세서용 테이블 선택 다이얼로그 표시"""
         self.progress_bar.stop()
@@ -671,8 +800,7 @@ class DBSpecGeneratorApp:
             self.logger.info(f"테이블 목록 조회 완료: {len(table_list)}개 테이블")
         
         # 테이블 선택 다이얼로그 표시
-        selected_tables = show_table_selector(
-            self.root, 
+        selected_tables = self._show_table_selector_with_keepalive(
             table_list, 
             "명세서 생성 대상 테이블 선택"
         )
@@ -725,15 +853,7 @@ class DBSpecGeneratorApp:
         """명세서 생성 스레드"""
         try:
             conn_info = self.get_connection_info()
-            
-            # 파일명에 명세서 접미사 추가
-            original_filename = self.filename_var.get()
-            if '.xlsx' in original_filename:
-                spec_filename = original_filename.replace('.xlsx', '_명세서.xlsx')
-            else:
-                spec_filename = original_filename + '_명세서.xlsx'
-                
-            save_path = os.path.join(self.save_path_var.get(), spec_filename)
+            save_path = self._get_spec_save_path()
             
             # 실제 메타데이터 수집
             if self.logger:
@@ -741,22 +861,35 @@ class DBSpecGeneratorApp:
                     self.logger.info(f"선택된 {len(selected_table_names)}개 테이블의 메타데이터 수집을 시작합니다...")
                 else:
                     self.logger.info("데이터베이스 메타데이터 수집을 시작합니다...")
-            
-            metadata = metadata_collector.collect_database_metadata(
-                dbms=conn_info['dbms'],
-                host=conn_info['host'],
-                port=conn_info['port'],
-                database=conn_info['database'],
-                username=conn_info['username'],
-                password=conn_info['password'],
-                timeout=30,
-                selected_tables=selected_table_names,
-                oracle_type=conn_info.get('oracle_type')
-            )
-            
+                    
+            session = self._get_active_session(conn_info)
+            if session:
+                # 연결 세션의 연결 재사용 (추가 로그인 없음)
+                metadata = session.collect_metadata(selected_table_names)
+            else:
+                metadata = metadata_collector.collect_database_metadata(
+                    dbms=conn_info['dbms'],
+                    host=conn_info['host'],
+                    port=conn_info['port'],
+                    database=conn_info['database'],
+                    username=conn_info['username'],
+                    password=conn_info['password'],
+                    timeout=30,
+                    selected_tables=selected_table_names,
+                    oracle_type=conn_info.get('oracle_type')
+                )
+                
+            if self.logger and metadata['statistics'].get('from_cache'):
+                self.logger.info(f"변경된 테이블이 없어 캐시된 메타데이터를 사용합니다 (저장 시각: {metadata['statistics']['cached_at']})")
             if self.logger:
                 self.logger.info(f"메타데이터 수집 완료: 테이블 {metadata['statistics']['total_tables']}개, 컬럼 {metadata['statistics']['total_columns']}개")
                 self.logger.info(f"수집 시간: {metadata['statistics']['collection_duration_ms']}ms")
+                pool_stats = connection_manager.get_pool_stats()
+                self.logger.info(
+                    f"연결 풀: 재사용 {pool_stats['hits']}회, 새 연결 {pool_stats['misses']}회 "
+                    f"(적중률 {pool_stats['hit_rate']:.0%}), 유휴 정리 {pool_stats['evictions']}개, "
+                    f"사용 중 {pool_stats['in_use_connections']}개, 유휴 {pool_stats['idle_connections']}개"
+                )
             
             # Excel 파일 생성
             if self.logger:
@@ -769,7 +902,17 @@ class DBSpecGeneratorApp:
             
             if self.logger:
                 self.logger.info(f"Excel 명세서 생성 완료: {excel_path}")
-            
+                
+            # DB 연결 없이 명세서를 다시 만들 수 있도록 스냅샷 저장 (실패해도 명세서 생성은 성공)
+            if SNAPSHOT_CONFIG["save_with_spec"]:
+                try:
+                    snapshot_path = save_snapshot(metadata, snapshot_path_for(excel_path))
+                    if self.logger:
+                        self.logger.info(f"스냅샷 저장 완료: {snapshot_path}")
+                except OSError as e:
+                    if self.logger:
+                        self.logger.warning(f"스냅샷 저장 실패: {e}")
+                        
             # GUI 업데이트는 메인 스레드에서
             result_info = {
                 'save_path': excel_path,
@@ -781,6 +924,114 @@ class DBSpecGeneratorApp:
             error_msg = str(e)
             self.root.after(0, lambda msg=error_msg: self._generate_spec_error(msg))
             
+    def _get_spec_save_path(self):
+        """명세서 저장 경로 (파일명에 명세서 접미사 추가)"""
+        original_filename = self.filename_var.get()
+        if '.xlsx' in original_filename:
+            spec_filename = original_filename.replace('.xlsx', '_명세서.xlsx')
+        else:
+            spec_filename = original_filename + '_명세서.xlsx'
+            
+        return os.path.join(self.save_path_var.get(), spec_filename)
+        
+    def generate_spec_from_snapshot(self):
+        """스냅샷 파일에서 명세서 생성 (DB 연결 없음, 선택한 테이블만 저장소에서 읽음)"""
+        filename = self.filename_var.get().strip()
+        if not filename:
+            messagebox.showerror("입력 오류", ERROR_MESSAGES["empty_filename"])
+            return
+        if not validate_filename(filename):
+            messagebox.showerror("입력 오류", ERROR_MESSAGES["invalid_filename"])
+            return
+            
+        extensions = f"*{SNAPSHOT_CONFIG['extension']} *{SNAPSHOT_CONFIG['store_extension']}"
+        snapshot_path = filedialog.askopenfilename(
+            initialdir=self.save_path_var.get(),
+            title="스냅샷 파일 선택",
+            filetypes=[("스냅샷 파일", extensions), ("모든 파일", "*.*")]
+        )
+        if not snapshot_path:
+            return
+            
+        if self.logger:
+            self.logger.info(f"스냅샷을 여는 중: {snapshot_path}")
+        self.progress_var.set("스냅샷 여는 중...")
+        self.progress_bar.start()
+        self.snapshot_button.config(state='disabled')
+        
+        threading.Thread(target=self._open_snapshot_thread, args=(snapshot_path,), daemon=True).start()
+        
+    def _open_snapshot_thread(self, snapshot_path):
+        """스냅샷 저장소 열기 스레드 (스냅샷 파일이면 처음 한 번 저장소 파일 생성)"""
+        try:
+            store = open_store(snapshot_path)
+            self.root.after(0, lambda: self._show_table_selector_for_snapshot(store))
+        except Exception as e:
+            error_msg = str(e)
+            self.root.after(0, lambda msg=error_msg: self._snapshot_error(msg))
+            
+    def _show_table_selector_for_snapshot(self, store):
+        """스냅샷 테이블 선택 다이얼로그 표시 (목록은 저장소 색인에서 바로 구성)"""
+        self.progress_bar.stop()
+        self.progress_var.set("테이블 선택 중...")
+        
+        info = store.connection_info
+        if self.logger:
+            self.logger.info(f"스냅샷 열기 완료: {info.get('dbms')} {info.get('database')} "
+                             f"(수집 시각 {info.get('collection_time')}), 테이블 {len(store)}개")
+        
+        selected_tables = show_table_selector(
+            self.root,
+            store.get_table_list_data()['table_list'],
+            "스냅샷 명세서 생성 대상 테이블 선택"
+        )
+        if not selected_tables:
+            store.close()
+            self.progress_var.set("준비됨")
+            self.snapshot_button.config(state='normal')
+            if self.logger:
+                self.logger.info("테이블 선택이 취소되었습니다.")
+            return
+            
+        if self.logger:
+            self.logger.info(f"선택된 테이블: {len(selected_tables)}개")
+        self.progress_var.set("명세서 생성 중...")
+        self.progress_bar.start()
+        
+        table_names = [table['table_name'] for table in selected_tables]
+        threading.Thread(target=self._generate_spec_from_snapshot_thread, args=(store, table_names),
+                         daemon=True).start()
+    
+    def _generate_spec_from_snapshot_thread(self, store, table_names):
+        """스냅샷 저장소로 명세서 생성 스레드"""
+        try:
+            with store:
+                save_path = ensure_excel_extension(self._get_spec_save_path())
+                excel_path = excel_generator.generate_excel(store, save_path, table_names)
+                metadata = {'connection_info': store.connection_info, 'statistics': store.get_statistics(table_names)}
+                
+            if self.logger:
+                self.logger.info(f"Excel 명세서 생성 완료 (스냅샷): {excel_path}")
+            result_info = {
+                'save_path': excel_path,
+                'metadata': metadata
+            }
+            self.root.after(0, lambda: self._generate_spec_from_snapshot_done(result_info))
+            
+        except Exception as e:
+            error_msg = str(e)
+            self.root.after(0, lambda msg=error_msg: self._snapshot_error(msg))
+            
+    def _generate_spec_from_snapshot_done(self, result_info):
+        """스냅샷 명세서 생성 완료 처리"""
+        self.snapshot_button.config(state='normal')
+        self._generate_spec_success(result_info)
+        
+    def _snapshot_error(self, error_msg):
+        """스냅샷 명세서 생성 실패 처리"""
+        self.snapshot_button.config(state='normal')
+        self._generate_spec_error(error_msg)
+        
     def _generate_spec_success(self, result_info):
         """명세서 생성 성공 처리"""
         self.progress_bar.stop()
@@ -881,18 +1132,7 @@ class DBSpecGeneratorApp:
     def _get_tables_for_list_selection(self):
         """목록용 테이블 목록 가져오기"""
         try:
-            conn_info = self.get_connection_info()
-            
-            # 테이블 목록 수집
-            table_list_data = metadata_collector.collect_table_list(
-                dbms=conn_info['dbms'],
-                host=conn_info['host'],
-                port=conn_info['port'],
-                database=conn_info['database'],
-                username=conn_info['username'],
-                password=conn_info['password'],
-                timeout=30
-            )
+            table_list_data = self._collect_table_list_for_selection()
             
             # GUI 업데이트는 메인 스레드에서
             self.root.after(0, lambda: self._show_table_selector_dialog_for_list(table_list_data['table_list']))
@@ -910,8 +1150,7 @@ class DBSpecGeneratorApp:
             self.logger.info(f"테이블 목록 조회 완료: {len(table_list)}개 테이블")
         
         # 테이블 선택 다이얼로그 표시
-        selected_tables = show_table_selector(
-            self.root, 
+        selected_tables = self._show_table_selector_with_keepalive(
             table_list, 
             "목록 생성 대상 테이블 선택"
         )
@@ -1087,6 +1326,12 @@ class DBSpecGeneratorApp:
     def on_closing(self):
         """윈도우 종료 시 호출되는 메서드"""
         try:
+            # 연결 세션 및 연결 풀에 남아 있는 연결 종료
+            if self.session:
+                self.session.close()
+                self.session = None
+            connection_manager.close_all()
+            
             # JVM 종료 (Oracle JDBC 사용 시)
             self._shutdown_jvm()
             
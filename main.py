@@ -1,10 +1,128 @@
 """
 DB 산출물 생성 GUI 애플리케이션
 메인 진입점
+
+일괄 생성(배치 모드):
+    python main.py --batch profiles.json [--workers 4] [--output batch_output]
+
+스냅샷에서 명세서 다시 생성 (DB 연결 없음):
+    python main.py --from-snapshot orders.dbsnap [--output 명세서.xlsx]
+
+두 스냅샷 비교 (변경 보고서):
+    python main.py --diff v1.dbsnap v2.dbsnap [--output 변경내역.xlsx]
+
+스냅샷을 Parquet 파일로 내보내기 (pyarrow 필요):
+    python main.py --export-parquet orders.dbsnap hr.dbsnap [--output catalogs]
 """
 
-from gui.main_window import DBSpecGeneratorApp
+import argparse
+import multiprocessing
+import sys
 
-if __name__ == "__main__":
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 산출물 생성기")
+    parser.add_argument('--batch', metavar='PROFILES', help="연결 프로필 JSON 파일 (지정하면 GUI 없이 일괄 생성)")
+    parser.add_argument('--workers', type=int, help="동시에 처리할 대상 수 (기본: CPU 코어 수)")
+    parser.add_argument('--from-snapshot', metavar='SNAPSHOT', help="스냅샷 파일로 명세서 생성 (DB 연결 없음)")
+    parser.add_argument('--diff', nargs=2, metavar=('OLD', 'NEW'), help="두 스냅샷 파일을 비교해 변경 보고서 생성")
+    parser.add_argument('--export-parquet', nargs='+', metavar='SNAPSHOT',
+                        help="스냅샷 파일을 Arrow/Parquet 파일로 내보내기 (스냅샷마다 폴더 하나)")
+    parser.add_argument('--output', help="명세서와 요약 보고서 저장 위치 (--from-snapshot/--diff이면 생성할 파일 경로, "
+                                         "--export-parquet이면 내보내기 폴더를 만들 위치)")
+    args = parser.parse_args()
+    
+    if args.batch:
+        from batch import run_batch
+        sys.exit(run_batch(args.batch, args.output, args.workers))
+        
+    if args.from_snapshot:
+        sys.exit(regenerate_from_snapshot(args.from_snapshot, args.output))
+        
+    if args.diff:
+        sys.exit(generate_diff_report(args.diff[0], args.diff[1], args.output))
+        
+    if args.export_parquet:
+        sys.exit(export_snapshots_to_parquet(args.export_parquet, args.output))
+        
+    from gui.main_window import DBSpecGeneratorApp
     app = DBSpecGeneratorApp()
-    app.run()
\ No newline at end of file
+    app.run()
+
+
+def regenerate_from_snapshot(snapshot_path, output=None):
+    """스냅샷 파일로 Excel 명세서 생성 (종료 코드 반환)"""
+    import os
+    import time
+    from excel import excel_generator
+    from snapshot import SnapshotError, load_snapshot
+    from utils import ensure_excel_extension
+    
+    output = ensure_excel_extension(output or os.path.splitext(snapshot_path)[0] + '_명세서.xlsx')
+    started = time.time()
+    try:
+        metadata = load_snapshot(snapshot_path)
+        loaded_ms = round((time.time() - started) * 1000, 2)
+        excel_generator.generate_excel(metadata, output)
+    except (OSError, SnapshotError) as e:
+        print(f"❌ 스냅샷으로 명세서를 생성하지 못했습니다: {e}")
+        return 1
+        
+    info = metadata['connection_info']
+    print(f"스냅샷: {info.get('dbms')} {info.get('database')} (수집 시각 {info.get('collection_time')}), 읽기 {loaded_ms}ms")
+    print(f"✅ 명세서 생성 완료: {output} (테이블 {metadata['statistics'].get('total_tables')}개)")
+    return 0
+
+
+def generate_diff_report(old_snapshot, new_snapshot, output=None):
+    """두 스냅샷 파일을 비교해 변경 보고서 생성 (종료 코드 반환)"""
+    import os
+    from diff import compare_schemas
+    from excel import diff_report_generator
+    from snapshot import SnapshotError
+    from utils import ensure_excel_extension
+    
+    output = ensure_excel_extension(output or os.path.splitext(new_snapshot)[0] + '_변경내역.xlsx')
+    try:
+        result = compare_schemas(old_snapshot, new_snapshot)
+        diff_report_generator.generate_diff_excel(result, output)
+    except (OSError, SnapshotError) as e:
+        print(f"❌ 변경 보고서를 생성하지 못했습니다: {e}")
+        return 1
+        
+    statistics = result['statistics']
+    print(f"테이블 추가 {len(result['added_tables'])}개, 삭제 {len(result['dropped_tables'])}개, "
+          f"변경 {len(result['modified_tables'])}개 (변경 내역 {statistics['total_changes']}건, "
+          f"비교 {statistics['comparison_duration_ms']}ms)")
+    print(f"✅ 변경 보고서 생성 완료: {output}")
+    return 0
+
+
+def export_snapshots_to_parquet(snapshot_paths, output=None):
+    """스냅샷 파일마다 Parquet 폴더 생성 (종료 코드 반환, 하나라도 실패하면 1)"""
+    import os
+    from export import ArrowExportError, export_parquet, export_dir_for
+    from snapshot import SnapshotError
+    
+    failed = 0
+    for snapshot_path in snapshot_paths:
+        output_dir = export_dir_for(snapshot_path)
+        if output:
+            output_dir = os.path.join(output, os.path.basename(output_dir))
+        try:
+            result = export_parquet(snapshot_path, output_dir)
+        except (OSError, SnapshotError, ArrowExportError) as e:
+            print(f"❌ {snapshot_path}: Parquet 파일로 내보내지 못했습니다: {e}")
+            failed += 1
+            continue
+            
+        statistics = result['statistics']
+        print(f"✅ {snapshot_path} → {output_dir} (컬럼 {statistics['columns_rows']}행, "
+              f"{statistics['export_duration_ms']}ms)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    # PyInstaller 실행파일에서 작업 프로세스(spawn)가 GUI를 다시 띄우지 않도록 처리
+    multiprocessing.freeze_support()
+    main()
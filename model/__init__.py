@@ -0,0 +1,42 @@
+"""
+스키마 모델 모듈
+
+이 모듈은 수집한 메타데이터를 테이블별로 한 번만 묶은 모델(Table, Column, ForeignKey, Index)을 제공합니다.
+수집기가 모델을 만들고, 명세서 생성기와 요약 함수는 다시 묶지 않고 모델을 그대로 사용합니다.
+
+주요 클래스:
+- SchemaModel: 테이블명 -> Table, 전체 외래키/인덱스
+- RowView: 모델을 기존 정규화 행 목록(metadata['tables'] 등)처럼 읽는 뷰
+- RelationshipIndex: (테이블, 컬럼)별 외래키, 테이블별 외래키/인덱스, 테이블을 참조하는 외래키 색인
+
+사용 예시:
+    from model import schema_of
+    
+    schema = schema_of(metadata)   # 수집기가 만든 모델 또는 행 목록에서 새로 생성
+    for table in schema.iter_tables():
+        print(table.name, table.primary_keys, len(table.columns))
+"""
+
+from .schema_model import (
+    SchemaModel,
+    Table,
+    Column,
+    ForeignKey,
+    Index,
+    RelationshipIndex,
+    RowView,
+    schema_of,
+    json_default
+)
+
+__all__ = [
+    'SchemaModel',
+    'Table',
+    'Column',
+    'ForeignKey',
+    'Index',
+    'RelationshipIndex',
+    'RowView',
+    'schema_of',
+    'json_default'
+]
@@ -0,0 +1,405 @@
+"""
+스키마 모델 (테이블/컬럼/외래키/인덱스)
+
+수집기가 정규화한 행(컬럼마다 딕셔너리 하나)을 테이블별로 한 번만 묶은 모델입니다.
+__slots__ 객체라 행 딕셔너리보다 메모리를 적게 쓰고, 여러 행에 반복되는 문자열
+(테이블명, 타입, 기본값, 컬럼명 등)은 sys.intern으로 하나만 저장합니다.
+명세서와 요약은 이 모델을 그대로 사용하며, 행 목록이 필요한 곳(스냅샷, 변경 비교)은
+RowView로 행 딕셔너리를 읽을 때마다 만들어 사용합니다. 캐시는 행 딕셔너리 없이 값 목록(iter_columnar)으로 저장합니다.
+외래키/인덱스는 RelationshipIndex로 한 번 색인해 테이블/컬럼별로 바로 찾습니다.
+"""
+
+import sys
+from bisect import bisect_right
+from collections.abc import Sequence
+
+
+# 행 목록 구역 (메타데이터 키)
+SECTIONS = ('tables', 'foreign_keys', 'indexes')
+
+
+def _intern(value):
+    """문자열이면 intern (같은 문자열은 객체 하나만 유지)"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _position_key(column):
+    """컬럼 정렬 키 (순번이 없으면 0)"""
+    return int(column.position) if column.position else 0
+
+
+class Column:
+    """컬럼"""
+    
+    __slots__ = ('position', 'name', 'type', 'default', 'nullable', 'key', 'extra', 'comment')
+    
+    def __init__(self, position, name, type, default, nullable, key, extra, comment):
+        self.position = position
+        self.name = name
+        self.type = type
+        self.default = default
+        self.nullable = nullable
+        self.key = key
+        self.extra = extra
+        self.comment = comment
+        
+    @classmethod
+    def from_row(cls, row):
+        """정규화된 컬럼 행으로 생성"""
+        return cls(
+            row['column_position'],
+            _intern(row['column_name']),
+            _intern(row['data_type']),
+            _intern(row['default_value']),
+            _intern(row['is_nullable']),
+            _intern(row['key_type']),
+            _intern(row['extra']),
+            _intern(row['column_comment'])
+        )
+        
+    def to_row(self, table):
+        """정규화된 컬럼 행 딕셔너리로 변환"""
+        return {
+            'table_name': table.name,
+            'table_comment': table.comment,
+            'column_position': self.position,
+            'column_name': self.name,
+            'data_type': self.type,
+            'default_value': self.default,
+            'is_nullable': self.nullable,
+            'key_type': self.key,
+            'extra': self.extra,
+            'column_comment': self.comment
+        }
+        
+    def __repr__(self):
+        return f"Column({self.name!r}, {self.type!r})"
+
+
+class ForeignKey:
+    """외래키 (컬럼 하나)"""
+    
+    __slots__ = ('table_name', 'column_name', 'referenced_table_name', 'referenced_column_name', 'constraint_name')
+    
+    def __init__(self, table_name, column_name, referenced_table_name, referenced_column_name, constraint_name):
+        self.table_name = table_name
+        self.column_name = column_name
+        self.referenced_table_name = referenced_table_name
+        self.referenced_column_name = referenced_column_name
+        self.constraint_name = constraint_name
+        
+    @classmethod
+    def from_row(cls, row):
+        """정규화된 외래키 행으로 생성"""
+        return cls(*(_intern(row[field]) for field in cls.__slots__))
+        
+    def to_row(self):
+        """정규화된 외래키 행 딕셔너리로 변환"""
+        return {field: getattr(self, field) for field in self.__slots__}
+        
+    def __repr__(self):
+        return (f"ForeignKey({self.table_name}.{self.column_name} -> "
+                f"{self.referenced_table_name}.{self.referenced_column_name})")
+
+
+class Index:
+    """인덱스 (컬럼 하나)"""
+    
+    __slots__ = ('table_name', 'index_name', 'non_unique', 'column_name', 'seq_in_index')
+    
+    def __init__(self, table_name, index_name, non_unique, column_name, seq_in_index):
+        self.table_name = table_name
+        self.index_name = index_name
+        self.non_unique = non_unique
+        self.column_name = column_name
+        self.seq_in_index = seq_in_index
+        
+    @classmethod
+    def from_row(cls, row):
+        """정규화된 인덱스 행으로 생성"""
+        return cls(*(_intern(row[field]) for field in cls.__slots__))
+        
+    def to_row(self):
+        """정규화된 인덱스 행 딕셔너리로 변환"""
+        return {field: getattr(self, field) for field in self.__slots__}
+        
+    @property
+    def is_unique(self):
+        """고유 인덱스 여부 (non_unique가 0 또는 False)"""
+        return self.non_unique == 0 or self.non_unique == False
+        
+    def __repr__(self):
+        return f"Index({self.table_name}.{self.index_name}, {self.column_name!r})"
+
+
+class RelationshipIndex:
+    """외래키/인덱스 색인 (한 번 만들어 명세서/요약에서 목록을 다시 훑지 않고 조회)"""
+    
+    __slots__ = ('foreign_keys_by_column', 'foreign_keys_by_table', 'indexes_by_table', 'referenced_by')
+    
+    def __init__(self, foreign_keys=(), indexes=()):
+        # (테이블명, 컬럼명) -> ForeignKey (같은 컬럼에 여럿이면 처음 것)
+        self.foreign_keys_by_column = {}
+        # 테이블명 -> [ForeignKey], 테이블명 -> [Index] (수집 순서)
+        self.foreign_keys_by_table = {}
+        self.indexes_by_table = {}
+        # 참조되는 테이블명 -> [그 테이블을 참조하는 ForeignKey]
+        self.referenced_by = {}
+        
+        for fk in foreign_keys:
+            self.foreign_keys_by_column.setdefault((fk.table_name, fk.column_name), fk)
+            self.foreign_keys_by_table.setdefault(fk.table_name, []).append(fk)
+            self.referenced_by.setdefault(fk.referenced_table_name, []).append(fk)
+            
+        for idx in indexes:
+            self.indexes_by_table.setdefault(idx.table_name, []).append(idx)
+            
+    def foreign_key(self, table_name, column_name):
+        """컬럼의 외래키 (없으면 None)"""
+        return self.foreign_keys_by_column.get((table_name, column_name))
+        
+    def table_foreign_keys(self, table_name):
+        """테이블의 외래키 목록"""
+        return self.foreign_keys_by_table.get(table_name, [])
+        
+    def table_indexes(self, table_name):
+        """테이블의 인덱스 목록 (인덱스 컬럼마다 하나)"""
+        return self.indexes_by_table.get(table_name, [])
+        
+    def referencing(self, table_name):
+        """테이블을 참조하는 외래키 목록"""
+        return self.referenced_by.get(table_name, [])
+
+
+class Table:
+    """테이블 (컬럼은 순번 순, 외래키/인덱스는 이 테이블 것만)"""
+    
+    __slots__ = ('name', 'comment', 'columns', 'foreign_keys', 'indexes')
+    
+    def __init__(self, name, comment=''):
+        self.name = name
+        self.comment = comment
+        self.columns = []
+        self.foreign_keys = []
+        self.indexes = []
+        
+    @classmethod
+    def from_rows(cls, name, comment, columns, foreign_keys=(), indexes=()):
+        """한 테이블의 정규화된 행들로 생성 (스냅샷 저장소의 테이블 블록 등)"""
+        table = cls(_intern(name), _intern(comment))
+        table.columns = [Column.from_row(row) for row in columns]
+        table.columns.sort(key=_position_key)
+        table.foreign_keys = [ForeignKey.from_row(row) for row in foreign_keys]
+        table.indexes = [Index.from_row(row) for row in indexes]
+        return table
+        
+    @property
+    def primary_keys(self):
+        """기본키 컬럼명 목록"""
+        return [column.name for column in self.columns if column.key == 'PRI']
+        
+    def column_rows(self):
+        """정규화된 컬럼 행 딕셔너리를 하나씩 생성"""
+        for column in self.columns:
+            yield column.to_row(self)
+            
+    def __repr__(self):
+        return f"Table({self.name!r}, 컬럼 {len(self.columns)}개)"
+
+
+class SchemaModel:
+    """수집 결과 하나의 스키마 (테이블별로 묶은 모델)"""
+    
+    __slots__ = ('tables', 'foreign_keys', 'indexes', 'column_count', 'relationships', '_row_offsets')
+    
+    def __init__(self):
+        # 테이블명 -> Table (수집 순서)
+        self.tables = {}
+        # 전체 외래키/인덱스 (컬럼 정보가 없는 테이블 것 포함, 수집 순서)
+        self.foreign_keys = []
+        self.indexes = []
+        self.column_count = 0
+        self.relationships = RelationshipIndex()
+        # (테이블별 첫 컬럼 행 번호 목록, 테이블 목록) (행 번호로 읽을 때 한 번 생성)
+        self._row_offsets = None
+        
+    @classmethod
+    def from_rows(cls, tables=(), foreign_keys=(), indexes=()):
+        """
+        정규화된 행 목록으로 생성 (행을 한 번씩만 순회)
+        
+        Args:
+            tables (iterable): 테이블+컬럼 행
+            foreign_keys (iterable): 외래키 행
+            indexes (iterable): 인덱스 행
+        """
+        schema = cls()
+        schema_tables = schema.tables
+        
+        for row in tables:
+            table_name = _intern(row['table_name'])
+            table = schema_tables.get(table_name)
+            if table is None:
+                table = schema_tables[table_name] = Table(table_name, _intern(row['table_comment']))
+            table.columns.append(Column.from_row(row))
+            schema.column_count += 1
+            
+        # 컬럼을 position 순으로 정렬
+        for table in schema_tables.values():
+            table.columns.sort(key=_position_key)
+            
+        schema.foreign_keys = [ForeignKey.from_row(row) for row in foreign_keys]
+        schema.indexes = [Index.from_row(row) for row in indexes]
+        schema._link_relationships()
+        return schema
+        
+    @classmethod
+    def from_columnar(cls, tables=(), foreign_keys=(), indexes=()):
+        """
+        iter_columnar 값 목록으로 생성 (캐시에서 읽을 때, 행 딕셔너리를 만들지 않음)
+        
+        Args:
+            tables (iterable): [테이블명, 코멘트, [컬럼 값 목록, ...]] (컬럼은 순번 순)
+            foreign_keys (iterable): 외래키 값 목록
+            indexes (iterable): 인덱스 값 목록
+        """
+        schema = cls()
+        for name, comment, columns in tables:
+            table = schema.tables[_intern(name)] = Table(_intern(name), _intern(comment))
+            table.columns = [Column(position, *map(_intern, values)) for position, *values in columns]
+            schema.column_count += len(table.columns)
+            
+        schema.foreign_keys = [ForeignKey(*map(_intern, values)) for values in foreign_keys]
+        schema.indexes = [Index(*map(_intern, values)) for values in indexes]
+        schema._link_relationships()
+        return schema
+        
+    def _link_relationships(self):
+        """외래키/인덱스를 한 번 색인하고 테이블별 목록은 색인의 목록을 그대로 사용"""
+        relationships = self.relationships = RelationshipIndex(self.foreign_keys, self.indexes)
+        for table_name, table in self.tables.items():
+            table.foreign_keys = relationships.table_foreign_keys(table_name)
+            table.indexes = relationships.table_indexes(table_name)
+            
+
+    @classmethod
+    def from_metadata(cls, metadata):
+        """메타데이터 딕셔너리(캐시, 스냅샷 등 행 목록)로 생성"""
+        return cls.from_rows(
+            metadata.get('tables', ()), metadata.get('foreign_keys', ()), metadata.get('indexes', ())
+        )
+        
+    def iter_tables(self, table_names=None):
+        """테이블을 수집 순서대로 반환 (table_names가 있으면 그 테이블만)"""
+        if not table_names:
+            return iter(self.tables.values())
+        selected = set(table_names)
+        return (table for table_name, table in self.tables.items() if table_name in selected)
+        
+    def iter_rows(self, section):
+        """구역별 정규화된 행 딕셔너리를 하나씩 생성"""
+        if section == 'tables':
+            for table in self.tables.values():
+                yield from table.column_rows()
+        else:
+            for item in getattr(self, section):
+                yield item.to_row()
+                
+    def iter_columnar(self, section):
+        """
+        구역별 행을 딕셔너리 없이 값 목록으로 생성 (from_columnar의 입력 형식)
+        
+        tables는 테이블마다 [테이블명, 코멘트, [컬럼 값 목록, ...]] 하나, 외래키/인덱스는 행마다 값 목록 하나입니다.
+        """
+        if section == 'tables':
+            fields = Column.__slots__
+            for table in self.tables.values():
+                yield [table.name, table.comment,
+                       [[getattr(column, field) for field in fields] for column in table.columns]]
+        else:
+            for item in getattr(self, section):
+                yield [getattr(item, field) for field in item.__slots__]
+                
+    def row_at(self, section, index):
+        """구역별 index번째 정규화된 행 딕셔너리 (0 <= index < count_rows)"""
+        if section != 'tables':
+            return getattr(self, section)[index].to_row()
+            
+        if self._row_offsets is None:
+            offsets, total = [], 0
+            for table in self.tables.values():
+                offsets.append(total)
+                total += len(table.columns)
+            self._row_offsets = (offsets, list(self.tables.values()))
+        offsets, tables = self._row_offsets
+        position = bisect_right(offsets, index) - 1
+        table = tables[position]
+        return table.columns[index - offsets[position]].to_row(table)
+        
+    def count_rows(self, section):
+        """구역별 행 수"""
+        if section == 'tables':
+            return self.column_count
+        return len(getattr(self, section))
+        
+    def attach(self, metadata):
+        """메타데이터의 행 목록(tables, foreign_keys, indexes)을 이 모델의 행 뷰로 교체"""
+        for section in SECTIONS:
+            metadata[section] = RowView(self, section)
+        return metadata
+
+
+class RowView(Sequence):
+    """모델을 정규화 행 목록처럼 읽는 읽기 전용 뷰 (행 딕셔너리는 읽을 때마다 새로 생성)"""
+    
+    __slots__ = ('schema', 'section')
+    
+    def __init__(self, schema, section):
+        self.schema = schema
+        self.section = section
+        
+    def __iter__(self):
+        return self.schema.iter_rows(self.section)
+        
+    def __len__(self):
+        return self.schema.count_rows(self.section)
+        
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("행 번호가 범위를 벗어났습니다.")
+        return self.schema.row_at(self.section, index)
+        
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, RowView)):
+            return list(self) == list(other)
+        return NotImplemented
+        
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"RowView({self.section!r}, {len(self)}행)"
+
+
+def schema_of(metadata):
+    """
+    메타데이터의 스키마 모델
+    
+    수집기가 만든 메타데이터는 행 뷰가 가리키는 모델을 그대로 사용하고,
+    캐시/스냅샷에서 읽은 행 목록이면 한 번 묶어서 새로 만듭니다.
+    """
+    rows = metadata.get('tables')
+    if isinstance(rows, RowView):
+        return rows.schema
+    return SchemaModel.from_metadata(metadata)
+
+
+def json_default(value):
+    """json.dumps의 default (행 뷰는 행 목록으로, 그 밖의 값은 문자열로)"""
+    if isinstance(value, RowView):
+        return list(value)
+    return str(value)
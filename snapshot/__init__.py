@@ -0,0 +1,42 @@
+"""
+스키마 스냅샷 모듈
+
+이 모듈은 수집한 메타데이터를 버전과 체크섬이 있는 압축 파일로 저장하고,
+DB 연결 없이 다시 읽어 Excel 명세서를 생성할 수 있게 합니다.
+
+주요 함수:
+- save_snapshot: 메타데이터를 스냅샷 파일로 저장
+- load_snapshot: 스냅샷 파일을 메타데이터로 읽기 (체크섬 확인)
+- read_snapshot_header: 본문을 풀지 않고 헤더(요약 정보)만 읽기
+- write_store / open_store: 테이블 단위로 바로 읽을 수 있는 mmap 저장소 파일 쓰기/열기
+
+사용 예시:
+    from snapshot import save_snapshot, load_snapshot
+    
+    save_snapshot(metadata, "orders.dbsnap")
+    excel_generator.generate_excel(load_snapshot("orders.dbsnap"), "명세서.xlsx")
+    
+    with open_store("orders.dbsnap") as store:   # orders.dbstore 생성 후 mmap으로 열기
+        columns = store.get_table("orders")['columns']
+"""
+
+from .snapshot_file import (
+    SnapshotError,
+    save_snapshot,
+    load_snapshot,
+    read_snapshot_header,
+    snapshot_path_for
+)
+from .snapshot_store import SnapshotStore, write_store, open_store, store_path_for
+
+__all__ = [
+    'SnapshotError',
+    'save_snapshot',
+    'load_snapshot',
+    'read_snapshot_header',
+    'snapshot_path_for',
+    'SnapshotStore',
+    'write_store',
+    'open_store',
+    'store_path_for'
+]
@@ -0,0 +1,192 @@
+"""
+스키마 스냅샷 파일
+
+수집한 메타데이터(collect_database_metadata 결과)를 DB 연결 없이 다시 쓸 수 있도록
+버전과 체크섬이 있는 압축 파일로 저장하고 읽습니다.
+
+파일 형식 (gzip 압축 텍스트):
+    1행: 헤더 JSON {"format", "version", "created_at", "checksum", "body_size", "schema", "summary"}
+    2행: 본문 JSON {"connection_info", "statistics", "tables", "foreign_keys", "indexes"}
+
+본문의 tables/foreign_keys/indexes는 행마다 키를 반복하지 않도록 열 단위로 저장합니다.
+    {"fields": [필드명, ...], "columns": [[필드 0의 값, ...], [필드 1의 값, ...], ...]}
+체크섬은 압축 전 본문의 SHA-256이며, 헤더만 읽으면 본문을 풀지 않고 요약 정보를 확인할 수 있습니다.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from config import SNAPSHOT_CONFIG
+from utils import without_credentials
+
+
+# 파일 형식 식별자와 버전 (본문 구조가 바뀌면 버전을 올림)
+SNAPSHOT_FORMAT = "dboutput-snapshot"
+SNAPSHOT_VERSION = 1
+
+# 구역별 필드 (수집기의 정규화 결과와 같은 키)
+SNAPSHOT_SCHEMA = {
+    'tables': (
+        'table_name', 'table_comment', 'column_position', 'column_name', 'data_type',
+        'default_value', 'is_nullable', 'key_type', 'extra', 'column_comment'
+    ),
+    'foreign_keys': (
+        'table_name', 'column_name', 'referenced_table_name', 'referenced_column_name', 'constraint_name'
+    ),
+    'indexes': (
+        'table_name', 'index_name', 'non_unique', 'column_name', 'seq_in_index'
+    )
+}
+
+
+class SnapshotError(Exception):
+    """스냅샷 파일 형식 오류 (손상, 체크섬 불일치, 지원하지 않는 버전)"""
+    pass
+
+
+def _to_columns(rows, fields):
+    """행 딕셔너리 목록을 필드별 값 목록으로 변환"""
+    columns = [[] for _ in fields]
+    appends = [column.append for column in columns]
+    for row in rows:
+        for append, field in zip(appends, fields):
+            append(row.get(field))
+    return columns
+
+
+def _to_rows(section):
+    """필드별 값 목록을 행 딕셔너리 목록으로 복원"""
+    fields = section['fields']
+    return [dict(zip(fields, values)) for values in zip(*section['columns'])]
+
+
+def save_snapshot(metadata, path, compresslevel=None):
+    """
+    메타데이터를 스냅샷 파일로 저장 (임시 파일에 쓴 뒤 교체)
+    
+    Args:
+        metadata (dict): collect_database_metadata 결과
+        path (str): 저장할 파일 경로
+        compresslevel (int): gzip 압축 수준 (None이면 설정값)
+        
+    Returns:
+        str: 저장된 파일 경로
+    """
+    connection_info = without_credentials(metadata.get('connection_info'))
+    body = {
+        'connection_info': connection_info,
+        'statistics': metadata.get('statistics', {})
+    }
+    for section, fields in SNAPSHOT_SCHEMA.items():
+        body[section] = {
+            'fields': list(fields),
+            'columns': _to_columns(metadata.get(section, []), fields)
+        }
+    body_bytes = json.dumps(body, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+    
+    header = {
+        'format': SNAPSHOT_FORMAT,
+        'version': SNAPSHOT_VERSION,
+        'created_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'checksum': hashlib.sha256(body_bytes).hexdigest(),
+        'body_size': len(body_bytes),
+        'schema': {section: list(fields) for section, fields in SNAPSHOT_SCHEMA.items()},
+        'summary': {
+            'dbms': connection_info.get('dbms'),
+            'database': connection_info.get('database'),
+            'version': connection_info.get('version'),
+            'collection_time': connection_info.get('collection_time'),
+            'tables': metadata.get('statistics', {}).get('total_tables'),
+            'columns': len(metadata.get('tables', []))
+        }
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False, default=str).encode('utf-8')
+    
+    save_dir = os.path.dirname(path)
+    if save_dir:
+        os.makedirs(save_dir, exist_ok=True)
+    level = SNAPSHOT_CONFIG["compresslevel"] if compresslevel is None else compresslevel
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with gzip.open(temp_path, 'wb', compresslevel=level) as f:
+            f.write(header_bytes)
+            f.write(b'\n')
+            f.write(body_bytes)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return path
+
+
+def _check_header(header, path):
+    """헤더 형식과 버전 확인"""
+    if not isinstance(header, dict) or header.get('format') != SNAPSHOT_FORMAT:
+        raise SnapshotError(f"스냅샷 파일이 아닙니다: {path}")
+    if header.get('version') != SNAPSHOT_VERSION:
+        raise SnapshotError(f"지원하지 않는 스냅샷 버전입니다: {header.get('version')} (지원: {SNAPSHOT_VERSION})")
+    return header
+
+
+def read_snapshot_header(path):
+    """
+    스냅샷 헤더만 읽기 (본문은 풀지 않음)
+    
+    Returns:
+        dict: 헤더 (format, version, created_at, checksum, body_size, schema, summary)
+    """
+    try:
+        with gzip.open(path, 'rb') as f:
+            header = json.loads(f.readline())
+    except (OSError, EOFError, ValueError) as e:
+        raise SnapshotError(f"스냅샷 파일을 읽을 수 없습니다: {path} ({e})")
+    return _check_header(header, path)
+
+
+def load_snapshot(path, verify=True):
+    """
+    스냅샷 파일을 메타데이터로 읽기 (collect_database_metadata 결과와 같은 형식)
+    
+    Args:
+        path (str): 스냅샷 파일 경로
+        verify (bool): 본문 체크섬 확인 여부
+        
+    Returns:
+        dict: 메타데이터 (statistics에 snapshot_path, snapshot_created_at 추가)
+        
+    Raises:
+        SnapshotError: 파일이 손상되었거나 형식/버전이 다른 경우
+    """
+    try:
+        with gzip.open(path, 'rb') as f:
+            header_line, _, body_bytes = f.read().partition(b'\n')
+        header = json.loads(header_line)
+    except (OSError, EOFError, ValueError) as e:
+        raise SnapshotError(f"스냅샷 파일을 읽을 수 없습니다: {path} ({e})")
+    _check_header(header, path)
+    
+    if verify and hashlib.sha256(body_bytes).hexdigest() != header.get('checksum'):
+        raise SnapshotError(f"스냅샷 체크섬이 일치하지 않습니다 (파일 손상): {path}")
+        
+    try:
+        body = json.loads(body_bytes)
+        metadata = {
+            'connection_info': body['connection_info'],
+            'tables': _to_rows(body['tables']),
+            'foreign_keys': _to_rows(body['foreign_keys']),
+            'indexes': _to_rows(body['indexes']),
+            'statistics': body['statistics']
+        }
+    except (ValueError, KeyError, TypeError) as e:
+        raise SnapshotError(f"스냅샷 본문 형식이 올바르지 않습니다: {path} ({e})")
+        
+    metadata['statistics']['snapshot_path'] = os.path.abspath(path)
+    metadata['statistics']['snapshot_created_at'] = header.get('created_at')
+    return metadata
+
+
+def snapshot_path_for(excel_path):
+    """명세서 파일 경로에 대응하는 스냅샷 파일 경로 (확장자만 변경)"""
+    return os.path.splitext(excel_path)[0] + SNAPSHOT_CONFIG["extension"]
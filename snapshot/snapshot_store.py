@@ -0,0 +1,250 @@
+"""
+메모리 매핑 스냅샷 저장소
+
+정규화된 테이블/외래키/인덱스를 테이블 단위 블록으로 저장하고 파일 끝에 테이블명 색인을 둡니다.
+파일을 mmap으로 열면 색인만 읽고, 테이블 하나를 조회할 때는 색인에서 위치를 찾아
+그 테이블의 블록만 풀기 때문에 전체 메타데이터를 메모리에 올리지 않고도 일부 테이블을 바로 볼 수 있습니다.
+
+파일 형식 (압축하지 않음):
+    헤더   : 식별자(8바이트) + 형식 버전(uint32) + 색인 위치(uint64) + 색인 길이(uint64)
+    블록   : 테이블별 JSON {"columns": [[값, ...], ...], "foreign_keys": [...], "indexes": [...]}
+             (행은 색인의 schema 필드 순서대로의 값 목록, 컬럼은 column_position 순)
+    색인   : JSON {"connection_info", "statistics", "schema",
+                   "tables": [[테이블명, 논리명, 블록 위치, 블록 길이, 컬럼 수, 외래키 수], ...]}
+"""
+
+import json
+import mmap
+import os
+import struct
+from config import SNAPSHOT_CONFIG
+from utils import without_credentials
+from .snapshot_file import SNAPSHOT_SCHEMA, SnapshotError, load_snapshot
+
+
+STORE_MAGIC = b'DBOSTORE'
+STORE_VERSION = 1
+
+# 식별자, 형식 버전, 색인 위치, 색인 길이 (리틀 엔디언)
+STORE_HEADER = struct.Struct('<8sIQQ')
+
+
+def _position(row):
+    """컬럼 정렬 키 (명세서와 같이 column_position 순, 없으면 0)"""
+    try:
+        return int(row.get('column_position') or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def write_store(metadata, path):
+    """
+    메타데이터를 저장소 파일로 저장 (임시 파일에 쓴 뒤 교체)
+    
+    Args:
+        metadata (dict): collect_database_metadata 또는 load_snapshot 결과
+        path (str): 저장할 파일 경로
+        
+    Returns:
+        str: 저장된 파일 경로
+    """
+    # 테이블별로 한 번에 묶기 (테이블 순서는 컬럼 행에 처음 나온 순서)
+    grouped = {}
+    for section, fields in SNAPSHOT_SCHEMA.items():
+        for row in metadata.get(section, []):
+            entry = grouped.get(row['table_name'])
+            if entry is None:
+                if section != 'tables':
+                    # 컬럼 정보가 없는 테이블의 외래키/인덱스는 명세서에 나오지 않으므로 제외
+                    continue
+                entry = grouped[row['table_name']] = {
+                    'comment': row.get('table_comment') or '', 'tables': [], 'foreign_keys': [], 'indexes': []
+                }
+            entry[section].append(row)
+            
+    connection_info = without_credentials(metadata.get('connection_info'))
+    save_dir = os.path.dirname(path)
+    if save_dir:
+        os.makedirs(save_dir, exist_ok=True)
+        
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(STORE_HEADER.pack(STORE_MAGIC, STORE_VERSION, 0, 0))
+            table_index = []
+            for table_name, entry in grouped.items():
+                entry['tables'].sort(key=_position)
+                block = {
+                    'columns': [[row.get(field) for field in SNAPSHOT_SCHEMA['tables']] for row in entry['tables']],
+                    'foreign_keys': [[row.get(field) for field in SNAPSHOT_SCHEMA['foreign_keys']]
+                                     for row in entry['foreign_keys']],
+                    'indexes': [[row.get(field) for field in SNAPSHOT_SCHEMA['indexes']] for row in entry['indexes']]
+                }
+                data = json.dumps(block, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+                table_index.append([table_name, entry['comment'], f.tell(), len(data),
+                                    len(entry['tables']), len(entry['foreign_keys'])])
+                f.write(data)
+                
+            index = {
+                'connection_info': connection_info,
+                'statistics': metadata.get('statistics', {}),
+                'schema': {section: list(fields) for section, fields in SNAPSHOT_SCHEMA.items()},
+                'tables': table_index
+            }
+            index_offset = f.tell()
+            index_data = json.dumps(index, ensure_ascii=False, default=str).encode('utf-8')
+            f.write(index_data)
+            f.seek(0)
+            f.write(STORE_HEADER.pack(STORE_MAGIC, STORE_VERSION, index_offset, len(index_data)))
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return path
+
+
+class SnapshotStore:
+    """
+    저장소 파일을 mmap으로 열어 테이블 단위로 읽는 읽기 전용 저장소
+    
+    색인만 미리 읽으며, get_table()은 해당 테이블 블록 하나만 풀어 반환합니다.
+    with 문으로 사용하거나 사용 후 close()를 호출해야 파일이 닫힙니다.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_offset, index_length = STORE_HEADER.unpack_from(self._map, 0)
+            if magic != STORE_MAGIC:
+                raise SnapshotError(f"스냅샷 저장소 파일이 아닙니다: {path}")
+            if version != STORE_VERSION:
+                raise SnapshotError(f"지원하지 않는 저장소 버전입니다: {version} (지원: {STORE_VERSION})")
+            index = json.loads(self._map[index_offset:index_offset + index_length])
+        except (ValueError, struct.error) as e:
+            self.close()
+            raise SnapshotError(f"스냅샷 저장소를 읽을 수 없습니다: {path} ({e})")
+        except Exception:
+            self.close()
+            raise
+            
+        self.connection_info = index['connection_info']
+        self.statistics = index['statistics']
+        self._fields = index['schema']
+        # 테이블명 -> (논리명, 블록 위치, 블록 길이, 컬럼 수, 외래키 수)
+        self._tables = {entry[0]: tuple(entry[1:]) for entry in index['tables']}
+        self.table_names = [entry[0] for entry in index['tables']]
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        
+    def __len__(self):
+        return len(self.table_names)
+        
+    def __contains__(self, table_name):
+        return table_name in self._tables
+        
+    def close(self):
+        """mmap과 파일 닫기"""
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            
+    def get_table(self, table_name):
+        """
+        테이블 하나의 컬럼/외래키/인덱스 조회 (해당 블록만 읽음)
+        
+        Returns:
+            dict: {'table_name', 'table_comment', 'columns', 'foreign_keys', 'indexes'}
+                  (각 목록은 수집기 정규화 결과와 같은 형식의 행, 없는 테이블이면 KeyError)
+        """
+        comment, offset, length = self._tables[table_name][:3]
+        block = json.loads(self._map[offset:offset + length])
+        return {
+            'table_name': table_name,
+            'table_comment': comment,
+            'columns': [dict(zip(self._fields['tables'], values)) for values in block['columns']],
+            'foreign_keys': [dict(zip(self._fields['foreign_keys'], values)) for values in block['foreign_keys']],
+            'indexes': [dict(zip(self._fields['indexes'], values)) for values in block['indexes']]
+        }
+        
+    def iter_tables(self, table_names=None):
+        """테이블을 저장 순서대로 하나씩 조회 (table_names가 있으면 그 중 저장소에 있는 테이블만)"""
+        if table_names is not None:
+            wanted = set(table_names)
+            names = [name for name in self.table_names if name in wanted]
+        else:
+            names = self.table_names
+        for name in names:
+            yield self.get_table(name)
+            
+    def get_table_list_data(self):
+        """테이블 목록 (collect_table_list 결과와 같은 형식, 색인만 사용)"""
+        table_list = [
+            {'no': no, 'table_name': name, 'table_comment': self._tables[name][0]}
+            for no, name in enumerate(self.table_names, 1)
+        ]
+        return {
+            'connection_info': self.connection_info,
+            'table_list': table_list,
+            'statistics': {'total_tables': len(table_list), 'collection_duration_ms': 0}
+        }
+        
+    def get_statistics(self, table_names=None):
+        """선택한 테이블의 건수 통계 (색인만 사용, collect_database_metadata의 statistics와 같은 키)"""
+        names = self.table_names if table_names is None else [name for name in table_names if name in self._tables]
+        statistics = dict(self.statistics)
+        statistics.update({
+            'total_tables': len(names),
+            'total_columns': sum(self._tables[name][3] for name in names),
+            'total_foreign_keys': sum(self._tables[name][4] for name in names)
+        })
+        return statistics
+        
+    def to_metadata(self, table_names=None):
+        """선택한 테이블만 메타데이터 딕셔너리로 읽기 (collect_database_metadata 결과와 같은 형식)"""
+        tables, foreign_keys, indexes = [], [], []
+        for table in self.iter_tables(table_names):
+            tables.extend(table['columns'])
+            foreign_keys.extend(table['foreign_keys'])
+            indexes.extend(table['indexes'])
+        statistics = dict(self.statistics)
+        statistics.update({
+            'total_tables': len({row['table_name'] for row in tables}),
+            'total_columns': len(tables),
+            'total_foreign_keys': len(foreign_keys)
+        })
+        return {
+            'connection_info': self.connection_info,
+            'tables': tables,
+            'foreign_keys': foreign_keys,
+            'indexes': indexes,
+            'statistics': statistics
+        }
+
+
+def store_path_for(snapshot_path):
+    """스냅샷 파일에 대응하는 저장소 파일 경로 (확장자만 변경)"""
+    return os.path.splitext(snapshot_path)[0] + SNAPSHOT_CONFIG["store_extension"]
+
+
+def open_store(path):
+    """
+    저장소 열기 (스냅샷 파일이면 같은 위치의 저장소 파일을 만들거나 갱신한 뒤 열기)
+    
+    Returns:
+        SnapshotStore: 열린 저장소
+    """
+    if not path.endswith(SNAPSHOT_CONFIG["store_extension"]):
+        store_path = store_path_for(path)
+        if not os.path.exists(store_path) or os.path.getmtime(store_path) < os.path.getmtime(path):
+            write_store(load_snapshot(path), store_path)
+        path = store_path
+    return SnapshotStore(path)
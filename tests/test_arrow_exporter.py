@@ -0,0 +1,70 @@
+"""
+Arrow/Parquet 내보내기 테스트 (pyarrow 필요)
+"""
+
+import json
+
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+from export import export_parquet  # noqa: E402
+from export.arrow_exporter import SCHEMA_METADATA_KEY  # noqa: E402
+
+
+def column_row(table_name, position, column_name, data_type='int', key_type=''):
+    return {
+        'table_name': table_name, 'table_comment': f'{table_name} 설명', 'column_position': position,
+        'column_name': column_name, 'data_type': data_type, 'default_value': '', 'is_nullable': 'YES',
+        'key_type': key_type, 'extra': '', 'column_comment': ''
+    }
+
+
+def build_metadata():
+    return {
+        'connection_info': {'dbms': 'MySQL', 'host': 'db1', 'database': 'shop', 'password': 'secret'},
+        'tables': [
+            column_row('customers', 1, 'id', key_type='PRI'),
+            column_row('customers', 2, 'name', 'varchar(50)'),
+            column_row('orders', 1, 'id', key_type='PRI'),
+            column_row('orders', 2, 'customer_id')
+        ],
+        'foreign_keys': [{'table_name': 'orders', 'column_name': 'customer_id', 'referenced_table_name': 'customers',
+                          'referenced_column_name': 'id', 'constraint_name': 'fk_orders_customer'}],
+        'indexes': [
+            {'table_name': 'orders', 'index_name': 'PRIMARY', 'non_unique': 0, 'column_name': 'id', 'seq_in_index': 1},
+            {'table_name': 'orders', 'index_name': 'ix_orders_customer', 'non_unique': 1,
+             'column_name': 'customer_id', 'seq_in_index': 1}
+        ],
+        'statistics': {'total_tables': 2}
+    }
+
+
+def test_parquet_row_counts(tmp_path):
+    result = export_parquet(build_metadata(), str(tmp_path / 'shop_parquet'))
+
+    assert {name: pq.read_metadata(path).num_rows for name, path in result['files'].items()} == {
+        'tables': 2, 'columns': 4, 'foreign_keys': 1, 'indexes': 2
+    }
+    assert result['statistics']['columns_rows'] == 4
+
+
+def test_parquet_schema(tmp_path):
+    result = export_parquet(build_metadata(), str(tmp_path / 'shop_parquet'))
+    columns = pq.read_table(result['files']['columns'])
+    schema = columns.schema
+
+    assert schema.names[:3] == ['dbms', 'host', 'database']
+    assert pa.types.is_dictionary(schema.field('data_type').type)
+    assert schema.field('column_position').type == pa.int32()
+    assert schema.field('is_nullable').type == pa.bool_()
+    assert columns.column('base_type').to_pylist() == ['int', 'varchar', 'int', 'int']
+    assert set(columns.column('database').to_pylist()) == {'shop'}
+
+    indexes = pq.read_table(result['files']['indexes'])
+    assert indexes.column('is_unique').to_pylist() == [True, False]
+
+    source = json.loads(schema.metadata[SCHEMA_METADATA_KEY])['connection_info']
+    assert 'password' not in source
+    assert source['database'] == 'shop'
@@ -0,0 +1,44 @@
+"""
+연결 풀 유휴 연결 정리 테스트 (가짜 연결 사용)
+"""
+
+import time
+
+from database.connection_manager import ConnectionManager, DatabaseConnectionFactory
+
+
+class FakeConnection:
+    """연결/해제만 기록하는 연결 대용"""
+
+    def __init__(self, password, **kwargs):
+        self.password = password
+        self.is_connected = False
+
+    def connect(self):
+        self.is_connected = True
+
+    def disconnect(self):
+        self.is_connected = False
+
+    def ping(self):
+        return self.is_connected
+
+
+def test_idle_connection_is_closed_without_checkout(monkeypatch):
+    monkeypatch.setattr(DatabaseConnectionFactory, 'create_connection',
+                        staticmethod(lambda oracle_driver=None, **params: FakeConnection(**params)))
+    manager = ConnectionManager(idle_timeout=0.05)
+    manager.evict_interval = 0.02
+
+    connection = manager.acquire('MySQL', 'localhost', 3306, 'shop', 'user', 'pass')
+    manager.release(connection)
+
+    deadline = time.time() + 2
+    while connection.is_connected and time.time() < deadline:
+        time.sleep(0.01)
+
+    stats = manager.get_pool_stats()
+    assert not connection.is_connected
+    assert stats['evictions'] == 1
+    assert stats['idle_connections'] == 0
+    manager.close_all()
@@ -0,0 +1,73 @@
+"""
+메타데이터 수집기 정규화 테스트 (딕셔너리 행과 값 튜플 행)
+"""
+
+import pytest
+
+from database.base_connection import PositionalRows
+from database.data_collector import DatabaseMetadataCollector
+from database.jdbc_oracle_connection import JdbcOracleConnection
+from database.oracle_connection import OracleConnection
+
+
+COLUMNS = ['table_name', 'table_comment', 'column_position', 'column_name', 'data_type',
+           'default_value', 'is_nullable', 'key_type', 'extra', 'column_comment']
+ROWS = [
+    ('orders', '주문', 1, 'id', 'integer', None, 'NO', 'PRI', '', '주문 번호'),
+    ('orders', '주문', 2, 'memo', 'text', "''::text", 'YES', None, None, None)
+]
+
+
+def test_positional_rows_normalize_like_dict_rows():
+    collector = DatabaseMetadataCollector()
+    closed = []
+
+    from_tuples = collector._normalize_tables_data(
+        PositionalRows(COLUMNS, iter(ROWS), lambda: closed.append(True))
+    )
+    from_dicts = collector._normalize_tables_data([dict(zip(COLUMNS, row)) for row in ROWS])
+
+    assert from_tuples == from_dicts
+    assert from_tuples[1]['default_value'] == "''::text"
+    assert closed == [True]
+
+
+def test_positional_rows_close_without_reading():
+    closed = []
+    rows = PositionalRows(COLUMNS, iter(ROWS), lambda: closed.append(True))
+    rows.close()
+    rows.close()
+    assert closed == [True]
+
+
+def test_catalog_results_closed_when_normalizing_fails():
+    closed = []
+
+    def broken_rows():
+        yield {'table_name': 'orders'}
+        raise RuntimeError('연결 끊김')
+
+    class FakeConnection:
+        def get_catalog(self, table_names):
+            return {
+                'version': '16.2',
+                'tables': broken_rows(),
+                'foreign_keys': PositionalRows(COLUMNS, iter(()), lambda: closed.append('foreign_keys')),
+                'indexes': PositionalRows(COLUMNS, iter(()), lambda: closed.append('indexes'))
+            }
+
+    collector = DatabaseMetadataCollector()
+    with pytest.raises(RuntimeError):
+        collector._collect_catalog(FakeConnection(), None)
+    assert closed == ['foreign_keys', 'indexes']
+
+
+def test_cache_key_comes_from_connection_family():
+    collector = DatabaseMetadataCollector()
+    thin = OracleConnection('db', 1521, 'ORCL', 'scott', 'tiger', oracle_type='service_name')
+    # JVM을 띄우지 않고 같은 연결 정보만 가진 JDBC 연결 객체
+    jdbc = JdbcOracleConnection.__new__(JdbcOracleConnection)
+    jdbc.__dict__.update(thin.__dict__)
+
+    assert collector.get_cache_key(thin) == collector.get_cache_key(jdbc) == \
+        'Oracle://scott@db:1521/ORCL?oracle_type=service_name'
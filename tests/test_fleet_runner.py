@@ -0,0 +1,33 @@
+"""
+일괄 생성 대상 처리 테스트 (부가 출력 실패 처리)
+"""
+
+import database
+import excel
+import snapshot
+from batch import fleet_runner
+
+
+PROFILE = {'name': '주문DB', 'dbms': 'MySQL', 'host': 'localhost', 'port': 3306,
+           'database': 'orders', 'username': 'reader', 'password': 'secret'}
+
+
+def test_snapshot_failure_is_a_warning(monkeypatch, tmp_path):
+    metadata = {'statistics': {'total_tables': 3, 'total_columns': 12}}
+    spec_path = str(tmp_path / 'orders.xlsx')
+
+    def fail_snapshot(metadata, path):
+        raise OSError("디스크 공간 부족")
+
+    monkeypatch.setattr(database.metadata_collector, 'collect_database_metadata', lambda **kwargs: metadata)
+    monkeypatch.setattr(excel.excel_generator, 'generate_excel', lambda metadata, path: spec_path)
+    monkeypatch.setattr(snapshot, 'save_snapshot', fail_snapshot)
+    monkeypatch.setitem(fleet_runner.SNAPSHOT_CONFIG, 'save_with_spec', True)
+    monkeypatch.setitem(fleet_runner.EXPORT_CONFIG, 'save_with_spec', False)
+
+    result = fleet_runner._run_target(PROFILE, str(tmp_path))
+
+    assert result['success']
+    assert result['path'] == spec_path
+    assert 'snapshot' not in result
+    assert result['warnings'] == ["스냅샷 저장 실패: 디스크 공간 부족"]
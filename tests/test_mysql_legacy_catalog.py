@@ -0,0 +1,146 @@
+"""
+MySQL 5.7 이하/MariaDB 테이블 단위 카탈로그 조회 테스트 (가짜 커서 사용)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import database.mysql_connection as mysql_connection
+from database.exceptions import DatabaseQueryError
+from database.mysql_connection import MySQLConnection
+from database.mysql_drivers import MySQLDriver
+
+
+class FakeError(Exception):
+    """드라이버 OperationalError 대용 (args: 오류 코드, 메시지)"""
+
+
+class FakeCursor:
+    """쿼리 종류에 따라 준비된 행을 돌려주는 DictCursor 대용"""
+
+    def __init__(self, server):
+        self.server = server
+        self.rows = []
+        self.description = None
+        self.rowcount = 0
+
+    def execute(self, query, params=None):
+        self.server.executed.append(query.strip())
+        self.rows = self.server.respond(query, params)
+        self.description = None if self.rows is None else (('column',),)
+        self.rowcount = 0 if self.rows is None else len(self.rows)
+
+    def fetchall(self):
+        return list(self.rows or ())
+
+    def close(self):
+        pass
+
+
+class FakeServer:
+    """MariaDB 10.5 흉내 (SHOW FULL TABLES, INFORMATION_SCHEMA 테이블 단위 조회)"""
+
+    tables = {'orders': 'BASE TABLE', 'customers': 'BASE TABLE', 'v_orders': 'VIEW', 'seq_id': 'SEQUENCE'}
+
+    def __init__(self):
+        self.executed = []
+        self.failures = []
+
+    def cursor(self, cursor_class=None):
+        return FakeCursor(self)
+
+    def respond(self, query, params):
+        query = query.strip()
+        for failure in self.failures:
+            matches, error_code, message = failure
+            if matches(query, params):
+                # 한 번만 실패
+                self.failures.remove(failure)
+                raise FakeError(error_code, message)
+        if query == mysql_connection.LEGACY_TABLE_LIST_QUERY:
+            return [{'Tables_in_shop': name, 'Table_type': table_type}
+                    for name, table_type in self.tables.items()]
+        if query.startswith('SET '):
+            return None
+        if 'lock_wait_timeout' in query:
+            return [{'lock_wait_timeout': 50}]
+        if query == mysql_connection.VERSION_QUERY:
+            return [{'version': '10.5.18-MariaDB'}]
+        if query == mysql_connection.LEGACY_TABLE_COLUMNS_QUERY.strip():
+            table_name = params[1]
+            return [{'TABLE_NAME': table_name, '테이블설명': f'{table_name} 설명', 'NO': 1,
+                     '컬럼명': 'id', 'TYPE': 'int(11)', 'DEFAULT_VALUE': None, 'NULLABLE': 'NO',
+                     'KEY_TYPE': 'PRI', 'EXTRA': '', '설명': ''}]
+        if query == mysql_connection.LEGACY_TABLE_COMMENT_QUERY.strip():
+            return [{'table_name': params[1], 'table_comment': f'{params[1]} 설명'}]
+        return []
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    driver = MySQLDriver(SimpleNamespace(OperationalError=FakeError), None, None)
+    monkeypatch.setattr(mysql_connection, 'get_mysql_driver', lambda name=None: driver)
+    monkeypatch.setattr(mysql_connection.time, 'sleep', lambda seconds: None)
+    monkeypatch.setitem(mysql_connection.MYSQL_CONFIG, 'multi_statements', False)
+    conn = MySQLConnection('localhost', 3306, 'shop', 'user', 'pass')
+    conn.connection = FakeServer()
+    conn.is_connected = True
+    conn._server_version = (True, (10, 5, 18))
+    return conn
+
+
+def test_legacy_table_names_read_show_full_tables_rows(connection):
+    assert connection._get_legacy_table_names() == ['customers', 'orders', 'v_orders']
+
+
+def test_legacy_catalog_collects_each_table(connection):
+    catalog = connection.get_catalog()
+
+    assert catalog['version'] == 'MariaDB 10.5.18-MariaDB'
+    assert [row['TABLE_NAME'] for row in catalog['tables']] == ['customers', 'orders', 'v_orders']
+    assert catalog['foreign_keys'] == []
+    assert catalog['indexes'] == []
+    # 세션 lock_wait_timeout을 낮췄다가 원래 값으로 되돌림
+    settings = [query for query in connection.connection.executed if query.startswith('SET SESSION')]
+    assert len(settings) == 2
+
+
+def test_legacy_tables_basic_info(connection):
+    assert connection.get_tables_basic_info() == [
+        {'table_name': 'customers', 'table_comment': 'customers 설명'},
+        {'table_name': 'orders', 'table_comment': 'orders 설명'},
+        {'table_name': 'v_orders', 'table_comment': 'v_orders 설명'}
+    ]
+
+
+def test_legacy_servers_skip_change_markers(connection):
+    # 스키마 전체 INFORMATION_SCHEMA.TABLES 조회 없이 전체 수집으로 넘어감
+    assert connection.get_change_markers() is None
+    assert connection.connection.executed == []
+
+
+def is_columns_query(query, params):
+    return query == mysql_connection.LEGACY_TABLE_COLUMNS_QUERY.strip()
+
+
+def test_legacy_catalog_retries_lock_wait_timeout_by_error_code(connection):
+    connection.connection.failures.append(
+        (is_columns_query, mysql_connection.LOCK_WAIT_TIMEOUT_ERROR, 'Lock wait timeout exceeded')
+    )
+
+    catalog = connection.get_catalog()
+
+    assert [row['TABLE_NAME'] for row in catalog['tables']] == ['customers', 'orders', 'v_orders']
+    assert connection.connection.failures == []
+
+
+def test_legacy_catalog_keeps_original_error_when_restore_fails(connection):
+    connection.connection.failures.append((is_columns_query, 1146, "Table 'shop.orders' doesn't exist"))
+    # 낮춘 값(2)으로 바꾸는 SET은 통과하고 원래 값(50)으로 되돌리는 SET만 실패
+    connection.connection.failures.append((lambda query, params: params == (50,), 2013, 'Lost connection'))
+
+    with pytest.raises(DatabaseQueryError) as error:
+        connection.get_catalog()
+    assert error.value.error_code == 1146
+    assert connection.connection.failures == []
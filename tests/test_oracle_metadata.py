@@ -0,0 +1,39 @@
+"""
+Oracle 컬럼 기본값 조회 테스트 (가짜 조회 사용)
+"""
+
+import database.base_connection as base_connection
+from database.oracle_connection import OracleConnection
+
+
+class FakeOracle(OracleConnection):
+    """기본값 쿼리의 테이블명 조건만 흉내 내는 연결"""
+
+    defaults = {'Orders': {'STATUS': "'NEW' "}, 'ITEMS': {'QTY': '1', 'NOTE': 'NULL'}}
+
+    def __init__(self):
+        super().__init__('localhost', 1521, 'ORCL', 'user', 'pass')
+        self.executed = []
+
+    def _fetch(self, query, params=None, stream=False):
+        self.executed.append(params)
+        names = params or list(self.defaults)
+        return [{'table_name': name, 'column_name': column, 'data_default': value}
+                for name in names for column, value in self.defaults.get(name, {}).items()]
+
+
+def test_default_values_keep_table_name_case():
+    conn = FakeOracle()
+
+    assert conn._get_default_values(['Orders']) == {'Orders': {'STATUS': "'NEW'"}}
+    assert conn._get_default_values() == {'Orders': {'STATUS': "'NEW'"}, 'ITEMS': {'QTY': '1', 'NOTE': ''}}
+
+
+def test_default_values_split_long_table_lists(monkeypatch):
+    monkeypatch.setattr(base_connection, 'TABLE_FILTER_CHUNK_SIZE', 2)
+    conn = FakeOracle()
+
+    assert conn._get_default_values(['ITEMS', 'Orders', 'EMPTY']) == {
+        'ITEMS': {'QTY': '1', 'NOTE': ''}, 'Orders': {'STATUS': "'NEW'"}
+    }
+    assert conn.executed == [('EMPTY', 'ITEMS'), ('Orders',)]
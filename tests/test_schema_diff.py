@@ -0,0 +1,98 @@
+"""
+스키마 비교 엔진 테스트
+"""
+
+import copy
+
+from diff import compare_schemas
+
+
+def column(table_name, position, name, data_type='int', comment=''):
+    return {
+        'table_name': table_name, 'table_comment': f'{table_name} 설명', 'column_position': position,
+        'column_name': name, 'data_type': data_type, 'default_value': '', 'is_nullable': 'N',
+        'key_type': 'PRI' if position == 1 else '', 'extra': '', 'column_comment': comment
+    }
+
+
+def build_metadata():
+    return {
+        'connection_info': {'database': 'shop'},
+        'tables': [
+            column('customers', 1, 'id'),
+            column('customers', 2, 'name', 'varchar(50)'),
+            column('orders', 1, 'id'),
+            column('orders', 2, 'customer_id')
+        ],
+        'foreign_keys': [{'table_name': 'orders', 'column_name': 'customer_id', 'referenced_table_name': 'customers',
+                          'referenced_column_name': 'id', 'constraint_name': 'fk1'}],
+        'indexes': [{'table_name': 'orders', 'index_name': 'ix_orders_customer', 'non_unique': 1,
+                     'column_name': 'customer_id', 'seq_in_index': 1}]
+    }
+
+
+def test_foreign_key_rename_is_reported():
+    old = build_metadata()
+    new = copy.deepcopy(old)
+    new['foreign_keys'][0]['constraint_name'] = 'fk_renamed'
+
+    result = compare_schemas(old, new)
+
+    assert result['modified_tables'] == ['orders']
+    assert [(c['object_type'], c['change'], c['old_value'], c['new_value']) for c in result['changes']] == [
+        ('외래키', '변경', 'fk1', 'fk_renamed')
+    ]
+    assert result['statistics']['unchanged_tables'] == 1
+
+
+def summarize(result):
+    return sorted((c['table_name'], c['object_type'], c['object_name'], c['change'], c['attribute'],
+                   c['old_value'], c['new_value']) for c in result['changes'])
+
+
+def test_identical_schemas_have_no_changes():
+    result = compare_schemas(build_metadata(), build_metadata())
+
+    assert result['changes'] == []
+    assert result['modified_tables'] == []
+    assert result['statistics']['unchanged_tables'] == 2
+
+
+def test_added_and_dropped_tables():
+    old = build_metadata()
+    new = copy.deepcopy(old)
+    new['tables'] = [row for row in new['tables'] if row['table_name'] != 'customers']
+    new['tables'].append(column('items', 1, 'id'))
+    new['foreign_keys'] = []
+
+    result = compare_schemas(old, new)
+
+    assert result['added_tables'] == ['items']
+    assert result['dropped_tables'] == ['customers']
+    assert result['modified_tables'] == ['orders']
+    assert summarize(result) == [
+        ('customers', '테이블', 'customers', '삭제', '컬럼 수', 2, ''),
+        ('items', '테이블', 'items', '추가', '컬럼 수', '', 1),
+        ('orders', '외래키', 'fk1', '삭제', '참조', 'customer_id -> customers.id', '')
+    ]
+    assert result['statistics']['unchanged_tables'] == 0
+
+
+def test_modified_columns_and_indexes():
+    old = build_metadata()
+    new = copy.deepcopy(old)
+    new['tables'][1]['data_type'] = 'varchar(100)'
+    new['tables'].append(column('customers', 3, 'email', 'varchar(200)'))
+    new['tables'] = [row for row in new['tables'] if row['column_name'] != 'customer_id']
+    new['indexes'][0]['non_unique'] = 0
+
+    result = compare_schemas(old, new)
+
+    assert result['modified_tables'] == ['customers', 'orders']
+    assert summarize(result) == [
+        ('customers', '컬럼', 'email', '추가', 'TYPE', '', 'varchar(200)'),
+        ('customers', '컬럼', 'name', '변경', 'TYPE', 'varchar(50)', 'varchar(100)'),
+        ('orders', '인덱스', 'ix_orders_customer', '변경', '컬럼', '(customer_id)', 'UNIQUE (customer_id)'),
+        ('orders', '컬럼', 'customer_id', '삭제', 'TYPE', 'int', '')
+    ]
+    assert result['statistics']['total_changes'] == 4
@@ -0,0 +1,58 @@
+"""
+스키마 모델 행 뷰와 메타데이터 캐시(값 목록 저장) 테스트
+"""
+
+from database.metadata_cache import MetadataCache
+from model import RowView, SchemaModel, schema_of
+
+
+def column_row(table_name, position, column_name, key_type=''):
+    return {
+        'table_name': table_name, 'table_comment': f'{table_name} 설명', 'column_position': position,
+        'column_name': column_name, 'data_type': 'int', 'default_value': '', 'is_nullable': 'N',
+        'key_type': key_type, 'extra': '', 'column_comment': ''
+    }
+
+
+def build_metadata():
+    tables = [
+        column_row('customers', 1, 'id', 'PRI'),
+        column_row('customers', 2, 'name'),
+        column_row('orders', 1, 'id', 'PRI'),
+        column_row('orders', 2, 'customer_id'),
+        column_row('orders', 3, 'amount')
+    ]
+    foreign_keys = [{'table_name': 'orders', 'column_name': 'customer_id', 'referenced_table_name': 'customers',
+                     'referenced_column_name': 'id', 'constraint_name': 'fk_orders_customer'}]
+    indexes = [{'table_name': 'orders', 'index_name': 'ix_orders_customer', 'non_unique': 1,
+                'column_name': 'customer_id', 'seq_in_index': 1}]
+    metadata = {'connection_info': {'database': 'shop', 'password': 'secret'}, 'statistics': {'total_tables': 2}}
+    SchemaModel.from_rows(tables, foreign_keys, indexes).attach(metadata)
+    return metadata, tables, foreign_keys, indexes
+
+
+def test_row_view_indexing_matches_rows():
+    metadata, tables, foreign_keys, indexes = build_metadata()
+
+    assert [metadata['tables'][index] for index in range(len(tables))] == tables
+    assert metadata['tables'][-1] == tables[-1]
+    assert metadata['foreign_keys'][0] == foreign_keys[0]
+    assert metadata['indexes'][-1] == indexes[0]
+
+
+def test_cache_round_trip_keeps_model(tmp_path):
+    cache = MetadataCache(path=str(tmp_path / 'cache.sqlite3'), ttl_seconds=0, max_bytes=0)
+    metadata, tables, foreign_keys, indexes = build_metadata()
+
+    assert cache.put('shop-key', '8.0.36', 'metadata', metadata)
+    assert not cache.put('shop-key', '8.0.36', 'metadata', metadata)
+    cached = cache.get('shop-key', '8.0.36', 'metadata')
+
+    assert isinstance(cached['tables'], RowView)
+    assert cached['tables'] == tables
+    assert cached['foreign_keys'] == foreign_keys
+    assert cached['indexes'] == indexes
+    assert 'password' not in cached['connection_info']
+    assert schema_of(cached).relationships.foreign_key('orders', 'customer_id').referenced_table_name == 'customers'
+    # 행 목록으로 바꿔도 같은 내용이면 해시가 같음
+    assert cache.content_digest(cached) == cache.content_digest(dict(cached, tables=list(cached['tables'])))
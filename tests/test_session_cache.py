@@ -0,0 +1,53 @@
+"""
+연결 세션의 캐시된 메타데이터 사용 여부 테스트 (변경 표시 비교)
+"""
+
+from database.session import ConnectionSession
+
+
+class MarkerConnection:
+    """변경 표시만 반환하는 연결 대용"""
+
+    is_connected = True
+
+    def __init__(self, markers):
+        self.markers = markers
+
+    def get_change_markers(self):
+        if isinstance(self.markers, Exception):
+            raise self.markers
+        return self.markers
+
+    def ping(self):
+        return True
+
+
+def make_session(markers):
+    session = ConnectionSession('MySQL', 'localhost', 3306, 'shop', 'user', 'pass')
+    session.connection = MarkerConnection(markers)
+    return session
+
+
+def test_cache_is_used_only_when_markers_match():
+    cached = {'change_markers': {'orders': 'a', 'customers': 'b'}}
+
+    assert make_session({'orders': 'a', 'customers': 'b'})._is_cache_current(cached, None)
+    assert not make_session({'orders': 'a', 'customers': 'c'})._is_cache_current(cached, None)
+    # 새로 생긴 테이블이 있으면 전체 캐시는 쓰지 않음
+    assert not make_session({'orders': 'a', 'customers': 'b', 'items': 'd'})._is_cache_current(cached, None)
+    # 선택한 테이블만 비교
+    assert make_session({'orders': 'a', 'customers': 'c'})._is_cache_current(cached, ['orders'])
+
+
+def test_cache_is_not_used_without_markers():
+    assert not make_session(None)._is_cache_current({'change_markers': {'orders': 'a'}}, None)
+    assert not make_session({'orders': 'a'})._is_cache_current({}, None)
+
+
+def test_marker_failure_is_reported_through_on_warning():
+    session = make_session(RuntimeError('권한 없음'))
+    warnings = []
+    session.on_warning = warnings.append
+
+    assert not session._is_cache_current({'change_markers': {'orders': 'a'}}, None)
+    assert warnings == ['변경 표시 조회 실패, 메타데이터를 다시 수집합니다: 권한 없음']
@@ -0,0 +1,69 @@
+"""
+스키마 스냅샷 파일 저장/읽기 테스트
+"""
+
+import gzip
+
+import pytest
+
+from snapshot import SnapshotError, load_snapshot, read_snapshot_header, save_snapshot
+
+
+def column_row(table_name, position, column_name, key_type=''):
+    return {
+        'table_name': table_name, 'table_comment': f'{table_name} 설명', 'column_position': position,
+        'column_name': column_name, 'data_type': 'int', 'default_value': '', 'is_nullable': 'N',
+        'key_type': key_type, 'extra': '', 'column_comment': ''
+    }
+
+
+def build_metadata():
+    return {
+        'connection_info': {'dbms': 'MySQL', 'database': 'shop', 'version': '8.0.36', 'password': 'secret'},
+        'tables': [
+            column_row('customers', 1, 'id', 'PRI'),
+            column_row('orders', 1, 'id', 'PRI'),
+            column_row('orders', 2, 'customer_id')
+        ],
+        'foreign_keys': [{'table_name': 'orders', 'column_name': 'customer_id', 'referenced_table_name': 'customers',
+                          'referenced_column_name': 'id', 'constraint_name': 'fk_orders_customer'}],
+        'indexes': [{'table_name': 'orders', 'index_name': 'ix_orders_customer', 'non_unique': 1,
+                     'column_name': 'customer_id', 'seq_in_index': 1}],
+        'statistics': {'total_tables': 2, 'total_columns': 3, 'total_foreign_keys': 1}
+    }
+
+
+def test_snapshot_round_trip(tmp_path):
+    metadata = build_metadata()
+    path = save_snapshot(metadata, str(tmp_path / 'shop.dbsnap'))
+
+    loaded = load_snapshot(path)
+
+    assert loaded['tables'] == metadata['tables']
+    assert loaded['foreign_keys'] == metadata['foreign_keys']
+    assert loaded['indexes'] == metadata['indexes']
+    assert 'password' not in loaded['connection_info']
+    assert loaded['statistics']['total_tables'] == 2
+    assert loaded['statistics']['snapshot_path'] == path
+    assert read_snapshot_header(path)['summary']['columns'] == 3
+
+
+def test_snapshot_checksum_mismatch(tmp_path):
+    path = save_snapshot(build_metadata(), str(tmp_path / 'shop.dbsnap'))
+    with gzip.open(path, 'rb') as f:
+        content = f.read()
+    # 헤더는 그대로 두고 본문만 바꿈
+    with gzip.open(path, 'wb') as f:
+        f.write(content.replace(b'customer_id', b'customer_no'))
+
+    with pytest.raises(SnapshotError):
+        load_snapshot(path)
+    assert load_snapshot(path, verify=False)['tables'][2]['column_name'] == 'customer_no'
+
+
+def test_snapshot_rejects_other_files(tmp_path):
+    path = tmp_path / 'not_snapshot.dbsnap'
+    path.write_bytes(b'plain text')
+
+    with pytest.raises(SnapshotError):
+        load_snapshot(str(path))
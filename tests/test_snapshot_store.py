@@ -0,0 +1,81 @@
+"""
+mmap 스냅샷 저장소 테이블 단위 읽기 테스트
+"""
+
+import os
+
+import pytest
+
+from snapshot import open_store, save_snapshot, store_path_for, write_store
+
+
+def column_row(table_name, position, column_name, key_type=''):
+    return {
+        'table_name': table_name, 'table_comment': f'{table_name} 설명', 'column_position': position,
+        'column_name': column_name, 'data_type': 'int', 'default_value': '', 'is_nullable': 'N',
+        'key_type': key_type, 'extra': '', 'column_comment': ''
+    }
+
+
+def build_metadata():
+    return {
+        'connection_info': {'dbms': 'MySQL', 'database': 'shop', 'password': 'secret'},
+        'tables': [
+            column_row('customers', 1, 'id', 'PRI'),
+            column_row('customers', 2, 'name'),
+            # 컬럼 순서가 섞여 있어도 저장소에는 column_position 순으로 저장
+            column_row('orders', 2, 'customer_id'),
+            column_row('orders', 1, 'id', 'PRI')
+        ],
+        'foreign_keys': [{'table_name': 'orders', 'column_name': 'customer_id', 'referenced_table_name': 'customers',
+                          'referenced_column_name': 'id', 'constraint_name': 'fk_orders_customer'}],
+        'indexes': [{'table_name': 'orders', 'index_name': 'ix_orders_customer', 'non_unique': 1,
+                     'column_name': 'customer_id', 'seq_in_index': 1}],
+        'statistics': {'total_tables': 2, 'total_columns': 4, 'total_foreign_keys': 1}
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = write_store(build_metadata(), str(tmp_path / 'shop.dbstore'))
+    with open_store(path) as opened:
+        yield opened
+
+
+def test_get_table_reads_one_table(store):
+    metadata = build_metadata()
+    orders = store.get_table('orders')
+
+    assert orders['table_comment'] == 'orders 설명'
+    assert [row['column_name'] for row in orders['columns']] == ['id', 'customer_id']
+    assert orders['foreign_keys'] == metadata['foreign_keys']
+    assert orders['indexes'] == metadata['indexes']
+    with pytest.raises(KeyError):
+        store.get_table('missing')
+
+
+def test_to_metadata_matches_source(store):
+    metadata = build_metadata()
+    result = store.to_metadata()
+
+    expected_tables = sorted(metadata['tables'], key=lambda row: (row['table_name'], row['column_position']))
+    assert result['tables'] == expected_tables
+    assert result['foreign_keys'] == metadata['foreign_keys']
+    assert result['indexes'] == metadata['indexes']
+    assert 'password' not in result['connection_info']
+    assert result['statistics']['total_tables'] == 2
+    assert result['statistics']['total_columns'] == 4
+
+    selected = store.to_metadata(['customers'])
+    assert [row['column_name'] for row in selected['tables']] == ['id', 'name']
+    assert selected['foreign_keys'] == []
+    assert selected['statistics']['total_tables'] == 1
+
+
+def test_open_store_builds_store_from_snapshot(tmp_path):
+    snapshot_path = save_snapshot(build_metadata(), str(tmp_path / 'shop.dbsnap'))
+
+    with open_store(snapshot_path) as opened:
+        assert opened.table_names == ['customers', 'orders']
+        assert opened.get_statistics(['orders'])['total_columns'] == 2
+    assert os.path.exists(store_path_for(snapshot_path))
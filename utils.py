@@ -4,8 +4,13 @@
 
 import os
 import datetime
+import json
 import re
 from pathlib import Path
+from config import FILE_CONFIG
+
+# 캐시·스냅샷·내보내기 파일에 저장하지 않는 연결 정보 키
+CREDENTIAL_KEYS = ('password', 'passwd', 'pwd')
 
 
 def validate_port(port_str):
@@ -103,6 +108,42 @@ def generate_spec_filename(database_name, timestamp=True):
     return base_name + ".xlsx"
 
 
+def get_user_data_dir():
+    """사용자 데이터 디렉토리 경로 반환 (없으면 생성)"""
+    path = os.path.expanduser(FILE_CONFIG["user_data_dir"])
+    ensure_directory_exists(path)
+    return path
+
+
+def load_user_settings():
+    """사용자 설정 읽기 (파일이 없거나 손상된 경우 빈 딕셔너리)"""
+    settings_path = os.path.join(get_user_data_dir(), FILE_CONFIG["settings_filename"])
+    try:
+        with open(settings_path, encoding=FILE_CONFIG["encoding"]) as f:
+            settings = json.load(f)
+        return settings if isinstance(settings, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_user_settings(**values):
+    """사용자 설정 저장 (기존 값에 병합)"""
+    settings = load_user_settings()
+    settings.update(values)
+    settings_path = os.path.join(get_user_data_dir(), FILE_CONFIG["settings_filename"])
+    try:
+        with open(settings_path, 'w', encoding=FILE_CONFIG["encoding"]) as f:
+            json.dump(settings, f, ensure_ascii=False, indent=2)
+        return True
+    except OSError:
+        return False
+
+
+def without_credentials(connection_info):
+    """연결 정보에서 인증 정보(CREDENTIAL_KEYS)를 뺀 사본 반환"""
+    return {key: value for key, value in (connection_info or {}).items() if key not in CREDENTIAL_KEYS}
+
+
 def mask_password(password, mask_char="*"):
     """비밀번호 마스킹"""
     if not password: